@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""批量生成银行卡号的速度（numpy与纯Python两种实现）
+用法（仓库根目录下执行）：python -m benchmarks.bench_bank_card [-n 数量]
+"""
+import time
+import argparse
+from unittest.mock import patch
+
+import dbox.testdata
+from dbox.testdata import iter_bank_card_numbers
+
+
+def bench(count: int) -> float:
+    """返回每秒生成的卡号数量"""
+    start = time.perf_counter()
+    for _ in iter_bank_card_numbers(count):
+        pass
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=1000000, help="生成的卡号数量")
+    args = parser.parse_args()
+
+    print(f"{'实现':<10}{'卡号/秒':>14}")
+    if dbox.testdata.numpy is not None:
+        print(f"{'numpy':<10}{round(bench(args.count)):>14}")
+    with patch("dbox.testdata.numpy", None):
+        print(f"{'python':<10}{round(bench(args.count)):>14}")
+
+
+if __name__ == "__main__":
+    main()
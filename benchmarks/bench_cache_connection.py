@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""MyCache连接复用前后的get/set耗时对比
+用法（仓库根目录下执行）：python -m benchmarks.bench_cache_connection [-n 次数]
+"""
+import time
+import sqlite3
+import argparse
+import tempfile
+from pathlib import Path
+
+from dbox.cache import MyCache
+
+
+class LegacyCache(MyCache):
+    """模拟改造前的实现：每次操作都新建连接，仅初始化时设置一次WAL"""
+
+    def _init_db(self):
+        super()._init_db()
+        with sqlite3.connect(str(self.cache_path), timeout=self.timeout) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+    def _get_connection(self):
+        return sqlite3.connect(str(self.cache_path), timeout=self.timeout)
+
+
+def bench(cache: MyCache, count: int) -> dict:
+    """分别统计set与get的平均耗时（微秒）"""
+    start = time.perf_counter()
+    for i in range(count):
+        cache.set(f"bench:{i}", {"index": i, "name": "dbox"})
+    set_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(count):
+        cache.get(f"bench:{i}")
+    get_elapsed = time.perf_counter() - start
+    return {
+        "set_us": round(set_elapsed / count * 1e6, 1),
+        "get_us": round(get_elapsed / count * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=2000, help="每种操作的执行次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        before = bench(LegacyCache(Path(tmp_dir) / "legacy.db"), args.count)
+        pooled_cache = MyCache(Path(tmp_dir) / "pooled.db")
+        after = bench(pooled_cache, args.count)
+        pooled_cache.close()
+
+    print(f"{'操作':<6}{'改造前(us)':>14}{'改造后(us)':>14}{'加速比':>10}")
+    for op in ("set", "get"):
+        _before, _after = before[f"{op}_us"], after[f"{op}_us"]
+        print(f"{op:<6}{_before:>14}{_after:>14}{round(_before / _after, 2):>10}")
+
+
+if __name__ == "__main__":
+    main()
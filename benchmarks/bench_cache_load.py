@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""get_cache_obj各缓存后端的吞吐量与延迟压测，结果以JSON输出
+用法（仓库根目录下执行）：
+    python -m benchmarks.bench_cache_load [-b sqlite redis fakeredis] [-w get set setex queue hash]
+        [-n 每线程次数] [-k 键数] [-s 值字节数] [-p 进程数] [-t 每进程线程数] [-o 结果文件]
+        [--baseline 上次结果文件 --tolerance 0.2]
+
+后端说明（均不需要网络）：
+    sqlite：临时目录下的MyCache，通过get_cache_obj获取
+    redis：本机存在redis-server时在空闲端口启动临时实例，通过get_cache_obj获取
+    fakeredis：安装fakeredis时使用进程内的模拟服务，仅支持单进程
+指定--baseline时与上次结果对比，ops/sec下降超过tolerance的项以非0退出码报告
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import base64
+import argparse
+import tempfile
+import threading
+import subprocess
+from contextlib import contextmanager
+from multiprocessing import Pool
+
+from redis import ConnectionPool
+
+from dbox.cache import get_cache_obj, MyRedis
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None
+
+WORKLOADS = ("get", "set", "setex", "queue", "hash")
+
+# fakeredis的服务端对象只存在于当前进程
+_FAKE_SERVER = None
+
+
+def _op_get(cache, key, value, index):
+    cache.get(key)
+
+
+def _op_set(cache, key, value, index):
+    cache.set(key, value)
+
+
+def _op_setex(cache, key, value, index):
+    cache.setex(key, 60, value)
+
+
+def _op_queue(cache, key, value, index):
+    """入队与出队交替执行"""
+    if index % 2:
+        cache.lpop("bench:queue")
+    else:
+        cache.rpush("bench:queue", value)
+
+
+def _op_hash(cache, key, value, index):
+    """字段写入与读取交替执行"""
+    if index % 2:
+        cache.hget("bench:hash", key)
+    else:
+        cache.hset("bench:hash", key, value)
+
+
+_OPERATIONS = {
+    "get": _op_get,
+    "set": _op_set,
+    "setex": _op_setex,
+    "queue": _op_queue,
+    "hash": _op_hash,
+}
+
+
+def _make_cache(backend: str, env: dict):
+    """在当前进程中创建缓存对象"""
+    if backend == "fakeredis":
+        pool = ConnectionPool(connection_class=fakeredis.FakeConnection, server=_FAKE_SERVER)
+        return MyRedis(connection_pool=pool)
+    os.environ.update(env)
+    if backend == "sqlite":
+        os.environ.pop("REDIS_DB_CONNECT", None)
+    return get_cache_obj()
+
+
+def _prefill(cache, workload: str, keys: int, value: str):
+    if workload == "get":
+        cache.mset({f"bench:{i}": value for i in range(keys)})
+    elif workload == "hash":
+        cache.hset("bench:hash", mapping={f"bench:{i}": value for i in range(keys)})
+
+
+def _run_worker(backend: str, env: dict, workload: str, count: int, keys: int, value_size: int, threads: int):
+    """在一个进程内用多个线程执行负载，返回所有操作的耗时（纳秒）及负载执行的总秒数（不含预置数据）"""
+    cache = _make_cache(backend, env)
+    value = "x" * value_size
+    operation = _OPERATIONS[workload]
+    _prefill(cache, workload, keys, value)
+    latencies = [[] for _ in range(threads)]
+
+    def _run_thread(thread_index):
+        _latencies = latencies[thread_index]
+        offset = thread_index * count
+        for index in range(count):
+            key = f"bench:{(offset + index) % keys}"
+            start = time.perf_counter_ns()
+            operation(cache, key, value, index)
+            _latencies.append(time.perf_counter_ns() - start)
+
+    thread_list = [threading.Thread(target=_run_thread, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return [latency for _latencies in latencies for latency in _latencies], elapsed
+
+
+def _percentile(sorted_values: list, percent: float) -> float:
+    index = min(int(len(sorted_values) * percent), len(sorted_values) - 1)
+    return round(sorted_values[index] / 1000, 1)
+
+
+def run_workload(backend: str, env: dict, workload: str, args) -> dict:
+    """执行一种负载并汇总ops/sec及延迟分位数（微秒）"""
+    cache = _make_cache(backend, env)
+    cache.batch_delete("bench:*")
+
+    worker_args = (backend, env, workload, args.count, args.keys, args.value_size, args.threads)
+    if args.processes > 1:
+        with Pool(args.processes) as pool:
+            results = pool.starmap(_run_worker, [worker_args] * args.processes)
+    else:
+        results = [_run_worker(*worker_args)]
+    latencies = [latency for result in results for latency in result[0]]
+    # 各进程并行执行，以最慢的进程耗时计算吞吐量
+    elapsed = max(result[1] for result in results)
+    cache.batch_delete("bench:*")
+
+    latencies.sort()
+    return {
+        "backend": backend,
+        "workload": workload,
+        "ops": len(latencies),
+        "elapsed": round(elapsed, 4),
+        "ops_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_us": _percentile(latencies, 0.5),
+        "p99_us": _percentile(latencies, 0.99),
+        "max_us": round(latencies[-1] / 1000, 1),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def redis_server():
+    """在空闲端口启动临时的redis-server（不持久化），返回get_cache_obj所需的环境变量；找不到redis-server时返回None"""
+    executable = shutil.which("redis-server")
+    if not executable:
+        yield None
+        return
+
+    port = _free_port()
+    process = subprocess.Popen(
+        [executable, "--port", str(port), "--bind", "127.0.0.1", "--save", "", "--appendonly", "no"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 5
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("redis-server启动失败")
+                time.sleep(0.05)
+        connect = json.dumps({"host": "127.0.0.1", "port": port, "pass": None})
+        yield {"REDIS_DB_CONNECT": base64.b64encode(connect.encode("utf8")).decode("utf8")}
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def compare_baseline(results: list, baseline_path: str, tolerance: float) -> list:
+    """与上次结果对比，返回ops/sec下降超过tolerance的项"""
+    with open(baseline_path, encoding="utf8") as f:
+        baseline = {(item["backend"], item["workload"]): item for item in json.load(f)["results"]}
+    regressions = []
+    for item in results:
+        before = baseline.get((item["backend"], item["workload"]))
+        if before and item["ops_per_sec"] < before["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                {
+                    "backend": item["backend"],
+                    "workload": item["workload"],
+                    "baseline_ops_per_sec": before["ops_per_sec"],
+                    "ops_per_sec": item["ops_per_sec"],
+                }
+            )
+    return regressions
+
+
+def main():
+    global _FAKE_SERVER
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-b", "--backend", nargs="+", default=["sqlite", "redis", "fakeredis"], help="后端")
+    parser.add_argument("-w", "--workload", nargs="+", default=list(WORKLOADS), choices=WORKLOADS, help="负载类型")
+    parser.add_argument("-n", "--count", type=int, default=2000, help="每个线程执行的操作次数")
+    parser.add_argument("-k", "--keys", type=int, default=1000, help="键的数量")
+    parser.add_argument("-s", "--value-size", type=int, default=100, help="值的字节数")
+    parser.add_argument("-p", "--processes", type=int, default=1, help="进程数")
+    parser.add_argument("-t", "--threads", type=int, default=1, help="每个进程的线程数")
+    parser.add_argument("-o", "--output", help="结果写入的JSON文件，为空时只打印")
+    parser.add_argument("--baseline", help="上次结果的JSON文件")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="允许的ops/sec下降比例")
+    args = parser.parse_args()
+
+    report = {"config": vars(args).copy(), "results": [], "skipped": {}}
+    with tempfile.TemporaryDirectory() as tmp_dir, redis_server() as redis_env:
+        envs = {"sqlite": {"HOME": tmp_dir, "USERPROFILE": tmp_dir}, "redis": redis_env, "fakeredis": {}}
+        for backend in args.backend:
+            if backend not in envs:
+                parser.error(f"未知的后端：{backend}")
+            if backend == "redis" and redis_env is None:
+                report["skipped"][backend] = "未找到redis-server"
+                continue
+            if backend == "fakeredis":
+                if fakeredis is None:
+                    report["skipped"][backend] = "未安装fakeredis"
+                    continue
+                if args.processes > 1:
+                    report["skipped"][backend] = "fakeredis仅支持单进程"
+                    continue
+                _FAKE_SERVER = fakeredis.FakeServer()
+            for workload in args.workload:
+                report["results"].append(run_workload(backend, envs[backend], workload, args))
+
+    exit_code = 0
+    if args.baseline:
+        report["regressions"] = compare_baseline(report["results"], args.baseline, args.tolerance)
+        exit_code = 1 if report["regressions"] else 0
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as f:
+            f.write(text)
+    print(text)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""各序列化方式/压缩方式的体积与编解码耗时对比
+用法（仓库根目录下执行）：python -m benchmarks.bench_cache_serializer [-n 次数] [-s 列表长度]
+"""
+import time
+import argparse
+
+from dbox.cache import CacheSerializer, _SERIALIZERS, _COMPRESSORS
+
+
+def make_payload(size: int) -> dict:
+    """构造一个典型的缓存对象：若干条结构相同的记录"""
+    return {
+        "total": size,
+        "items": [
+            {"id": i, "name": f"用户{i}", "email": f"user{i}@example.com", "score": i * 0.5, "active": i % 2 == 0}
+            for i in range(size)
+        ],
+    }
+
+
+def bench(serializer: CacheSerializer, value, count: int) -> dict:
+    """统计序列化后的字节数，以及dumps/loads的平均耗时（微秒）"""
+    raw = serializer.dumps(value)
+    size = len(raw.encode("utf-8") if isinstance(raw, str) else raw)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        serializer.dumps(value)
+    dumps_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(count):
+        serializer.loads(raw)
+    loads_elapsed = time.perf_counter() - start
+    return {
+        "size": size,
+        "dumps_us": round(dumps_elapsed / count * 1e6, 1),
+        "loads_us": round(loads_elapsed / count * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=2000, help="每种组合的编解码次数")
+    parser.add_argument("-s", "--size", type=int, default=100, help="测试对象中的记录条数")
+    args = parser.parse_args()
+
+    value = make_payload(args.size)
+    print(f"{'序列化':<10}{'压缩':<8}{'字节数':>10}{'dumps(us)':>12}{'loads(us)':>12}")
+    for name in _SERIALIZERS:
+        for compress in [None, *_COMPRESSORS]:
+            result = bench(CacheSerializer(name, compress=compress, compress_threshold=0), value, args.count)
+            print(f"{name:<10}{compress or '-':<8}{result['size']:>10}{result['dumps_us']:>12}{result['loads_us']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""各压缩方式的吞吐量（MB/s，按压缩前的数据量计算）与压缩率
+用法（仓库根目录下执行）：python -m benchmarks.bench_compress [-f 文件数] [-s 每个文件KB数] [-w 线程数] [-d 待压缩目录]
+未指定待压缩目录时生成一半可压缩文本、一半随机数据的目录
+"""
+import os
+import argparse
+import tempfile
+
+from dbox.file import compress_zip, extract_zip, compress_tgz, uncompress_tgz, _TAR_COMPRESS_TYPES
+
+
+def make_tree(root: str, files: int, size_kb: int):
+    text = ("2024-01-01 12:00:00 INFO dbox 模拟日志内容 " * 64).encode("utf-8")
+    for index in range(files):
+        data = os.urandom(size_kb * 1024) if index % 2 else (text * (size_kb * 1024 // len(text) + 1))[: size_kb * 1024]
+        with open(os.path.join(root, f"file{index}.{'bin' if index % 2 else 'log'}"), "wb") as f:
+            f.write(data)
+
+
+def _print(name: str, result: dict, extract: dict):
+    ratio = result["compressed_bytes"] / result["bytes"] if result["bytes"] else 0
+    print(f"{name:<24}{result['mb_per_sec']:>12.1f}{extract['mb_per_sec']:>12.1f}{ratio:>10.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-f", "--files", type=int, default=200, help="文件数")
+    parser.add_argument("-s", "--size", type=int, default=512, help="每个文件的KB数")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 4, help="zip多线程压缩的线程数")
+    parser.add_argument("-d", "--dir", help="待压缩目录，为空时生成测试数据")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        src = args.dir
+        if not src:
+            src = os.path.join(tmp_dir, "src")
+            os.mkdir(src)
+            make_tree(src, args.files, args.size)
+
+        print(f"{'方式':<24}{'压缩MB/s':>12}{'解压MB/s':>12}{'压缩率':>10}")
+        for compress_type in ("store", "deflate", "bzip2", "lzma"):
+            for workers in sorted({1, args.workers}):
+                if workers > 1 and compress_type in ("store", "lzma"):
+                    continue
+                archive = os.path.join(tmp_dir, f"{compress_type}_{workers}.zip")
+                result = compress_zip(src, archive, compress_type=compress_type, workers=workers)
+                extract = extract_zip(archive, os.path.join(tmp_dir, f"{compress_type}_{workers}"))
+                _print(f"zip {compress_type} workers={workers}", result, extract)
+
+        for compress_type in _TAR_COMPRESS_TYPES:
+            archive = os.path.join(tmp_dir, f"test.tar.{compress_type}")
+            try:
+                result = compress_tgz(src, archive, compress_type=compress_type)
+            except Exception as e:
+                print(f"{f'tar {compress_type}':<24}不可用：{e}")
+                continue
+            extract = uncompress_tgz(archive, os.path.join(tmp_dir, f"tar_{compress_type}"))
+            _print(f"tar {compress_type}", result, extract)
+
+
+if __name__ == "__main__":
+    main()
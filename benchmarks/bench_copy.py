@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""复制目录的吞吐量：shutil.copytree与copy_tree不同线程数的对比，源目录未修改时再次复制的耗时，
+以及修改1%的文件后sync_dir增量同步的耗时
+用法（仓库根目录下执行）：python -m benchmarks.bench_copy [-f 文件数] [-s 每个文件KB数] [-w 1 4 8] [-d 临时目录]
+"""
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from dbox.file import copy_tree, sync_dir
+
+
+def make_tree(root: str, files: int, size_kb: int):
+    """生成每个子目录100个文件的目录树"""
+    data = os.urandom(size_kb * 1024)
+    for index in range(files):
+        sub_dir = os.path.join(root, f"dir{index // 100}")
+        os.makedirs(sub_dir, exist_ok=True)
+        with open(os.path.join(sub_dir, f"file{index}.bin"), "wb") as f:
+            f.write(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--files", type=int, default=2000, help="文件数")
+    parser.add_argument("-s", "--size", type=int, default=256, help="每个文件的KB数")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 4, 8], help="copy_tree的线程数")
+    parser.add_argument("-d", "--dir", help="临时目录所在的目录，用于测试指定的磁盘或文件系统")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp_dir:
+        src = os.path.join(tmp_dir, "src")
+        make_tree(src, args.files, args.size)
+        total_mb = args.files * args.size / 1024
+        print(f"{args.files}个文件，共{total_mb:.1f}MB")
+        print(f"{'方式':<24}{'耗时(秒)':>10}{'MB/s':>10}")
+
+        dst = os.path.join(tmp_dir, "copytree")
+        start = time.perf_counter()
+        shutil.copytree(src, dst)
+        elapsed = time.perf_counter() - start
+        print(f"{'shutil.copytree':<24}{elapsed:>10.3f}{total_mb / elapsed:>10.1f}")
+        shutil.rmtree(dst)
+
+        for workers in args.workers:
+            dst = os.path.join(tmp_dir, f"copy_tree_{workers}")
+            result = copy_tree(src, dst, workers=workers)
+            speed = result["bytes_per_sec"] / 1024 / 1024
+            print(f"{f'copy_tree workers={workers}':<24}{result['elapsed']:>10.3f}{speed:>10.1f}")
+            # 源目录未修改，再次复制时全部跳过
+            result = copy_tree(src, dst, workers=workers)
+            print(f"{f'  再次复制（跳过{result["skipped"]}个）':<24}{result['elapsed']:>10.3f}{'-':>10}")
+            shutil.rmtree(dst)
+
+        dst = os.path.join(tmp_dir, "sync")
+        result = sync_dir(src, dst)
+        speed = result["bytes"] / 1024 / 1024 / result["elapsed"]
+        print(f"{'sync_dir 首次同步':<24}{result['elapsed']:>10.3f}{speed:>10.1f}")
+        changed = 0
+        for sub_dir, _, names in os.walk(src):
+            for name in names[: max(len(names) // 100, 1)]:
+                with open(os.path.join(sub_dir, name), "r+b") as f:
+                    f.write(os.urandom(16))
+                changed += 1
+        result = sync_dir(src, dst)
+        print(f"{f'sync_dir 修改{changed}个文件':<24}{result['elapsed']:>10.3f}{'-':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""按结构生成数据集并写入文件的吞吐量，按列类型输出每秒生成行数，并输出进程内存峰值
+用法（仓库根目录下执行）：python -m benchmarks.bench_dataset [-n 行数] [-c 每块行数] [-f csv jsonl parquet]
+"""
+import os
+import time
+import argparse
+import resource
+import tempfile
+
+from dbox.testdata import write_dataset, _get_pyarrow
+
+SCHEMA = {
+    "name": "name",
+    "id_card": "id_card",
+    "mobile": "mobile",
+    "phone_serial": "phone_serial",
+    "bank_card": "bank_card",
+    "date": "date",
+    "string": ("string", {"length": 16}),
+    "uuid": "uuid",
+    "int": ("int", {"start": 0, "end": 10000}),
+    "choice": ("choice", {"values": ["A", "B", "C"]}),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=1000000, help="总行数")
+    parser.add_argument("-c", "--chunk-size", type=int, default=100000, help="每块的行数")
+    parser.add_argument("-f", "--format", nargs="+", default=["csv", "jsonl", "parquet"], help="文件格式")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_format in args.format:
+            if file_format == "parquet" and _get_pyarrow() is None:
+                print("parquet: 未安装pyarrow，跳过\n")
+                continue
+            file_path = os.path.join(tmp_dir, f"data.{file_format}")
+            start = time.perf_counter()
+            stats = write_dataset(file_path, SCHEMA, args.count, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(file_path) / 1024 / 1024
+            print(f"{file_format}: {args.count / elapsed:.0f}行/秒，写入耗时{stats['write_elapsed']:.2f}秒，文件{size:.1f}MB")
+            print(f"{'列类型':<14}{'行/秒':>14}")
+            for column in stats["columns"].values():
+                print(f"{column['type']:<14}{column['rows_per_sec']:>14.0f}")
+            print()
+    # ru_maxrss在Linux下单位为KB；内存只与chunk_size有关，增大行数时峰值应基本不变
+    print(f"进程内存峰值：{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
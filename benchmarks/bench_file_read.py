@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""大文件读取：read_file_stream与MappedFile的随机范围读取、逐行扫描，以及JSONL/JSON数组的流式解析
+用法（仓库根目录下执行）：python -m benchmarks.bench_file_read [-s 文件MB数] [-n 范围读取次数]
+"""
+import os
+import re
+import json
+import time
+import random
+import argparse
+import tempfile
+
+from dbox.file import read_file_stream, read_file_content, MappedFile, iter_jsonl, iter_json_array
+
+
+def _timeit(func) -> float:
+    """返回耗时（秒），不保留func的返回值，避免memoryview切片在MappedFile关闭后仍被引用"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _read_ranges(read, ranges: list):
+    for start, end in ranges:
+        read(start, end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-s", "--size", type=int, default=200, help="测试文件的MB数")
+    parser.add_argument("-n", "--count", type=int, default=100000, help="随机范围读取的次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, "test.log")
+        line = "2024-01-01 12:00:00 INFO dbox.flow 执行步骤完成，耗时123ms\n".encode("utf-8")
+        with open(log_path, "wb") as f:
+            f.write(line * (args.size * 1024 * 1024 // len(line)))
+        size = os.path.getsize(log_path)
+        ranges = [(start, start + 256) for start in (random.randrange(size - 256) for _ in range(args.count))]
+
+        print(f"{'方式':<36}{'耗时(秒)':>10}")
+        elapsed = _timeit(lambda: _read_ranges(lambda start, end: read_file_stream(log_path, start, end), ranges))
+        print(f"{f'read_file_stream 范围读取{args.count}次':<36}{elapsed:>10.3f}")
+        with MappedFile(log_path) as mapped:
+            elapsed = _timeit(lambda: _read_ranges(mapped.read, ranges))
+            print(f"{f'MappedFile.read 范围读取{args.count}次':<36}{elapsed:>10.3f}")
+
+        def _scan_open():
+            with open(log_path, "rb") as f:
+                return sum(1 for _ in f)
+
+        elapsed = _timeit(_scan_open)
+        print(f"{'open逐行扫描':<36}{elapsed:>10.3f}")
+        with MappedFile(log_path) as mapped:
+            elapsed = _timeit(lambda: sum(1 for _ in mapped.iter_lines()))
+            print(f"{'MappedFile.iter_lines逐行扫描':<36}{elapsed:>10.3f}")
+
+        # 查找包含关键字的行：逐行判断与按块使用正则表达式
+        pattern = re.compile("^.*耗时123ms$".encode("utf-8"), re.M)
+
+        def _search_open():
+            with open(log_path, "rb") as f:
+                return sum(1 for line in f if pattern.search(line))
+
+        elapsed = _timeit(_search_open)
+        print(f"{'open逐行查找':<36}{elapsed:>10.3f}")
+        with MappedFile(log_path) as mapped:
+            elapsed = _timeit(lambda: sum(len(pattern.findall(block)) for block in mapped.iter_blocks()))
+            print(f"{'MappedFile.iter_blocks按块查找':<36}{elapsed:>10.3f}")
+
+        records = [{"id": index, "name": f"记录{index}", "tags": ["a", "b"]} for index in range(200000)]
+        jsonl_path, json_path = os.path.join(tmp_dir, "test.jsonl"), os.path.join(tmp_dir, "test.json")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+
+        elapsed = _timeit(lambda: read_file_content(json_path, _return="json"))
+        print(f"{'read_file_content整体解析JSON':<36}{elapsed:>10.3f}")
+        elapsed = _timeit(lambda: sum(1 for _ in iter_json_array(json_path)))
+        print(f"{'iter_json_array流式解析JSON':<36}{elapsed:>10.3f}")
+        elapsed = _timeit(lambda: sum(1 for _ in iter_jsonl(jsonl_path)))
+        print(f"{'iter_jsonl流式解析JSONL':<36}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
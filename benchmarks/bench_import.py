@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# coding:utf-8
+"""dbox.testdata的冷启动耗时：每个场景在新的解释器进程中执行，输出导入耗时、首次调用耗时的中位数（毫秒）与内存峰值
+用法（仓库根目录下执行）：python -m benchmarks.bench_import [-n 次数]
+
+“导入全部依赖”场景同时导入addressinfo、bankinfo与numpy，相当于数据模块与numpy改为延迟导入之前的导入成本
+"""
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# 场景名称 -> (导入语句, 首次调用语句)
+SCENARIOS = {
+    "空解释器": ("pass", "pass"),
+    "导入testdata": ("import dbox.testdata", "dbox.testdata.get_random_string()"),
+    "导入全部依赖": ("import dbox.testdata, dbox.addressinfo, dbox.bankinfo, numpy", "dbox.testdata.get_random_string()"),
+    "首次生成身份证号码": ("import dbox.testdata", "dbox.testdata.generate_id_card()"),
+    "首次生成银行卡号": ("import dbox.testdata", "dbox.testdata.generate_bank_card_number()"),
+}
+
+_CHILD = """
+import time, json, resource
+start = time.perf_counter()
+{import_stmt}
+imported = time.perf_counter()
+{call_stmt}
+called = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "call_ms": (called - imported) * 1000,
+    "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def run(import_stmt: str, call_stmt: str, count: int) -> dict:
+    """在新进程中执行count次，返回各项的中位数"""
+    code = _CHILD.format(import_stmt=import_stmt, call_stmt=call_stmt)
+    results = [json.loads(subprocess.check_output([sys.executable, "-c", code])) for _ in range(count)]
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--count", type=int, default=10, help="每个场景执行的次数")
+    args = parser.parse_args()
+
+    print(f"{'场景':<12}{'导入(ms)':>12}{'首次调用(ms)':>14}{'内存峰值(MB)':>14}")
+    for name, (import_stmt, call_stmt) in SCENARIOS.items():
+        result = run(import_stmt, call_stmt, args.count)
+        print(f"{name:<12}{result['import_ms']:>12.1f}{result['call_ms']:>14.1f}{result['maxrss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,3510 +5,3653 @@ author：dqy
 time：2018/1/12 下午6:19
 from：https://github.com/HeLiangHIT/idCardNumber
 """
+import sys
+import random
+import bisect
+from array import array
 
 
-addr = [
-    (110000, "北京市"),
-    (110100, "市辖区"),
-    (110101, "东城区"),
-    (110102, "西城区"),
-    (110103, "崇文区"),
-    (110104, "宣武区"),
-    (110105, "朝阳区"),
-    (110106, "丰台区"),
-    (110107, "石景山区"),
-    (110108, "海淀区"),
-    (110109, "门头沟区"),
-    (110111, "房山区"),
-    (110112, "通州区"),
-    (110113, "顺义区"),
-    (110114, "昌平区"),
-    (110115, "大兴区"),
-    (110116, "怀柔区"),
-    (110117, "平谷区"),
-    (110200, "县"),
-    (110228, "密云县"),
-    (110229, "延庆县"),
-    (120000, "天津市"),
-    (120100, "市辖区"),
-    (120101, "和平区"),
-    (120102, "河东区"),
-    (120103, "河西区"),
-    (120104, "南开区"),
-    (120105, "河北区"),
-    (120106, "红桥区"),
-    (120107, "塘沽区"),
-    (120108, "汉沽区"),
-    (120109, "大港区"),
-    (120110, "东丽区"),
-    (120111, "西青区"),
-    (120112, "津南区"),
-    (120113, "北辰区"),
-    (120114, "武清区"),
-    (120115, "宝坻区"),
-    (120200, "市辖县"),
-    (120221, "宁河县"),
-    (120223, "静海县"),
-    (120225, "蓟县"),
-    (130000, "河北省"),
-    (130100, "石家庄市"),
-    (130101, "市辖区"),
-    (130102, "长安区"),
-    (130103, "桥东区"),
-    (130104, "桥西区"),
-    (130105, "新华区"),
-    (130107, "井陉矿区"),
-    (130108, "裕华区"),
-    (130121, "井陉县"),
-    (130123, "正定县"),
-    (130124, "栾城县"),
-    (130125, "行唐县"),
-    (130126, "灵寿县"),
-    (130127, "高邑县"),
-    (130128, "深泽县"),
-    (130129, "赞皇县"),
-    (130130, "无极县"),
-    (130131, "平山县"),
-    (130132, "元氏县"),
-    (130133, "赵县"),
-    (130181, "辛集市"),
-    (130182, "藁城市"),
-    (130183, "晋州市"),
-    (130184, "新乐市"),
-    (130185, "鹿泉市"),
-    (130200, "唐山市"),
-    (130201, "市辖区"),
-    (130202, "路南区"),
-    (130203, "路北区"),
-    (130204, "古冶区"),
-    (130205, "开平区"),
-    (130207, "丰南区"),
-    (130208, "丰润区"),
-    (130223, "滦县"),
-    (130224, "滦南县"),
-    (130225, "乐亭县"),
-    (130227, "迁西县"),
-    (130229, "玉田县"),
-    (130230, "唐海县"),
-    (130281, "遵化市"),
-    (130283, "迁安市"),
-    (130300, "秦皇岛市"),
-    (130301, "市辖区"),
-    (130302, "海港区"),
-    (130303, "山海关区"),
-    (130304, "北戴河区"),
-    (130321, "青龙满族自治县"),
-    (130322, "昌黎县"),
-    (130323, "抚宁县"),
-    (130324, "卢龙县"),
-    (130400, "邯郸市"),
-    (130401, "市辖区"),
-    (130402, "邯山区"),
-    (130403, "丛台区"),
-    (130404, "复兴区"),
-    (130406, "峰峰矿区"),
-    (130421, "邯郸县"),
-    (130423, "临漳县"),
-    (130424, "成安县"),
-    (130425, "大名县"),
-    (130426, "涉县"),
-    (130427, "磁县"),
-    (130428, "肥乡县"),
-    (130429, "永年县"),
-    (130430, "邱县"),
-    (130431, "鸡泽县"),
-    (130432, "广平县"),
-    (130433, "馆陶县"),
-    (130434, "魏县"),
-    (130435, "曲周县"),
-    (130481, "武安市"),
-    (130500, "邢台市"),
-    (130501, "市辖区"),
-    (130502, "桥东区"),
-    (130503, "桥西区"),
-    (130521, "邢台县"),
-    (130522, "临城县"),
-    (130523, "内邱县"),
-    (130524, "柏乡县"),
-    (130525, "隆尧县"),
-    (130526, "任县"),
-    (130527, "南和县"),
-    (130528, "宁晋县"),
-    (130529, "巨鹿县"),
-    (130530, "新河县"),
-    (130531, "广宗县"),
-    (130532, "平乡县"),
-    (130533, "威县"),
-    (130534, "清河县"),
-    (130535, "临西县"),
-    (130581, "南宫市"),
-    (130582, "沙河市"),
-    (130600, "保定市"),
-    (130601, "市辖区"),
-    (130602, "新市区"),
-    (130603, "北市区"),
-    (130604, "南市区"),
-    (130621, "满城县"),
-    (130622, "清苑县"),
-    (130623, "涞水县"),
-    (130624, "阜平县"),
-    (130625, "徐水县"),
-    (130626, "定兴县"),
-    (130627, "唐县"),
-    (130628, "高阳县"),
-    (130629, "容城县"),
-    (130630, "涞源县"),
-    (130631, "望都县"),
-    (130632, "安新县"),
-    (130633, "易县"),
-    (130634, "曲阳县"),
-    (130635, "蠡县"),
-    (130636, "顺平县"),
-    (130637, "博野县"),
-    (130638, "雄县"),
-    (130681, "涿州市"),
-    (130682, "定州市"),
-    (130683, "安国市"),
-    (130684, "高碑店市"),
-    (130700, "张家口市"),
-    (130701, "市辖区"),
-    (130702, "桥东区"),
-    (130703, "桥西区"),
-    (130705, "宣化区"),
-    (130706, "下花园区"),
-    (130721, "宣化县"),
-    (130722, "张北县"),
-    (130723, "康保县"),
-    (130724, "沽源县"),
-    (130725, "尚义县"),
-    (130726, "蔚县"),
-    (130727, "阳原县"),
-    (130728, "怀安县"),
-    (130729, "万全县"),
-    (130730, "怀来县"),
-    (130731, "涿鹿县"),
-    (130732, "赤城县"),
-    (130733, "崇礼县"),
-    (130800, "承德市"),
-    (130801, "市辖区"),
-    (130802, "双桥区"),
-    (130803, "双滦区"),
-    (130804, "鹰手营子矿区"),
-    (130821, "承德县"),
-    (130822, "兴隆县"),
-    (130823, "平泉县"),
-    (130824, "滦平县"),
-    (130825, "隆化县"),
-    (130826, "丰宁满族自治县"),
-    (130827, "宽城满族自治县"),
-    (130828, "围场满族蒙古族自治县"),
-    (130900, "沧州市"),
-    (130901, "市辖区"),
-    (130902, "新华区"),
-    (130903, "运河区"),
-    (130921, "沧县"),
-    (130922, "青县"),
-    (130923, "东光县"),
-    (130924, "海兴县"),
-    (130925, "盐山县"),
-    (130926, "肃宁县"),
-    (130927, "南皮县"),
-    (130928, "吴桥县"),
-    (130929, "献县"),
-    (130930, "孟村回族自治县"),
-    (130981, "泊头市"),
-    (130982, "任邱市"),
-    (130983, "黄骅市"),
-    (130984, "河间市"),
-    (131000, "廊坊市"),
-    (131001, "市辖区"),
-    (131002, "安次区"),
-    (131003, "广阳区"),
-    (131022, "固安县"),
-    (131023, "永清县"),
-    (131024, "香河县"),
-    (131025, "大城县"),
-    (131026, "文安县"),
-    (131028, "大厂回族自治县"),
-    (131081, "霸州市"),
-    (131082, "三河市"),
-    (131100, "衡水市"),
-    (131101, "市辖区"),
-    (131102, "桃城区"),
-    (131121, "枣强县"),
-    (131122, "武邑县"),
-    (131123, "武强县"),
-    (131124, "饶阳县"),
-    (131125, "安平县"),
-    (131126, "故城县"),
-    (131127, "景县"),
-    (131128, "阜城县"),
-    (131181, "冀州市"),
-    (131182, "深州市"),
-    (140000, "山西"),
-    (140100, "太原市"),
-    (140101, "市辖区"),
-    (140105, "小店区(人口含高新经济区)"),
-    (140106, "迎泽区"),
-    (140107, "杏花岭区"),
-    (140108, "尖草坪区"),
-    (140109, "万柏林区"),
-    (140110, "晋源区"),
-    (140121, "清徐县"),
-    (140122, "阳曲县"),
-    (140123, "娄烦县"),
-    (140181, "古交市"),
-    (140200, "大同市"),
-    (140201, "市辖区"),
-    (140202, "大同市城区"),
-    (140203, "矿区"),
-    (140211, "南郊区"),
-    (140212, "新荣区"),
-    (140221, "阳高县"),
-    (140222, "天镇县"),
-    (140223, "广灵县"),
-    (140224, "灵丘县"),
-    (140225, "浑源县"),
-    (140226, "左云县"),
-    (140227, "大同县"),
-    (140300, "阳泉市"),
-    (140301, "市辖区"),
-    (140302, "城区"),
-    (140303, "矿区"),
-    (140311, "郊区"),
-    (140321, "平定县"),
-    (140322, "盂县"),
-    (140400, "长治市"),
-    (140401, "市辖区"),
-    (140402, "长治市城区"),
-    (140411, "长治市郊区"),
-    (140421, "长治县"),
-    (140423, "襄垣县"),
-    (140424, "屯留县"),
-    (140425, "平顺县"),
-    (140426, "黎城县"),
-    (140427, "壶关县"),
-    (140428, "长子县"),
-    (140429, "武乡县"),
-    (140430, "沁县"),
-    (140431, "沁源县"),
-    (140481, "潞城市"),
-    (140500, "晋城市"),
-    (140501, "市辖区"),
-    (140502, "晋城市城区"),
-    (140521, "沁水县"),
-    (140522, "阳城县"),
-    (140524, "陵川县"),
-    (140525, "泽州县"),
-    (140581, "高平市"),
-    (140600, "朔州市"),
-    (140601, "市辖区"),
-    (140602, "朔城区"),
-    (140603, "平鲁区"),
-    (140621, "山阴县"),
-    (140622, "应县"),
-    (140623, "右玉县"),
-    (140624, "怀仁县"),
-    (140700, "晋中市"),
-    (140701, "市辖区"),
-    (140702, "榆次区"),
-    (140721, "榆社县"),
-    (140722, "左权县"),
-    (140723, "和顺县"),
-    (140724, "昔阳县"),
-    (140725, "寿阳县"),
-    (140726, "太谷县"),
-    (140727, "祁县"),
-    (140728, "平遥县"),
-    (140729, "灵石县"),
-    (140781, "介休市"),
-    (140800, "运城市"),
-    (140801, "市辖区"),
-    (140802, "盐湖区"),
-    (140821, "临猗县"),
-    (140822, "万荣县"),
-    (140823, "闻喜县"),
-    (140824, "稷山县"),
-    (140825, "新绛县"),
-    (140826, "绛县"),
-    (140827, "垣曲县"),
-    (140828, "夏县"),
-    (140829, "平陆县"),
-    (140830, "芮城县"),
-    (140881, "永济市"),
-    (140882, "河津市"),
-    (140900, "忻州市"),
-    (140901, "市辖区"),
-    (140902, "忻府区"),
-    (140921, "定襄县"),
-    (140922, "五台县"),
-    (140923, "代县"),
-    (140924, "繁峙县"),
-    (140925, "宁武县"),
-    (140926, "静乐县"),
-    (140927, "神池县"),
-    (140928, "五寨县"),
-    (140929, "岢岚县"),
-    (140930, "河曲县"),
-    (140931, "保德县"),
-    (140932, "偏关县"),
-    (140981, "原平市"),
-    (141000, "临汾市"),
-    (141001, "市辖区"),
-    (141002, "尧都区"),
-    (141021, "曲沃县"),
-    (141022, "翼城县"),
-    (141023, "襄汾县"),
-    (141024, "洪洞县"),
-    (141025, "古县"),
-    (141026, "安泽县"),
-    (141027, "浮山县"),
-    (141028, "吉县"),
-    (141029, "乡宁县"),
-    (141030, "大宁县"),
-    (141031, "隰县"),
-    (141032, "永和县"),
-    (141033, "蒲县"),
-    (141034, "汾西县"),
-    (141081, "侯马市"),
-    (141082, "霍州市"),
-    (141100, "吕梁市"),
-    (141101, "市辖区"),
-    (141102, "离石区"),
-    (141121, "文水县"),
-    (141122, "交城县"),
-    (141123, "兴县"),
-    (141124, "临县"),
-    (141125, "柳林县"),
-    (141126, "石楼县"),
-    (141127, "岚县"),
-    (141128, "方山县"),
-    (141129, "中阳县"),
-    (141130, "交口县"),
-    (141181, "孝义市"),
-    (141182, "汾阳市"),
-    (150000, "内蒙古自治区"),
-    (150100, "呼和浩特市"),
-    (150101, "市辖区"),
-    (150102, "新城区"),
-    (150103, "回民区"),
-    (150104, "玉泉区"),
-    (150105, "赛罕区"),
-    (150121, "土左旗"),
-    (150122, "托克托县"),
-    (150123, "和林格尔县"),
-    (150124, "清水河县"),
-    (150125, "武川县"),
-    (150200, "包头市"),
-    (150201, "市辖区"),
-    (150202, "东河区"),
-    (150203, "昆都仑区"),
-    (150204, "青山区"),
-    (150205, "石拐区"),
-    (150206, "白云鄂博矿区"),
-    (150207, "九原区"),
-    (150221, "土默特右旗"),
-    (150222, "固阳县"),
-    (150223, "达茂联合旗"),
-    (150300, "乌海市"),
-    (150301, "乌海市辖区"),
-    (150302, "海勃湾区"),
-    (150303, "海南区"),
-    (150304, "乌达区"),
-    (150400, "赤峰市"),
-    (150401, "市辖区"),
-    (150402, "红山区"),
-    (150403, "元宝山区"),
-    (150404, "松山区"),
-    (150421, "阿鲁科尔沁旗"),
-    (150422, "巴林左旗"),
-    (150423, "巴林右旗"),
-    (150424, "林西县"),
-    (150425, "克什克腾旗"),
-    (150426, "翁牛特旗"),
-    (150428, "喀喇沁旗"),
-    (150429, "宁城县"),
-    (150430, "敖汉旗"),
-    (150500, "通辽市"),
-    (150501, "市辖区"),
-    (150502, "科尔沁区"),
-    (150521, "科尔沁左翼中旗"),
-    (150522, "科左后旗"),
-    (150523, "开鲁县"),
-    (150524, "库伦旗"),
-    (150525, "奈曼旗"),
-    (150526, "扎鲁特旗"),
-    (150581, "霍林郭勒市"),
-    (150600, "鄂尔多斯市"),
-    (150602, "东胜区"),
-    (150621, "达拉特旗"),
-    (150622, "准格尔旗"),
-    (150623, "鄂托克前旗"),
-    (150624, "鄂托克旗"),
-    (150625, "杭锦旗"),
-    (150626, "乌审旗"),
-    (150627, "伊金霍洛旗"),
-    (150700, "呼伦贝尔市"),
-    (150701, "市辖区"),
-    (150702, "海拉尔区"),
-    (150721, "阿荣旗"),
-    (150722, "莫力达瓦达斡尔族自治旗"),
-    (150723, "鄂伦春自治旗"),
-    (150724, "鄂温克族自治旗"),
-    (150725, "陈巴尔虎旗镇"),
-    (150726, "新巴尔虎左旗"),
-    (150727, "新巴尔虎右旗"),
-    (150781, "满洲里市"),
-    (150782, "牙克石市"),
-    (150783, "扎兰屯市"),
-    (150784, "额尔古纳市"),
-    (150785, "根河市"),
-    (150800, "巴彦淖尔市"),
-    (150801, "市辖区"),
-    (150802, "临河区"),
-    (150821, "五原县"),
-    (150822, "磴口县"),
-    (150823, "乌拉特前旗"),
-    (150824, "乌拉特中旗"),
-    (150825, "乌拉特后旗"),
-    (150826, "杭锦后旗"),
-    (150900, "乌兰察布市"),
-    (150901, "市辖区"),
-    (150902, "集宁区"),
-    (150921, "卓资县"),
-    (150922, "化德县"),
-    (150923, "商都县"),
-    (150924, "兴和县"),
-    (150925, "凉城县"),
-    (150926, "察哈尔右翼前旗"),
-    (150927, "察右中旗"),
-    (150928, "察哈尔右翼后旗"),
-    (150929, "四子王旗"),
-    (150981, "丰镇市"),
-    (152200, "兴安盟"),
-    (152201, "乌兰浩特市"),
-    (152202, "阿尔山市"),
-    (152221, "科右前旗"),
-    (152222, "科右中旗"),
-    (152223, "扎赉特旗"),
-    (152224, "突泉县"),
-    (152500, "锡林郭勒盟"),
-    (152501, "二连浩特市"),
-    (152502, "锡林浩特市"),
-    (152522, "阿巴嘎旗"),
-    (152523, "苏尼特左旗"),
-    (152524, "苏尼特右旗"),
-    (152525, "东乌珠穆沁旗"),
-    (152526, "西乌珠穆沁旗"),
-    (152527, "太仆寺旗"),
-    (152528, "镶黄旗"),
-    (152529, "正镶白旗"),
-    (152530, "正蓝旗"),
-    (152531, "多伦县"),
-    (152900, "阿拉善盟"),
-    (152921, "阿拉善左旗"),
-    (152922, "阿拉善右旗"),
-    (152923, "额济纳旗"),
-    (210000, "辽宁省"),
-    (210100, "沈阳市"),
-    (210101, "市辖区"),
-    (210102, "和平区"),
-    (210103, "沈河区"),
-    (210104, "大东区"),
-    (210105, "皇姑区"),
-    (210106, "铁西区"),
-    (210111, "苏家屯区"),
-    (210112, "东陵区"),
-    (210113, "新城子区"),
-    (210114, "于洪区"),
-    (210122, "辽中县"),
-    (210123, "康平县"),
-    (210124, "法库县"),
-    (210181, "新民市"),
-    (210200, "大连市"),
-    (210201, "市辖区"),
-    (210202, "中山区"),
-    (210203, "西岗区"),
-    (210204, "沙河口区"),
-    (210211, "甘井子区"),
-    (210212, "旅顺口区"),
-    (210213, "金州区"),
-    (210224, "长海县"),
-    (210281, "瓦房店市"),
-    (210282, "普兰店市"),
-    (210283, "庄河市"),
-    (210300, "鞍山市"),
-    (210301, "市辖区"),
-    (210302, "铁东区"),
-    (210303, "铁西区"),
-    (210304, "立山区"),
-    (210311, "千山区"),
-    (210321, "台安县"),
-    (210323, "岫岩县"),
-    (210381, "海城市"),
-    (210400, "抚顺市"),
-    (210401, "市辖区"),
-    (210402, "新抚区"),
-    (210403, "东洲区"),
-    (210404, "望花区"),
-    (210411, "顺城区"),
-    (210421, "抚顺县"),
-    (210422, "新宾满族自治县"),
-    (210423, "清原满族自治县"),
-    (210500, "本溪市"),
-    (210501, "市辖区"),
-    (210502, "平山区"),
-    (210503, "溪湖区"),
-    (210504, "明山区"),
-    (210505, "南芬区"),
-    (210521, "本溪满族自治县"),
-    (210522, "桓仁满族自治县"),
-    (210600, "丹东市"),
-    (210601, "市辖区"),
-    (210602, "元宝区"),
-    (210603, "振兴区"),
-    (210604, "振安区"),
-    (210624, "宽甸满族自治县"),
-    (210681, "东港市"),
-    (210682, "凤城市"),
-    (210700, "锦州市"),
-    (210701, "市辖区"),
-    (210702, "古塔区"),
-    (210703, "凌河区"),
-    (210711, "太和区"),
-    (210726, "黑山县"),
-    (210727, "义县"),
-    (210781, "凌海市"),
-    (210782, "北镇市"),
-    (210800, "营口市"),
-    (210801, "市辖区"),
-    (210802, "站前区"),
-    (210803, "西市区"),
-    (210804, "鲅鱼圈区"),
-    (210811, "老边区"),
-    (210881, "盖州市"),
-    (210882, "大石桥市"),
-    (210900, "阜新市"),
-    (210901, "市辖区"),
-    (210902, "海州区"),
-    (210903, "新邱区"),
-    (210904, "太平区"),
-    (210905, "清河门区"),
-    (210911, "细河区"),
-    (210921, "阜新蒙古族自治县"),
-    (210922, "彰武县"),
-    (211000, "辽阳市"),
-    (211001, "市辖区"),
-    (211002, "白塔区"),
-    (211003, "文圣区"),
-    (211004, "宏伟区"),
-    (211005, "弓长岭区"),
-    (211011, "太子河区"),
-    (211021, "辽阳县"),
-    (211081, "灯塔市"),
-    (211100, "盘锦市"),
-    (211101, "市辖区"),
-    (211102, "双台子区"),
-    (211103, "兴隆台区"),
-    (211121, "大洼县"),
-    (211122, "盘山县"),
-    (211200, "铁岭市"),
-    (211201, "市辖区"),
-    (211202, "银州区"),
-    (211204, "清河区"),
-    (211221, "铁岭县"),
-    (211223, "西丰县"),
-    (211224, "昌图县"),
-    (211281, "调兵山市"),
-    (211282, "开原市"),
-    (211300, "朝阳市"),
-    (211301, "市辖区"),
-    (211302, "双塔区"),
-    (211303, "龙城区"),
-    (211321, "朝阳县"),
-    (211322, "建平县"),
-    (211324, "喀喇沁左翼蒙古族自治县"),
-    (211381, "北票市"),
-    (211382, "凌源市"),
-    (211400, "葫芦岛市"),
-    (211401, "市辖区"),
-    (211402, "连山区"),
-    (211403, "龙港区"),
-    (211404, "南票区"),
-    (211421, "绥中县"),
-    (211422, "建昌县"),
-    (211481, "兴城市"),
-    (220000, "吉林省"),
-    (220100, "长春市"),
-    (220101, "长春市辖区"),
-    (220102, "南关区"),
-    (220103, "宽城区"),
-    (220104, "朝阳区"),
-    (220105, "二道区"),
-    (220106, "绿园区"),
-    (220112, "双阳区"),
-    (220122, "农安县"),
-    (220181, "九台市"),
-    (220182, "榆树市"),
-    (220183, "德惠市"),
-    (220200, "吉林市"),
-    (220201, "吉林市辖区"),
-    (220202, "昌邑区"),
-    (220203, "龙潭区"),
-    (220204, "船营区"),
-    (220211, "丰满区"),
-    (220221, "永吉县"),
-    (220281, "蛟河市"),
-    (220282, "桦甸市"),
-    (220283, "舒兰市"),
-    (220284, "磐石市"),
-    (220300, "四平市"),
-    (220301, "四平市辖区"),
-    (220302, "铁西区"),
-    (220303, "铁东区"),
-    (220322, "梨树县"),
-    (220323, "伊通满族自治县"),
-    (220381, "公主岭市"),
-    (220382, "双辽市"),
-    (220400, "辽源市"),
-    (220401, "辽源市辖区"),
-    (220402, "龙山区"),
-    (220403, "西安区"),
-    (220421, "东丰县"),
-    (220422, "东辽县"),
-    (220500, "通化市"),
-    (220501, "通化市辖区"),
-    (220502, "东昌区"),
-    (220503, "二道江区"),
-    (220521, "通化县"),
-    (220523, "辉南县"),
-    (220524, "柳河县"),
-    (220581, "梅河口市"),
-    (220582, "集安市"),
-    (220600, "白山市"),
-    (220601, "白山市辖区"),
-    (220602, "八道江区"),
-    (220604, "江源区"),
-    (220621, "抚松县"),
-    (220622, "靖宇县"),
-    (220623, "长白朝鲜族自治县"),
-    (220681, "临江市"),
-    (220700, "松原市"),
-    (220701, "松原市辖区"),
-    (220702, "宁江区"),
-    (220721, "前郭尔罗斯蒙古族自治县"),
-    (220722, "长岭县"),
-    (220723, "乾安县"),
-    (220724, "扶余县"),
-    (220800, "白城市"),
-    (220801, "白城市辖区"),
-    (220802, "洮北区"),
-    (220821, "镇赉县"),
-    (220822, "通榆县"),
-    (220881, "洮南市"),
-    (220882, "大安市"),
-    (222400, "延边朝鲜族自治州"),
-    (222401, "延吉市"),
-    (222402, "图们市"),
-    (222403, "敦化市"),
-    (222404, "珲春市"),
-    (222405, "龙井市"),
-    (222406, "和龙市"),
-    (222424, "汪清县"),
-    (222426, "安图县"),
-    (230000, "黑龙江省"),
-    (230100, "哈尔滨市"),
-    (230101, "市辖区"),
-    (230102, "道里区"),
-    (230103, "南岗区"),
-    (230104, "道外区"),
-    (230108, "平房区"),
-    (230109, "松北区"),
-    (230110, "香坊区"),
-    (230111, "呼兰区"),
-    (230112, "阿城区"),
-    (230123, "依兰县"),
-    (230124, "方正县"),
-    (230125, "宾县"),
-    (230126, "巴彦县"),
-    (230127, "木兰县"),
-    (230128, "通河县"),
-    (230129, "延寿县"),
-    (230182, "双城市"),
-    (230183, "尚志市"),
-    (230184, "五常市"),
-    (230200, "齐齐哈尔市"),
-    (230201, "市辖区"),
-    (230202, "龙沙区"),
-    (230203, "建华区"),
-    (230204, "铁锋区"),
-    (230205, "昂昂溪区"),
-    (230206, "富拉尔基区"),
-    (230207, "碾子山区"),
-    (230208, "梅里斯达斡尔族区"),
-    (230221, "龙江县"),
-    (230223, "依安县"),
-    (230224, "泰来县"),
-    (230225, "甘南县"),
-    (230227, "富裕县"),
-    (230229, "克山县"),
-    (230230, "克东县"),
-    (230231, "拜泉县"),
-    (230281, "讷河市"),
-    (230300, "鸡西市"),
-    (230301, "市辖区"),
-    (230302, "鸡冠区"),
-    (230303, "恒山区"),
-    (230304, "滴道区"),
-    (230305, "梨树区"),
-    (230306, "城子河区"),
-    (230307, "麻山区"),
-    (230321, "鸡东县"),
-    (230381, "虎林市"),
-    (230382, "密山市"),
-    (230400, "鹤岗市"),
-    (230401, "市辖区"),
-    (230402, "向阳区"),
-    (230403, "工农区"),
-    (230404, "南山区"),
-    (230405, "兴安区"),
-    (230406, "东山区"),
-    (230407, "兴山区"),
-    (230421, "萝北县"),
-    (230422, "绥滨县"),
-    (230500, "双鸭山市"),
-    (230501, "市辖区"),
-    (230502, "尖山区"),
-    (230503, "岭东区"),
-    (230505, "四方台区"),
-    (230506, "宝山区"),
-    (230521, "集贤县"),
-    (230522, "友谊县"),
-    (230523, "宝清县"),
-    (230524, "饶河县"),
-    (230600, "大庆市"),
-    (230601, "市辖区"),
-    (230602, "萨尔图区"),
-    (230603, "龙凤区"),
-    (230604, "让胡路区"),
-    (230605, "红岗区"),
-    (230606, "大同区"),
-    (230621, "肇州县"),
-    (230622, "肇源县"),
-    (230623, "林甸县"),
-    (230624, "杜尔伯特县"),
-    (230700, "伊春市"),
-    (230701, "市辖区"),
-    (230702, "伊春区"),
-    (230703, "南岔区"),
-    (230704, "友好区"),
-    (230705, "西林区"),
-    (230706, "翠峦区"),
-    (230707, "新青区"),
-    (230708, "美溪区"),
-    (230709, "金山屯区"),
-    (230710, "五营区"),
-    (230711, "乌马河区"),
-    (230712, "汤旺河区"),
-    (230713, "带岭区"),
-    (230714, "乌伊岭区"),
-    (230715, "红星区"),
-    (230716, "上甘岭区"),
-    (230722, "嘉荫县"),
-    (230781, "铁力市"),
-    (230800, "佳木斯市"),
-    (230801, "市辖区"),
-    (230803, "向阳区"),
-    (230804, "前进区"),
-    (230805, "东风区"),
-    (230811, "郊区"),
-    (230822, "桦南县"),
-    (230826, "桦川县"),
-    (230828, "汤原县"),
-    (230833, "抚远县"),
-    (230881, "同江市"),
-    (230882, "富锦市"),
-    (230900, "七台河市"),
-    (230901, "市辖区"),
-    (230902, "新兴区"),
-    (230903, "桃山区"),
-    (230904, "茄子河区"),
-    (230921, "勃利县"),
-    (231000, "牡丹江市"),
-    (231001, "市辖区"),
-    (231002, "东安区"),
-    (231003, "阳明区"),
-    (231004, "爱民区"),
-    (231005, "西安区"),
-    (231024, "东宁县"),
-    (231025, "林口县"),
-    (231081, "绥芬河市"),
-    (231083, "海林市"),
-    (231084, "宁安市"),
-    (231085, "穆棱市"),
-    (231100, "黑河市"),
-    (231101, "市辖区"),
-    (231102, "爱辉区"),
-    (231121, "嫩江县"),
-    (231123, "逊克县"),
-    (231124, "孙吴县"),
-    (231181, "北安市"),
-    (231182, "五大连池市"),
-    (231200, "绥化市"),
-    (231201, "市辖区"),
-    (231202, "北林区"),
-    (231221, "望奎县"),
-    (231222, "兰西县"),
-    (231223, "青冈县"),
-    (231224, "庆安县"),
-    (231225, "明水县"),
-    (231226, "绥棱县"),
-    (231281, "安达市"),
-    (231282, "肇东市"),
-    (231283, "海伦市"),
-    (232700, "大兴安岭地区"),
-    (232701, "加格达奇区"),
-    (232702, "松岭区"),
-    (232703, "新林区"),
-    (232704, "呼中区"),
-    (232721, "呼玛县"),
-    (232722, "塔河县"),
-    (232723, "漠河县"),
-    (310000, "上海市"),
-    (310100, "市辖区"),
-    (310101, "黄浦区"),
-    (310103, "卢湾区"),
-    (310104, "徐汇区"),
-    (310105, "长宁区"),
-    (310106, "静安区"),
-    (310107, "普陀区"),
-    (310108, "闸北区"),
-    (310109, "虹口区"),
-    (310110, "杨浦区"),
-    (310112, "闵行区"),
-    (310113, "宝山区"),
-    (310114, "嘉定区"),
-    (310115, "浦东新区"),
-    (310116, "金山区"),
-    (310117, "松江区"),
-    (310118, "青浦区"),
-    (310119, "南汇区"),
-    (310120, "奉贤区"),
-    (310200, "县"),
-    (310230, "崇明县"),
-    (320000, "江苏省"),
-    (320100, "南京市"),
-    (320101, "市辖区"),
-    (320102, "玄武区"),
-    (320103, "白下区"),
-    (320104, "秦淮区"),
-    (320105, "建邺区"),
-    (320106, "鼓楼区"),
-    (320107, "下关区"),
-    (320111, "浦口区"),
-    (320113, "栖霞区"),
-    (320114, "雨花台区"),
-    (320115, "江宁区"),
-    (320116, "六合区"),
-    (320124, "溧水县"),
-    (320125, "高淳县"),
-    (320200, "无锡市"),
-    (320201, "市辖区"),
-    (320202, "崇安区"),
-    (320203, "南长区"),
-    (320204, "北塘区"),
-    (320205, "锡山区"),
-    (320206, "惠山区"),
-    (320211, "滨湖区"),
-    (320281, "江阴市"),
-    (320282, "宜兴市"),
-    (320300, "徐州市"),
-    (320301, "市辖区"),
-    (320302, "鼓楼区"),
-    (320303, "云龙区"),
-    (320304, "九里区"),
-    (320305, "贾汪区"),
-    (320311, "泉山区"),
-    (320321, "丰县"),
-    (320322, "沛县"),
-    (320323, "铜山县"),
-    (320324, "睢宁县"),
-    (320381, "新沂市"),
-    (320382, "邳州市"),
-    (320400, "常州市"),
-    (320401, "常州市区"),
-    (320402, "天宁区"),
-    (320404, "钟楼区"),
-    (320405, "戚墅堰区"),
-    (320411, "新北区"),
-    (320412, "武进区"),
-    (320481, "溧阳市"),
-    (320482, "金坛市"),
-    (320500, "苏州市"),
-    (320501, "市辖区"),
-    (320502, "沧浪区"),
-    (320503, "平江区"),
-    (320504, "金阊区"),
-    (320505, "苏州高新区虎丘区"),
-    (320506, "吴中区"),
-    (320507, "相城区"),
-    (320581, "常熟市"),
-    (320582, "张家港市"),
-    (320583, "昆山市"),
-    (320584, "吴江市"),
-    (320585, "太仓市"),
-    (320600, "南通市"),
-    (320601, "市辖区"),
-    (320602, "崇川区"),
-    (320611, "港闸区"),
-    (320621, "海安县"),
-    (320623, "如东"),
-    (320681, "启东市"),
-    (320682, "如皋市"),
-    (320683, "通州市"),
-    (320684, "海门市"),
-    (320700, "连云港市"),
-    (320701, "市辖区"),
-    (320703, "连云区"),
-    (320705, "新浦区"),
-    (320706, "海州区"),
-    (320721, "赣榆县"),
-    (320722, "东海县"),
-    (320723, "灌云县"),
-    (320724, "灌南县"),
-    (320800, "淮安市"),
-    (320801, "市辖区"),
-    (320802, "清河区"),
-    (320803, "楚州区"),
-    (320804, "淮阴区"),
-    (320811, "清浦区"),
-    (320826, "涟水县"),
-    (320829, "洪泽县"),
-    (320830, "盱眙县"),
-    (320831, "金湖县"),
-    (320900, "盐城市"),
-    (320901, "市辖区"),
-    (320902, "亭湖区"),
-    (320903, "盐都区"),
-    (320921, "响水县"),
-    (320922, "滨海县"),
-    (320923, "阜宁县"),
-    (320924, "射阳县"),
-    (320925, "建湖县"),
-    (320981, "东台市"),
-    (320982, "大丰市"),
-    (321000, "扬州市"),
-    (321001, "市辖区"),
-    (321002, "广陵区"),
-    (321003, "邗江区"),
-    (321011, "维扬区"),
-    (321023, "宝应县"),
-    (321081, "仪征市"),
-    (321084, "高邮市"),
-    (321088, "江都市"),
-    (321100, "镇江市"),
-    (321101, "市区"),
-    (321102, "京口区"),
-    (321111, "润州区"),
-    (321112, "丹徒区"),
-    (321181, "丹阳市"),
-    (321182, "扬中市"),
-    (321183, "句容市"),
-    (321200, "泰州市"),
-    (321201, "市辖区"),
-    (321202, "海陵区"),
-    (321203, "高港区"),
-    (321281, "兴化市"),
-    (321282, "靖江市"),
-    (321283, "泰兴市"),
-    (321284, "姜堰市"),
-    (321300, "宿迁市"),
-    (321301, "市辖区"),
-    (321302, "宿城区"),
-    (321311, "宿豫区"),
-    (321322, "沭阳县"),
-    (321323, "泗阳县"),
-    (321324, "泗洪县"),
-    (330000, "浙江省"),
-    (330100, "杭州市"),
-    (330101, "市辖区"),
-    (330102, "上城区"),
-    (330103, "下城区"),
-    (330104, "江干区"),
-    (330105, "拱墅区"),
-    (330106, "西湖区"),
-    (330108, "滨江区"),
-    (330109, "萧山区"),
-    (330110, "余杭区"),
-    (330122, "桐庐县"),
-    (330127, "淳安县"),
-    (330182, "建德市"),
-    (330183, "富阳市"),
-    (330185, "临安市"),
-    (330200, "宁波市"),
-    (330201, "市辖区"),
-    (330203, "海曙区"),
-    (330204, "江东区"),
-    (330205, "江北区"),
-    (330206, "北仑区"),
-    (330211, "镇海区"),
-    (330212, "鄞州区"),
-    (330225, "象山县"),
-    (330226, "宁海县"),
-    (330281, "余姚市"),
-    (330282, "慈溪市"),
-    (330283, "奉化市"),
-    (330300, "温州市"),
-    (330301, "市辖区"),
-    (330302, "鹿城区"),
-    (330303, "龙湾区"),
-    (330304, "瓯海区"),
-    (330322, "洞头县"),
-    (330324, "永嘉县"),
-    (330326, "平阳县"),
-    (330327, "苍南县"),
-    (330328, "文成县"),
-    (330329, "泰顺县"),
-    (330381, "瑞安市"),
-    (330382, "乐清市"),
-    (330400, "嘉兴市"),
-    (330401, "市辖区"),
-    (330402, "南湖区"),
-    (330411, "秀洲区"),
-    (330421, "嘉善县"),
-    (330424, "海盐县"),
-    (330481, "海宁市"),
-    (330482, "平湖市"),
-    (330483, "桐乡市"),
-    (330500, "湖州市"),
-    (330501, "市辖区"),
-    (330502, "吴兴区"),
-    (330503, "南浔区"),
-    (330521, "德清县"),
-    (330522, "长兴县"),
-    (330523, "安吉县"),
-    (330600, "绍兴市"),
-    (330601, "市辖区"),
-    (330602, "越城区"),
-    (330621, "绍兴县"),
-    (330624, "新昌县"),
-    (330681, "诸暨市"),
-    (330682, "上虞市"),
-    (330683, "嵊州市"),
-    (330700, "金华市"),
-    (330701, "市辖区"),
-    (330702, "婺城区"),
-    (330703, "金东区"),
-    (330723, "武义县"),
-    (330726, "浦江县"),
-    (330727, "磐安县"),
-    (330781, "兰溪市"),
-    (330782, "义乌市"),
-    (330783, "东阳市"),
-    (330784, "永康市"),
-    (330800, "衢州市"),
-    (330801, "市辖区"),
-    (330802, "柯城区"),
-    (330803, "衢江区"),
-    (330822, "常山县"),
-    (330824, "开化县"),
-    (330825, "龙游县"),
-    (330881, "江山市"),
-    (330900, "舟山市"),
-    (330901, "市辖区"),
-    (330902, "定海区"),
-    (330903, "普陀区"),
-    (330921, "岱山县"),
-    (330922, "嵊泗县"),
-    (331000, "台州市"),
-    (331001, "市辖区"),
-    (331002, "椒江区"),
-    (331003, "黄岩区"),
-    (331004, "路桥区"),
-    (331021, "玉环县"),
-    (331022, "三门县"),
-    (331023, "天台县"),
-    (331024, "仙居县"),
-    (331081, "温岭市"),
-    (331082, "临海市"),
-    (331100, "丽水市"),
-    (331101, "市辖区"),
-    (331102, "莲都区"),
-    (331121, "青田县"),
-    (331122, "缙云县"),
-    (331123, "遂昌县"),
-    (331124, "松阳县"),
-    (331125, "云和县"),
-    (331126, "庆元县"),
-    (331127, "景宁畲族自治县"),
-    (331181, "龙泉市"),
-    (340000, "安徽省"),
-    (340100, "合肥市"),
-    (340101, "市辖区"),
-    (340102, "瑶海区"),
-    (340103, "庐阳区"),
-    (340104, "蜀山区"),
-    (340111, "包河区"),
-    (340121, "长丰县"),
-    (340122, "肥东县"),
-    (340123, "肥西县"),
-    (340200, "芜湖市"),
-    (340201, "市辖区"),
-    (340202, "镜湖区"),
-    (340203, "弋江区"),
-    (340207, "鸠江区"),
-    (340208, "三山区"),
-    (340221, "芜湖县"),
-    (340222, "繁昌县"),
-    (340223, "南陵县"),
-    (340300, "蚌埠市"),
-    (340301, "市辖区"),
-    (340302, "龙子湖区"),
-    (340303, "蚌山区"),
-    (340304, "禹会区"),
-    (340311, "淮上区"),
-    (340321, "怀远县"),
-    (340322, "五河县"),
-    (340323, "固镇县"),
-    (340400, "淮南市"),
-    (340401, "市辖区"),
-    (340402, "大通区"),
-    (340403, "田家庵区"),
-    (340404, "谢家集区"),
-    (340405, "八公山区"),
-    (340406, "潘集区"),
-    (340421, "凤台县"),
-    (340500, "马鞍山市"),
-    (340501, "市辖区"),
-    (340502, "金家庄区"),
-    (340503, "花山区"),
-    (340504, "雨山区"),
-    (340521, "当涂县"),
-    (340600, "淮北市"),
-    (340601, "市辖区"),
-    (340602, "杜集区"),
-    (340603, "相山区"),
-    (340604, "烈山区"),
-    (340621, "濉溪县"),
-    (340700, "铜陵市"),
-    (340701, "市辖区"),
-    (340702, "铜官山区"),
-    (340703, "狮子山区"),
-    (340711, "铜陵市郊区"),
-    (340721, "铜陵县"),
-    (340800, "安庆市"),
-    (340801, "市辖区"),
-    (340802, "迎江区"),
-    (340803, "大观区"),
-    (340811, "宜秀区"),
-    (340822, "怀宁县"),
-    (340823, "枞阳县"),
-    (340824, "潜山县"),
-    (340825, "太湖县"),
-    (340826, "宿松县"),
-    (340827, "望江县"),
-    (340828, "岳西县"),
-    (340881, "桐城市"),
-    (341000, "黄山市"),
-    (341001, "市辖区"),
-    (341002, "屯溪区"),
-    (341003, "黄山区"),
-    (341004, "徽州区"),
-    (341021, "歙县"),
-    (341022, "休宁县"),
-    (341023, "黟县"),
-    (341024, "祁门县"),
-    (341100, "滁州市"),
-    (341101, "市辖区"),
-    (341102, "琅琊区"),
-    (341103, "南谯区"),
-    (341122, "来安县"),
-    (341124, "全椒县"),
-    (341125, "定远县"),
-    (341126, "凤阳县"),
-    (341181, "天长市"),
-    (341182, "明光市"),
-    (341200, "阜阳市"),
-    (341201, "市辖区"),
-    (341202, "颍州区"),
-    (341203, "颍东区"),
-    (341204, "颍泉区"),
-    (341221, "临泉县"),
-    (341222, "太和县"),
-    (341225, "阜南县"),
-    (341226, "颍上县"),
-    (341282, "界首市"),
-    (341300, "宿州市"),
-    (341301, "市辖区"),
-    (341302, "墉桥区"),
-    (341321, "砀山县"),
-    (341322, "萧县"),
-    (341323, "灵璧县"),
-    (341324, "泗县"),
-    (341400, "巢湖市"),
-    (341401, "市辖区"),
-    (341402, "居巢区"),
-    (341421, "庐江县"),
-    (341422, "无为县"),
-    (341423, "含山县"),
-    (341424, "和县"),
-    (341500, "六安市"),
-    (341501, "市辖区"),
-    (341502, "金安区"),
-    (341503, "裕安区"),
-    (341521, "寿县"),
-    (341522, "霍邱县"),
-    (341523, "舒城县"),
-    (341524, "金寨县"),
-    (341525, "霍山县"),
-    (341600, "亳州市"),
-    (341601, "市辖区"),
-    (341602, "谯城区"),
-    (341621, "涡阳县"),
-    (341622, "蒙城县"),
-    (341623, "利辛县"),
-    (341700, "池州市"),
-    (341701, "市辖区"),
-    (341702, "贵池区"),
-    (341721, "东至县"),
-    (341722, "石台县"),
-    (341723, "青阳县"),
-    (341800, "宣城市"),
-    (341801, "市辖区"),
-    (341802, "宣州区"),
-    (341821, "郎溪县"),
-    (341822, "广德县"),
-    (341823, "泾县"),
-    (341824, "绩溪县"),
-    (341825, "旌德县"),
-    (341881, "宁国市"),
-    (350000, "福建省"),
-    (350100, "福州市"),
-    (350101, "市辖区"),
-    (350102, "鼓楼区"),
-    (350103, "台江区"),
-    (350104, "仓山区"),
-    (350105, "马尾区"),
-    (350111, "晋安区"),
-    (350121, "闽侯县"),
-    (350122, "连江县"),
-    (350123, "罗源县"),
-    (350124, "闽清县"),
-    (350125, "永泰县"),
-    (350128, "平潭县"),
-    (350181, "福清市"),
-    (350182, "长乐市"),
-    (350200, "厦门市"),
-    (350201, "市辖区"),
-    (350203, "思明区"),
-    (350205, "海沧区"),
-    (350206, "湖里区"),
-    (350211, "集美区"),
-    (350212, "同安区"),
-    (350213, "翔安区"),
-    (350300, "莆田市"),
-    (350301, "市辖区"),
-    (350302, "城厢区"),
-    (350303, "涵江区"),
-    (350304, "荔城区"),
-    (350305, "秀屿区"),
-    (350322, "仙游县"),
-    (350400, "三明市"),
-    (350401, "市辖区"),
-    (350402, "梅列区"),
-    (350403, "三元区"),
-    (350421, "明溪县"),
-    (350423, "清流县"),
-    (350424, "宁化县"),
-    (350425, "大田县"),
-    (350426, "尤溪县"),
-    (350427, "沙县"),
-    (350428, "将乐县"),
-    (350429, "泰宁县"),
-    (350430, "建宁县"),
-    (350481, "永安市"),
-    (350500, "泉州市"),
-    (350501, "市辖区"),
-    (350502, "鲤城区"),
-    (350503, "丰泽区"),
-    (350504, "洛江区"),
-    (350505, "泉港区"),
-    (350521, "惠安县"),
-    (350524, "安溪县"),
-    (350525, "永春县"),
-    (350526, "德化县"),
-    (350527, "金门县"),
-    (350581, "石狮市"),
-    (350582, "晋江市"),
-    (350583, "南安市"),
-    (350600, "漳州市"),
-    (350601, "市辖区"),
-    (350602, "芗城区"),
-    (350603, "龙文区"),
-    (350622, "云霄县"),
-    (350623, "漳浦县"),
-    (350624, "诏安县"),
-    (350625, "长泰县"),
-    (350626, "东山县"),
-    (350627, "南靖县"),
-    (350628, "平和县"),
-    (350629, "华安县"),
-    (350681, "龙海市"),
-    (350700, "南平市"),
-    (350701, "市辖区"),
-    (350702, "延平区"),
-    (350721, "顺昌县"),
-    (350722, "浦城县"),
-    (350723, "光泽县"),
-    (350724, "松溪县"),
-    (350725, "政和县"),
-    (350781, "邵武市"),
-    (350782, "武夷山市"),
-    (350783, "建瓯市"),
-    (350784, "建阳市"),
-    (350800, "龙岩市"),
-    (350801, "市辖区"),
-    (350802, "新罗区"),
-    (350821, "长汀县"),
-    (350822, "永定县"),
-    (350823, "上杭县"),
-    (350824, "武平县"),
-    (350825, "连城县"),
-    (350881, "漳平市"),
-    (350900, "宁德市"),
-    (350901, "市辖区"),
-    (350902, "蕉城区"),
-    (350921, "霞浦县"),
-    (350922, "古田县"),
-    (350923, "屏南县"),
-    (350924, "寿宁县"),
-    (350925, "周宁县"),
-    (350926, "柘荣县"),
-    (350981, "福安市"),
-    (350982, "福鼎市"),
-    (360000, "江西省"),
-    (360100, "南昌市"),
-    (360101, "市辖区"),
-    (360102, "东湖区"),
-    (360103, "西湖区"),
-    (360104, "青云谱区"),
-    (360105, "湾里区"),
-    (360111, "青山湖区"),
-    (360121, "南昌县"),
-    (360122, "新建县"),
-    (360123, "安义县"),
-    (360124, "进贤县"),
-    (360200, "景德镇市"),
-    (360201, "市辖区"),
-    (360202, "昌江区"),
-    (360203, "珠山区"),
-    (360222, "浮梁县"),
-    (360281, "乐平市"),
-    (360300, "萍乡市"),
-    (360301, "市辖区"),
-    (360302, "安源区"),
-    (360313, "湘东区"),
-    (360321, "莲花县"),
-    (360322, "上栗县"),
-    (360323, "芦溪县"),
-    (360400, "九江市"),
-    (360401, "市辖区"),
-    (360402, "庐山区"),
-    (360403, "浔阳区"),
-    (360421, "九江县"),
-    (360423, "武宁县"),
-    (360424, "修水县"),
-    (360425, "永修县"),
-    (360426, "德安县"),
-    (360427, "星子县"),
-    (360428, "都昌县"),
-    (360429, "湖口县"),
-    (360430, "彭泽县"),
-    (360481, "瑞昌市"),
-    (360500, "新余市"),
-    (360501, "市辖区"),
-    (360502, "渝水区"),
-    (360521, "分宜县"),
-    (360600, "鹰潭市"),
-    (360601, "市辖区"),
-    (360602, "月湖区"),
-    (360622, "余江县"),
-    (360681, "贵溪市"),
-    (360700, "赣州市"),
-    (360701, "市辖区"),
-    (360702, "章贡区"),
-    (360721, "赣县"),
-    (360722, "信丰县"),
-    (360723, "大余县"),
-    (360724, "上犹县"),
-    (360725, "崇义县"),
-    (360726, "安远县"),
-    (360727, "龙南县"),
-    (360728, "定南县"),
-    (360729, "全南县"),
-    (360730, "宁都县"),
-    (360731, "于都县"),
-    (360732, "兴国县"),
-    (360733, "会昌县"),
-    (360734, "寻乌县"),
-    (360735, "石城县"),
-    (360781, "瑞金市"),
-    (360782, "南康市"),
-    (360800, "吉安市"),
-    (360801, "市辖区"),
-    (360802, "吉州区"),
-    (360803, "青原区"),
-    (360821, "吉安县"),
-    (360822, "吉水县"),
-    (360823, "峡江县"),
-    (360824, "新干县"),
-    (360825, "永丰县"),
-    (360826, "泰和县"),
-    (360827, "遂川县"),
-    (360828, "万安县"),
-    (360829, "安福县"),
-    (360830, "永新县"),
-    (360881, "井冈山市"),
-    (360900, "宜春市"),
-    (360901, "市辖区"),
-    (360902, "袁州区"),
-    (360921, "奉新县"),
-    (360922, "万载县"),
-    (360923, "上高县"),
-    (360924, "宜丰县"),
-    (360925, "靖安县"),
-    (360926, "铜鼓县"),
-    (360981, "丰城市"),
-    (360982, "樟树市"),
-    (360983, "高安市"),
-    (361000, "抚州市"),
-    (361001, "市辖区"),
-    (361002, "临川区"),
-    (361021, "南城县"),
-    (361022, "黎川县"),
-    (361023, "南丰县"),
-    (361024, "崇仁县"),
-    (361025, "乐安县"),
-    (361026, "宜黄县"),
-    (361027, "金溪县"),
-    (361028, "资溪县"),
-    (361029, "东乡县"),
-    (361030, "广昌县"),
-    (361100, "上饶市"),
-    (361101, "市辖区"),
-    (361102, "信州区"),
-    (361121, "上饶县"),
-    (361122, "广丰县"),
-    (361123, "玉山县"),
-    (361124, "铅山县"),
-    (361125, "横峰县"),
-    (361126, "弋阳县"),
-    (361127, "余干县"),
-    (361128, "鄱阳县"),
-    (361129, "万年县"),
-    (361130, "婺源县"),
-    (361181, "德兴市"),
-    (370000, "山东省"),
-    (370100, "济南市"),
-    (370101, "市辖区"),
-    (370102, "历下区"),
-    (370103, "市中区"),
-    (370104, "槐荫区"),
-    (370105, "天桥区"),
-    (370112, "历城区"),
-    (370113, "长清区"),
-    (370124, "平阴县"),
-    (370125, "济阳县"),
-    (370126, "商河县"),
-    (370181, "章丘市"),
-    (370200, "青岛市"),
-    (370201, "市辖区"),
-    (370202, "市南区"),
-    (370203, "市北区"),
-    (370205, "四方区"),
-    (370211, "黄岛区"),
-    (370212, "崂山区"),
-    (370213, "李沧区"),
-    (370214, "城阳区"),
-    (370281, "胶州市"),
-    (370282, "即墨市"),
-    (370283, "平度市"),
-    (370284, "胶南市"),
-    (370285, "莱西市"),
-    (370300, "淄博市"),
-    (370301, "市辖区"),
-    (370302, "淄川区"),
-    (370303, "张店区"),
-    (370304, "博山区"),
-    (370305, "临淄区"),
-    (370306, "周村区"),
-    (370321, "桓台县"),
-    (370322, "高青县"),
-    (370323, "沂源县"),
-    (370400, "枣庄市"),
-    (370401, "市辖区"),
-    (370402, "市中区"),
-    (370403, "薛城区"),
-    (370404, "峄城区"),
-    (370405, "台儿庄区"),
-    (370406, "山亭区"),
-    (370481, "滕州市"),
-    (370500, "东营市"),
-    (370501, "市辖区"),
-    (370502, "东营区"),
-    (370503, "河口区"),
-    (370521, "垦利县"),
-    (370522, "利津县"),
-    (370523, "广饶县"),
-    (370600, "烟台市"),
-    (370601, "市辖区"),
-    (370602, "芝罘区"),
-    (370611, "福山区"),
-    (370612, "牟平区"),
-    (370613, "莱山区"),
-    (370634, "长岛县"),
-    (370681, "龙口市"),
-    (370682, "莱阳市"),
-    (370683, "莱州市"),
-    (370684, "蓬莱市"),
-    (370685, "招远市"),
-    (370686, "栖霞市"),
-    (370687, "海阳市"),
-    (370700, "潍坊市"),
-    (370701, "市辖区"),
-    (370702, "潍城区"),
-    (370703, "寒亭区"),
-    (370704, "坊子区"),
-    (370705, "奎文区"),
-    (370724, "临朐县"),
-    (370725, "昌乐县"),
-    (370781, "青州市"),
-    (370782, "诸城市"),
-    (370783, "寿光市"),
-    (370784, "安丘市"),
-    (370785, "高密市"),
-    (370786, "昌邑市"),
-    (370800, "济宁市"),
-    (370801, "市辖区"),
-    (370802, "市中区"),
-    (370811, "任城区"),
-    (370826, "微山县"),
-    (370827, "鱼台县"),
-    (370828, "金乡县"),
-    (370829, "嘉祥县"),
-    (370830, "汶上县"),
-    (370831, "泗水县"),
-    (370832, "梁山县"),
-    (370881, "曲阜市"),
-    (370882, "兖州市"),
-    (370883, "邹城市"),
-    (370900, "泰安市"),
-    (370901, "市辖区"),
-    (370902, "泰山区"),
-    (370903, "岱岳区"),
-    (370921, "宁阳县"),
-    (370923, "东平县"),
-    (370982, "新泰市"),
-    (370983, "肥城市"),
-    (371000, "威海市"),
-    (371001, "市辖区"),
-    (371002, "环翠区"),
-    (371081, "文登市"),
-    (371082, "荣成市"),
-    (371083, "乳山市"),
-    (371100, "日照市"),
-    (371101, "市辖区"),
-    (371102, "东港区"),
-    (371103, "岚山区"),
-    (371121, "五莲县"),
-    (371122, "莒县"),
-    (371200, "莱芜市"),
-    (371201, "市辖区"),
-    (371202, "莱城区"),
-    (371203, "钢城区"),
-    (371300, "临沂市"),
-    (371301, "临沂市辖区"),
-    (371302, "兰山区"),
-    (371311, "罗庄区"),
-    (371312, "河东区"),
-    (371321, "沂南县"),
-    (371322, "郯城县"),
-    (371323, "沂水县"),
-    (371324, "苍山县"),
-    (371325, "费县"),
-    (371326, "平邑县"),
-    (371327, "莒南县"),
-    (371328, "蒙阴县"),
-    (371329, "临沭县"),
-    (371400, "德州市"),
-    (371401, "市辖区"),
-    (371402, "德城区"),
-    (371421, "陵县"),
-    (371422, "宁津县"),
-    (371423, "庆云县"),
-    (371424, "临邑县"),
-    (371425, "齐河县"),
-    (371426, "平原县"),
-    (371427, "夏津县"),
-    (371428, "武城县"),
-    (371481, "乐陵市"),
-    (371482, "禹城市"),
-    (371500, "聊城市"),
-    (371501, "市辖区"),
-    (371502, "东昌府区"),
-    (371521, "阳谷县"),
-    (371522, "莘县"),
-    (371523, "茌平县"),
-    (371524, "东阿县"),
-    (371525, "冠县"),
-    (371526, "高唐县"),
-    (371581, "临清市"),
-    (371600, "滨州市"),
-    (371601, "市辖区"),
-    (371602, "滨城区"),
-    (371621, "惠民县"),
-    (371622, "阳信县"),
-    (371623, "无棣县"),
-    (371624, "沾化县"),
-    (371625, "博兴县"),
-    (371626, "邹平县"),
-    (371700, "菏泽市"),
-    (371701, "市辖区"),
-    (371702, "牡丹区"),
-    (371721, "曹县"),
-    (371722, "单县"),
-    (371723, "成武县"),
-    (371724, "巨野县"),
-    (371725, "郓城县"),
-    (371726, "鄄城县"),
-    (371727, "定陶县"),
-    (371728, "东明县"),
-    (410000, "河南省"),
-    (410100, "郑州市"),
-    (410101, "市辖区"),
-    (410102, "中原区"),
-    (410103, "二七区"),
-    (410104, "管城回族区"),
-    (410105, "金水区"),
-    (410106, "上街区"),
-    (410108, "惠济区"),
-    (410122, "中牟县"),
-    (410181, "巩义市"),
-    (410182, "荥阳市"),
-    (410183, "新密市"),
-    (410184, "新郑市"),
-    (410185, "登封市"),
-    (410200, "开封市"),
-    (410201, "市辖区"),
-    (410202, "龙亭区"),
-    (410203, "顺河区"),
-    (410204, "鼓楼区"),
-    (410205, "禹王台区"),
-    (410211, "金明区"),
-    (410221, "杞县"),
-    (410222, "通许县"),
-    (410223, "尉氏县"),
-    (410224, "开封县"),
-    (410225, "兰考县"),
-    (410300, "洛阳市"),
-    (410301, "市辖区"),
-    (410302, "老城区"),
-    (410303, "西工区"),
-    (410304, "廛河回族区"),
-    (410305, "涧西区"),
-    (410306, "吉利区"),
-    (410307, "洛龙区"),
-    (410322, "孟津县"),
-    (410323, "新安县"),
-    (410324, "栾川县"),
-    (410325, "嵩县"),
-    (410326, "汝阳县"),
-    (410327, "宜阳县"),
-    (410328, "洛宁县"),
-    (410329, "伊川县"),
-    (410381, "偃师市"),
-    (410400, "平顶山市"),
-    (410401, "市辖区"),
-    (410402, "新华区"),
-    (410403, "卫东区"),
-    (410404, "石龙区"),
-    (410411, "湛河区"),
-    (410421, "宝丰县"),
-    (410422, "叶县"),
-    (410423, "鲁山县"),
-    (410425, "郏县"),
-    (410481, "舞钢市"),
-    (410482, "汝州市"),
-    (410500, "安阳市"),
-    (410501, "市辖区"),
-    (410502, "文峰区"),
-    (410503, "北关区"),
-    (410505, "殷都区"),
-    (410506, "龙安区"),
-    (410522, "安阳县"),
-    (410523, "汤阴县"),
-    (410526, "滑县"),
-    (410527, "内黄县"),
-    (410581, "林州市"),
-    (410600, "鹤壁市"),
-    (410601, "市辖区"),
-    (410602, "鹤山区"),
-    (410603, "山城区"),
-    (410611, "淇滨区"),
-    (410621, "浚县"),
-    (410622, "淇县"),
-    (410700, "新乡市"),
-    (410701, "市辖区"),
-    (410702, "红旗区"),
-    (410703, "卫滨区"),
-    (410704, "凤泉区"),
-    (410711, "牧野区"),
-    (410721, "新乡县"),
-    (410724, "获嘉县"),
-    (410725, "原阳县"),
-    (410726, "延津县"),
-    (410727, "封丘县"),
-    (410728, "长垣县"),
-    (410781, "卫辉市"),
-    (410782, "辉县市"),
-    (410800, "焦作市"),
-    (410801, "市辖区"),
-    (410802, "解放区"),
-    (410803, "中站区"),
-    (410804, "马村区"),
-    (410811, "山阳区"),
-    (410821, "修武县"),
-    (410822, "博爱县"),
-    (410823, "武陟县"),
-    (410825, "温县"),
-    (410881, "济源市"),
-    (410882, "沁阳市"),
-    (410883, "孟州市"),
-    (410900, "濮阳市"),
-    (410901, "市辖区"),
-    (410902, "华龙区"),
-    (410922, "清丰县"),
-    (410923, "南乐县"),
-    (410926, "范县"),
-    (410927, "台前县"),
-    (410928, "濮阳县"),
-    (411000, "许昌市"),
-    (411001, "市辖区"),
-    (411002, "魏都区"),
-    (411023, "许昌县"),
-    (411024, "鄢陵县"),
-    (411025, "襄城县"),
-    (411081, "禹州市"),
-    (411082, "长葛市"),
-    (411100, "漯河市"),
-    (411101, "市辖区"),
-    (411102, "源汇区"),
-    (411103, "郾城区"),
-    (411104, "召陵区"),
-    (411121, "舞阳县"),
-    (411122, "临颖县"),
-    (411200, "三门峡市"),
-    (411201, "市辖区"),
-    (411202, "湖滨区"),
-    (411221, "渑池县"),
-    (411222, "陕县"),
-    (411224, "卢氏县"),
-    (411281, "义马市"),
-    (411282, "灵宝市"),
-    (411300, "南阳市"),
-    (411301, "市辖区"),
-    (411302, "宛城区"),
-    (411303, "卧龙区"),
-    (411321, "南召县"),
-    (411322, "方城县"),
-    (411323, "西峡县"),
-    (411324, "镇平县"),
-    (411325, "内乡县"),
-    (411326, "淅川县"),
-    (411327, "社旗县"),
-    (411328, "唐河县"),
-    (411329, "新野县"),
-    (411330, "桐柏县"),
-    (411381, "邓州市"),
-    (411400, "商丘市"),
-    (411401, "市辖区"),
-    (411402, "梁园区"),
-    (411403, "睢阳区"),
-    (411421, "民权县"),
-    (411422, "睢县"),
-    (411423, "宁陵县"),
-    (411424, "柘城县"),
-    (411425, "虞城县"),
-    (411426, "夏邑县"),
-    (411481, "永城市"),
-    (411500, "信阳市"),
-    (411501, "市辖区"),
-    (411502, "浉河区"),
-    (411503, "平桥区"),
-    (411521, "罗山县"),
-    (411522, "光山县"),
-    (411523, "新县"),
-    (411524, "商城县"),
-    (411525, "固始县"),
-    (411526, "潢川县"),
-    (411527, "淮滨县"),
-    (411528, "息县"),
-    (411600, "周口市"),
-    (411601, "市辖区"),
-    (411602, "川汇区"),
-    (411621, "扶沟县"),
-    (411622, "西华县"),
-    (411623, "商水县"),
-    (411624, "沈丘县"),
-    (411625, "郸城县"),
-    (411626, "淮阳县"),
-    (411627, "太康县"),
-    (411628, "鹿邑县"),
-    (411681, "项城市"),
-    (411700, "驻马店市"),
-    (411701, "市辖区"),
-    (411702, "驿城区"),
-    (411721, "西平县"),
-    (411722, "上蔡县"),
-    (411723, "平舆县"),
-    (411724, "正阳县"),
-    (411725, "确山县"),
-    (411726, "泌阳县"),
-    (411727, "汝南县"),
-    (411728, "遂平县"),
-    (411729, "新蔡县"),
-    (420000, "湖北省"),
-    (420100, "武汉市"),
-    (420101, "市辖区"),
-    (420102, "江岸区"),
-    (420103, "江汉区"),
-    (420104, "硚口区"),
-    (420105, "汉阳区"),
-    (420106, "武昌区"),
-    (420107, "青山区"),
-    (420111, "洪山区"),
-    (420112, "东西湖区"),
-    (420113, "汉南区"),
-    (420114, "蔡甸区"),
-    (420115, "江夏区"),
-    (420116, "黄陂区"),
-    (420117, "武汉市新洲区"),
-    (420200, "黄石市"),
-    (420201, "市辖区"),
-    (420202, "黄石港区"),
-    (420203, "西塞山区"),
-    (420204, "下陆区"),
-    (420205, "铁山区"),
-    (420222, "阳新县"),
-    (420281, "大冶市"),
-    (420300, "十堰市"),
-    (420301, "市辖区"),
-    (420302, "茅箭区"),
-    (420303, "张湾区"),
-    (420321, "郧县"),
-    (420322, "郧西县"),
-    (420323, "竹山县"),
-    (420324, "竹溪县"),
-    (420325, "房县"),
-    (420381, "丹江口市"),
-    (420500, "宜昌市"),
-    (420501, "市辖区"),
-    (420502, "西陵区"),
-    (420503, "伍家岗区"),
-    (420504, "点军区"),
-    (420505, "猇亭区"),
-    (420506, "夷陵区"),
-    (420525, "远安县"),
-    (420526, "兴山县"),
-    (420527, "秭归县"),
-    (420528, "长阳土家族自治县"),
-    (420529, "五峰土家族自治县"),
-    (420581, "宜都市"),
-    (420582, "当阳市"),
-    (420583, "枝江市"),
-    (420600, "襄樊市"),
-    (420601, "市辖区"),
-    (420602, "襄城区"),
-    (420606, "樊城区"),
-    (420607, "襄阳区"),
-    (420624, "南漳县"),
-    (420625, "谷城县"),
-    (420626, "保康县"),
-    (420682, "老河口市"),
-    (420683, "枣阳市"),
-    (420684, "宜城市"),
-    (420700, "鄂州市"),
-    (420701, "市辖区"),
-    (420702, "粱子湖区"),
-    (420703, "华容区"),
-    (420704, "鄂城区"),
-    (420800, "荆门市"),
-    (420801, "市辖区"),
-    (420802, "东宝区"),
-    (420804, "掇刀区"),
-    (420821, "京山县"),
-    (420822, "沙洋县"),
-    (420881, "钟祥市"),
-    (420900, "孝感市"),
-    (420901, "市辖区"),
-    (420902, "孝南区"),
-    (420921, "孝昌县"),
-    (420922, "大悟县"),
-    (420923, "云梦县"),
-    (420981, "应城市"),
-    (420982, "安陆市"),
-    (420984, "汉川市"),
-    (421000, "荆州市"),
-    (421001, "市辖区"),
-    (421002, "沙市区"),
-    (421003, "荆州区"),
-    (421022, "公安县"),
-    (421023, "监利县"),
-    (421024, "江陵县"),
-    (421081, "石首市"),
-    (421083, "洪湖市"),
-    (421087, "松滋市"),
-    (421100, "黄冈市"),
-    (421101, "市辖区"),
-    (421102, "黄州区"),
-    (421121, "团风县"),
-    (421122, "红安县"),
-    (421123, "罗田县"),
-    (421124, "英山县"),
-    (421125, "浠水县"),
-    (421126, "蕲春县"),
-    (421127, "黄梅县"),
-    (421181, "麻城市"),
-    (421182, "武穴市"),
-    (421200, "咸宁市"),
-    (421201, "市辖区"),
-    (421202, "咸安区"),
-    (421221, "嘉鱼县"),
-    (421222, "通城县"),
-    (421223, "崇阳县"),
-    (421224, "通山县"),
-    (421281, "赤壁市"),
-    (421300, "随州市"),
-    (421301, "市辖区"),
-    (421302, "曾都区"),
-    (421381, "广水市"),
-    (422800, "恩施州"),
-    (422801, "恩施市"),
-    (422802, "利川市"),
-    (422822, "建始县"),
-    (422823, "巴东县"),
-    (422825, "宣恩县"),
-    (422826, "咸丰县"),
-    (422827, "来凤县"),
-    (422828, "鹤峰县"),
-    (429000, "省直辖行政单位"),
-    (429004, "仙桃市"),
-    (429005, "潜江市"),
-    (429006, "天门市"),
-    (429021, "神农架林区"),
-    (430000, "湖南省"),
-    (430100, "长沙市"),
-    (430101, "市辖区"),
-    (430102, "芙蓉区"),
-    (430103, "天心区"),
-    (430104, "岳麓区"),
-    (430105, "开福区"),
-    (430111, "雨花区"),
-    (430121, "长沙县"),
-    (430122, "望城县"),
-    (430124, "宁乡县"),
-    (430181, "浏阳市"),
-    (430200, "株洲市"),
-    (430201, "市辖区"),
-    (430202, "荷塘区"),
-    (430203, "芦淞区"),
-    (430204, "石峰区"),
-    (430211, "天元区"),
-    (430221, "株洲县"),
-    (430223, "攸县"),
-    (430224, "茶陵县"),
-    (430225, "炎陵县"),
-    (430281, "醴陵市"),
-    (430300, "湘潭市"),
-    (430301, "市辖区"),
-    (430302, "雨湖区"),
-    (430304, "岳塘区"),
-    (430321, "湘潭县"),
-    (430381, "湘乡市"),
-    (430382, "韶山市"),
-    (430400, "衡阳市"),
-    (430401, "市辖区"),
-    (430405, "珠晖区"),
-    (430406, "雁峰区"),
-    (430407, "石鼓区"),
-    (430408, "蒸湘区"),
-    (430412, "南岳区"),
-    (430421, "衡阳县"),
-    (430422, "衡南县"),
-    (430423, "衡山县"),
-    (430424, "衡东县"),
-    (430426, "祁东县"),
-    (430481, "耒阳市"),
-    (430482, "常宁市"),
-    (430500, "邵阳市"),
-    (430501, "市辖区"),
-    (430502, "双清区"),
-    (430503, "大祥区"),
-    (430511, "北塔区"),
-    (430521, "邵东县"),
-    (430522, "新邵县"),
-    (430523, "邵阳县"),
-    (430524, "隆回县"),
-    (430525, "洞口县"),
-    (430527, "绥宁县"),
-    (430528, "新宁县"),
-    (430529, "城步苗族自治县"),
-    (430581, "武冈市"),
-    (430600, "岳阳市"),
-    (430601, "市辖区"),
-    (430602, "岳阳楼区"),
-    (430603, "云溪区"),
-    (430611, "君山区"),
-    (430621, "岳阳县"),
-    (430623, "华容县"),
-    (430624, "湘阴县"),
-    (430626, "平江县"),
-    (430681, "汩罗市"),
-    (430682, "临湘市"),
-    (430700, "常德市"),
-    (430701, "市辖区"),
-    (430702, "武陵区"),
-    (430703, "鼎城区"),
-    (430721, "安乡县"),
-    (430722, "汉寿县"),
-    (430723, "澧县"),
-    (430724, "临澧县"),
-    (430725, "桃源县"),
-    (430726, "石门县"),
-    (430781, "津市市"),
-    (430800, "张家界市"),
-    (430801, "市辖区"),
-    (430802, "永定区"),
-    (430811, "武陵源区"),
-    (430821, "慈利县"),
-    (430822, "桑植县"),
-    (430900, "益阳市"),
-    (430901, "市辖区"),
-    (430902, "资阳区"),
-    (430903, "赫山区"),
-    (430921, "南县"),
-    (430922, "桃江县"),
-    (430923, "安化县"),
-    (430981, "沅江市"),
-    (431000, "郴州市"),
-    (431001, "市辖区"),
-    (431002, "北湖区"),
-    (431003, "苏仙区"),
-    (431021, "桂阳县"),
-    (431022, "宜章县"),
-    (431023, "永兴县"),
-    (431024, "嘉禾县"),
-    (431025, "临武县"),
-    (431026, "汝城县"),
-    (431027, "桂东县"),
-    (431028, "安仁县"),
-    (431081, "资兴市"),
-    (431100, "永州市"),
-    (431101, "市辖区"),
-    (431102, "零陵区"),
-    (431103, "冷水滩区"),
-    (431121, "祁阳县"),
-    (431122, "东安县"),
-    (431123, "双牌县"),
-    (431124, "道县"),
-    (431125, "江永县"),
-    (431126, "宁远县"),
-    (431127, "蓝山县"),
-    (431128, "新田县"),
-    (431129, "江华县"),
-    (431200, "怀化市"),
-    (431201, "市辖区"),
-    (431202, "鹤城区"),
-    (431221, "中方县"),
-    (431222, "沅陵县"),
-    (431223, "辰溪县"),
-    (431224, "溆浦县"),
-    (431225, "会同县"),
-    (431226, "麻阳苗族自治县"),
-    (431227, "新晃侗族自治县"),
-    (431228, "芷江侗族自治县"),
-    (431229, "靖州苗族侗族县"),
-    (431230, "通道侗族自治县"),
-    (431281, "洪江市"),
-    (431300, "娄底市"),
-    (431301, "市辖区"),
-    (431302, "娄星区"),
-    (431321, "双峰县"),
-    (431322, "新化县"),
-    (431381, "冷水江市"),
-    (431382, "涟源市"),
-    (433100, "湘西土家族苗族自治州"),
-    (433101, "吉首市"),
-    (433122, "泸溪县"),
-    (433123, "凤凰县"),
-    (433124, "花垣县"),
-    (433125, "保靖县"),
-    (433126, "古丈县"),
-    (433127, "永顺县"),
-    (433130, "龙山县"),
-    (440000, "广东省"),
-    (440100, "广州市"),
-    (440103, "荔湾区"),
-    (440104, "越秀区"),
-    (440105, "海珠区"),
-    (440106, "天河区"),
-    (440111, "白云区"),
-    (440112, "黄埔区"),
-    (440113, "番禺区"),
-    (440114, "花都区"),
-    (440115, "南沙区"),
-    (440116, "萝岗区"),
-    (440183, "增城市"),
-    (440184, "从化市"),
-    (440200, "韶关市"),
-    (440203, "武江区"),
-    (440204, "浈江区"),
-    (440205, "曲江区"),
-    (440222, "始兴县"),
-    (440224, "仁化县"),
-    (440229, "翁源县"),
-    (440232, "乳源瑶族自治县"),
-    (440233, "新丰县"),
-    (440281, "乐昌市"),
-    (440282, "南雄市"),
-    (440300, "深圳市"),
-    (440303, "罗湖区"),
-    (440304, "福田区"),
-    (440305, "南山区"),
-    (440306, "宝安区"),
-    (440307, "龙岗区"),
-    (440308, "盐田区"),
-    (440400, "珠海市"),
-    (440402, "香洲区"),
-    (440403, "斗门区"),
-    (440404, "金湾区"),
-    (440500, "汕头市"),
-    (440507, "龙湖区"),
-    (440511, "金平区"),
-    (440512, "濠江区"),
-    (440513, "潮阳区"),
-    (440514, "潮南区"),
-    (440515, "澄海区"),
-    (440523, "南澳县"),
-    (440600, "佛山市"),
-    (440604, "禅城区"),
-    (440605, "南海区"),
-    (440606, "顺德区"),
-    (440607, "三水区"),
-    (440608, "高明区"),
-    (440700, "江门市"),
-    (440703, "蓬江区"),
-    (440704, "江海区"),
-    (440705, "新会区"),
-    (440781, "台山市"),
-    (440783, "开平市"),
-    (440784, "鹤山市"),
-    (440785, "恩平市"),
-    (440800, "湛江市"),
-    (440802, "湛江市赤坎区"),
-    (440803, "湛江市霞山区"),
-    (440804, "湛江市坡头区"),
-    (440811, "湛江市麻章区"),
-    (440823, "遂溪县"),
-    (440825, "徐闻县"),
-    (440881, "廉江市"),
-    (440882, "雷州市"),
-    (440883, "吴川市"),
-    (440900, "茂名市"),
-    (440902, "茂南区"),
-    (440903, "茂港区"),
-    (440923, "电白县"),
-    (440981, "高州市"),
-    (440982, "化州市"),
-    (440983, "信宜市"),
-    (441200, "肇庆市"),
-    (441202, "端州区"),
-    (441203, "鼎湖区"),
-    (441223, "广宁县"),
-    (441224, "怀集县"),
-    (441225, "封开县"),
-    (441226, "德庆县"),
-    (441283, "高要市"),
-    (441284, "四会市"),
-    (441300, "惠州市"),
-    (441302, "惠城区"),
-    (441303, "惠阳区"),
-    (441322, "博罗县"),
-    (441323, "惠东县"),
-    (441324, "龙门县"),
-    (441400, "梅州市"),
-    (441402, "梅江区"),
-    (441421, "梅县"),
-    (441422, "大埔县"),
-    (441423, "丰顺县"),
-    (441424, "五华县"),
-    (441426, "平远县"),
-    (441427, "蕉岭县"),
-    (441481, "兴宁市"),
-    (441500, "汕尾市"),
-    (441501, "市辖区"),
-    (441502, "城区"),
-    (441521, "海丰县"),
-    (441523, "陆河县"),
-    (441581, "陆丰市"),
-    (441600, "河源市"),
-    (441602, "源城区"),
-    (441621, "紫金县"),
-    (441622, "龙川县"),
-    (441623, "连平县"),
-    (441624, "和平县"),
-    (441625, "东源县"),
-    (441700, "阳江市"),
-    (441702, "江城区"),
-    (441721, "阳西县"),
-    (441723, "阳东县"),
-    (441781, "阳春市"),
-    (441800, "清远市"),
-    (441802, "清城区"),
-    (441821, "佛冈县"),
-    (441823, "阳山县"),
-    (441825, "连山县"),
-    (441826, "连南瑶族自治县"),
-    (441827, "清新县"),
-    (441881, "英德市"),
-    (441882, "连州市"),
-    (441900, "东莞市"),
-    (441901, "市辖区"),
-    (442000, "中山市"),
-    (442001, "市辖区"),
-    (445100, "潮州市"),
-    (445102, "潮州市湘桥区"),
-    (445121, "潮州市潮安县"),
-    (445122, "潮州市饶平县"),
-    (445200, "揭阳市"),
-    (445202, "榕城区"),
-    (445221, "揭东县"),
-    (445222, "揭西县"),
-    (445224, "惠来县"),
-    (445281, "普宁市"),
-    (445300, "云浮市"),
-    (445302, "云城区"),
-    (445321, "新兴县"),
-    (445322, "郁南县"),
-    (445323, "云安县"),
-    (445381, "罗定市"),
-    (450000, "广西壮族自治区"),
-    (450100, "南宁市"),
-    (450101, "市辖区"),
-    (450102, "兴宁区"),
-    (450103, "青秀区"),
-    (450105, "江南区"),
-    (450107, "西乡塘区"),
-    (450108, "良庆区"),
-    (450109, "邕宁区"),
-    (450122, "武鸣县"),
-    (450123, "隆安县"),
-    (450124, "马山县"),
-    (450125, "上林县"),
-    (450126, "宾阳县"),
-    (450127, "横县"),
-    (450200, "柳州市"),
-    (450201, "市辖区"),
-    (450202, "城中区"),
-    (450203, "鱼峰区"),
-    (450204, "柳南区"),
-    (450205, "柳北区"),
-    (450221, "柳江县"),
-    (450222, "柳城县"),
-    (450223, "鹿寨县"),
-    (450224, "融安县"),
-    (450225, "融水苗族自治县"),
-    (450226, "三江侗族自治县"),
-    (450300, "桂林市"),
-    (450301, "市辖区"),
-    (450302, "秀峰区"),
-    (450303, "叠彩区"),
-    (450304, "象山区"),
-    (450305, "七星区"),
-    (450311, "雁山区"),
-    (450321, "阳朔县"),
-    (450322, "临桂县"),
-    (450323, "灵川县"),
-    (450324, "全州县"),
-    (450325, "兴安县"),
-    (450326, "永福县"),
-    (450327, "灌阳县"),
-    (450328, "龙胜各族自治县"),
-    (450329, "资源县"),
-    (450330, "平乐县"),
-    (450331, "荔浦县"),
-    (450332, "恭城县"),
-    (450400, "梧州市"),
-    (450401, "市辖区"),
-    (450403, "万秀区"),
-    (450404, "蝶山区"),
-    (450405, "长洲区"),
-    (450421, "苍梧县"),
-    (450422, "藤县"),
-    (450423, "蒙山县"),
-    (450481, "岑溪市"),
-    (450500, "北海市"),
-    (450501, "市辖区"),
-    (450502, "海城区"),
-    (450503, "银海区"),
-    (450512, "铁山港区"),
-    (450521, "合浦县"),
-    (450600, "防城港市"),
-    (450601, "市辖区"),
-    (450602, "港口区"),
-    (450603, "防城区"),
-    (450621, "上思县"),
-    (450681, "东兴市"),
-    (450700, "钦州市"),
-    (450701, "市辖区"),
-    (450702, "钦南区"),
-    (450703, "钦北区"),
-    (450721, "灵山县"),
-    (450722, "浦北县"),
-    (450800, "贵港市"),
-    (450801, "市辖区"),
-    (450802, "港北区"),
-    (450803, "港南区"),
-    (450804, "覃塘区"),
-    (450821, "平南县"),
-    (450881, "桂平市"),
-    (450900, "玉林市"),
-    (450901, "市辖区"),
-    (450902, "玉州区"),
-    (450921, "容县"),
-    (450922, "陆川县"),
-    (450923, "博白县"),
-    (450924, "兴业县"),
-    (450981, "北流市"),
-    (451000, "百色市"),
-    (451001, "市辖区"),
-    (451002, "右江区"),
-    (451021, "田阳县"),
-    (451022, "田东县"),
-    (451023, "平果县"),
-    (451024, "德保县"),
-    (451025, "靖西县"),
-    (451026, "那坡县"),
-    (451027, "凌云县"),
-    (451028, "乐业县"),
-    (451029, "田林县"),
-    (451030, "西林县"),
-    (451031, "隆林各族自治县"),
-    (451100, "贺州市"),
-    (451101, "市辖区"),
-    (451102, "八步区"),
-    (451121, "昭平县"),
-    (451122, "钟山县"),
-    (451123, "富川瑶族自治县"),
-    (451200, "河池市"),
-    (451201, "市辖区"),
-    (451202, "金城江区"),
-    (451221, "南丹县"),
-    (451222, "天峨县"),
-    (451223, "凤山县"),
-    (451224, "东兰县"),
-    (451225, "罗城仫佬族自治县"),
-    (451226, "环江毛南族自治县"),
-    (451227, "巴马瑶族自治县"),
-    (451228, "都安瑶族自治县"),
-    (451229, "大化瑶族自治县"),
-    (451281, "宜州市"),
-    (451300, "来宾市"),
-    (451301, "市辖区"),
-    (451302, "兴宾区"),
-    (451321, "忻城县"),
-    (451322, "象州县"),
-    (451323, "武宣县"),
-    (451324, "金秀瑶族自治县"),
-    (451381, "合山市"),
-    (451400, "崇左市"),
-    (451401, "市辖区"),
-    (451402, "江州区"),
-    (451421, "扶绥县"),
-    (451422, "宁明县"),
-    (451423, "龙州县"),
-    (451424, "大新县"),
-    (451425, "天等县"),
-    (451481, "凭祥市"),
-    (460000, "海南省"),
-    (460100, "海口市"),
-    (460101, "市辖区"),
-    (460105, "秀英区"),
-    (460106, "龙华区"),
-    (460107, "琼山区"),
-    (460108, "美兰区"),
-    (460200, "三亚市"),
-    (460201, "市辖区"),
-    (469000, "省属虚拟市"),
-    (469001, "五指山市"),
-    (469002, "琼海市"),
-    (469003, "儋州市"),
-    (469005, "文昌市"),
-    (469006, "万宁市"),
-    (469007, "东方市"),
-    (469025, "定安县"),
-    (469026, "屯昌县"),
-    (469027, "澄迈县"),
-    (469028, "临高县"),
-    (469030, "白沙黎族自治县"),
-    (469031, "昌江黎族自治县"),
-    (469033, "乐东黎族自治县"),
-    (469034, "陵水黎族自治县"),
-    (469035, "保亭黎族苗族自治县"),
-    (469036, "琼中黎族苗族自治县"),
-    (469037, "西沙群岛"),
-    (469038, "南沙群岛"),
-    (469039, "中沙群岛的岛礁及其海域"),
-    (500000, "重庆市"),
-    (500100, "市辖区"),
-    (500101, "万州区"),
-    (500102, "涪陵区"),
-    (500103, "渝中区"),
-    (500104, "大渡口区"),
-    (500105, "江北区"),
-    (500106, "沙坪坝区"),
-    (500107, "九龙坡区"),
-    (500108, "南岸区"),
-    (500109, "北碚区"),
-    (500110, "万盛区"),
-    (500111, "双桥区"),
-    (500112, "渝北区"),
-    (500113, "巴南区"),
-    (500114, "黔江区"),
-    (500115, "长寿区"),
-    (500116, "江津区"),
-    (500117, "合川区"),
-    (500118, "永川区"),
-    (500119, "南川区"),
-    (500200, "县"),
-    (500222, "綦江县"),
-    (500223, "潼南县"),
-    (500224, "铜梁县"),
-    (500225, "大足县"),
-    (500226, "荣昌县"),
-    (500227, "璧山县"),
-    (500228, "梁平县"),
-    (500229, "城口县"),
-    (500230, "丰都县"),
-    (500231, "垫江县"),
-    (500232, "武隆县"),
-    (500233, "忠县"),
-    (500234, "开县"),
-    (500235, "云阳县"),
-    (500236, "奉节县"),
-    (500237, "巫山县"),
-    (500238, "巫溪县"),
-    (500240, "石柱县"),
-    (500241, "秀山土家族苗族自治县"),
-    (500242, "酉阳土家族苗族自治县"),
-    (500243, "彭水苗族土家族自治县"),
-    (510000, "四川省"),
-    (510100, "成都市"),
-    (510101, "市辖区"),
-    (510104, "锦江区"),
-    (510105, "青羊区"),
-    (510106, "金牛区"),
-    (510107, "武侯区"),
-    (510108, "成华区"),
-    (510112, "龙泉驿区"),
-    (510113, "青白江区"),
-    (510114, "新都区"),
-    (510115, "温江区"),
-    (510121, "金堂县"),
-    (510122, "双流县"),
-    (510124, "郫县"),
-    (510129, "大邑县"),
-    (510131, "蒲江县"),
-    (510132, "新津县"),
-    (510181, "都江堰市"),
-    (510182, "彭州市"),
-    (510183, "邛崃市"),
-    (510184, "崇州市"),
-    (510300, "自贡市"),
-    (510301, "市辖区"),
-    (510302, "自流井区"),
-    (510303, "贡井区"),
-    (510304, "大安区"),
-    (510311, "沿滩区"),
-    (510321, "荣县"),
-    (510322, "富顺县"),
-    (510400, "攀枝花市"),
-    (510401, "市辖区"),
-    (510402, "攀枝花东区"),
-    (510403, "西区"),
-    (510411, "仁和区"),
-    (510421, "米易县"),
-    (510422, "盐边县"),
-    (510500, "泸州市"),
-    (510501, "市辖区"),
-    (510502, "江阳区"),
-    (510503, "纳溪区"),
-    (510504, "龙马潭区"),
-    (510521, "泸县"),
-    (510522, "合江县"),
-    (510524, "叙永县"),
-    (510525, "古蔺县"),
-    (510600, "德阳市"),
-    (510601, "市辖区"),
-    (510603, "旌阳区"),
-    (510623, "中江县"),
-    (510626, "罗江县"),
-    (510681, "广汉市"),
-    (510682, "什邡市"),
-    (510683, "绵竹市"),
-    (510700, "绵阳市"),
-    (510701, "市辖区"),
-    (510703, "涪城区"),
-    (510704, "游仙区"),
-    (510722, "三台县"),
-    (510723, "盐亭县"),
-    (510724, "安县"),
-    (510725, "梓潼县"),
-    (510726, "北川羌族自治县"),
-    (510727, "平武县"),
-    (510781, "江油市"),
-    (510800, "广元市"),
-    (510801, "市辖区"),
-    (510802, "市中区"),
-    (510811, "元坝区"),
-    (510812, "朝天区"),
-    (510821, "旺苍县"),
-    (510822, "青川县"),
-    (510823, "剑阁县"),
-    (510824, "苍溪县"),
-    (510900, "遂宁市"),
-    (510901, "市辖区"),
-    (510903, "船山区"),
-    (510904, "安居区"),
-    (510921, "蓬溪县"),
-    (510922, "射洪县"),
-    (510923, "大英县"),
-    (511000, "内江市"),
-    (511001, "市辖区"),
-    (511002, "市中区"),
-    (511011, "东兴区"),
-    (511024, "威远县"),
-    (511025, "资中县"),
-    (511028, "隆昌县"),
-    (511100, "乐山市"),
-    (511101, "市辖区"),
-    (511102, "市中区"),
-    (511111, "沙湾区"),
-    (511112, "五通桥区"),
-    (511113, "金口河区"),
-    (511123, "犍为县"),
-    (511124, "井研县"),
-    (511126, "夹江县"),
-    (511129, "沐川县"),
-    (511132, "峨边彝族自治县"),
-    (511133, "马边彝族自治县"),
-    (511181, "峨眉山市"),
-    (511300, "南充市"),
-    (511301, "市辖区"),
-    (511302, "顺庆区"),
-    (511303, "高坪区"),
-    (511304, "嘉陵区"),
-    (511321, "南部县"),
-    (511322, "营山县"),
-    (511323, "蓬安县"),
-    (511324, "仪陇县"),
-    (511325, "西充县"),
-    (511381, "阆中市"),
-    (511400, "眉山市"),
-    (511401, "市辖区"),
-    (511402, "东坡区"),
-    (511421, "仁寿县"),
-    (511422, "彭山县"),
-    (511423, "洪雅县"),
-    (511424, "丹棱县"),
-    (511425, "青神县"),
-    (511500, "宜宾市"),
-    (511501, "市辖区"),
-    (511502, "翠屏区"),
-    (511521, "宜宾县"),
-    (511522, "南溪县"),
-    (511523, "江安县"),
-    (511524, "长宁县"),
-    (511525, "高县"),
-    (511526, "珙县"),
-    (511527, "筠连县"),
-    (511528, "兴文县"),
-    (511529, "屏山县"),
-    (511600, "广安市"),
-    (511601, "市辖区"),
-    (511602, "广安区"),
-    (511621, "岳池县"),
-    (511622, "武胜县"),
-    (511623, "邻水县"),
-    (511681, "华蓥市"),
-    (511700, "达州市"),
-    (511701, "市辖区"),
-    (511702, "通川区"),
-    (511721, "达县"),
-    (511722, "宣汉县"),
-    (511723, "开江县"),
-    (511724, "大竹县"),
-    (511725, "渠县"),
-    (511781, "万源市"),
-    (511800, "雅安市"),
-    (511801, "市辖区"),
-    (511802, "雨城区"),
-    (511821, "名山县"),
-    (511822, "荥经县"),
-    (511823, "汉源县"),
-    (511824, "石棉县"),
-    (511825, "天全县"),
-    (511826, "芦山县"),
-    (511827, "宝兴县"),
-    (511900, "巴中市"),
-    (511901, "市辖区"),
-    (511902, "巴州区"),
-    (511921, "通江县"),
-    (511922, "南江县"),
-    (511923, "平昌县"),
-    (512000, "资阳市"),
-    (512001, "市辖区"),
-    (512002, "雁江区"),
-    (512021, "安岳县"),
-    (512022, "乐至县"),
-    (512081, "简阳市"),
-    (513200, "阿坝州"),
-    (513221, "汶川县"),
-    (513222, "理县"),
-    (513223, "茂县"),
-    (513224, "松潘县"),
-    (513225, "九寨沟县"),
-    (513226, "金川县"),
-    (513227, "小金县"),
-    (513228, "黑水县"),
-    (513229, "马尔康县"),
-    (513230, "壤塘县"),
-    (513231, "阿坝县"),
-    (513232, "若尔盖县"),
-    (513233, "红原县"),
-    (513300, "甘孜藏族自治州"),
-    (513321, "康定县"),
-    (513322, "泸定县"),
-    (513323, "丹巴县"),
-    (513324, "九龙县"),
-    (513325, "雅江县"),
-    (513326, "道孚县"),
-    (513327, "炉霍县"),
-    (513328, "甘孜县"),
-    (513329, "新龙县"),
-    (513330, "德格县"),
-    (513331, "白玉县"),
-    (513332, "石渠县"),
-    (513333, "色达县"),
-    (513334, "理塘县"),
-    (513335, "巴塘县"),
-    (513336, "乡城县"),
-    (513337, "稻城县"),
-    (513338, "得荣县"),
-    (513400, "凉山州"),
-    (513401, "西昌市"),
-    (513422, "木里藏族自治县"),
-    (513423, "盐源县"),
-    (513424, "德昌"),
-    (513425, "会理县"),
-    (513426, "会东县"),
-    (513427, "宁南县"),
-    (513428, "普格县"),
-    (513429, "布拖县"),
-    (513430, "金阳县"),
-    (513431, "昭觉县"),
-    (513432, "喜德县"),
-    (513433, "冕宁县"),
-    (513434, "越西县"),
-    (513435, "甘洛县"),
-    (513436, "美姑县"),
-    (513437, "雷波县"),
-    (520000, "贵州省"),
-    (520100, "贵阳市"),
-    (520101, "市辖区"),
-    (520102, "南明区"),
-    (520103, "云岩区"),
-    (520111, "花溪区"),
-    (520112, "乌当区"),
-    (520113, "白云区"),
-    (520114, "小河区"),
-    (520121, "开阳县"),
-    (520122, "息烽县"),
-    (520123, "修文县"),
-    (520181, "清镇市"),
-    (520200, "六盘水市"),
-    (520201, "钟山区"),
-    (520203, "六枝特区"),
-    (520221, "水城县"),
-    (520222, "盘县"),
-    (520300, "遵义市"),
-    (520301, "市辖区"),
-    (520302, "红花岗区"),
-    (520303, "汇川区"),
-    (520321, "遵义县"),
-    (520322, "桐梓县"),
-    (520323, "绥阳县"),
-    (520324, "正安县"),
-    (520325, "道真仡佬族苗族自治县"),
-    (520326, "务川仡佬族苗族自治县"),
-    (520327, "凤冈县"),
-    (520328, "湄潭县"),
-    (520329, "余庆县"),
-    (520330, "习水县"),
-    (520381, "赤水市"),
-    (520382, "仁怀市"),
-    (520400, "安顺市"),
-    (520401, "市辖区"),
-    (520402, "西秀区"),
-    (520421, "平坝县"),
-    (520422, "普定县"),
-    (520423, "镇宁布依族苗族自治县"),
-    (520424, "关岭自治县"),
-    (520425, "紫云苗族布依族自治县"),
-    (522200, "铜仁地区"),
-    (522201, "铜仁市"),
-    (522222, "江口县"),
-    (522223, "玉屏侗族自治县"),
-    (522224, "石阡县"),
-    (522225, "思南县"),
-    (522226, "印江土家族苗族自治县"),
-    (522227, "德江县"),
-    (522228, "沿河土家族自治县"),
-    (522229, "松桃苗族自治县"),
-    (522230, "万山特区"),
-    (522300, "黔西南州"),
-    (522301, "兴义市"),
-    (522322, "兴仁县"),
-    (522323, "普安县"),
-    (522324, "晴隆县"),
-    (522325, "贞丰县"),
-    (522326, "望谟县"),
-    (522327, "册亨县"),
-    (522328, "安龙县"),
-    (522400, "毕节地区"),
-    (522401, "毕节市"),
-    (522422, "大方县"),
-    (522423, "黔西县"),
-    (522424, "金沙县"),
-    (522425, "织金县"),
-    (522426, "纳雍县"),
-    (522427, "威宁彝族回族苗族自治县"),
-    (522428, "赫章县"),
-    (522600, "黔东南苗族侗族自治州"),
-    (522601, "凯里市"),
-    (522622, "黄平县"),
-    (522623, "施秉县"),
-    (522624, "三穗县"),
-    (522625, "镇远县"),
-    (522626, "岑巩县"),
-    (522627, "天柱县"),
-    (522628, "锦屏县"),
-    (522629, "剑河县"),
-    (522630, "台江县"),
-    (522631, "黎平县"),
-    (522632, "榕江县"),
-    (522633, "从江县"),
-    (522634, "雷山县"),
-    (522635, "麻江县"),
-    (522636, "丹寨县"),
-    (522700, "黔南布依族苗族自治州"),
-    (522701, "都匀市"),
-    (522702, "福泉市"),
-    (522722, "荔波县"),
-    (522723, "贵定县"),
-    (522725, "瓮安县"),
-    (522726, "独山县"),
-    (522727, "平塘县"),
-    (522728, "罗甸县"),
-    (522729, "长顺县"),
-    (522730, "龙里县"),
-    (522731, "惠水县"),
-    (522732, "三都水族自治县"),
-    (530000, "云南省"),
-    (530100, "昆明市"),
-    (530101, "市辖区"),
-    (530102, "五华区"),
-    (530103, "盘龙区"),
-    (530111, "官渡区"),
-    (530112, "西山区"),
-    (530113, "东川区"),
-    (530121, "呈贡县"),
-    (530122, "晋宁县"),
-    (530124, "富民县"),
-    (530125, "宜良县"),
-    (530126, "石林县"),
-    (530127, "嵩明县"),
-    (530128, "禄劝县"),
-    (530129, "寻甸县"),
-    (530181, "安宁市"),
-    (530300, "曲靖市"),
-    (530301, "市辖区"),
-    (530302, "麒麟区"),
-    (530321, "马龙县"),
-    (530322, "陆良县"),
-    (530323, "师宗县"),
-    (530324, "罗平县"),
-    (530325, "富源县"),
-    (530326, "会泽县"),
-    (530328, "沾益县"),
-    (530381, "宣威市"),
-    (530400, "玉溪市"),
-    (530401, "市辖区"),
-    (530402, "红塔区"),
-    (530421, "江川县"),
-    (530422, "澄江县"),
-    (530423, "通海县"),
-    (530424, "华宁县"),
-    (530425, "易门县"),
-    (530426, "峨山县"),
-    (530427, "新平县"),
-    (530428, "元江县"),
-    (530500, "保山市"),
-    (530501, "市辖区"),
-    (530502, "隆阳区"),
-    (530521, "施甸县"),
-    (530522, "腾冲县"),
-    (530523, "龙陵县"),
-    (530524, "昌宁县"),
-    (530600, "昭通市"),
-    (530601, "市辖区"),
-    (530602, "昭阳区"),
-    (530621, "鲁甸县"),
-    (530622, "巧家县"),
-    (530623, "盐津县"),
-    (530624, "大关县"),
-    (530625, "永善县"),
-    (530626, "绥江县"),
-    (530627, "镇雄县"),
-    (530628, "彝良县"),
-    (530629, "威信县"),
-    (530630, "水富县"),
-    (530700, "丽江市"),
-    (530701, "市辖区"),
-    (530702, "古城区"),
-    (530721, "玉龙县"),
-    (530722, "永胜县"),
-    (530723, "华坪县"),
-    (530724, "宁蒗县"),
-    (530800, "思茅市"),
-    (530801, "市辖区"),
-    (530802, "翠云区"),
-    (530821, "普洱县"),
-    (530822, "墨江县"),
-    (530823, "景东县"),
-    (530824, "景谷县"),
-    (530825, "镇沅县"),
-    (530826, "江城县"),
-    (530827, "孟连县"),
-    (530828, "澜沧县"),
-    (530829, "西盟县"),
-    (530900, "临沧市"),
-    (530901, "市辖区"),
-    (530902, "临翔区"),
-    (530921, "凤庆县"),
-    (530922, "云县"),
-    (530923, "永德县"),
-    (530924, "镇康县"),
-    (530925, "双江县"),
-    (530926, "耿马县"),
-    (530927, "沧源县"),
-    (532300, "楚雄州"),
-    (532301, "楚雄市"),
-    (532322, "双柏县"),
-    (532323, "牟定县"),
-    (532324, "南华县"),
-    (532325, "姚安县"),
-    (532326, "大姚县"),
-    (532327, "永仁县"),
-    (532328, "元谋县"),
-    (532329, "武定县"),
-    (532331, "禄丰县"),
-    (532500, "红河州"),
-    (532501, "个旧市"),
-    (532502, "开远市"),
-    (532522, "蒙自县"),
-    (532523, "屏边县"),
-    (532524, "建水县"),
-    (532525, "石屏县"),
-    (532526, "弥勒县"),
-    (532527, "泸西县"),
-    (532528, "元阳县"),
-    (532529, "红河县"),
-    (532530, "金平县"),
-    (532531, "绿春县"),
-    (532532, "河口县"),
-    (532600, "文山州"),
-    (532621, "文山县"),
-    (532622, "砚山县"),
-    (532623, "西畴县"),
-    (532624, "麻栗坡县"),
-    (532625, "马关县"),
-    (532626, "丘北县"),
-    (532627, "广南县"),
-    (532628, "富宁县"),
-    (532800, "西双版纳州"),
-    (532801, "景洪市"),
-    (532822, "勐海县"),
-    (532823, "勐腊县"),
-    (532900, "大理州"),
-    (532901, "大理市"),
-    (532922, "漾濞县"),
-    (532923, "祥云县"),
-    (532924, "宾川县"),
-    (532925, "弥渡县"),
-    (532926, "南涧县"),
-    (532927, "巍山县"),
-    (532928, "永平县"),
-    (532929, "云龙县"),
-    (532930, "洱源县"),
-    (532931, "剑川县"),
-    (532932, "鹤庆县"),
-    (533100, "德宏州"),
-    (533102, "瑞丽市"),
-    (533103, "潞西市"),
-    (533122, "梁河县"),
-    (533123, "盈江县"),
-    (533124, "陇川县"),
-    (533300, "怒江州"),
-    (533321, "泸水县"),
-    (533323, "福贡县"),
-    (533324, "贡山县"),
-    (533325, "兰坪县"),
-    (533400, "迪庆州"),
-    (533421, "香格里拉县"),
-    (533422, "德钦县"),
-    (533423, "维西县"),
-    (540000, "西藏自治区"),
-    (540100, "拉萨市"),
-    (540102, "城关区"),
-    (540121, "林周县"),
-    (540122, "当雄县"),
-    (540123, "尼木县"),
-    (540124, "曲水县"),
-    (540125, "堆龙德庆"),
-    (540126, "达孜县"),
-    (540127, "墨竹工卡县"),
-    (542100, "昌都地区"),
-    (542121, "昌都县"),
-    (542122, "江达县"),
-    (542123, "贡觉县"),
-    (542124, "类乌齐县"),
-    (542125, "丁青县"),
-    (542126, "察亚县"),
-    (542127, "八宿县"),
-    (542128, "左贡县"),
-    (542129, "芒康县"),
-    (542132, "洛隆县"),
-    (542133, "边坝县"),
-    (542200, "山南地区"),
-    (542221, "乃东县"),
-    (542222, "扎囊县"),
-    (542223, "贡嘎县"),
-    (542224, "桑日县"),
-    (542225, "琼结县"),
-    (542226, "曲松县"),
-    (542227, "措美县"),
-    (542228, "洛扎县"),
-    (542229, "加查县"),
-    (542231, "隆子县"),
-    (542232, "错那县"),
-    (542233, "浪卡子县"),
-    (542300, "日喀则地区"),
-    (542301, "日喀则市"),
-    (542322, "南木林县"),
-    (542323, "江孜县"),
-    (542324, "定日县"),
-    (542325, "萨迦县"),
-    (542326, "拉孜县"),
-    (542327, "昂仁县"),
-    (542328, "谢通门县"),
-    (542329, "白朗县"),
-    (542330, "仁布县"),
-    (542331, "康马县"),
-    (542332, "定结县"),
-    (542333, "仲巴县"),
-    (542334, "亚东县"),
-    (542335, "吉隆县"),
-    (542336, "聂拉木县"),
-    (542337, "萨嘎县"),
-    (542338, "岗巴县"),
-    (542400, "那曲地区"),
-    (542421, "那曲县"),
-    (542422, "嘉黎县"),
-    (542423, "比如县"),
-    (542424, "聂荣县"),
-    (542425, "安多县"),
-    (542426, "申扎县"),
-    (542427, "索县"),
-    (542428, "班戈县"),
-    (542429, "巴青县"),
-    (542430, "尼玛县"),
-    (542500, "阿里地区"),
-    (542521, "普兰县"),
-    (542522, "札达县"),
-    (542523, "噶尔县"),
-    (542524, "日土县"),
-    (542525, "革吉县"),
-    (542526, "改则县"),
-    (542527, "措勤县"),
-    (542600, "林芝地区"),
-    (542621, "林芝县"),
-    (542622, "工布江达县"),
-    (542623, "米林县"),
-    (542624, "墨脱县"),
-    (542625, "波密县"),
-    (542626, "察隅县"),
-    (542627, "朗县"),
-    (610000, "陕西省"),
-    (610100, "西安市"),
-    (610101, "市辖区"),
-    (610102, "新城区"),
-    (610103, "碑林区"),
-    (610104, "莲湖区"),
-    (610111, "灞桥区"),
-    (610112, "未央区"),
-    (610113, "雁塔区"),
-    (610114, "阎良区"),
-    (610115, "临潼区"),
-    (610116, "长安区"),
-    (610122, "蓝田县"),
-    (610124, "周至县"),
-    (610125, "户县"),
-    (610126, "高陵县"),
-    (610200, "铜川市"),
-    (610201, "市辖区"),
-    (610202, "王益区"),
-    (610203, "印台区"),
-    (610204, "耀州区"),
-    (610222, "宜君县"),
-    (610300, "宝鸡市"),
-    (610301, "市辖区"),
-    (610302, "渭滨区"),
-    (610303, "金台区"),
-    (610304, "陈仓区"),
-    (610322, "凤翔县"),
-    (610323, "岐山县"),
-    (610324, "扶风县"),
-    (610326, "眉县"),
-    (610327, "陇县"),
-    (610328, "千阳县"),
-    (610329, "麟游县"),
-    (610330, "凤县"),
-    (610331, "太白县"),
-    (610400, "咸阳市"),
-    (610401, "市辖区"),
-    (610402, "秦都区"),
-    (610403, "杨凌区"),
-    (610404, "渭城区"),
-    (610422, "三原县"),
-    (610423, "泾阳县"),
-    (610424, "乾县"),
-    (610425, "礼泉县"),
-    (610426, "永寿县"),
-    (610427, "彬县"),
-    (610428, "长武县"),
-    (610429, "旬邑县"),
-    (610430, "淳化县"),
-    (610431, "武功县"),
-    (610481, "兴平市"),
-    (610500, "渭南市"),
-    (610501, "市辖区"),
-    (610502, "临渭区"),
-    (610521, "华县"),
-    (610522, "潼关县"),
-    (610523, "大荔县"),
-    (610524, "合阳县"),
-    (610525, "澄城县"),
-    (610526, "蒲城县"),
-    (610527, "白水县"),
-    (610528, "富平县"),
-    (610581, "韩城市"),
-    (610582, "华阴市"),
-    (610600, "延安市"),
-    (610601, "市辖区"),
-    (610602, "宝塔区"),
-    (610621, "延长县"),
-    (610622, "延川县"),
-    (610623, "子长县"),
-    (610624, "安塞县"),
-    (610625, "志丹县"),
-    (610626, "吴起县"),
-    (610627, "甘泉县"),
-    (610628, "富县"),
-    (610629, "洛川县"),
-    (610630, "宜川县"),
-    (610631, "黄龙县"),
-    (610632, "黄陵县"),
-    (610700, "汉中市"),
-    (610701, "市辖区"),
-    (610702, "汉台区"),
-    (610721, "南郑县"),
-    (610722, "城固县"),
-    (610723, "洋县"),
-    (610724, "西乡县"),
-    (610725, "勉县"),
-    (610726, "宁强县"),
-    (610727, "略阳县"),
-    (610728, "镇巴县"),
-    (610729, "留坝县"),
-    (610730, "佛坪县"),
-    (610800, "榆林市"),
-    (610801, "市辖区"),
-    (610802, "榆阳区"),
-    (610821, "神木县"),
-    (610822, "府谷县"),
-    (610823, "横山县"),
-    (610824, "靖边县"),
-    (610825, "定边县"),
-    (610826, "绥德县"),
-    (610827, "米脂县"),
-    (610828, "佳县"),
-    (610829, "吴堡县"),
-    (610830, "清涧县"),
-    (610831, "子洲县"),
-    (610900, "安康市"),
-    (610901, "市辖区"),
-    (610902, "汉滨区"),
-    (610921, "汉阴县"),
-    (610922, "石泉县"),
-    (610923, "宁陕县"),
-    (610924, "紫阳县"),
-    (610925, "岚皋县"),
-    (610926, "平利县"),
-    (610927, "镇坪县"),
-    (610928, "旬阳县"),
-    (610929, "白河县"),
-    (611000, "商洛市"),
-    (611001, "市辖区"),
-    (611002, "商州区"),
-    (611021, "洛南县"),
-    (611022, "丹凤县"),
-    (611023, "商南县"),
-    (611024, "山阳县"),
-    (611025, "镇安县"),
-    (611026, "柞水县"),
-    (620000, "甘肃省"),
-    (620100, "兰州市"),
-    (620101, "市辖区"),
-    (620102, "城关区"),
-    (620103, "七里河区"),
-    (620104, "兰州市西固区"),
-    (620105, "安宁区"),
-    (620111, "红古区"),
-    (620121, "永登县"),
-    (620122, "皋兰县"),
-    (620123, "榆中县"),
-    (620200, "嘉峪关市"),
-    (620201, "市辖"),
-    (620300, "金昌市"),
-    (620301, "市辖区"),
-    (620302, "金川区"),
-    (620321, "永昌县"),
-    (620400, "白银市"),
-    (620401, "市辖区"),
-    (620402, "白银区"),
-    (620403, "平川区"),
-    (620421, "靖远县"),
-    (620422, "会宁县"),
-    (620423, "景泰县"),
-    (620500, "天水市"),
-    (620501, "市辖区"),
-    (620502, "秦州区"),
-    (620503, "麦积区"),
-    (620521, "清水县"),
-    (620522, "秦安县"),
-    (620523, "甘谷县"),
-    (620524, "武山县"),
-    (620525, "张家川县"),
-    (620600, "武威市"),
-    (620601, "市辖区"),
-    (620602, "凉州区"),
-    (620621, "民勤县"),
-    (620622, "古浪县"),
-    (620623, "天祝县"),
-    (620700, "张掖市"),
-    (620701, "市辖区"),
-    (620702, "甘州区"),
-    (620721, "肃南裕固族自治县"),
-    (620722, "民乐县"),
-    (620723, "临泽县"),
-    (620724, "高台县"),
-    (620725, "山丹县"),
-    (620800, "平凉市"),
-    (620801, "市辖区"),
-    (620802, "崆峒区"),
-    (620821, "泾川县"),
-    (620822, "灵台县"),
-    (620823, "崇信县"),
-    (620824, "华亭县"),
-    (620825, "庄浪县"),
-    (620826, "静宁县"),
-    (620900, "酒泉市"),
-    (620901, "市辖区"),
-    (620902, "肃州区"),
-    (620921, "金塔县"),
-    (620922, "瓜州县"),
-    (620923, "肃北蒙古族自治县"),
-    (620924, "阿克塞县"),
-    (620981, "玉门市"),
-    (620982, "敦煌市"),
-    (621000, "庆阳市"),
-    (621001, "市辖区"),
-    (621002, "西峰区"),
-    (621021, "庆城县"),
-    (621022, "环县"),
-    (621023, "华池县"),
-    (621024, "合水县"),
-    (621025, "正宁县"),
-    (621026, "宁县"),
-    (621027, "镇原县"),
-    (621100, "定西市"),
-    (621101, "市辖区"),
-    (621102, "安定区"),
-    (621121, "通渭县"),
-    (621122, "陇西县"),
-    (621123, "渭源县"),
-    (621124, "临洮县"),
-    (621125, "漳县"),
-    (621126, "岷县"),
-    (621200, "陇南市"),
-    (621201, "市辖区"),
-    (621202, "武都区"),
-    (621221, "成县"),
-    (621222, "文县"),
-    (621223, "宕昌县"),
-    (621224, "康县"),
-    (621225, "西和县"),
-    (621226, "礼县"),
-    (621227, "徽县"),
-    (621228, "两当县"),
-    (622900, "临夏州"),
-    (622901, "临夏市"),
-    (622921, "临夏县"),
-    (622922, "康乐县"),
-    (622923, "永靖县"),
-    (622924, "广河县"),
-    (622925, "和政县"),
-    (622926, "东乡族自治县"),
-    (622927, "积石山县"),
-    (623000, "甘南州"),
-    (623001, "合作市"),
-    (623021, "临潭县"),
-    (623022, "卓尼县"),
-    (623023, "舟曲县"),
-    (623024, "迭部县"),
-    (623025, "玛曲县"),
-    (623026, "碌曲县"),
-    (623027, "夏河县"),
-    (630000, "青海省"),
-    (630100, "西宁市"),
-    (630102, "城东区"),
-    (630103, "城中区"),
-    (630104, "城西区"),
-    (630105, "城北区"),
-    (630121, "大通回族土族自治县"),
-    (630122, "湟中县"),
-    (630123, "湟源县"),
-    (632100, "海东地区"),
-    (632121, "平安县"),
-    (632122, "民和县"),
-    (632123, "乐都县"),
-    (632126, "互助县"),
-    (632127, "化隆回族自治县"),
-    (632128, "循化县"),
-    (632200, "海北州"),
-    (632221, "门源县"),
-    (632222, "祁连县"),
-    (632223, "海晏县"),
-    (632224, "刚察县"),
-    (632300, "黄南州"),
-    (632321, "同仁县"),
-    (632322, "尖扎县"),
-    (632323, "泽库县"),
-    (632324, "河南县"),
-    (632500, "海南州"),
-    (632521, "共和县"),
-    (632522, "同德县"),
-    (632523, "贵德县"),
-    (632524, "兴海县"),
-    (632525, "贵南县"),
-    (632600, "果洛州"),
-    (632621, "玛沁县"),
-    (632622, "班玛县"),
-    (632623, "甘德县"),
-    (632624, "达日县"),
-    (632625, "久治县"),
-    (632626, "玛多县"),
-    (632700, "玉树州"),
-    (632721, "玉树县"),
-    (632722, "杂多县"),
-    (632723, "称多县"),
-    (632724, "治多县"),
-    (632725, "囊谦县"),
-    (632726, "曲麻莱县"),
-    (632800, "海西州"),
-    (632801, "格尔木市"),
-    (632802, "德令哈市"),
-    (632821, "乌兰县"),
-    (632822, "都兰县"),
-    (632823, "天峻县"),
-    (640000, "宁夏回族自治区"),
-    (640100, "银川市"),
-    (640101, "市辖区"),
-    (640104, "兴庆区"),
-    (640105, "西夏区"),
-    (640106, "金凤区"),
-    (640121, "永宁县"),
-    (640122, "贺兰县"),
-    (640181, "灵武市"),
-    (640200, "石嘴山市"),
-    (640201, "市辖区"),
-    (640202, "大武口区"),
-    (640205, "惠农区"),
-    (640221, "平罗县"),
-    (640300, "吴忠市"),
-    (640301, "市辖区"),
-    (640302, "利通区"),
-    (640323, "盐池县"),
-    (640324, "同心县"),
-    (640381, "青铜峡市"),
-    (640400, "固原市"),
-    (640401, "市辖区"),
-    (640402, "原州区"),
-    (640422, "西吉县"),
-    (640423, "隆德县"),
-    (640424, "泾源县"),
-    (640425, "彭阳县"),
-    (640500, "中卫市"),
-    (640501, "市辖区"),
-    (640502, "沙坡头区"),
-    (640521, "中宁县"),
-    (640522, "海原县"),
-    (650000, "新疆维吾尔自治区"),
-    (650100, "乌鲁木齐市"),
-    (650101, "市辖区"),
-    (650102, "天山区"),
-    (650103, "沙依巴克区"),
-    (650104, "新市区"),
-    (650105, "水磨沟区"),
-    (650106, "头屯河区"),
-    (650107, "达坂城区"),
-    (650108, "东山区"),
-    (650121, "乌鲁木齐县"),
-    (650200, "克拉玛依市"),
-    (650201, "市辖区"),
-    (650202, "独山子区"),
-    (650203, "克拉玛依区"),
-    (650204, "白碱滩区"),
-    (650205, "乌尔禾区"),
-    (652100, "吐鲁番地区"),
-    (652101, "吐鲁番市"),
-    (652122, "鄯善县"),
-    (652123, "托克逊县"),
-    (652200, "哈密地区"),
-    (652201, "哈密市"),
-    (652222, "巴里坤县"),
-    (652223, "伊吾县"),
-    (652300, "昌吉州"),
-    (652301, "昌吉市"),
-    (652302, "阜康市"),
-    (652303, "米泉市"),
-    (652323, "呼图壁县"),
-    (652324, "玛纳斯"),
-    (652325, "奇台县"),
-    (652327, "吉木萨尔县"),
-    (652328, "木垒县"),
-    (652700, "博尔塔拉蒙古自治州"),
-    (652701, "博乐市"),
-    (652722, "精河县"),
-    (652723, "温泉县"),
-    (652800, "巴音郭楞蒙古自治州"),
-    (652801, "库尔勒市"),
-    (652822, "轮台县"),
-    (652823, "尉犁县"),
-    (652824, "若羌县"),
-    (652825, "且末县"),
-    (652826, "焉耆县"),
-    (652827, "和静县"),
-    (652828, "和硕县"),
-    (652829, "博湖县"),
-    (652900, "阿克苏地区"),
-    (652901, "阿克苏市"),
-    (652922, "温宿县"),
-    (652923, "库车县"),
-    (652924, "沙雅县"),
-    (652925, "新和县"),
-    (652926, "拜城县"),
-    (652927, "乌什县"),
-    (652928, "阿瓦提县"),
-    (652929, "柯坪县"),
-    (653000, "克州"),
-    (653001, "阿图什市"),
-    (653022, "阿克陶县"),
-    (653023, "阿合奇县"),
-    (653024, "乌恰县"),
-    (653100, "喀什地区"),
-    (653101, "喀什市"),
-    (653121, "疏附县"),
-    (653122, "疏勒县"),
-    (653123, "英吉沙县"),
-    (653124, "泽普县"),
-    (653125, "莎车县"),
-    (653126, "叶城县"),
-    (653127, "麦盖提县"),
-    (653128, "岳普湖县"),
-    (653129, "伽师县"),
-    (653130, "巴楚县"),
-    (653131, "塔什库尔干县"),
-    (653200, "和田地区"),
-    (653201, "和田市"),
-    (653221, "和田县"),
-    (653222, "墨玉县"),
-    (653223, "皮山县"),
-    (653224, "洛浦县"),
-    (653225, "策勒县"),
-    (653226, "于田县"),
-    (653227, "民丰县"),
-    (654000, "伊犁州"),
-    (654002, "伊宁市"),
-    (654003, "奎屯市"),
-    (654021, "伊宁县"),
-    (654022, "察布查尔县"),
-    (654023, "霍城县"),
-    (654024, "巩留县"),
-    (654025, "新源县"),
-    (654026, "昭苏县"),
-    (654027, "特克斯县"),
-    (654028, "尼勒克县"),
-    (654200, "塔城地区"),
-    (654201, "塔城市"),
-    (654202, "乌苏市"),
-    (654221, "额敏县"),
-    (654223, "沙湾县"),
-    (654224, "托里县"),
-    (654225, "裕民县"),
-    (654226, "和布克赛尔蒙古自治县"),
-    (654300, "阿勒泰地区"),
-    (654301, "阿勒泰市"),
-    (654321, "布尔津县"),
-    (654322, "富蕴县"),
-    (654323, "福海县"),
-    (654324, "哈巴河县"),
-    (654325, "青河县"),
-    (654326, "吉木乃县"),
-    (659000, "省直辖行政单位"),
-    (659001, "石河子市"),
-    (659002, "阿拉尔市"),
-    (659003, "图木舒克市"),
-    (659004, "五家渠市"),
-]
+# 行政区划数据：每行为6位代码紧跟名称，按代码升序排列；
+# 以单个字符串常量存放，导入模块时不再构建3500多个元组，addr与行政区划表在首次使用时才由它生成
+_ADDR_DATA = """\
+110000北京市
+110100市辖区
+110101东城区
+110102西城区
+110103崇文区
+110104宣武区
+110105朝阳区
+110106丰台区
+110107石景山区
+110108海淀区
+110109门头沟区
+110111房山区
+110112通州区
+110113顺义区
+110114昌平区
+110115大兴区
+110116怀柔区
+110117平谷区
+110200县
+110228密云县
+110229延庆县
+120000天津市
+120100市辖区
+120101和平区
+120102河东区
+120103河西区
+120104南开区
+120105河北区
+120106红桥区
+120107塘沽区
+120108汉沽区
+120109大港区
+120110东丽区
+120111西青区
+120112津南区
+120113北辰区
+120114武清区
+120115宝坻区
+120200市辖县
+120221宁河县
+120223静海县
+120225蓟县
+130000河北省
+130100石家庄市
+130101市辖区
+130102长安区
+130103桥东区
+130104桥西区
+130105新华区
+130107井陉矿区
+130108裕华区
+130121井陉县
+130123正定县
+130124栾城县
+130125行唐县
+130126灵寿县
+130127高邑县
+130128深泽县
+130129赞皇县
+130130无极县
+130131平山县
+130132元氏县
+130133赵县
+130181辛集市
+130182藁城市
+130183晋州市
+130184新乐市
+130185鹿泉市
+130200唐山市
+130201市辖区
+130202路南区
+130203路北区
+130204古冶区
+130205开平区
+130207丰南区
+130208丰润区
+130223滦县
+130224滦南县
+130225乐亭县
+130227迁西县
+130229玉田县
+130230唐海县
+130281遵化市
+130283迁安市
+130300秦皇岛市
+130301市辖区
+130302海港区
+130303山海关区
+130304北戴河区
+130321青龙满族自治县
+130322昌黎县
+130323抚宁县
+130324卢龙县
+130400邯郸市
+130401市辖区
+130402邯山区
+130403丛台区
+130404复兴区
+130406峰峰矿区
+130421邯郸县
+130423临漳县
+130424成安县
+130425大名县
+130426涉县
+130427磁县
+130428肥乡县
+130429永年县
+130430邱县
+130431鸡泽县
+130432广平县
+130433馆陶县
+130434魏县
+130435曲周县
+130481武安市
+130500邢台市
+130501市辖区
+130502桥东区
+130503桥西区
+130521邢台县
+130522临城县
+130523内邱县
+130524柏乡县
+130525隆尧县
+130526任县
+130527南和县
+130528宁晋县
+130529巨鹿县
+130530新河县
+130531广宗县
+130532平乡县
+130533威县
+130534清河县
+130535临西县
+130581南宫市
+130582沙河市
+130600保定市
+130601市辖区
+130602新市区
+130603北市区
+130604南市区
+130621满城县
+130622清苑县
+130623涞水县
+130624阜平县
+130625徐水县
+130626定兴县
+130627唐县
+130628高阳县
+130629容城县
+130630涞源县
+130631望都县
+130632安新县
+130633易县
+130634曲阳县
+130635蠡县
+130636顺平县
+130637博野县
+130638雄县
+130681涿州市
+130682定州市
+130683安国市
+130684高碑店市
+130700张家口市
+130701市辖区
+130702桥东区
+130703桥西区
+130705宣化区
+130706下花园区
+130721宣化县
+130722张北县
+130723康保县
+130724沽源县
+130725尚义县
+130726蔚县
+130727阳原县
+130728怀安县
+130729万全县
+130730怀来县
+130731涿鹿县
+130732赤城县
+130733崇礼县
+130800承德市
+130801市辖区
+130802双桥区
+130803双滦区
+130804鹰手营子矿区
+130821承德县
+130822兴隆县
+130823平泉县
+130824滦平县
+130825隆化县
+130826丰宁满族自治县
+130827宽城满族自治县
+130828围场满族蒙古族自治县
+130900沧州市
+130901市辖区
+130902新华区
+130903运河区
+130921沧县
+130922青县
+130923东光县
+130924海兴县
+130925盐山县
+130926肃宁县
+130927南皮县
+130928吴桥县
+130929献县
+130930孟村回族自治县
+130981泊头市
+130982任邱市
+130983黄骅市
+130984河间市
+131000廊坊市
+131001市辖区
+131002安次区
+131003广阳区
+131022固安县
+131023永清县
+131024香河县
+131025大城县
+131026文安县
+131028大厂回族自治县
+131081霸州市
+131082三河市
+131100衡水市
+131101市辖区
+131102桃城区
+131121枣强县
+131122武邑县
+131123武强县
+131124饶阳县
+131125安平县
+131126故城县
+131127景县
+131128阜城县
+131181冀州市
+131182深州市
+140000山西
+140100太原市
+140101市辖区
+140105小店区(人口含高新经济区)
+140106迎泽区
+140107杏花岭区
+140108尖草坪区
+140109万柏林区
+140110晋源区
+140121清徐县
+140122阳曲县
+140123娄烦县
+140181古交市
+140200大同市
+140201市辖区
+140202大同市城区
+140203矿区
+140211南郊区
+140212新荣区
+140221阳高县
+140222天镇县
+140223广灵县
+140224灵丘县
+140225浑源县
+140226左云县
+140227大同县
+140300阳泉市
+140301市辖区
+140302城区
+140303矿区
+140311郊区
+140321平定县
+140322盂县
+140400长治市
+140401市辖区
+140402长治市城区
+140411长治市郊区
+140421长治县
+140423襄垣县
+140424屯留县
+140425平顺县
+140426黎城县
+140427壶关县
+140428长子县
+140429武乡县
+140430沁县
+140431沁源县
+140481潞城市
+140500晋城市
+140501市辖区
+140502晋城市城区
+140521沁水县
+140522阳城县
+140524陵川县
+140525泽州县
+140581高平市
+140600朔州市
+140601市辖区
+140602朔城区
+140603平鲁区
+140621山阴县
+140622应县
+140623右玉县
+140624怀仁县
+140700晋中市
+140701市辖区
+140702榆次区
+140721榆社县
+140722左权县
+140723和顺县
+140724昔阳县
+140725寿阳县
+140726太谷县
+140727祁县
+140728平遥县
+140729灵石县
+140781介休市
+140800运城市
+140801市辖区
+140802盐湖区
+140821临猗县
+140822万荣县
+140823闻喜县
+140824稷山县
+140825新绛县
+140826绛县
+140827垣曲县
+140828夏县
+140829平陆县
+140830芮城县
+140881永济市
+140882河津市
+140900忻州市
+140901市辖区
+140902忻府区
+140921定襄县
+140922五台县
+140923代县
+140924繁峙县
+140925宁武县
+140926静乐县
+140927神池县
+140928五寨县
+140929岢岚县
+140930河曲县
+140931保德县
+140932偏关县
+140981原平市
+141000临汾市
+141001市辖区
+141002尧都区
+141021曲沃县
+141022翼城县
+141023襄汾县
+141024洪洞县
+141025古县
+141026安泽县
+141027浮山县
+141028吉县
+141029乡宁县
+141030大宁县
+141031隰县
+141032永和县
+141033蒲县
+141034汾西县
+141081侯马市
+141082霍州市
+141100吕梁市
+141101市辖区
+141102离石区
+141121文水县
+141122交城县
+141123兴县
+141124临县
+141125柳林县
+141126石楼县
+141127岚县
+141128方山县
+141129中阳县
+141130交口县
+141181孝义市
+141182汾阳市
+150000内蒙古自治区
+150100呼和浩特市
+150101市辖区
+150102新城区
+150103回民区
+150104玉泉区
+150105赛罕区
+150121土左旗
+150122托克托县
+150123和林格尔县
+150124清水河县
+150125武川县
+150200包头市
+150201市辖区
+150202东河区
+150203昆都仑区
+150204青山区
+150205石拐区
+150206白云鄂博矿区
+150207九原区
+150221土默特右旗
+150222固阳县
+150223达茂联合旗
+150300乌海市
+150301乌海市辖区
+150302海勃湾区
+150303海南区
+150304乌达区
+150400赤峰市
+150401市辖区
+150402红山区
+150403元宝山区
+150404松山区
+150421阿鲁科尔沁旗
+150422巴林左旗
+150423巴林右旗
+150424林西县
+150425克什克腾旗
+150426翁牛特旗
+150428喀喇沁旗
+150429宁城县
+150430敖汉旗
+150500通辽市
+150501市辖区
+150502科尔沁区
+150521科尔沁左翼中旗
+150522科左后旗
+150523开鲁县
+150524库伦旗
+150525奈曼旗
+150526扎鲁特旗
+150581霍林郭勒市
+150600鄂尔多斯市
+150602东胜区
+150621达拉特旗
+150622准格尔旗
+150623鄂托克前旗
+150624鄂托克旗
+150625杭锦旗
+150626乌审旗
+150627伊金霍洛旗
+150700呼伦贝尔市
+150701市辖区
+150702海拉尔区
+150721阿荣旗
+150722莫力达瓦达斡尔族自治旗
+150723鄂伦春自治旗
+150724鄂温克族自治旗
+150725陈巴尔虎旗镇
+150726新巴尔虎左旗
+150727新巴尔虎右旗
+150781满洲里市
+150782牙克石市
+150783扎兰屯市
+150784额尔古纳市
+150785根河市
+150800巴彦淖尔市
+150801市辖区
+150802临河区
+150821五原县
+150822磴口县
+150823乌拉特前旗
+150824乌拉特中旗
+150825乌拉特后旗
+150826杭锦后旗
+150900乌兰察布市
+150901市辖区
+150902集宁区
+150921卓资县
+150922化德县
+150923商都县
+150924兴和县
+150925凉城县
+150926察哈尔右翼前旗
+150927察右中旗
+150928察哈尔右翼后旗
+150929四子王旗
+150981丰镇市
+152200兴安盟
+152201乌兰浩特市
+152202阿尔山市
+152221科右前旗
+152222科右中旗
+152223扎赉特旗
+152224突泉县
+152500锡林郭勒盟
+152501二连浩特市
+152502锡林浩特市
+152522阿巴嘎旗
+152523苏尼特左旗
+152524苏尼特右旗
+152525东乌珠穆沁旗
+152526西乌珠穆沁旗
+152527太仆寺旗
+152528镶黄旗
+152529正镶白旗
+152530正蓝旗
+152531多伦县
+152900阿拉善盟
+152921阿拉善左旗
+152922阿拉善右旗
+152923额济纳旗
+210000辽宁省
+210100沈阳市
+210101市辖区
+210102和平区
+210103沈河区
+210104大东区
+210105皇姑区
+210106铁西区
+210111苏家屯区
+210112东陵区
+210113新城子区
+210114于洪区
+210122辽中县
+210123康平县
+210124法库县
+210181新民市
+210200大连市
+210201市辖区
+210202中山区
+210203西岗区
+210204沙河口区
+210211甘井子区
+210212旅顺口区
+210213金州区
+210224长海县
+210281瓦房店市
+210282普兰店市
+210283庄河市
+210300鞍山市
+210301市辖区
+210302铁东区
+210303铁西区
+210304立山区
+210311千山区
+210321台安县
+210323岫岩县
+210381海城市
+210400抚顺市
+210401市辖区
+210402新抚区
+210403东洲区
+210404望花区
+210411顺城区
+210421抚顺县
+210422新宾满族自治县
+210423清原满族自治县
+210500本溪市
+210501市辖区
+210502平山区
+210503溪湖区
+210504明山区
+210505南芬区
+210521本溪满族自治县
+210522桓仁满族自治县
+210600丹东市
+210601市辖区
+210602元宝区
+210603振兴区
+210604振安区
+210624宽甸满族自治县
+210681东港市
+210682凤城市
+210700锦州市
+210701市辖区
+210702古塔区
+210703凌河区
+210711太和区
+210726黑山县
+210727义县
+210781凌海市
+210782北镇市
+210800营口市
+210801市辖区
+210802站前区
+210803西市区
+210804鲅鱼圈区
+210811老边区
+210881盖州市
+210882大石桥市
+210900阜新市
+210901市辖区
+210902海州区
+210903新邱区
+210904太平区
+210905清河门区
+210911细河区
+210921阜新蒙古族自治县
+210922彰武县
+211000辽阳市
+211001市辖区
+211002白塔区
+211003文圣区
+211004宏伟区
+211005弓长岭区
+211011太子河区
+211021辽阳县
+211081灯塔市
+211100盘锦市
+211101市辖区
+211102双台子区
+211103兴隆台区
+211121大洼县
+211122盘山县
+211200铁岭市
+211201市辖区
+211202银州区
+211204清河区
+211221铁岭县
+211223西丰县
+211224昌图县
+211281调兵山市
+211282开原市
+211300朝阳市
+211301市辖区
+211302双塔区
+211303龙城区
+211321朝阳县
+211322建平县
+211324喀喇沁左翼蒙古族自治县
+211381北票市
+211382凌源市
+211400葫芦岛市
+211401市辖区
+211402连山区
+211403龙港区
+211404南票区
+211421绥中县
+211422建昌县
+211481兴城市
+220000吉林省
+220100长春市
+220101长春市辖区
+220102南关区
+220103宽城区
+220104朝阳区
+220105二道区
+220106绿园区
+220112双阳区
+220122农安县
+220181九台市
+220182榆树市
+220183德惠市
+220200吉林市
+220201吉林市辖区
+220202昌邑区
+220203龙潭区
+220204船营区
+220211丰满区
+220221永吉县
+220281蛟河市
+220282桦甸市
+220283舒兰市
+220284磐石市
+220300四平市
+220301四平市辖区
+220302铁西区
+220303铁东区
+220322梨树县
+220323伊通满族自治县
+220381公主岭市
+220382双辽市
+220400辽源市
+220401辽源市辖区
+220402龙山区
+220403西安区
+220421东丰县
+220422东辽县
+220500通化市
+220501通化市辖区
+220502东昌区
+220503二道江区
+220521通化县
+220523辉南县
+220524柳河县
+220581梅河口市
+220582集安市
+220600白山市
+220601白山市辖区
+220602八道江区
+220604江源区
+220621抚松县
+220622靖宇县
+220623长白朝鲜族自治县
+220681临江市
+220700松原市
+220701松原市辖区
+220702宁江区
+220721前郭尔罗斯蒙古族自治县
+220722长岭县
+220723乾安县
+220724扶余县
+220800白城市
+220801白城市辖区
+220802洮北区
+220821镇赉县
+220822通榆县
+220881洮南市
+220882大安市
+222400延边朝鲜族自治州
+222401延吉市
+222402图们市
+222403敦化市
+222404珲春市
+222405龙井市
+222406和龙市
+222424汪清县
+222426安图县
+230000黑龙江省
+230100哈尔滨市
+230101市辖区
+230102道里区
+230103南岗区
+230104道外区
+230108平房区
+230109松北区
+230110香坊区
+230111呼兰区
+230112阿城区
+230123依兰县
+230124方正县
+230125宾县
+230126巴彦县
+230127木兰县
+230128通河县
+230129延寿县
+230182双城市
+230183尚志市
+230184五常市
+230200齐齐哈尔市
+230201市辖区
+230202龙沙区
+230203建华区
+230204铁锋区
+230205昂昂溪区
+230206富拉尔基区
+230207碾子山区
+230208梅里斯达斡尔族区
+230221龙江县
+230223依安县
+230224泰来县
+230225甘南县
+230227富裕县
+230229克山县
+230230克东县
+230231拜泉县
+230281讷河市
+230300鸡西市
+230301市辖区
+230302鸡冠区
+230303恒山区
+230304滴道区
+230305梨树区
+230306城子河区
+230307麻山区
+230321鸡东县
+230381虎林市
+230382密山市
+230400鹤岗市
+230401市辖区
+230402向阳区
+230403工农区
+230404南山区
+230405兴安区
+230406东山区
+230407兴山区
+230421萝北县
+230422绥滨县
+230500双鸭山市
+230501市辖区
+230502尖山区
+230503岭东区
+230505四方台区
+230506宝山区
+230521集贤县
+230522友谊县
+230523宝清县
+230524饶河县
+230600大庆市
+230601市辖区
+230602萨尔图区
+230603龙凤区
+230604让胡路区
+230605红岗区
+230606大同区
+230621肇州县
+230622肇源县
+230623林甸县
+230624杜尔伯特县
+230700伊春市
+230701市辖区
+230702伊春区
+230703南岔区
+230704友好区
+230705西林区
+230706翠峦区
+230707新青区
+230708美溪区
+230709金山屯区
+230710五营区
+230711乌马河区
+230712汤旺河区
+230713带岭区
+230714乌伊岭区
+230715红星区
+230716上甘岭区
+230722嘉荫县
+230781铁力市
+230800佳木斯市
+230801市辖区
+230803向阳区
+230804前进区
+230805东风区
+230811郊区
+230822桦南县
+230826桦川县
+230828汤原县
+230833抚远县
+230881同江市
+230882富锦市
+230900七台河市
+230901市辖区
+230902新兴区
+230903桃山区
+230904茄子河区
+230921勃利县
+231000牡丹江市
+231001市辖区
+231002东安区
+231003阳明区
+231004爱民区
+231005西安区
+231024东宁县
+231025林口县
+231081绥芬河市
+231083海林市
+231084宁安市
+231085穆棱市
+231100黑河市
+231101市辖区
+231102爱辉区
+231121嫩江县
+231123逊克县
+231124孙吴县
+231181北安市
+231182五大连池市
+231200绥化市
+231201市辖区
+231202北林区
+231221望奎县
+231222兰西县
+231223青冈县
+231224庆安县
+231225明水县
+231226绥棱县
+231281安达市
+231282肇东市
+231283海伦市
+232700大兴安岭地区
+232701加格达奇区
+232702松岭区
+232703新林区
+232704呼中区
+232721呼玛县
+232722塔河县
+232723漠河县
+310000上海市
+310100市辖区
+310101黄浦区
+310103卢湾区
+310104徐汇区
+310105长宁区
+310106静安区
+310107普陀区
+310108闸北区
+310109虹口区
+310110杨浦区
+310112闵行区
+310113宝山区
+310114嘉定区
+310115浦东新区
+310116金山区
+310117松江区
+310118青浦区
+310119南汇区
+310120奉贤区
+310200县
+310230崇明县
+320000江苏省
+320100南京市
+320101市辖区
+320102玄武区
+320103白下区
+320104秦淮区
+320105建邺区
+320106鼓楼区
+320107下关区
+320111浦口区
+320113栖霞区
+320114雨花台区
+320115江宁区
+320116六合区
+320124溧水县
+320125高淳县
+320200无锡市
+320201市辖区
+320202崇安区
+320203南长区
+320204北塘区
+320205锡山区
+320206惠山区
+320211滨湖区
+320281江阴市
+320282宜兴市
+320300徐州市
+320301市辖区
+320302鼓楼区
+320303云龙区
+320304九里区
+320305贾汪区
+320311泉山区
+320321丰县
+320322沛县
+320323铜山县
+320324睢宁县
+320381新沂市
+320382邳州市
+320400常州市
+320401常州市区
+320402天宁区
+320404钟楼区
+320405戚墅堰区
+320411新北区
+320412武进区
+320481溧阳市
+320482金坛市
+320500苏州市
+320501市辖区
+320502沧浪区
+320503平江区
+320504金阊区
+320505苏州高新区虎丘区
+320506吴中区
+320507相城区
+320581常熟市
+320582张家港市
+320583昆山市
+320584吴江市
+320585太仓市
+320600南通市
+320601市辖区
+320602崇川区
+320611港闸区
+320621海安县
+320623如东
+320681启东市
+320682如皋市
+320683通州市
+320684海门市
+320700连云港市
+320701市辖区
+320703连云区
+320705新浦区
+320706海州区
+320721赣榆县
+320722东海县
+320723灌云县
+320724灌南县
+320800淮安市
+320801市辖区
+320802清河区
+320803楚州区
+320804淮阴区
+320811清浦区
+320826涟水县
+320829洪泽县
+320830盱眙县
+320831金湖县
+320900盐城市
+320901市辖区
+320902亭湖区
+320903盐都区
+320921响水县
+320922滨海县
+320923阜宁县
+320924射阳县
+320925建湖县
+320981东台市
+320982大丰市
+321000扬州市
+321001市辖区
+321002广陵区
+321003邗江区
+321011维扬区
+321023宝应县
+321081仪征市
+321084高邮市
+321088江都市
+321100镇江市
+321101市区
+321102京口区
+321111润州区
+321112丹徒区
+321181丹阳市
+321182扬中市
+321183句容市
+321200泰州市
+321201市辖区
+321202海陵区
+321203高港区
+321281兴化市
+321282靖江市
+321283泰兴市
+321284姜堰市
+321300宿迁市
+321301市辖区
+321302宿城区
+321311宿豫区
+321322沭阳县
+321323泗阳县
+321324泗洪县
+330000浙江省
+330100杭州市
+330101市辖区
+330102上城区
+330103下城区
+330104江干区
+330105拱墅区
+330106西湖区
+330108滨江区
+330109萧山区
+330110余杭区
+330122桐庐县
+330127淳安县
+330182建德市
+330183富阳市
+330185临安市
+330200宁波市
+330201市辖区
+330203海曙区
+330204江东区
+330205江北区
+330206北仑区
+330211镇海区
+330212鄞州区
+330225象山县
+330226宁海县
+330281余姚市
+330282慈溪市
+330283奉化市
+330300温州市
+330301市辖区
+330302鹿城区
+330303龙湾区
+330304瓯海区
+330322洞头县
+330324永嘉县
+330326平阳县
+330327苍南县
+330328文成县
+330329泰顺县
+330381瑞安市
+330382乐清市
+330400嘉兴市
+330401市辖区
+330402南湖区
+330411秀洲区
+330421嘉善县
+330424海盐县
+330481海宁市
+330482平湖市
+330483桐乡市
+330500湖州市
+330501市辖区
+330502吴兴区
+330503南浔区
+330521德清县
+330522长兴县
+330523安吉县
+330600绍兴市
+330601市辖区
+330602越城区
+330621绍兴县
+330624新昌县
+330681诸暨市
+330682上虞市
+330683嵊州市
+330700金华市
+330701市辖区
+330702婺城区
+330703金东区
+330723武义县
+330726浦江县
+330727磐安县
+330781兰溪市
+330782义乌市
+330783东阳市
+330784永康市
+330800衢州市
+330801市辖区
+330802柯城区
+330803衢江区
+330822常山县
+330824开化县
+330825龙游县
+330881江山市
+330900舟山市
+330901市辖区
+330902定海区
+330903普陀区
+330921岱山县
+330922嵊泗县
+331000台州市
+331001市辖区
+331002椒江区
+331003黄岩区
+331004路桥区
+331021玉环县
+331022三门县
+331023天台县
+331024仙居县
+331081温岭市
+331082临海市
+331100丽水市
+331101市辖区
+331102莲都区
+331121青田县
+331122缙云县
+331123遂昌县
+331124松阳县
+331125云和县
+331126庆元县
+331127景宁畲族自治县
+331181龙泉市
+340000安徽省
+340100合肥市
+340101市辖区
+340102瑶海区
+340103庐阳区
+340104蜀山区
+340111包河区
+340121长丰县
+340122肥东县
+340123肥西县
+340200芜湖市
+340201市辖区
+340202镜湖区
+340203弋江区
+340207鸠江区
+340208三山区
+340221芜湖县
+340222繁昌县
+340223南陵县
+340300蚌埠市
+340301市辖区
+340302龙子湖区
+340303蚌山区
+340304禹会区
+340311淮上区
+340321怀远县
+340322五河县
+340323固镇县
+340400淮南市
+340401市辖区
+340402大通区
+340403田家庵区
+340404谢家集区
+340405八公山区
+340406潘集区
+340421凤台县
+340500马鞍山市
+340501市辖区
+340502金家庄区
+340503花山区
+340504雨山区
+340521当涂县
+340600淮北市
+340601市辖区
+340602杜集区
+340603相山区
+340604烈山区
+340621濉溪县
+340700铜陵市
+340701市辖区
+340702铜官山区
+340703狮子山区
+340711铜陵市郊区
+340721铜陵县
+340800安庆市
+340801市辖区
+340802迎江区
+340803大观区
+340811宜秀区
+340822怀宁县
+340823枞阳县
+340824潜山县
+340825太湖县
+340826宿松县
+340827望江县
+340828岳西县
+340881桐城市
+341000黄山市
+341001市辖区
+341002屯溪区
+341003黄山区
+341004徽州区
+341021歙县
+341022休宁县
+341023黟县
+341024祁门县
+341100滁州市
+341101市辖区
+341102琅琊区
+341103南谯区
+341122来安县
+341124全椒县
+341125定远县
+341126凤阳县
+341181天长市
+341182明光市
+341200阜阳市
+341201市辖区
+341202颍州区
+341203颍东区
+341204颍泉区
+341221临泉县
+341222太和县
+341225阜南县
+341226颍上县
+341282界首市
+341300宿州市
+341301市辖区
+341302墉桥区
+341321砀山县
+341322萧县
+341323灵璧县
+341324泗县
+341400巢湖市
+341401市辖区
+341402居巢区
+341421庐江县
+341422无为县
+341423含山县
+341424和县
+341500六安市
+341501市辖区
+341502金安区
+341503裕安区
+341521寿县
+341522霍邱县
+341523舒城县
+341524金寨县
+341525霍山县
+341600亳州市
+341601市辖区
+341602谯城区
+341621涡阳县
+341622蒙城县
+341623利辛县
+341700池州市
+341701市辖区
+341702贵池区
+341721东至县
+341722石台县
+341723青阳县
+341800宣城市
+341801市辖区
+341802宣州区
+341821郎溪县
+341822广德县
+341823泾县
+341824绩溪县
+341825旌德县
+341881宁国市
+350000福建省
+350100福州市
+350101市辖区
+350102鼓楼区
+350103台江区
+350104仓山区
+350105马尾区
+350111晋安区
+350121闽侯县
+350122连江县
+350123罗源县
+350124闽清县
+350125永泰县
+350128平潭县
+350181福清市
+350182长乐市
+350200厦门市
+350201市辖区
+350203思明区
+350205海沧区
+350206湖里区
+350211集美区
+350212同安区
+350213翔安区
+350300莆田市
+350301市辖区
+350302城厢区
+350303涵江区
+350304荔城区
+350305秀屿区
+350322仙游县
+350400三明市
+350401市辖区
+350402梅列区
+350403三元区
+350421明溪县
+350423清流县
+350424宁化县
+350425大田县
+350426尤溪县
+350427沙县
+350428将乐县
+350429泰宁县
+350430建宁县
+350481永安市
+350500泉州市
+350501市辖区
+350502鲤城区
+350503丰泽区
+350504洛江区
+350505泉港区
+350521惠安县
+350524安溪县
+350525永春县
+350526德化县
+350527金门县
+350581石狮市
+350582晋江市
+350583南安市
+350600漳州市
+350601市辖区
+350602芗城区
+350603龙文区
+350622云霄县
+350623漳浦县
+350624诏安县
+350625长泰县
+350626东山县
+350627南靖县
+350628平和县
+350629华安县
+350681龙海市
+350700南平市
+350701市辖区
+350702延平区
+350721顺昌县
+350722浦城县
+350723光泽县
+350724松溪县
+350725政和县
+350781邵武市
+350782武夷山市
+350783建瓯市
+350784建阳市
+350800龙岩市
+350801市辖区
+350802新罗区
+350821长汀县
+350822永定县
+350823上杭县
+350824武平县
+350825连城县
+350881漳平市
+350900宁德市
+350901市辖区
+350902蕉城区
+350921霞浦县
+350922古田县
+350923屏南县
+350924寿宁县
+350925周宁县
+350926柘荣县
+350981福安市
+350982福鼎市
+360000江西省
+360100南昌市
+360101市辖区
+360102东湖区
+360103西湖区
+360104青云谱区
+360105湾里区
+360111青山湖区
+360121南昌县
+360122新建县
+360123安义县
+360124进贤县
+360200景德镇市
+360201市辖区
+360202昌江区
+360203珠山区
+360222浮梁县
+360281乐平市
+360300萍乡市
+360301市辖区
+360302安源区
+360313湘东区
+360321莲花县
+360322上栗县
+360323芦溪县
+360400九江市
+360401市辖区
+360402庐山区
+360403浔阳区
+360421九江县
+360423武宁县
+360424修水县
+360425永修县
+360426德安县
+360427星子县
+360428都昌县
+360429湖口县
+360430彭泽县
+360481瑞昌市
+360500新余市
+360501市辖区
+360502渝水区
+360521分宜县
+360600鹰潭市
+360601市辖区
+360602月湖区
+360622余江县
+360681贵溪市
+360700赣州市
+360701市辖区
+360702章贡区
+360721赣县
+360722信丰县
+360723大余县
+360724上犹县
+360725崇义县
+360726安远县
+360727龙南县
+360728定南县
+360729全南县
+360730宁都县
+360731于都县
+360732兴国县
+360733会昌县
+360734寻乌县
+360735石城县
+360781瑞金市
+360782南康市
+360800吉安市
+360801市辖区
+360802吉州区
+360803青原区
+360821吉安县
+360822吉水县
+360823峡江县
+360824新干县
+360825永丰县
+360826泰和县
+360827遂川县
+360828万安县
+360829安福县
+360830永新县
+360881井冈山市
+360900宜春市
+360901市辖区
+360902袁州区
+360921奉新县
+360922万载县
+360923上高县
+360924宜丰县
+360925靖安县
+360926铜鼓县
+360981丰城市
+360982樟树市
+360983高安市
+361000抚州市
+361001市辖区
+361002临川区
+361021南城县
+361022黎川县
+361023南丰县
+361024崇仁县
+361025乐安县
+361026宜黄县
+361027金溪县
+361028资溪县
+361029东乡县
+361030广昌县
+361100上饶市
+361101市辖区
+361102信州区
+361121上饶县
+361122广丰县
+361123玉山县
+361124铅山县
+361125横峰县
+361126弋阳县
+361127余干县
+361128鄱阳县
+361129万年县
+361130婺源县
+361181德兴市
+370000山东省
+370100济南市
+370101市辖区
+370102历下区
+370103市中区
+370104槐荫区
+370105天桥区
+370112历城区
+370113长清区
+370124平阴县
+370125济阳县
+370126商河县
+370181章丘市
+370200青岛市
+370201市辖区
+370202市南区
+370203市北区
+370205四方区
+370211黄岛区
+370212崂山区
+370213李沧区
+370214城阳区
+370281胶州市
+370282即墨市
+370283平度市
+370284胶南市
+370285莱西市
+370300淄博市
+370301市辖区
+370302淄川区
+370303张店区
+370304博山区
+370305临淄区
+370306周村区
+370321桓台县
+370322高青县
+370323沂源县
+370400枣庄市
+370401市辖区
+370402市中区
+370403薛城区
+370404峄城区
+370405台儿庄区
+370406山亭区
+370481滕州市
+370500东营市
+370501市辖区
+370502东营区
+370503河口区
+370521垦利县
+370522利津县
+370523广饶县
+370600烟台市
+370601市辖区
+370602芝罘区
+370611福山区
+370612牟平区
+370613莱山区
+370634长岛县
+370681龙口市
+370682莱阳市
+370683莱州市
+370684蓬莱市
+370685招远市
+370686栖霞市
+370687海阳市
+370700潍坊市
+370701市辖区
+370702潍城区
+370703寒亭区
+370704坊子区
+370705奎文区
+370724临朐县
+370725昌乐县
+370781青州市
+370782诸城市
+370783寿光市
+370784安丘市
+370785高密市
+370786昌邑市
+370800济宁市
+370801市辖区
+370802市中区
+370811任城区
+370826微山县
+370827鱼台县
+370828金乡县
+370829嘉祥县
+370830汶上县
+370831泗水县
+370832梁山县
+370881曲阜市
+370882兖州市
+370883邹城市
+370900泰安市
+370901市辖区
+370902泰山区
+370903岱岳区
+370921宁阳县
+370923东平县
+370982新泰市
+370983肥城市
+371000威海市
+371001市辖区
+371002环翠区
+371081文登市
+371082荣成市
+371083乳山市
+371100日照市
+371101市辖区
+371102东港区
+371103岚山区
+371121五莲县
+371122莒县
+371200莱芜市
+371201市辖区
+371202莱城区
+371203钢城区
+371300临沂市
+371301临沂市辖区
+371302兰山区
+371311罗庄区
+371312河东区
+371321沂南县
+371322郯城县
+371323沂水县
+371324苍山县
+371325费县
+371326平邑县
+371327莒南县
+371328蒙阴县
+371329临沭县
+371400德州市
+371401市辖区
+371402德城区
+371421陵县
+371422宁津县
+371423庆云县
+371424临邑县
+371425齐河县
+371426平原县
+371427夏津县
+371428武城县
+371481乐陵市
+371482禹城市
+371500聊城市
+371501市辖区
+371502东昌府区
+371521阳谷县
+371522莘县
+371523茌平县
+371524东阿县
+371525冠县
+371526高唐县
+371581临清市
+371600滨州市
+371601市辖区
+371602滨城区
+371621惠民县
+371622阳信县
+371623无棣县
+371624沾化县
+371625博兴县
+371626邹平县
+371700菏泽市
+371701市辖区
+371702牡丹区
+371721曹县
+371722单县
+371723成武县
+371724巨野县
+371725郓城县
+371726鄄城县
+371727定陶县
+371728东明县
+410000河南省
+410100郑州市
+410101市辖区
+410102中原区
+410103二七区
+410104管城回族区
+410105金水区
+410106上街区
+410108惠济区
+410122中牟县
+410181巩义市
+410182荥阳市
+410183新密市
+410184新郑市
+410185登封市
+410200开封市
+410201市辖区
+410202龙亭区
+410203顺河区
+410204鼓楼区
+410205禹王台区
+410211金明区
+410221杞县
+410222通许县
+410223尉氏县
+410224开封县
+410225兰考县
+410300洛阳市
+410301市辖区
+410302老城区
+410303西工区
+410304廛河回族区
+410305涧西区
+410306吉利区
+410307洛龙区
+410322孟津县
+410323新安县
+410324栾川县
+410325嵩县
+410326汝阳县
+410327宜阳县
+410328洛宁县
+410329伊川县
+410381偃师市
+410400平顶山市
+410401市辖区
+410402新华区
+410403卫东区
+410404石龙区
+410411湛河区
+410421宝丰县
+410422叶县
+410423鲁山县
+410425郏县
+410481舞钢市
+410482汝州市
+410500安阳市
+410501市辖区
+410502文峰区
+410503北关区
+410505殷都区
+410506龙安区
+410522安阳县
+410523汤阴县
+410526滑县
+410527内黄县
+410581林州市
+410600鹤壁市
+410601市辖区
+410602鹤山区
+410603山城区
+410611淇滨区
+410621浚县
+410622淇县
+410700新乡市
+410701市辖区
+410702红旗区
+410703卫滨区
+410704凤泉区
+410711牧野区
+410721新乡县
+410724获嘉县
+410725原阳县
+410726延津县
+410727封丘县
+410728长垣县
+410781卫辉市
+410782辉县市
+410800焦作市
+410801市辖区
+410802解放区
+410803中站区
+410804马村区
+410811山阳区
+410821修武县
+410822博爱县
+410823武陟县
+410825温县
+410881济源市
+410882沁阳市
+410883孟州市
+410900濮阳市
+410901市辖区
+410902华龙区
+410922清丰县
+410923南乐县
+410926范县
+410927台前县
+410928濮阳县
+411000许昌市
+411001市辖区
+411002魏都区
+411023许昌县
+411024鄢陵县
+411025襄城县
+411081禹州市
+411082长葛市
+411100漯河市
+411101市辖区
+411102源汇区
+411103郾城区
+411104召陵区
+411121舞阳县
+411122临颖县
+411200三门峡市
+411201市辖区
+411202湖滨区
+411221渑池县
+411222陕县
+411224卢氏县
+411281义马市
+411282灵宝市
+411300南阳市
+411301市辖区
+411302宛城区
+411303卧龙区
+411321南召县
+411322方城县
+411323西峡县
+411324镇平县
+411325内乡县
+411326淅川县
+411327社旗县
+411328唐河县
+411329新野县
+411330桐柏县
+411381邓州市
+411400商丘市
+411401市辖区
+411402梁园区
+411403睢阳区
+411421民权县
+411422睢县
+411423宁陵县
+411424柘城县
+411425虞城县
+411426夏邑县
+411481永城市
+411500信阳市
+411501市辖区
+411502浉河区
+411503平桥区
+411521罗山县
+411522光山县
+411523新县
+411524商城县
+411525固始县
+411526潢川县
+411527淮滨县
+411528息县
+411600周口市
+411601市辖区
+411602川汇区
+411621扶沟县
+411622西华县
+411623商水县
+411624沈丘县
+411625郸城县
+411626淮阳县
+411627太康县
+411628鹿邑县
+411681项城市
+411700驻马店市
+411701市辖区
+411702驿城区
+411721西平县
+411722上蔡县
+411723平舆县
+411724正阳县
+411725确山县
+411726泌阳县
+411727汝南县
+411728遂平县
+411729新蔡县
+420000湖北省
+420100武汉市
+420101市辖区
+420102江岸区
+420103江汉区
+420104硚口区
+420105汉阳区
+420106武昌区
+420107青山区
+420111洪山区
+420112东西湖区
+420113汉南区
+420114蔡甸区
+420115江夏区
+420116黄陂区
+420117武汉市新洲区
+420200黄石市
+420201市辖区
+420202黄石港区
+420203西塞山区
+420204下陆区
+420205铁山区
+420222阳新县
+420281大冶市
+420300十堰市
+420301市辖区
+420302茅箭区
+420303张湾区
+420321郧县
+420322郧西县
+420323竹山县
+420324竹溪县
+420325房县
+420381丹江口市
+420500宜昌市
+420501市辖区
+420502西陵区
+420503伍家岗区
+420504点军区
+420505猇亭区
+420506夷陵区
+420525远安县
+420526兴山县
+420527秭归县
+420528长阳土家族自治县
+420529五峰土家族自治县
+420581宜都市
+420582当阳市
+420583枝江市
+420600襄樊市
+420601市辖区
+420602襄城区
+420606樊城区
+420607襄阳区
+420624南漳县
+420625谷城县
+420626保康县
+420682老河口市
+420683枣阳市
+420684宜城市
+420700鄂州市
+420701市辖区
+420702粱子湖区
+420703华容区
+420704鄂城区
+420800荆门市
+420801市辖区
+420802东宝区
+420804掇刀区
+420821京山县
+420822沙洋县
+420881钟祥市
+420900孝感市
+420901市辖区
+420902孝南区
+420921孝昌县
+420922大悟县
+420923云梦县
+420981应城市
+420982安陆市
+420984汉川市
+421000荆州市
+421001市辖区
+421002沙市区
+421003荆州区
+421022公安县
+421023监利县
+421024江陵县
+421081石首市
+421083洪湖市
+421087松滋市
+421100黄冈市
+421101市辖区
+421102黄州区
+421121团风县
+421122红安县
+421123罗田县
+421124英山县
+421125浠水县
+421126蕲春县
+421127黄梅县
+421181麻城市
+421182武穴市
+421200咸宁市
+421201市辖区
+421202咸安区
+421221嘉鱼县
+421222通城县
+421223崇阳县
+421224通山县
+421281赤壁市
+421300随州市
+421301市辖区
+421302曾都区
+421381广水市
+422800恩施州
+422801恩施市
+422802利川市
+422822建始县
+422823巴东县
+422825宣恩县
+422826咸丰县
+422827来凤县
+422828鹤峰县
+429000省直辖行政单位
+429004仙桃市
+429005潜江市
+429006天门市
+429021神农架林区
+430000湖南省
+430100长沙市
+430101市辖区
+430102芙蓉区
+430103天心区
+430104岳麓区
+430105开福区
+430111雨花区
+430121长沙县
+430122望城县
+430124宁乡县
+430181浏阳市
+430200株洲市
+430201市辖区
+430202荷塘区
+430203芦淞区
+430204石峰区
+430211天元区
+430221株洲县
+430223攸县
+430224茶陵县
+430225炎陵县
+430281醴陵市
+430300湘潭市
+430301市辖区
+430302雨湖区
+430304岳塘区
+430321湘潭县
+430381湘乡市
+430382韶山市
+430400衡阳市
+430401市辖区
+430405珠晖区
+430406雁峰区
+430407石鼓区
+430408蒸湘区
+430412南岳区
+430421衡阳县
+430422衡南县
+430423衡山县
+430424衡东县
+430426祁东县
+430481耒阳市
+430482常宁市
+430500邵阳市
+430501市辖区
+430502双清区
+430503大祥区
+430511北塔区
+430521邵东县
+430522新邵县
+430523邵阳县
+430524隆回县
+430525洞口县
+430527绥宁县
+430528新宁县
+430529城步苗族自治县
+430581武冈市
+430600岳阳市
+430601市辖区
+430602岳阳楼区
+430603云溪区
+430611君山区
+430621岳阳县
+430623华容县
+430624湘阴县
+430626平江县
+430681汩罗市
+430682临湘市
+430700常德市
+430701市辖区
+430702武陵区
+430703鼎城区
+430721安乡县
+430722汉寿县
+430723澧县
+430724临澧县
+430725桃源县
+430726石门县
+430781津市市
+430800张家界市
+430801市辖区
+430802永定区
+430811武陵源区
+430821慈利县
+430822桑植县
+430900益阳市
+430901市辖区
+430902资阳区
+430903赫山区
+430921南县
+430922桃江县
+430923安化县
+430981沅江市
+431000郴州市
+431001市辖区
+431002北湖区
+431003苏仙区
+431021桂阳县
+431022宜章县
+431023永兴县
+431024嘉禾县
+431025临武县
+431026汝城县
+431027桂东县
+431028安仁县
+431081资兴市
+431100永州市
+431101市辖区
+431102零陵区
+431103冷水滩区
+431121祁阳县
+431122东安县
+431123双牌县
+431124道县
+431125江永县
+431126宁远县
+431127蓝山县
+431128新田县
+431129江华县
+431200怀化市
+431201市辖区
+431202鹤城区
+431221中方县
+431222沅陵县
+431223辰溪县
+431224溆浦县
+431225会同县
+431226麻阳苗族自治县
+431227新晃侗族自治县
+431228芷江侗族自治县
+431229靖州苗族侗族县
+431230通道侗族自治县
+431281洪江市
+431300娄底市
+431301市辖区
+431302娄星区
+431321双峰县
+431322新化县
+431381冷水江市
+431382涟源市
+433100湘西土家族苗族自治州
+433101吉首市
+433122泸溪县
+433123凤凰县
+433124花垣县
+433125保靖县
+433126古丈县
+433127永顺县
+433130龙山县
+440000广东省
+440100广州市
+440103荔湾区
+440104越秀区
+440105海珠区
+440106天河区
+440111白云区
+440112黄埔区
+440113番禺区
+440114花都区
+440115南沙区
+440116萝岗区
+440183增城市
+440184从化市
+440200韶关市
+440203武江区
+440204浈江区
+440205曲江区
+440222始兴县
+440224仁化县
+440229翁源县
+440232乳源瑶族自治县
+440233新丰县
+440281乐昌市
+440282南雄市
+440300深圳市
+440303罗湖区
+440304福田区
+440305南山区
+440306宝安区
+440307龙岗区
+440308盐田区
+440400珠海市
+440402香洲区
+440403斗门区
+440404金湾区
+440500汕头市
+440507龙湖区
+440511金平区
+440512濠江区
+440513潮阳区
+440514潮南区
+440515澄海区
+440523南澳县
+440600佛山市
+440604禅城区
+440605南海区
+440606顺德区
+440607三水区
+440608高明区
+440700江门市
+440703蓬江区
+440704江海区
+440705新会区
+440781台山市
+440783开平市
+440784鹤山市
+440785恩平市
+440800湛江市
+440802湛江市赤坎区
+440803湛江市霞山区
+440804湛江市坡头区
+440811湛江市麻章区
+440823遂溪县
+440825徐闻县
+440881廉江市
+440882雷州市
+440883吴川市
+440900茂名市
+440902茂南区
+440903茂港区
+440923电白县
+440981高州市
+440982化州市
+440983信宜市
+441200肇庆市
+441202端州区
+441203鼎湖区
+441223广宁县
+441224怀集县
+441225封开县
+441226德庆县
+441283高要市
+441284四会市
+441300惠州市
+441302惠城区
+441303惠阳区
+441322博罗县
+441323惠东县
+441324龙门县
+441400梅州市
+441402梅江区
+441421梅县
+441422大埔县
+441423丰顺县
+441424五华县
+441426平远县
+441427蕉岭县
+441481兴宁市
+441500汕尾市
+441501市辖区
+441502城区
+441521海丰县
+441523陆河县
+441581陆丰市
+441600河源市
+441602源城区
+441621紫金县
+441622龙川县
+441623连平县
+441624和平县
+441625东源县
+441700阳江市
+441702江城区
+441721阳西县
+441723阳东县
+441781阳春市
+441800清远市
+441802清城区
+441821佛冈县
+441823阳山县
+441825连山县
+441826连南瑶族自治县
+441827清新县
+441881英德市
+441882连州市
+441900东莞市
+441901市辖区
+442000中山市
+442001市辖区
+445100潮州市
+445102潮州市湘桥区
+445121潮州市潮安县
+445122潮州市饶平县
+445200揭阳市
+445202榕城区
+445221揭东县
+445222揭西县
+445224惠来县
+445281普宁市
+445300云浮市
+445302云城区
+445321新兴县
+445322郁南县
+445323云安县
+445381罗定市
+450000广西壮族自治区
+450100南宁市
+450101市辖区
+450102兴宁区
+450103青秀区
+450105江南区
+450107西乡塘区
+450108良庆区
+450109邕宁区
+450122武鸣县
+450123隆安县
+450124马山县
+450125上林县
+450126宾阳县
+450127横县
+450200柳州市
+450201市辖区
+450202城中区
+450203鱼峰区
+450204柳南区
+450205柳北区
+450221柳江县
+450222柳城县
+450223鹿寨县
+450224融安县
+450225融水苗族自治县
+450226三江侗族自治县
+450300桂林市
+450301市辖区
+450302秀峰区
+450303叠彩区
+450304象山区
+450305七星区
+450311雁山区
+450321阳朔县
+450322临桂县
+450323灵川县
+450324全州县
+450325兴安县
+450326永福县
+450327灌阳县
+450328龙胜各族自治县
+450329资源县
+450330平乐县
+450331荔浦县
+450332恭城县
+450400梧州市
+450401市辖区
+450403万秀区
+450404蝶山区
+450405长洲区
+450421苍梧县
+450422藤县
+450423蒙山县
+450481岑溪市
+450500北海市
+450501市辖区
+450502海城区
+450503银海区
+450512铁山港区
+450521合浦县
+450600防城港市
+450601市辖区
+450602港口区
+450603防城区
+450621上思县
+450681东兴市
+450700钦州市
+450701市辖区
+450702钦南区
+450703钦北区
+450721灵山县
+450722浦北县
+450800贵港市
+450801市辖区
+450802港北区
+450803港南区
+450804覃塘区
+450821平南县
+450881桂平市
+450900玉林市
+450901市辖区
+450902玉州区
+450921容县
+450922陆川县
+450923博白县
+450924兴业县
+450981北流市
+451000百色市
+451001市辖区
+451002右江区
+451021田阳县
+451022田东县
+451023平果县
+451024德保县
+451025靖西县
+451026那坡县
+451027凌云县
+451028乐业县
+451029田林县
+451030西林县
+451031隆林各族自治县
+451100贺州市
+451101市辖区
+451102八步区
+451121昭平县
+451122钟山县
+451123富川瑶族自治县
+451200河池市
+451201市辖区
+451202金城江区
+451221南丹县
+451222天峨县
+451223凤山县
+451224东兰县
+451225罗城仫佬族自治县
+451226环江毛南族自治县
+451227巴马瑶族自治县
+451228都安瑶族自治县
+451229大化瑶族自治县
+451281宜州市
+451300来宾市
+451301市辖区
+451302兴宾区
+451321忻城县
+451322象州县
+451323武宣县
+451324金秀瑶族自治县
+451381合山市
+451400崇左市
+451401市辖区
+451402江州区
+451421扶绥县
+451422宁明县
+451423龙州县
+451424大新县
+451425天等县
+451481凭祥市
+460000海南省
+460100海口市
+460101市辖区
+460105秀英区
+460106龙华区
+460107琼山区
+460108美兰区
+460200三亚市
+460201市辖区
+469000省属虚拟市
+469001五指山市
+469002琼海市
+469003儋州市
+469005文昌市
+469006万宁市
+469007东方市
+469025定安县
+469026屯昌县
+469027澄迈县
+469028临高县
+469030白沙黎族自治县
+469031昌江黎族自治县
+469033乐东黎族自治县
+469034陵水黎族自治县
+469035保亭黎族苗族自治县
+469036琼中黎族苗族自治县
+469037西沙群岛
+469038南沙群岛
+469039中沙群岛的岛礁及其海域
+500000重庆市
+500100市辖区
+500101万州区
+500102涪陵区
+500103渝中区
+500104大渡口区
+500105江北区
+500106沙坪坝区
+500107九龙坡区
+500108南岸区
+500109北碚区
+500110万盛区
+500111双桥区
+500112渝北区
+500113巴南区
+500114黔江区
+500115长寿区
+500116江津区
+500117合川区
+500118永川区
+500119南川区
+500200县
+500222綦江县
+500223潼南县
+500224铜梁县
+500225大足县
+500226荣昌县
+500227璧山县
+500228梁平县
+500229城口县
+500230丰都县
+500231垫江县
+500232武隆县
+500233忠县
+500234开县
+500235云阳县
+500236奉节县
+500237巫山县
+500238巫溪县
+500240石柱县
+500241秀山土家族苗族自治县
+500242酉阳土家族苗族自治县
+500243彭水苗族土家族自治县
+510000四川省
+510100成都市
+510101市辖区
+510104锦江区
+510105青羊区
+510106金牛区
+510107武侯区
+510108成华区
+510112龙泉驿区
+510113青白江区
+510114新都区
+510115温江区
+510121金堂县
+510122双流县
+510124郫县
+510129大邑县
+510131蒲江县
+510132新津县
+510181都江堰市
+510182彭州市
+510183邛崃市
+510184崇州市
+510300自贡市
+510301市辖区
+510302自流井区
+510303贡井区
+510304大安区
+510311沿滩区
+510321荣县
+510322富顺县
+510400攀枝花市
+510401市辖区
+510402攀枝花东区
+510403西区
+510411仁和区
+510421米易县
+510422盐边县
+510500泸州市
+510501市辖区
+510502江阳区
+510503纳溪区
+510504龙马潭区
+510521泸县
+510522合江县
+510524叙永县
+510525古蔺县
+510600德阳市
+510601市辖区
+510603旌阳区
+510623中江县
+510626罗江县
+510681广汉市
+510682什邡市
+510683绵竹市
+510700绵阳市
+510701市辖区
+510703涪城区
+510704游仙区
+510722三台县
+510723盐亭县
+510724安县
+510725梓潼县
+510726北川羌族自治县
+510727平武县
+510781江油市
+510800广元市
+510801市辖区
+510802市中区
+510811元坝区
+510812朝天区
+510821旺苍县
+510822青川县
+510823剑阁县
+510824苍溪县
+510900遂宁市
+510901市辖区
+510903船山区
+510904安居区
+510921蓬溪县
+510922射洪县
+510923大英县
+511000内江市
+511001市辖区
+511002市中区
+511011东兴区
+511024威远县
+511025资中县
+511028隆昌县
+511100乐山市
+511101市辖区
+511102市中区
+511111沙湾区
+511112五通桥区
+511113金口河区
+511123犍为县
+511124井研县
+511126夹江县
+511129沐川县
+511132峨边彝族自治县
+511133马边彝族自治县
+511181峨眉山市
+511300南充市
+511301市辖区
+511302顺庆区
+511303高坪区
+511304嘉陵区
+511321南部县
+511322营山县
+511323蓬安县
+511324仪陇县
+511325西充县
+511381阆中市
+511400眉山市
+511401市辖区
+511402东坡区
+511421仁寿县
+511422彭山县
+511423洪雅县
+511424丹棱县
+511425青神县
+511500宜宾市
+511501市辖区
+511502翠屏区
+511521宜宾县
+511522南溪县
+511523江安县
+511524长宁县
+511525高县
+511526珙县
+511527筠连县
+511528兴文县
+511529屏山县
+511600广安市
+511601市辖区
+511602广安区
+511621岳池县
+511622武胜县
+511623邻水县
+511681华蓥市
+511700达州市
+511701市辖区
+511702通川区
+511721达县
+511722宣汉县
+511723开江县
+511724大竹县
+511725渠县
+511781万源市
+511800雅安市
+511801市辖区
+511802雨城区
+511821名山县
+511822荥经县
+511823汉源县
+511824石棉县
+511825天全县
+511826芦山县
+511827宝兴县
+511900巴中市
+511901市辖区
+511902巴州区
+511921通江县
+511922南江县
+511923平昌县
+512000资阳市
+512001市辖区
+512002雁江区
+512021安岳县
+512022乐至县
+512081简阳市
+513200阿坝州
+513221汶川县
+513222理县
+513223茂县
+513224松潘县
+513225九寨沟县
+513226金川县
+513227小金县
+513228黑水县
+513229马尔康县
+513230壤塘县
+513231阿坝县
+513232若尔盖县
+513233红原县
+513300甘孜藏族自治州
+513321康定县
+513322泸定县
+513323丹巴县
+513324九龙县
+513325雅江县
+513326道孚县
+513327炉霍县
+513328甘孜县
+513329新龙县
+513330德格县
+513331白玉县
+513332石渠县
+513333色达县
+513334理塘县
+513335巴塘县
+513336乡城县
+513337稻城县
+513338得荣县
+513400凉山州
+513401西昌市
+513422木里藏族自治县
+513423盐源县
+513424德昌
+513425会理县
+513426会东县
+513427宁南县
+513428普格县
+513429布拖县
+513430金阳县
+513431昭觉县
+513432喜德县
+513433冕宁县
+513434越西县
+513435甘洛县
+513436美姑县
+513437雷波县
+520000贵州省
+520100贵阳市
+520101市辖区
+520102南明区
+520103云岩区
+520111花溪区
+520112乌当区
+520113白云区
+520114小河区
+520121开阳县
+520122息烽县
+520123修文县
+520181清镇市
+520200六盘水市
+520201钟山区
+520203六枝特区
+520221水城县
+520222盘县
+520300遵义市
+520301市辖区
+520302红花岗区
+520303汇川区
+520321遵义县
+520322桐梓县
+520323绥阳县
+520324正安县
+520325道真仡佬族苗族自治县
+520326务川仡佬族苗族自治县
+520327凤冈县
+520328湄潭县
+520329余庆县
+520330习水县
+520381赤水市
+520382仁怀市
+520400安顺市
+520401市辖区
+520402西秀区
+520421平坝县
+520422普定县
+520423镇宁布依族苗族自治县
+520424关岭自治县
+520425紫云苗族布依族自治县
+522200铜仁地区
+522201铜仁市
+522222江口县
+522223玉屏侗族自治县
+522224石阡县
+522225思南县
+522226印江土家族苗族自治县
+522227德江县
+522228沿河土家族自治县
+522229松桃苗族自治县
+522230万山特区
+522300黔西南州
+522301兴义市
+522322兴仁县
+522323普安县
+522324晴隆县
+522325贞丰县
+522326望谟县
+522327册亨县
+522328安龙县
+522400毕节地区
+522401毕节市
+522422大方县
+522423黔西县
+522424金沙县
+522425织金县
+522426纳雍县
+522427威宁彝族回族苗族自治县
+522428赫章县
+522600黔东南苗族侗族自治州
+522601凯里市
+522622黄平县
+522623施秉县
+522624三穗县
+522625镇远县
+522626岑巩县
+522627天柱县
+522628锦屏县
+522629剑河县
+522630台江县
+522631黎平县
+522632榕江县
+522633从江县
+522634雷山县
+522635麻江县
+522636丹寨县
+522700黔南布依族苗族自治州
+522701都匀市
+522702福泉市
+522722荔波县
+522723贵定县
+522725瓮安县
+522726独山县
+522727平塘县
+522728罗甸县
+522729长顺县
+522730龙里县
+522731惠水县
+522732三都水族自治县
+530000云南省
+530100昆明市
+530101市辖区
+530102五华区
+530103盘龙区
+530111官渡区
+530112西山区
+530113东川区
+530121呈贡县
+530122晋宁县
+530124富民县
+530125宜良县
+530126石林县
+530127嵩明县
+530128禄劝县
+530129寻甸县
+530181安宁市
+530300曲靖市
+530301市辖区
+530302麒麟区
+530321马龙县
+530322陆良县
+530323师宗县
+530324罗平县
+530325富源县
+530326会泽县
+530328沾益县
+530381宣威市
+530400玉溪市
+530401市辖区
+530402红塔区
+530421江川县
+530422澄江县
+530423通海县
+530424华宁县
+530425易门县
+530426峨山县
+530427新平县
+530428元江县
+530500保山市
+530501市辖区
+530502隆阳区
+530521施甸县
+530522腾冲县
+530523龙陵县
+530524昌宁县
+530600昭通市
+530601市辖区
+530602昭阳区
+530621鲁甸县
+530622巧家县
+530623盐津县
+530624大关县
+530625永善县
+530626绥江县
+530627镇雄县
+530628彝良县
+530629威信县
+530630水富县
+530700丽江市
+530701市辖区
+530702古城区
+530721玉龙县
+530722永胜县
+530723华坪县
+530724宁蒗县
+530800思茅市
+530801市辖区
+530802翠云区
+530821普洱县
+530822墨江县
+530823景东县
+530824景谷县
+530825镇沅县
+530826江城县
+530827孟连县
+530828澜沧县
+530829西盟县
+530900临沧市
+530901市辖区
+530902临翔区
+530921凤庆县
+530922云县
+530923永德县
+530924镇康县
+530925双江县
+530926耿马县
+530927沧源县
+532300楚雄州
+532301楚雄市
+532322双柏县
+532323牟定县
+532324南华县
+532325姚安县
+532326大姚县
+532327永仁县
+532328元谋县
+532329武定县
+532331禄丰县
+532500红河州
+532501个旧市
+532502开远市
+532522蒙自县
+532523屏边县
+532524建水县
+532525石屏县
+532526弥勒县
+532527泸西县
+532528元阳县
+532529红河县
+532530金平县
+532531绿春县
+532532河口县
+532600文山州
+532621文山县
+532622砚山县
+532623西畴县
+532624麻栗坡县
+532625马关县
+532626丘北县
+532627广南县
+532628富宁县
+532800西双版纳州
+532801景洪市
+532822勐海县
+532823勐腊县
+532900大理州
+532901大理市
+532922漾濞县
+532923祥云县
+532924宾川县
+532925弥渡县
+532926南涧县
+532927巍山县
+532928永平县
+532929云龙县
+532930洱源县
+532931剑川县
+532932鹤庆县
+533100德宏州
+533102瑞丽市
+533103潞西市
+533122梁河县
+533123盈江县
+533124陇川县
+533300怒江州
+533321泸水县
+533323福贡县
+533324贡山县
+533325兰坪县
+533400迪庆州
+533421香格里拉县
+533422德钦县
+533423维西县
+540000西藏自治区
+540100拉萨市
+540102城关区
+540121林周县
+540122当雄县
+540123尼木县
+540124曲水县
+540125堆龙德庆
+540126达孜县
+540127墨竹工卡县
+542100昌都地区
+542121昌都县
+542122江达县
+542123贡觉县
+542124类乌齐县
+542125丁青县
+542126察亚县
+542127八宿县
+542128左贡县
+542129芒康县
+542132洛隆县
+542133边坝县
+542200山南地区
+542221乃东县
+542222扎囊县
+542223贡嘎县
+542224桑日县
+542225琼结县
+542226曲松县
+542227措美县
+542228洛扎县
+542229加查县
+542231隆子县
+542232错那县
+542233浪卡子县
+542300日喀则地区
+542301日喀则市
+542322南木林县
+542323江孜县
+542324定日县
+542325萨迦县
+542326拉孜县
+542327昂仁县
+542328谢通门县
+542329白朗县
+542330仁布县
+542331康马县
+542332定结县
+542333仲巴县
+542334亚东县
+542335吉隆县
+542336聂拉木县
+542337萨嘎县
+542338岗巴县
+542400那曲地区
+542421那曲县
+542422嘉黎县
+542423比如县
+542424聂荣县
+542425安多县
+542426申扎县
+542427索县
+542428班戈县
+542429巴青县
+542430尼玛县
+542500阿里地区
+542521普兰县
+542522札达县
+542523噶尔县
+542524日土县
+542525革吉县
+542526改则县
+542527措勤县
+542600林芝地区
+542621林芝县
+542622工布江达县
+542623米林县
+542624墨脱县
+542625波密县
+542626察隅县
+542627朗县
+610000陕西省
+610100西安市
+610101市辖区
+610102新城区
+610103碑林区
+610104莲湖区
+610111灞桥区
+610112未央区
+610113雁塔区
+610114阎良区
+610115临潼区
+610116长安区
+610122蓝田县
+610124周至县
+610125户县
+610126高陵县
+610200铜川市
+610201市辖区
+610202王益区
+610203印台区
+610204耀州区
+610222宜君县
+610300宝鸡市
+610301市辖区
+610302渭滨区
+610303金台区
+610304陈仓区
+610322凤翔县
+610323岐山县
+610324扶风县
+610326眉县
+610327陇县
+610328千阳县
+610329麟游县
+610330凤县
+610331太白县
+610400咸阳市
+610401市辖区
+610402秦都区
+610403杨凌区
+610404渭城区
+610422三原县
+610423泾阳县
+610424乾县
+610425礼泉县
+610426永寿县
+610427彬县
+610428长武县
+610429旬邑县
+610430淳化县
+610431武功县
+610481兴平市
+610500渭南市
+610501市辖区
+610502临渭区
+610521华县
+610522潼关县
+610523大荔县
+610524合阳县
+610525澄城县
+610526蒲城县
+610527白水县
+610528富平县
+610581韩城市
+610582华阴市
+610600延安市
+610601市辖区
+610602宝塔区
+610621延长县
+610622延川县
+610623子长县
+610624安塞县
+610625志丹县
+610626吴起县
+610627甘泉县
+610628富县
+610629洛川县
+610630宜川县
+610631黄龙县
+610632黄陵县
+610700汉中市
+610701市辖区
+610702汉台区
+610721南郑县
+610722城固县
+610723洋县
+610724西乡县
+610725勉县
+610726宁强县
+610727略阳县
+610728镇巴县
+610729留坝县
+610730佛坪县
+610800榆林市
+610801市辖区
+610802榆阳区
+610821神木县
+610822府谷县
+610823横山县
+610824靖边县
+610825定边县
+610826绥德县
+610827米脂县
+610828佳县
+610829吴堡县
+610830清涧县
+610831子洲县
+610900安康市
+610901市辖区
+610902汉滨区
+610921汉阴县
+610922石泉县
+610923宁陕县
+610924紫阳县
+610925岚皋县
+610926平利县
+610927镇坪县
+610928旬阳县
+610929白河县
+611000商洛市
+611001市辖区
+611002商州区
+611021洛南县
+611022丹凤县
+611023商南县
+611024山阳县
+611025镇安县
+611026柞水县
+620000甘肃省
+620100兰州市
+620101市辖区
+620102城关区
+620103七里河区
+620104兰州市西固区
+620105安宁区
+620111红古区
+620121永登县
+620122皋兰县
+620123榆中县
+620200嘉峪关市
+620201市辖
+620300金昌市
+620301市辖区
+620302金川区
+620321永昌县
+620400白银市
+620401市辖区
+620402白银区
+620403平川区
+620421靖远县
+620422会宁县
+620423景泰县
+620500天水市
+620501市辖区
+620502秦州区
+620503麦积区
+620521清水县
+620522秦安县
+620523甘谷县
+620524武山县
+620525张家川县
+620600武威市
+620601市辖区
+620602凉州区
+620621民勤县
+620622古浪县
+620623天祝县
+620700张掖市
+620701市辖区
+620702甘州区
+620721肃南裕固族自治县
+620722民乐县
+620723临泽县
+620724高台县
+620725山丹县
+620800平凉市
+620801市辖区
+620802崆峒区
+620821泾川县
+620822灵台县
+620823崇信县
+620824华亭县
+620825庄浪县
+620826静宁县
+620900酒泉市
+620901市辖区
+620902肃州区
+620921金塔县
+620922瓜州县
+620923肃北蒙古族自治县
+620924阿克塞县
+620981玉门市
+620982敦煌市
+621000庆阳市
+621001市辖区
+621002西峰区
+621021庆城县
+621022环县
+621023华池县
+621024合水县
+621025正宁县
+621026宁县
+621027镇原县
+621100定西市
+621101市辖区
+621102安定区
+621121通渭县
+621122陇西县
+621123渭源县
+621124临洮县
+621125漳县
+621126岷县
+621200陇南市
+621201市辖区
+621202武都区
+621221成县
+621222文县
+621223宕昌县
+621224康县
+621225西和县
+621226礼县
+621227徽县
+621228两当县
+622900临夏州
+622901临夏市
+622921临夏县
+622922康乐县
+622923永靖县
+622924广河县
+622925和政县
+622926东乡族自治县
+622927积石山县
+623000甘南州
+623001合作市
+623021临潭县
+623022卓尼县
+623023舟曲县
+623024迭部县
+623025玛曲县
+623026碌曲县
+623027夏河县
+630000青海省
+630100西宁市
+630102城东区
+630103城中区
+630104城西区
+630105城北区
+630121大通回族土族自治县
+630122湟中县
+630123湟源县
+632100海东地区
+632121平安县
+632122民和县
+632123乐都县
+632126互助县
+632127化隆回族自治县
+632128循化县
+632200海北州
+632221门源县
+632222祁连县
+632223海晏县
+632224刚察县
+632300黄南州
+632321同仁县
+632322尖扎县
+632323泽库县
+632324河南县
+632500海南州
+632521共和县
+632522同德县
+632523贵德县
+632524兴海县
+632525贵南县
+632600果洛州
+632621玛沁县
+632622班玛县
+632623甘德县
+632624达日县
+632625久治县
+632626玛多县
+632700玉树州
+632721玉树县
+632722杂多县
+632723称多县
+632724治多县
+632725囊谦县
+632726曲麻莱县
+632800海西州
+632801格尔木市
+632802德令哈市
+632821乌兰县
+632822都兰县
+632823天峻县
+640000宁夏回族自治区
+640100银川市
+640101市辖区
+640104兴庆区
+640105西夏区
+640106金凤区
+640121永宁县
+640122贺兰县
+640181灵武市
+640200石嘴山市
+640201市辖区
+640202大武口区
+640205惠农区
+640221平罗县
+640300吴忠市
+640301市辖区
+640302利通区
+640323盐池县
+640324同心县
+640381青铜峡市
+640400固原市
+640401市辖区
+640402原州区
+640422西吉县
+640423隆德县
+640424泾源县
+640425彭阳县
+640500中卫市
+640501市辖区
+640502沙坡头区
+640521中宁县
+640522海原县
+650000新疆维吾尔自治区
+650100乌鲁木齐市
+650101市辖区
+650102天山区
+650103沙依巴克区
+650104新市区
+650105水磨沟区
+650106头屯河区
+650107达坂城区
+650108东山区
+650121乌鲁木齐县
+650200克拉玛依市
+650201市辖区
+650202独山子区
+650203克拉玛依区
+650204白碱滩区
+650205乌尔禾区
+652100吐鲁番地区
+652101吐鲁番市
+652122鄯善县
+652123托克逊县
+652200哈密地区
+652201哈密市
+652222巴里坤县
+652223伊吾县
+652300昌吉州
+652301昌吉市
+652302阜康市
+652303米泉市
+652323呼图壁县
+652324玛纳斯
+652325奇台县
+652327吉木萨尔县
+652328木垒县
+652700博尔塔拉蒙古自治州
+652701博乐市
+652722精河县
+652723温泉县
+652800巴音郭楞蒙古自治州
+652801库尔勒市
+652822轮台县
+652823尉犁县
+652824若羌县
+652825且末县
+652826焉耆县
+652827和静县
+652828和硕县
+652829博湖县
+652900阿克苏地区
+652901阿克苏市
+652922温宿县
+652923库车县
+652924沙雅县
+652925新和县
+652926拜城县
+652927乌什县
+652928阿瓦提县
+652929柯坪县
+653000克州
+653001阿图什市
+653022阿克陶县
+653023阿合奇县
+653024乌恰县
+653100喀什地区
+653101喀什市
+653121疏附县
+653122疏勒县
+653123英吉沙县
+653124泽普县
+653125莎车县
+653126叶城县
+653127麦盖提县
+653128岳普湖县
+653129伽师县
+653130巴楚县
+653131塔什库尔干县
+653200和田地区
+653201和田市
+653221和田县
+653222墨玉县
+653223皮山县
+653224洛浦县
+653225策勒县
+653226于田县
+653227民丰县
+654000伊犁州
+654002伊宁市
+654003奎屯市
+654021伊宁县
+654022察布查尔县
+654023霍城县
+654024巩留县
+654025新源县
+654026昭苏县
+654027特克斯县
+654028尼勒克县
+654200塔城地区
+654201塔城市
+654202乌苏市
+654221额敏县
+654223沙湾县
+654224托里县
+654225裕民县
+654226和布克赛尔蒙古自治县
+654300阿勒泰地区
+654301阿勒泰市
+654321布尔津县
+654322富蕴县
+654323福海县
+654324哈巴河县
+654325青河县
+654326吉木乃县
+659000省直辖行政单位
+659001石河子市
+659002阿拉尔市
+659003图木舒克市
+659004五家渠市
+"""
+
+
+class RegionTable:
+    """紧凑的行政区划表：代码按升序存放在array("i")中，名称经去重后存放在名称表中，
+    按代码查询名称为O(log n)，某个省、市下的全部代码在数组中是连续的一段
+
+    代码为6位整数：后4位为0的是省级，后2位为0的是地级，其余为县级
+    """
+
+    PROVINCE, CITY, DISTRICT = 1, 2, 3
+
+    def __init__(self, items):
+        """
+        :param items: (代码, 名称)的可迭代对象
+        """
+        items = sorted(items)
+        names = {}
+        self.codes = array("i", (code for code, _ in items))
+        self._name_indices = array("H", (names.setdefault(sys.intern(name), len(names)) for _, name in items))
+        self._names = tuple(names)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        names = self._names
+        return ((code, names[index]) for code, index in zip(self.codes, self._name_indices))
+
+    def __contains__(self, code):
+        return self._index(code) is not None
+
+    def __getitem__(self, code) -> str:
+        index = self._index(code)
+        if index is None:
+            raise KeyError(code)
+        return self._names[self._name_indices[index]]
+
+    def get(self, code, default=None):
+        """按代码查询名称，不存在时返回default"""
+        index = self._index(code)
+        return default if index is None else self._names[self._name_indices[index]]
+
+    def _index(self, code):
+        code = int(code)
+        index = bisect.bisect_left(self.codes, code)
+        if index < len(self.codes) and self.codes[index] == code:
+            return index
+        return None
+
+    @classmethod
+    def level(cls, code) -> int:
+        """代码的级别：1省级，2地级，3县级"""
+        code = int(code)
+        if code % 10000 == 0:
+            return cls.PROVINCE
+        if code % 100 == 0:
+            return cls.CITY
+        return cls.DISTRICT
+
+    def parent(self, code) -> int | None:
+        """上级代码，县级优先返回所属地级，表中不存在所属地级时返回省级；省级返回None"""
+        code = int(code)
+        level = self.level(code)
+        if level == self.DISTRICT and code // 100 * 100 in self:
+            return code // 100 * 100
+        if level != self.PROVINCE and code // 10000 * 10000 in self:
+            return code // 10000 * 10000
+        return None
+
+    def children(self, code) -> list:
+        """直属下级代码：省级返回地级，地级返回县级；直辖县级（没有地级）归入省级"""
+        return [child for child in self.select(code) if self.parent(child) == int(code)]
+
+    @staticmethod
+    def _code_range(region) -> tuple[int, int]:
+        """地区前缀对应的代码区间[low, high)：2位为省，4位为地级，6位按自身级别"""
+        text = str(region)
+        if len(text) == 6:
+            code = int(text)
+            if code % 10000 == 0:
+                text = text[:2]
+            elif code % 100 == 0:
+                text = text[:4]
+        if len(text) not in (2, 4, 6) or not text.isdigit():
+            raise ValueError(f"地区代码应为2、4或6位数字：{region}")
+        scale = 10 ** (6 - len(text))
+        return int(text) * scale, (int(text) + 1) * scale
+
+    def select(self, region=None, level: int | None = None) -> array:
+        """筛选代码
+        :param region: 地区代码或前缀，如44、4401、440000、440100，为空时不限地区；结果包含该地区自身
+        :param level: 级别，1省级，2地级，3县级，为空时不限
+        :return: 升序的代码数组
+        """
+        codes = self.codes
+        if region is not None:
+            low, high = self._code_range(region)
+            codes = codes[bisect.bisect_left(codes, low) : bisect.bisect_left(codes, high)]
+        if level is not None:
+            codes = array("i", (code for code in codes if self.level(code) == level))
+        return codes
+
+    def sample(self, k: int = 1, region=None, level: int | None = None, rng=random) -> list:
+        """随机抽取k个代码（可重复）
+        :param rng: 随机数生成器，默认为random模块
+        其他参数同select
+        """
+        codes = self.select(region, level)
+        if not codes:
+            raise ValueError(f"未找到符合条件的地区：region={region}, level={level}")
+        return rng.choices(codes, k=k)
+
+
+def _iter_addr_data():
+    """逐行解析_ADDR_DATA，生成(代码, 名称)"""
+    for line in _ADDR_DATA.splitlines():
+        yield int(line[:6]), line[6:]
+
+
+_region_table = None
+
+
+def get_region_table() -> RegionTable:
+    """首次调用时由_ADDR_DATA构建行政区划表"""
+    global _region_table
+    if _region_table is None:
+        _region_table = RegionTable(_iter_addr_data())
+    return _region_table
+
+
+def __getattr__(name: str):
+    """兼容旧版本的模块属性addr：(代码, 名称)元组的列表，首次访问时由行政区划表生成并缓存"""
+    if name == "addr":
+        value = list(get_region_table())
+        globals()["addr"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,10 +8,28 @@ time：2020-06-28
 import os
 import sys
 import json
+import zlib
+import pickle
 import logging
+import time
+import uuid
 import sqlite3
+import threading
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
 from redis import Redis, ConnectionPool
+from redis.exceptions import ResponseError
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
 
 from .utils import byte_to_str, get_caller_info
 
@@ -19,27 +37,52 @@ logger = logging.getLogger(__name__)
 from .encrypt import to_decode, sum_md5
 from .file import read_file_content, save_json_to_file
 
+# 不自动失效的锁在SQLite中的租约天数
+_LOCK_NO_EXPIRE_DAYS = 365 * 1000
+
+# SQLite单条语句中IN参数的分批数量，避免超过SQLITE_MAX_VARIABLE_NUMBER
+_SQLITE_BATCH_SIZE = 500
+
+# 释放锁：只有token一致时才删除，避免误删其他进程持有的锁
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
-def get_cache_obj(db_index: int = 15):
+
+def get_cache_obj(
+    db_index: int = 15, local_cache: bool = False, local_cache_size: int = 1024, local_cache_ttl=60, serializer=None
+):
     """获取缓存对象
     :param db_index: int, redis中数据库索引编号
+    :param local_cache: bool, 为True时在缓存对象前增加进程内LRU缓存层（LocalCache）
+    :param local_cache_size: int, 进程内缓存的最大条目数
+    :param local_cache_ttl: int or float, 进程内缓存条目的最长存活秒数
+    :param serializer: 缓存值的序列化方式，序列化方式名称或CacheSerializer对象，为空时使用JSON
     """
+    cache_obj = None
     if os.environ.get("REDIS_DB_CONNECT"):
         try:
-            _redis = MyRedis(db_index)
+            cache_obj = MyRedis(db_index, serializer=serializer)
         except Exception as _e:
             pass
         else:
             logger.debug(f"redis缓存初始成功！")
-            return _redis
 
-    if sys.platform == "win32":
-        _target_path = Path(os.environ["USERPROFILE"])
-    else:
-        _target_path = Path(os.environ["HOME"])
-    __cache_path__ = _target_path / ".dbox_cache.db"
-    logger.warning(f"redis缓存不可用，启动本地SQLite缓存：{__cache_path__}")
-    return MyCache(__cache_path__)
+    if cache_obj is None:
+        if sys.platform == "win32":
+            _target_path = Path(os.environ["USERPROFILE"])
+        else:
+            _target_path = Path(os.environ["HOME"])
+        __cache_path__ = _target_path / ".dbox_cache.db"
+        logger.warning(f"redis缓存不可用，启动本地SQLite缓存：{__cache_path__}")
+        cache_obj = MyCache(__cache_path__, serializer=serializer)
+
+    if local_cache:
+        return LocalCache(cache_obj, maxsize=local_cache_size, ttl=local_cache_ttl)
+    return cache_obj
 
 
 def get_redis_pool(db_index=0, max_connections=None):
@@ -74,49 +117,223 @@ def get_redis_handler(db_index=0):
         return None
 
 
-def batch_delete_key(db_index: int, name_expression: str):
+def batch_delete_key(db_index: int, name_expression: str, count: int = 1000, chunk_size: int = 500) -> int:
     """批量删除redis key
     :param db_index: int, redis中数据库索引编号
     :param name_expression: str, key值通配符
+    :param count: int, 每次SCAN建议返回的数量
+    :param chunk_size: int, 每次删除的key数量上限
+    :return 删除的key数量
     """
     redis = get_redis_handler(db_index)
     if redis is None:
         logger.warning("Redis connection failed, cannot delete keys")
-        return
-    temp_lock_list = redis.keys(name_expression)  # type: ignore
-    if temp_lock_list:
-        redis.delete(*list(temp_lock_list))  # type: ignore
+        return 0
+    return scan_delete(redis, name_expression, count=count, chunk_size=chunk_size)
+
+
+def scan_delete(redis: Redis, name_expression: str, count: int = 1000, chunk_size: int = 500) -> int:
+    """通过SCAN增量遍历并分批删除匹配的key，避免KEYS命令阻塞redis服务
+    :param redis: Redis, redis连接对象
+    :param name_expression: str, key值通配符
+    :param count: int, 每次SCAN建议返回的数量
+    :param chunk_size: int, 每次删除的key数量上限，优先使用UNLINK异步释放内存，服务端不支持时改用DELETE
+    :return 删除的key数量
+    """
+    deleted_count = 0
+    use_unlink = True
+    chunk = []
+
+    def _delete_chunk():
+        nonlocal use_unlink
+        if use_unlink:
+            try:
+                return redis.unlink(*chunk)  # type: ignore
+            except ResponseError as e:
+                # redis 4.0以下版本不支持UNLINK
+                logger.debug(f"UNLINK不可用，改用DELETE：{e}")
+                use_unlink = False
+        return redis.delete(*chunk)  # type: ignore
+
+    for key in redis.scan_iter(match=name_expression, count=count):
+        chunk.append(key)
+        if len(chunk) >= chunk_size:
+            deleted_count += _delete_chunk()
+            chunk = []
+    if chunk:
+        deleted_count += _delete_chunk()
+    return deleted_count
+
+
+class CacheLockTimeout(Exception):
+    """在限定时间内未能获取缓存锁"""
+
+
+class CacheLock:
+    """基于缓存的分布式锁，通过cache_lock或MyCache.lock获取（MyRedis的lock仍为redis-py原有的方法），
+    用法与redis-py的Lock一致：
+
+        with cache.cache_lock("job", ttl=30):
+            ...
+
+    每次获取时生成随机token，释放时只删除token一致的锁，避免误删已过期后被其他进程获取的锁；
+    ttl到期后锁自动失效，防止持有者异常退出导致死锁。
+    """
+
+    def __init__(self, backend, name: str, ttl: float = 30, blocking: bool = True, blocking_timeout=None, sleep=0.1):
+        """
+        :param backend: MyRedis或MyCache对象
+        :param name: str, 锁名称
+        :param ttl: int or float, 锁的自动失效秒数，为空时不自动失效
+        :param blocking: bool, 获取不到锁时是否等待
+        :param blocking_timeout: int or float, 最长等待秒数，为空时一直等待
+        :param sleep: float, 等待时的轮询间隔秒数
+        """
+        self.backend = backend
+        self.name = name
+        self.ttl = ttl
+        self.blocking = blocking
+        self.blocking_timeout = blocking_timeout
+        self.sleep = sleep
+        self.token = None
+
+    def __enter__(self):
+        if not self.acquire():
+            raise CacheLockTimeout(f"获取锁超时：{self.name}")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+    def acquire(self, blocking: bool | None = None, blocking_timeout=None) -> bool:
+        """获取锁，成功返回True"""
+        blocking = self.blocking if blocking is None else blocking
+        blocking_timeout = self.blocking_timeout if blocking_timeout is None else blocking_timeout
+        token = uuid.uuid4().hex
+        deadline = None if blocking_timeout is None else time.monotonic() + blocking_timeout
+        while True:
+            if self.backend._acquire_lock(self.name, token, self.ttl):
+                self.token = token
+                return True
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                return False
+            time.sleep(self.sleep)
+
+    def release(self) -> bool:
+        """释放锁，锁已失效或已被其他进程获取时返回False"""
+        if self.token is None:
+            return False
+        token, self.token = self.token, None
+        return bool(self.backend._release_lock(self.name, token))
+
+    def locked(self) -> bool:
+        """当前对象是否持有锁（不检查是否已过期）"""
+        return self.token is not None
+
+
+class _CacheLockMixin:
+    """MyRedis与MyCache共用的锁和单飞（single-flight）计算逻辑，子类需实现：
+    _acquire_lock、_release_lock、_get_value、_set_value
+    """
+
+    def cache_lock(self, name: str, ttl: float = 30, blocking: bool = True, blocking_timeout=None, sleep=0.1):
+        """获取锁对象，可作为上下文管理器使用
+        :param name: str, 锁名称
+        :param ttl: int or float, 锁的自动失效秒数
+        :param blocking: bool, 获取不到锁时是否等待
+        :param blocking_timeout: int or float, 最长等待秒数，为空时一直等待，超时后进入with时抛出CacheLockTimeout
+        :param sleep: float, 等待时的轮询间隔秒数
+        """
+        return CacheLock(self, name, ttl=ttl, blocking=blocking, blocking_timeout=blocking_timeout, sleep=sleep)
+
+    def get_or_compute(self, key: str, fn, ttl, stale_ttl=0, lock_ttl=30, wait_timeout=None, sleep=0.1):
+        """读取缓存，不存在或已过期时调用fn重新计算并写入；同一时刻只有一个进程执行fn，
+        其他进程等待计算结果，或在陈旧期内直接返回旧值
+        :param key: str, 缓存键
+        :param fn: callable, 无参函数，返回值为None时不写入缓存
+        :param ttl: int or float, 计算结果的有效秒数
+        :param stale_ttl: int or float, 过期后旧值仍可返回的秒数（陈旧期），期间由抢到锁的进程重算，其他进程直接返回旧值
+        :param lock_ttl: int or float, 计算锁的自动失效秒数，应大于fn的最长执行时间
+        :param wait_timeout: int or float, 等待其他进程计算结果的最长秒数，为空时一直等待，超时抛出CacheLockTimeout
+        :param sleep: float, 等待时的轮询间隔秒数
+        """
+        value = self._get_value(key)
+        if value is not None:
+            remaining = self.ttl(key) if stale_ttl else -1
+            if remaining < 0 or remaining > stale_ttl:
+                return value
+            # 已进入陈旧期：抢到锁的进程重算，其他进程直接返回旧值
+            lock = self.cache_lock(f"lock:{key}", ttl=lock_ttl, blocking=False)
+            if not lock.acquire():
+                return value
+            try:
+                if self.ttl(key) > stale_ttl:
+                    return self._get_value(key)
+                new_value = self._compute_and_set(key, fn, ttl + stale_ttl)
+                return value if new_value is None else new_value
+            finally:
+                lock.release()
+
+        lock = self.cache_lock(f"lock:{key}", ttl=lock_ttl, blocking=False)
+        deadline = None if wait_timeout is None else time.monotonic() + wait_timeout
+        while not lock.acquire():
+            # 其他进程正在计算，等待其写入结果
+            value = self._get_value(key)
+            if value is not None:
+                return value
+            if deadline is not None and time.monotonic() >= deadline:
+                raise CacheLockTimeout(f"等待缓存计算结果超时：{key}")
+            time.sleep(sleep)
+        try:
+            # 获取锁期间可能已有其他进程写入
+            value = self._get_value(key)
+            if value is None:
+                value = self._compute_and_set(key, fn, ttl + stale_ttl)
+            return value
+        finally:
+            lock.release()
+
+    def _compute_and_set(self, key, fn, expire_seconds):
+        value = fn()
+        if value is not None:
+            self._set_value(key, value, expire_seconds)
+        return value
 
 
-class MyRedis(Redis):
-    def __init__(self, db_index=0):
-        super().__init__(connection_pool=get_redis_pool(db_index))
+class MyRedis(_CacheLockMixin, Redis):
+    def __init__(self, db_index=0, serializer=None, connection_pool=None):
+        """
+        :param db_index: int, redis中数据库索引编号
+        :param serializer: set_obj保存对象时的序列化方式，序列化方式名称或CacheSerializer对象，为空时使用JSON
+        :param connection_pool: 连接池，为空时按REDIS_DB_CONNECT环境变量创建
+        """
+        super().__init__(connection_pool=connection_pool or get_redis_pool(db_index))
+        self.serializer = get_serializer(serializer)
 
-    def batch_delete(self, name_expression):
-        key_list = self.keys(name_expression)  # type: ignore
-        if key_list:
-            self.delete(*list(key_list))  # type: ignore
+    def batch_delete(self, name_expression, count: int = 1000, chunk_size: int = 500) -> int:
+        """通过SCAN分批删除匹配模式的键，返回删除的数量"""
+        return scan_delete(self, name_expression, count=count, chunk_size=chunk_size)
 
     def get_to_json(self, name):
         if name:
             value_raw = self.get(name)  # type: ignore
             if value_raw:
                 try:
-                    if isinstance(value_raw, str):
+                    if isinstance(value_raw, dict):
+                        user = value_raw
+                    elif isinstance(value_raw, str):
                         user = json.loads(value_raw)
                     else:
                         user = json.loads(value_raw.decode("utf-8"))  # type: ignore
-                except (TypeError, json.decoder.JSONDecodeError) as e:
-                    self.delete(name)
-                else:
                     return MyDict(**user)
+                except (TypeError, ValueError) as e:
+                    self.delete(name)
         return None
 
     def set_obj(self, prefix: str, value, **kwargs):
         if isinstance(value, (dict, list, tuple)):
-            value = json.dumps(value, ensure_ascii=False)
-            key = prefix + sum_md5(value)
-            self.set(key, value, **kwargs)
+            key = prefix + sum_md5(json.dumps(value, ensure_ascii=False, default=repr))
+            self.set(key, self.serializer.dumps(value), **kwargs)
             return key
         else:
             raise TypeError("此方法只用于保存对象！")
@@ -163,11 +380,47 @@ class MyRedis(Redis):
         else:
             return _l
 
+    def mget(self, keys, *args):
+        _l = super(MyRedis, self).mget(keys, *args)  # type: ignore
+        return [self._decode_value(_i) for _i in _l]  # type: ignore
+
+    def setex_many(self, mapping: dict, expire_seconds):
+        """批量设置带相同过期时间的缓存值，通过管道一次网络往返完成"""
+        with self.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.setex(key, expire_seconds, value)
+            pipe.execute()
+        return True
+
+    def _acquire_lock(self, name, token, ttl) -> bool:
+        """SET NX PX：键不存在时写入token并设置毫秒级过期时间"""
+        return bool(self.set(name, token, nx=True, px=None if ttl is None else max(int(ttl * 1000), 1)))
+
+    def _release_lock(self, name, token) -> bool:
+        """通过Lua脚本原子地比较token并删除"""
+        return bool(self.eval(_RELEASE_LOCK_SCRIPT, 1, name, token))
+
+    def _get_value(self, key):
+        value = self.get(key)
+        return _load_value(value) if isinstance(value, str) else value
+
+    def _set_value(self, key, value, expire_seconds):
+        self.set(key, self.serializer.dumps(value), px=max(int(expire_seconds * 1000), 1))
+
     def get(self, name):
         _v = super(MyRedis, self).get(name)  # type: ignore
-        if _v:
-            if isinstance(_v, bytes):
-                _v = _v.decode("utf-8")
+        return self._decode_value(_v)
+
+    def _decode_value(self, _v):
+        """带数据头的值由序列化器解码，其他bytes按utf-8解码为字符串"""
+        if _v and isinstance(_v, bytes):
+            if _v.startswith(_MAGIC):
+                try:
+                    return self.serializer.loads(_v)
+                except ValueError as e:
+                    logger.warning(f"反序列化缓存值时出错: {e}")
+                    return _v
+            return _v.decode("utf-8")
         return _v
 
     def smembers(self, name):
@@ -178,21 +431,63 @@ class MyRedis(Redis):
             return _l
 
 
-class MyCache:
-    """自定义缓存类，redis不可用时替代使用，基于SQLite3实现，支持多进程安全"""
+class MyCache(_CacheLockMixin):
+    """自定义缓存类，redis不可用时替代使用，基于SQLite3实现，支持多进程安全
+
+    连接按“进程+线程”复用：每个线程首次访问时建立连接并设置PRAGMA，之后复用同一连接及其预编译语句缓存；
+    线程结束后，其连接在其他线程新建连接时关闭，连接数不会随短生命周期线程的数量增长；
+    fork后的子进程检测到pid变化时丢弃继承自父进程的连接，重新建立。
+
+    过期键的清理：读取到已过期的键时立即删除；每次写入时顺带删除少量过期键；
+    另可通过start_sweeper启动后台线程，定期分批清理并在空闲页超过阈值时回收文件空间。
+    """
 
-    def __init__(self, cache_path: Path):
+    def __init__(
+        self,
+        cache_path: Path,
+        timeout: float = 30.0,
+        cached_statements: int = 256,
+        lazy_expire_batch: int = 20,
+        vacuum_threshold: float = 0.25,
+        serializer=None,
+    ):
+        """
+        :param cache_path: SQLite数据库文件路径
+        :param timeout: float, 数据库锁等待超时时间（秒）
+        :param cached_statements: int, 每个连接缓存的预编译语句数量
+        :param lazy_expire_batch: int, 每次写入时顺带删除的过期键数量上限，0为不删除
+        :param vacuum_threshold: float, 空闲页占总页数的比例超过该值时，清理后回收文件空间
+        :param serializer: 缓存值的序列化方式，序列化方式名称或CacheSerializer对象，为空时使用JSON（队列和哈希的元素不受影响）
+        """
         self.cache_path = cache_path
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.lazy_expire_batch = lazy_expire_batch
+        self.vacuum_threshold = vacuum_threshold
+        self.serializer = get_serializer(serializer)
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        # 线程ident -> (线程对象, 连接)，线程结束后其连接在下次新建连接时关闭并移除
+        self._connections = {}
+        self._stats_lock = threading.Lock()
+        self._expire_stats = {
+            "lazy_expired": 0,
+            "swept": 0,
+            "sweep_runs": 0,
+            "vacuum_runs": 0,
+            "last_sweep_time": None,
+            "last_sweep_elapsed": None,
+        }
+        self._sweeper_thread = None
+        self._sweeper_stop = threading.Event()
         self._init_db()
 
     def _init_db(self):
         """初始化SQLite数据库和表结构"""
         try:
-            with sqlite3.connect(str(self.cache_path), timeout=30.0) as conn:
-                conn.execute("PRAGMA journal_mode=WAL")  # 启用WAL模式，提高并发性能
-                conn.execute("PRAGMA synchronous=NORMAL")  # 平衡性能和安全性
-                conn.execute("PRAGMA busy_timeout=30000")  # 30秒超时
-
+            conn = self._get_connection()
+            with conn:
                 # 创建缓存表
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS cache (
@@ -206,38 +501,248 @@ class MyCache:
                 # 创建过期时间索引
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_expire_time ON cache(expire_time)")
 
-                conn.commit()
+                # 创建队列表：每个元素一行，seq在同一队列内单调递增；head/tail记录队首与队尾的下一个序号
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_list (
+                        name TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        value TEXT NOT NULL,
+                        PRIMARY KEY (name, seq)
+                    ) WITHOUT ROWID
+                """)
+
+                # 创建哈希表：每个字段一行，读写只涉及相关字段
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_hash (
+                        name TEXT NOT NULL,
+                        field TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        PRIMARY KEY (name, field)
+                    ) WITHOUT ROWID
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_list_meta (
+                        name TEXT PRIMARY KEY,
+                        head INTEGER NOT NULL,
+                        tail INTEGER NOT NULL
+                    )
+                """)
+
+                # 创建锁表：每个锁一行，记录持有者的token和租约到期时间
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_lock (
+                        name TEXT PRIMARY KEY,
+                        token TEXT NOT NULL,
+                        expire_time REAL NOT NULL
+                    )
+                """)
 
         except sqlite3.Error as e:
             logger.error(f"初始化SQLite缓存数据库失败: {e}")
             raise
 
+    def _connect(self):
+        """新建数据库连接，并设置连接级别的PRAGMA（每个连接只设置一次）"""
+        # check_same_thread=False仅用于close()时跨线程关闭，连接本身只在所属线程内使用
+        conn = sqlite3.connect(
+            str(self.cache_path),
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+        # 必须在启用WAL及建表之前设置，只对新建的数据库文件生效，已有的数据库文件保持原模式
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")  # 启用WAL模式，提高并发性能
+        conn.execute("PRAGMA synchronous=NORMAL")  # 平衡性能和安全性
+        conn.execute(f"PRAGMA busy_timeout={int(self.timeout * 1000)}")
+        return conn
+
     def _get_connection(self):
-        """获取数据库连接"""
-        return sqlite3.connect(str(self.cache_path), timeout=30.0)
+        """获取当前进程、当前线程复用的数据库连接"""
+        pid = os.getpid()
+        if pid != self._pid:
+            # fork后的子进程：父进程的连接不可跨进程使用，直接丢弃（不能close，否则会影响父进程）
+            self._pid = pid
+            self._local = threading.local()
+            self._pool_lock = threading.Lock()
+            self._connections = {}
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            thread = threading.current_thread()
+            with self._pool_lock:
+                stale = self._prune_connections()
+                # 线程ident可能被新线程复用，旧连接一并关闭
+                previous = self._connections.get(thread.ident)
+                if previous is not None:
+                    stale.append(previous[1])
+                self._connections[thread.ident] = (thread, conn)
+            self._close_connections(stale)
+        return conn
+
+    def _prune_connections(self) -> list:
+        """移除已结束线程的连接并返回，调用方需持有_pool_lock"""
+        stale = []
+        for ident, (thread, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                del self._connections[ident]
+                stale.append(conn)
+        return stale
+
+    @staticmethod
+    def _close_connections(connections):
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"关闭SQLite连接时出错: {e}")
+
+    def close(self):
+        """关闭当前进程中由本对象建立的所有连接"""
+        with self._pool_lock:
+            connections, self._connections = self._connections, {}
+        self._close_connections(conn for _, conn in connections.values())
+        self._local = threading.local()
+
+    @contextmanager
+    def _transaction(self):
+        """写事务：BEGIN IMMEDIATE立即获取写锁，保证多进程下读改写的原子性；支持嵌套，只在最外层提交"""
+        conn = self._get_connection()
+        depth = getattr(self._local, "tx_depth", 0)
+        if depth:
+            self._local.tx_depth = depth + 1
+            try:
+                yield conn
+            finally:
+                self._local.tx_depth = depth
+            return
 
-    def _cleanup_expired(self):
-        """清理过期的缓存项"""
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.tx_depth = 1
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    "DELETE FROM cache WHERE expire_time IS NOT NULL AND expire_time < julianday('now')"
-                )
-                if cursor.rowcount > 0:
-                    conn.commit()
-                    logger.debug(f"清理了 {cursor.rowcount} 个过期缓存项")
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self._local.tx_depth = 0
+
+    def _count_expire_stat(self, name, count):
+        with self._stats_lock:
+            self._expire_stats[name] += count
+
+    def _expire_some(self, conn, limit):
+        """删除最多limit个过期键（需在写事务中调用），借助过期时间索引，不会扫描全表"""
+        if limit <= 0:
+            return 0
+        return conn.execute("""
+            DELETE FROM cache WHERE rowid IN (
+                SELECT rowid FROM cache WHERE expire_time < julianday('now') LIMIT ?
+            )
+        """, (limit,)).rowcount
+
+    def _lazy_expire(self, conn):
+        """写入时顺带删除少量过期键"""
+        deleted = self._expire_some(conn, self.lazy_expire_batch)
+        if deleted:
+            self._count_expire_stat("lazy_expired", deleted)
+
+    def sweep(self, batch_size: int = 500, max_batches: int | None = None):
+        """分批清理过期键，每批一个短事务，避免长时间持有写锁；清理后按需回收文件空间
+        :param batch_size: int, 每批删除的数量
+        :param max_batches: int, 最多执行的批次，为空时清理到没有过期键为止
+        :return 本次删除的过期键数量
+        """
+        start_time = time.perf_counter()
+        total = 0
+        batches = 0
+        try:
+            while max_batches is None or batches < max_batches:
+                with self._transaction() as conn:
+                    deleted = self._expire_some(conn, batch_size)
+                    if not batches:
+                        conn.execute("DELETE FROM cache_lock WHERE expire_time <= julianday('now')")
+                total += deleted
+                batches += 1
+                if deleted < batch_size:
+                    break
+            self._maybe_vacuum()
         except sqlite3.Error as e:
             logger.warning(f"清理过期缓存时出错: {e}")
 
+        with self._stats_lock:
+            self._expire_stats["swept"] += total
+            self._expire_stats["sweep_runs"] += 1
+            self._expire_stats["last_sweep_time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self._expire_stats["last_sweep_elapsed"] = round(time.perf_counter() - start_time, 4)
+        if total:
+            logger.debug(f"清理了 {total} 个过期缓存项")
+        return total
+
+    def _maybe_vacuum(self):
+        """空闲页比例超过阈值时回收文件空间：增量模式的数据库执行incremental_vacuum，否则执行VACUUM"""
+        conn = self._get_connection()
+        if conn.in_transaction:
+            return False
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if not page_count or freelist_count / page_count < self.vacuum_threshold:
+            return False
+
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            # incremental_vacuum返回结果集，需要取完才会执行完毕
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            conn.commit()
+        else:
+            conn.execute("VACUUM")
+        # 截断WAL文件，避免WAL文件持续增大
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        self._count_expire_stat("vacuum_runs", 1)
+        logger.debug(f"回收SQLite缓存文件空间，空闲页：{freelist_count}/{page_count}")
+        return True
+
+    def start_sweeper(self, interval: float = 60, batch_size: int = 500):
+        """启动后台清理线程（守护线程），每隔interval秒执行一次sweep
+        :param interval: float, 清理间隔秒数
+        :param batch_size: int, 每批删除的数量
+        """
+        if self._sweeper_thread and self._sweeper_thread.is_alive():
+            return self._sweeper_thread
+
+        self._sweeper_stop.clear()
+
+        def _run():
+            while not self._sweeper_stop.wait(interval):
+                self.sweep(batch_size=batch_size)
+
+        self._sweeper_thread = threading.Thread(target=_run, name="dbox-cache-sweeper", daemon=True)
+        self._sweeper_thread.start()
+        return self._sweeper_thread
+
+    def stop_sweeper(self, timeout: float | None = None):
+        """停止后台清理线程"""
+        self._sweeper_stop.set()
+        if self._sweeper_thread:
+            self._sweeper_thread.join(timeout)
+            self._sweeper_thread = None
+
     def exists(self, key: str):
         """检查键是否存在（且未过期）"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT 1 FROM cache
-                    WHERE key = ? AND (expire_time IS NULL OR expire_time > julianday('now'))
-                """, (key,))
-                return cursor.fetchone() is not None
+            conn = self._get_connection()
+            cursor = conn.execute("""
+                SELECT 1 FROM cache
+                WHERE key = ? AND (expire_time IS NULL OR expire_time > julianday('now'))
+                UNION ALL
+                SELECT 1 FROM cache_list_meta WHERE name = ?
+                UNION ALL
+                SELECT 1 FROM cache_hash WHERE name = ?
+            """, (key, key, key))
+            return cursor.fetchone() is not None
         except sqlite3.Error as e:
             logger.warning(f"检查键存在性时出错: {e}")
             return False
@@ -245,112 +750,383 @@ class MyCache:
     def get(self, key: str):
         """获取缓存值"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT value FROM cache
-                    WHERE key = ? AND (expire_time IS NULL OR expire_time > julianday('now'))
-                """, (key,))
-                row = cursor.fetchone()
-                if row:
-                    try:
-                        return json.loads(row[0])
-                    except json.JSONDecodeError:
-                        return row[0]  # 如果不是JSON格式，直接返回字符串
+            conn = self._get_connection()
+            cursor = conn.execute("""
+                SELECT value, expire_time IS NOT NULL AND expire_time <= julianday('now') FROM cache
+                WHERE key = ?
+            """, (key,))
+            row = cursor.fetchone()
+            if row and row[1]:
+                # 读取到已过期的键时直接删除
+                with self._transaction() as conn:
+                    deleted = conn.execute(
+                        "DELETE FROM cache WHERE key = ? AND expire_time <= julianday('now')", (key,)
+                    ).rowcount
+                self._count_expire_stat("lazy_expired", deleted)
                 return None
-        except (sqlite3.Error, json.JSONDecodeError) as e:
+            if row:
+                return self._loads(row[0])
+            return None
+        except sqlite3.Error as e:
             logger.warning(f"获取缓存值时出错: {e}")
             return None
 
     def set(self, key: str, value):
         """设置缓存值"""
         try:
-            with self._get_connection() as conn:
-                # 将value序列化为JSON字符串
-                if isinstance(value, (dict, list, tuple)):
-                    value_str = json.dumps(value, ensure_ascii=False)
-                else:
-                    value_str = json.dumps(value, ensure_ascii=False) if isinstance(value, (str, bool)) else str(value)
+            with self._transaction() as conn:
+                value_str = self._dumps(value)
 
                 conn.execute("""
                     INSERT OR REPLACE INTO cache (key, value, expire_time)
                     VALUES (?, ?, NULL)
                 """, (key, value_str))
-                conn.commit()
+                self._drop_other_types(conn, [key], "kv")
+                self._lazy_expire(conn)
         except sqlite3.Error as e:
             logger.warning(f"设置缓存值时出错: {e}")
 
     def delete(self, key: str):
         """删除缓存项"""
         try:
-            with self._get_connection() as conn:
-                cursor = conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                conn.commit()
-                return cursor.rowcount > 0
+            with self._transaction() as conn:
+                deleted = conn.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount
+                if conn.execute("DELETE FROM cache_list_meta WHERE name = ?", (key,)).rowcount:
+                    conn.execute("DELETE FROM cache_list WHERE name = ?", (key,))
+                    deleted += 1
+                if conn.execute("DELETE FROM cache_hash WHERE name = ?", (key,)).rowcount:
+                    deleted += 1
+                return deleted > 0
         except sqlite3.Error as e:
             logger.warning(f"删除缓存项时出错: {e}")
             return False
 
+    @staticmethod
+    def _drop_other_types(conn, names, keep: str):
+        """与Redis一致，写入某种类型的值时删除同名的其他类型的数据，避免同一个键同时存在于多张表中（需在写事务中调用）
+        :param names: 键名列表
+        :param keep: 写入的类型：kv、list、hash
+        """
+        params = [(name,) for name in names]
+        if keep != "kv":
+            conn.executemany("DELETE FROM cache WHERE key = ?", params)
+        if keep != "list":
+            conn.executemany("DELETE FROM cache_list_meta WHERE name = ?", params)
+            conn.executemany("DELETE FROM cache_list WHERE name = ?", params)
+        if keep != "hash":
+            conn.executemany("DELETE FROM cache_hash WHERE name = ?", params)
+
     def setex(self, name, expire_seconds, value):
         """设置带过期时间的缓存值"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 # 使用SQLite的julianday函数计算过期时间
                 cursor = conn.execute("SELECT julianday('now')")
                 current_julianday = cursor.fetchone()[0]
                 expire_days = expire_seconds / 86400.0  # 秒转换为天
                 expire_time = current_julianday + expire_days  # 当前朱利安日 + 过期天数
 
-                # 将value序列化为JSON字符串
-                if isinstance(value, (dict, list, tuple)):
-                    value_str = json.dumps(value, ensure_ascii=False)
-                else:
-                    value_str = json.dumps(value, ensure_ascii=False) if isinstance(value, (str, bool)) else str(value)
+                value_str = self._dumps(value)
 
                 conn.execute("""
                     INSERT OR REPLACE INTO cache (key, value, expire_time)
                     VALUES (?, ?, ?)
                 """, (name, value_str, expire_time))
-                conn.commit()
+                self._drop_other_types(conn, [name], "kv")
+                self._lazy_expire(conn)
         except sqlite3.Error as e:
             logger.warning(f"设置带过期时间的缓存值时出错: {e}")
 
-    def hmset(self, name, mapping):
-        """设置哈希映射"""
-        self.set(name, mapping)
+    def ttl(self, key: str):
+        """获取键的剩余存活秒数（兼容Redis接口）：键不存在返回-2，没有过期时间返回-1"""
+        try:
+            conn = self._get_connection()
+            row = conn.execute("""
+                SELECT (expire_time - julianday('now')) * 86400.0 FROM cache
+                WHERE key = ? AND (expire_time IS NULL OR expire_time > julianday('now'))
+            """, (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"获取键的剩余存活时间时出错: {e}")
+            return -2
+        if row is None:
+            return -1 if self.exists(key) else -2
+        if row[0] is None:
+            return -1
+        return max(int(row[0] + 0.5), 0)
+
+    def mget(self, keys, *args):
+        """批量获取缓存值，按传入顺序返回列表，不存在或已过期的键为None"""
+        key_list = ([keys] if isinstance(keys, (str, bytes)) else list(keys)) + list(args)
+        values = {}
+        try:
+            conn = self._get_connection()
+            for index in range(0, len(key_list), _SQLITE_BATCH_SIZE):
+                chunk = key_list[index : index + _SQLITE_BATCH_SIZE]
+                cursor = conn.execute(f"""
+                    SELECT key, value FROM cache
+                    WHERE key IN ({','.join('?' * len(chunk))})
+                    AND (expire_time IS NULL OR expire_time > julianday('now'))
+                """, chunk)
+                values.update((key, self._loads(value)) for key, value in cursor)
+        except sqlite3.Error as e:
+            logger.warning(f"批量获取缓存值时出错: {e}")
+        return [values.get(key) for key in key_list]
 
-    def hgetall(self, key: str):
-        """获取哈希所有值"""
-        value = self.get(key)
-        if isinstance(value, dict):
-            return value
-        elif value is not None:
-            logger.warning(f"hgetall: {key} 不是字典类型: {type(value)}")
-        return {}
+    def mset(self, mapping: dict):
+        """批量设置缓存值，在同一个事务中写入"""
+        try:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expire_time) VALUES (?, ?, NULL)",
+                    [(key, self._dumps(value)) for key, value in mapping.items()],
+                )
+                self._drop_other_types(conn, list(mapping), "kv")
+                self._lazy_expire(conn)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"批量设置缓存值时出错: {e}")
+            return False
+
+    def setex_many(self, mapping: dict, expire_seconds):
+        """批量设置带相同过期时间的缓存值，在同一个事务中写入"""
+        try:
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expire_time) VALUES (?, ?, julianday('now') + ?)",
+                    [(key, self._dumps(value), expire_seconds / 86400.0) for key, value in mapping.items()],
+                )
+                self._drop_other_types(conn, list(mapping), "kv")
+                self._lazy_expire(conn)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"批量设置带过期时间的缓存值时出错: {e}")
+            return False
+
+    def _dumps(self, value):
+        """按当前序列化器序列化缓存值"""
+        return self.serializer.dumps(value)
+
+    def _loads(self, raw):
+        """按当前序列化器反序列化缓存值，无法解析时返回原始值"""
+        try:
+            return self.serializer.loads(raw)
+        except (ValueError, TypeError):
+            return raw
+
+    def _acquire_lock(self, name, token, ttl) -> bool:
+        """写入租约行；已存在时只有原租约已到期才覆盖"""
+        try:
+            with self._transaction() as conn:
+                return conn.execute("""
+                    INSERT INTO cache_lock (name, token, expire_time) VALUES (?, ?, julianday('now') + ?)
+                    ON CONFLICT(name) DO UPDATE SET token = excluded.token, expire_time = excluded.expire_time
+                    WHERE cache_lock.expire_time <= julianday('now')
+                """, (name, token, _LOCK_NO_EXPIRE_DAYS if ttl is None else ttl / 86400.0)).rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning(f"获取锁时出错: {e}")
+            return False
+
+    def _release_lock(self, name, token) -> bool:
+        """删除token一致的租约行"""
+        try:
+            with self._transaction() as conn:
+                return conn.execute(
+                    "DELETE FROM cache_lock WHERE name = ? AND token = ?", (name, token)
+                ).rowcount > 0
+        except sqlite3.Error as e:
+            logger.warning(f"释放锁时出错: {e}")
+            return False
+
+    def _get_value(self, key):
+        return self.get(key)
+
+    def _set_value(self, key, value, expire_seconds):
+        self.setex(key, expire_seconds, value)
+
+    def pipeline(self, transaction=True):
+        """获取管道对象，缓存的命令在execute时于同一个事务中执行（兼容Redis接口）"""
+        return MyCachePipeline(self)
+
+    def _migrate_legacy_hash(self, conn, name):
+        """将旧版本以JSON对象形式存储在cache表中的同名哈希迁移到哈希表（需在写事务中调用）"""
+        legacy = self._load_legacy_hash(conn, name)
+        if legacy:
+            conn.execute("DELETE FROM cache WHERE key = ?", (name,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache_hash (name, field, value) VALUES (?, ?, ?)",
+                [(name, str(field), _dump_value(value)) for field, value in legacy.items()],
+            )
+
+    @staticmethod
+    def _load_legacy_hash(conn, name):
+        """读取旧版本以JSON对象形式存储的哈希，哈希表中已有该哈希或旧数据不是字典时返回None"""
+        if conn.execute("SELECT 1 FROM cache_hash WHERE name = ? LIMIT 1", (name,)).fetchone():
+            return None
+        row = conn.execute(
+            "SELECT value FROM cache WHERE key = ? AND (expire_time IS NULL OR expire_time > julianday('now'))",
+            (name,),
+        ).fetchone()
+        if row is None:
+            return None
+        value = _load_value(row[0])
+        return value if isinstance(value, dict) else None
 
     def hset(self, name, key=None, value=None, mapping=None):
-        """设置哈希字段"""
+        """设置哈希字段（兼容Redis接口），返回新增字段的数量"""
         if key is None and not mapping:
             raise ValueError("'key'或'mapping'不能同时为空")
 
-        # 获取现有的哈希数据
-        existing_data = self.get(name) or {}
-
         items = dict()
         if key is not None:
             items[key] = value
         if mapping:
             items.update(mapping)
 
-        # 合并到现有数据
-        existing_data.update(items)
-        self.set(name, existing_data)
+        rows = [(name, str(field), _dump_value(field_value)) for field, field_value in items.items()]
+        fields = [row[1] for row in rows]
+        try:
+            with self._transaction() as conn:
+                self._migrate_legacy_hash(conn, name)
+                self._drop_other_types(conn, [name], "hash")
+                existing_count = conn.execute(
+                    f"SELECT COUNT(*) FROM cache_hash WHERE name = ? AND field IN ({','.join('?' * len(fields))})",
+                    (name, *fields),
+                ).fetchone()[0]
+                conn.executemany("INSERT OR REPLACE INTO cache_hash (name, field, value) VALUES (?, ?, ?)", rows)
+                return len(fields) - existing_count
+        except sqlite3.Error as e:
+            logger.warning(f"设置哈希字段时出错: {e}")
+            return 0
+
+    def hmset(self, name, mapping):
+        """设置哈希映射"""
+        self.hset(name, mapping=mapping)
+        return True
+
+    def hget(self, name, key):
+        """获取哈希字段值，不存在时返回None"""
+        try:
+            conn = self._get_connection()
+            row = conn.execute("SELECT value FROM cache_hash WHERE name = ? AND field = ?", (name, str(key))).fetchone()
+            if row:
+                return _load_value(row[0])
+            legacy = self._load_legacy_hash(conn, name)
+            return legacy.get(str(key)) if legacy else None
+        except sqlite3.Error as e:
+            logger.warning(f"获取哈希字段时出错: {e}")
+            return None
 
-    def batch_delete(self, name_expression):
-        """批量删除匹配模式的键"""
-        key_list = self.keys(name_expression)
-        if key_list:
-            for key in key_list:
-                self.delete(key)
+    def hmget(self, name, keys, *args):
+        """批量获取哈希字段值，按传入顺序返回列表，不存在的字段为None"""
+        fields = [str(field) for field in ([keys] if isinstance(keys, (str, bytes)) else list(keys)) + list(args)]
+        if not fields:
+            return []
+        try:
+            conn = self._get_connection()
+            rows = conn.execute(
+                f"SELECT field, value FROM cache_hash WHERE name = ? AND field IN ({','.join('?' * len(fields))})",
+                (name, *fields),
+            ).fetchall()
+            if rows:
+                values = {field: _load_value(value) for field, value in rows}
+            else:
+                values = self._load_legacy_hash(conn, name) or {}
+            return [values.get(field) for field in fields]
+        except sqlite3.Error as e:
+            logger.warning(f"批量获取哈希字段时出错: {e}")
+            return [None] * len(fields)
+
+    def hgetall(self, key: str):
+        """获取哈希所有值"""
+        try:
+            conn = self._get_connection()
+            rows = conn.execute("SELECT field, value FROM cache_hash WHERE name = ?", (key,)).fetchall()
+            if rows:
+                return {field: _load_value(value) for field, value in rows}
+            return self._load_legacy_hash(conn, key) or {}
+        except sqlite3.Error as e:
+            logger.warning(f"获取哈希所有值时出错: {e}")
+            return {}
+
+    def hdel(self, name, *keys):
+        """删除哈希字段，返回实际删除的数量"""
+        if not keys:
+            return 0
+        try:
+            with self._transaction() as conn:
+                self._migrate_legacy_hash(conn, name)
+                return conn.execute(
+                    f"DELETE FROM cache_hash WHERE name = ? AND field IN ({','.join('?' * len(keys))})",
+                    (name, *[str(field) for field in keys]),
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"删除哈希字段时出错: {e}")
+            return 0
+
+    def hincrby(self, name, key, amount: int = 1):
+        """哈希字段自增，字段不存在时从0开始，返回自增后的值"""
+        try:
+            with self._transaction() as conn:
+                self._migrate_legacy_hash(conn, name)
+                self._drop_other_types(conn, [name], "hash")
+                row = conn.execute(
+                    "SELECT value FROM cache_hash WHERE name = ? AND field = ?", (name, str(key))
+                ).fetchone()
+                # 字段值可能以JSON字符串形式保存（如hset写入的"1"），解析后再转换为整数
+                current = int(_load_value(row[0])) if row else 0
+                new_value = current + int(amount)
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_hash (name, field, value) VALUES (?, ?, ?)",
+                    (name, str(key), _dump_value(new_value)),
+                )
+                return new_value
+        except sqlite3.Error as e:
+            logger.warning(f"哈希字段自增时出错: {e}")
+            return None
+
+    def hlen(self, name):
+        """获取哈希字段数量"""
+        try:
+            conn = self._get_connection()
+            count = conn.execute("SELECT COUNT(*) FROM cache_hash WHERE name = ?", (name,)).fetchone()[0]
+            if count:
+                return count
+            return len(self._load_legacy_hash(conn, name) or {})
+        except sqlite3.Error as e:
+            logger.warning(f"获取哈希字段数量时出错: {e}")
+            return 0
+
+    def hexists(self, name, key):
+        """检查哈希字段是否存在"""
+        try:
+            conn = self._get_connection()
+            row = conn.execute("SELECT 1 FROM cache_hash WHERE name = ? AND field = ?", (name, str(key))).fetchone()
+            if row:
+                return True
+            return str(key) in (self._load_legacy_hash(conn, name) or {})
+        except sqlite3.Error as e:
+            logger.warning(f"检查哈希字段时出错: {e}")
+            return False
+
+    def batch_delete(self, name_expression) -> int:
+        """批量删除匹配模式的键（与redis一致的glob通配符），每张表一条DELETE语句完成，返回删除的数量"""
+        try:
+            with self._transaction() as conn:
+                deleted_count = conn.execute("DELETE FROM cache WHERE key GLOB ?", (name_expression,)).rowcount
+                list_count = conn.execute(
+                    "DELETE FROM cache_list_meta WHERE name GLOB ?", (name_expression,)
+                ).rowcount
+                if list_count:
+                    conn.execute("DELETE FROM cache_list WHERE name GLOB ?", (name_expression,))
+                hash_count = conn.execute(
+                    "SELECT COUNT(DISTINCT name) FROM cache_hash WHERE name GLOB ?", (name_expression,)
+                ).fetchone()[0]
+                if hash_count:
+                    conn.execute("DELETE FROM cache_hash WHERE name GLOB ?", (name_expression,))
+                return deleted_count + list_count + hash_count
+        except sqlite3.Error as e:
+            logger.warning(f"批量删除缓存项时出错: {e}")
+            return 0
 
     def get_to_json(self, name):
         """获取JSON值并返回MyDict对象"""
@@ -370,81 +1146,117 @@ class MyCache:
     def set_obj(self, prefix: str, value, **kwargs):
         """设置对象并返回生成的键名"""
         if isinstance(value, (dict, list, tuple)):
-            value_str = json.dumps(value, ensure_ascii=False)
-            key = prefix + sum_md5(value_str)
-            self.set(key, value_str)
+            key = prefix + sum_md5(json.dumps(value, ensure_ascii=False, default=repr))
+            self.set(key, value)
             return key
         else:
             raise TypeError("此方法只用于保存对象！")
 
     def push_obj(self, queue_name: str, value):
-        """推送对象到队列（简单实现）"""
-        if isinstance(value, (dict, list, tuple)):
-            value_str = json.dumps(value, ensure_ascii=False)
-            # 使用简单的列表追加方式模拟队列
-            current_queue = self.get(queue_name) or []
-            current_queue.append(value_str)
-            self.set(queue_name, current_queue)
-            return len(current_queue)
-        else:
-            # 原始值
-            current_queue = self.get(queue_name) or []
-            current_queue.append(str(value))
-            self.set(queue_name, current_queue)
-            return len(current_queue)
+        """推送对象到队列"""
+        return self.rpush(queue_name, value)
 
     def pop_obj(self, queue_name: str):
-        """从队列弹出对象（简单实现）"""
-        current_queue = self.get(queue_name) or []
-        if current_queue:
-            value_str = current_queue.pop(0)
-            self.set(queue_name, current_queue)
-            try:
-                return json.loads(value_str)
-            except (json.JSONDecodeError, TypeError):
-                return value_str
-        return None
+        """从队列弹出对象"""
+        return self.lpop(queue_name)
+
+    def _load_list_meta(self, conn, name):
+        """读取队列的head/tail；队列不存在时，将旧版本以JSON数组形式存储在cache表中的同名队列迁移到队列表"""
+        row = conn.execute("SELECT head, tail FROM cache_list_meta WHERE name = ?", (name,)).fetchone()
+        if row:
+            return row
+
+        legacy = conn.execute("SELECT value FROM cache WHERE key = ?", (name,)).fetchone()
+        if legacy is None:
+            return None
+        try:
+            items = json.loads(legacy[0])
+        except (ValueError, TypeError):
+            # 带数据头的值（bytes）解码时抛出UnicodeDecodeError，同样视为非队列
+            items = None
+        if not isinstance(items, list):
+            return None
+
+        conn.execute("DELETE FROM cache WHERE key = ?", (name,))
+        if not items:
+            return None
+        conn.executemany(
+            "INSERT INTO cache_list (name, seq, value) VALUES (?, ?, ?)",
+            [(name, seq, _dump_list_item(item)) for seq, item in enumerate(items)],
+        )
+        conn.execute("INSERT INTO cache_list_meta (name, head, tail) VALUES (?, 0, ?)", (name, len(items)))
+        return 0, len(items)
 
     def rpush(self, name, *values):
-        """右推入队列（兼容Redis接口）"""
-        queue = self.get(name) or []
-        for value in values:
-            if isinstance(value, (dict, list, tuple)):
-                queue.append(json.dumps(value, ensure_ascii=False))
-            else:
-                queue.append(str(value))
-        self.set(name, queue)
-        return len(queue)
+        """右推入队列（兼容Redis接口），返回推入后的队列长度"""
+        if not values:
+            raise ValueError("rpush至少需要一个值")
+        try:
+            with self._transaction() as conn:
+                head, tail = self._load_list_meta(conn, name) or (0, 0)
+                self._drop_other_types(conn, [name], "list")
+                conn.executemany(
+                    "INSERT INTO cache_list (name, seq, value) VALUES (?, ?, ?)",
+                    [(name, tail + index, _dump_list_item(value)) for index, value in enumerate(values)],
+                )
+                tail += len(values)
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_list_meta (name, head, tail) VALUES (?, ?, ?)", (name, head, tail)
+                )
+                return tail - head
+        except sqlite3.Error as e:
+            logger.warning(f"推入队列时出错: {e}")
+            return 0
 
     def lpop(self, name, count=None):
-        """左弹出队列（兼容Redis接口）"""
-        queue = self.get(name) or []
-        if not queue:
+        """左弹出队列（兼容Redis接口），count为空时返回单个值，否则返回列表；队列为空时返回None"""
+        if count is not None:
+            if count < 0:
+                # 与redis一致，负数时报错；否则SQLite的LIMIT -1会弹出整个队列
+                raise ValueError("count不能为负数")
+            if count == 0:
+                # 与redis一致，队列存在时返回空列表，不弹出元素
+                return [] if self.llen(name) else None
+        try:
+            with self._transaction() as conn:
+                meta = self._load_list_meta(conn, name)
+                if meta is None:
+                    return None
+                head, tail = meta
+                limit = 1 if count is None else min(count, tail - head)
+                rows = conn.execute(
+                    "SELECT seq, value FROM cache_list WHERE name = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                    (name, head, limit),
+                ).fetchall()
+                if rows:
+                    conn.execute("DELETE FROM cache_list WHERE name = ? AND seq <= ?", (name, rows[-1][0]))
+                    head = rows[-1][0] + 1
+                if head >= tail:
+                    conn.execute("DELETE FROM cache_list_meta WHERE name = ?", (name,))
+                else:
+                    conn.execute("UPDATE cache_list_meta SET head = ? WHERE name = ?", (head, name))
+        except sqlite3.Error as e:
+            logger.warning(f"弹出队列时出错: {e}")
             return None
 
+        values = [_load_value(row[1]) for row in rows]
         if count is None:
-            # 单个值
-            value = queue.pop(0)
-            self.set(name, queue)
-            try:
-                return json.loads(value) if isinstance(value, str) else value
-            except (json.JSONDecodeError, TypeError):
-                return value
-        else:
-            # 多个值
-            count = min(count, len(queue))
-            values = queue[:count]
-            remaining = queue[count:]
-            self.set(name, remaining)
-
-            # 尝试解析JSON
-            result = []
-            for value in values:
-                try:
-                    result.append(json.loads(value) if isinstance(value, str) else value)
-                except (json.JSONDecodeError, TypeError):
-                    result.append(value)
-            return result
+            return values[0] if values else None
+        return values or None
+
+    def llen(self, name):
+        """获取队列长度（兼容Redis接口）"""
+        try:
+            conn = self._get_connection()
+            row = conn.execute("SELECT tail - head FROM cache_list_meta WHERE name = ?", (name,)).fetchone()
+            if row:
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"获取队列长度时出错: {e}")
+            return 0
+        # 兼容旧版本以JSON数组存储的队列
+        queue = self.get(name)
+        return len(queue) if isinstance(queue, list) else 0
 
     def smembers(self, name):
         """获取集合成员（简单实现）"""
@@ -459,23 +1271,29 @@ class MyCache:
         return set()
 
     def keys(self, pattern="*"):
-        """获取匹配模式的所有键（支持简单的通配符匹配）"""
-        try:
-            with self._get_connection() as conn:
-                if pattern == "*":
-                    cursor = conn.execute("""
-                        SELECT key FROM cache
-                        WHERE expire_time IS NULL OR expire_time > julianday('now')
-                    """)
-                else:
-                    # 简单的通配符匹配
-                    like_pattern = pattern.replace('*', '%')
-                    cursor = conn.execute("""
-                        SELECT key FROM cache
-                        WHERE key LIKE ? AND (expire_time IS NULL OR expire_time > julianday('now'))
-                    """, (like_pattern,))
-
-                return [row[0] for row in cursor.fetchall()]
+        """获取匹配模式的所有键（与redis一致的glob通配符：*、?、[abc]）"""
+        try:
+            conn = self._get_connection()
+            if pattern == "*":
+                cursor = conn.execute("""
+                    SELECT key FROM cache
+                    WHERE expire_time IS NULL OR expire_time > julianday('now')
+                    UNION
+                    SELECT name FROM cache_list_meta
+                    UNION
+                    SELECT DISTINCT name FROM cache_hash
+                """)
+            else:
+                cursor = conn.execute("""
+                    SELECT key FROM cache
+                    WHERE key GLOB ? AND (expire_time IS NULL OR expire_time > julianday('now'))
+                    UNION
+                    SELECT name FROM cache_list_meta WHERE name GLOB ?
+                    UNION
+                    SELECT DISTINCT name FROM cache_hash WHERE name GLOB ?
+                """, (pattern, pattern, pattern))
+
+            return [row[0] for row in cursor.fetchall()]
         except sqlite3.Error as e:
             logger.warning(f"获取键列表时出错: {e}")
             return []
@@ -483,40 +1301,73 @@ class MyCache:
     def clear(self):
         """清空所有缓存"""
         try:
-            with self._get_connection() as conn:
+            with self._transaction() as conn:
                 conn.execute("DELETE FROM cache")
-                conn.commit()
+                conn.execute("DELETE FROM cache_list")
+                conn.execute("DELETE FROM cache_list_meta")
+                conn.execute("DELETE FROM cache_hash")
+                conn.execute("DELETE FROM cache_lock")
         except sqlite3.Error as e:
             logger.warning(f"清空缓存时出错: {e}")
 
     def info(self):
         """获取缓存信息"""
         try:
-            with self._get_connection() as conn:
-                # 总键数
-                total_cursor = conn.execute("SELECT COUNT(*) FROM cache")
-                total_count = total_cursor.fetchone()[0]
-
-                # 过期键数
-                expired_cursor = conn.execute("""
-                    SELECT COUNT(*) FROM cache
-                    WHERE expire_time IS NOT NULL AND expire_time < julianday('now')
-                """)
-                expired_count = expired_cursor.fetchone()[0]
+            conn = self._get_connection()
+            # 总键数
+            total_cursor = conn.execute("SELECT COUNT(*) FROM cache")
+            total_count = total_cursor.fetchone()[0]
+
+            # 过期键数
+            expired_cursor = conn.execute("""
+                SELECT COUNT(*) FROM cache
+                WHERE expire_time IS NOT NULL AND expire_time < julianday('now')
+            """)
+            expired_count = expired_cursor.fetchone()[0]
+
+            # 有效键数
+            active_count = total_count - expired_count
+
+            # 队列数
+            list_count = conn.execute("SELECT COUNT(*) FROM cache_list_meta").fetchone()[0]
+
+            # 哈希数
+            hash_count = conn.execute("SELECT COUNT(DISTINCT name) FROM cache_hash").fetchone()[0]
+
+            # 文件空间与过期清理统计
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            with self._stats_lock:
+                expire_stats = dict(self._expire_stats)
+            expire_stats["sweeper_running"] = bool(self._sweeper_thread and self._sweeper_thread.is_alive())
 
-                # 有效键数
-                active_count = total_count - expired_count
-
-                return {
-                    'total_keys': total_count,
-                    'expired_keys': expired_count,
-                    'active_keys': active_count,
-                    'cache_file': str(self.cache_path)
-                }
+            return {
+                'total_keys': total_count,
+                'expired_keys': expired_count,
+                'active_keys': active_count,
+                'list_keys': list_count,
+                'hash_keys': hash_count,
+                'cache_file': str(self.cache_path),
+                'file_size': page_size * page_count,
+                'page_count': page_count,
+                'freelist_count': freelist_count,
+                'expire_stats': expire_stats,
+            }
         except sqlite3.Error as e:
             logger.warning(f"获取缓存信息时出错: {e}")
             return {}
 
+    def lock(self, name: str, timeout=None, sleep=0.1, blocking: bool = True, blocking_timeout=None):
+        """获取锁对象（兼容redis-py的Redis.lock参数），等同于cache_lock
+        :param name: str, 锁名称
+        :param timeout: int or float, 锁的自动失效秒数，为空时不自动失效
+        :param sleep: float, 等待时的轮询间隔秒数
+        :param blocking: bool, 获取不到锁时是否等待
+        :param blocking_timeout: int or float, 最长等待秒数，为空时一直等待
+        """
+        return self.cache_lock(name, ttl=timeout, blocking=blocking, blocking_timeout=blocking_timeout, sleep=sleep)
+
     def __getattr__(self, item):
         logger.warning(f"SQLite缓存类没有实现{item}方法，忽略")
 
@@ -526,6 +1377,350 @@ class MyCache:
         return __temp_func
 
 
+def _dump_value(value) -> str:
+    """序列化缓存值：对象、字符串、布尔值转为JSON字符串，其他值直接转为字符串"""
+    if isinstance(value, (dict, list, tuple, str, bool)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _dump_list_item(value) -> str:
+    """序列化队列元素：对象转为JSON字符串，其他值转为字符串（与Redis的存储方式一致）"""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _load_value(raw):
+    """反序列化缓存值：优先按JSON解析，失败时返回原始值"""
+    try:
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        # ValueError同时涵盖JSONDecodeError与带数据头的bytes值引发的UnicodeDecodeError
+        return raw
+
+
+# ---------------------------- 缓存值序列化 ----------------------------
+# 非默认方式写入的值带有数据头：魔数 + 序列化方式编号(1字节) + 压缩方式编号(1字节，0为不压缩)；
+# 不带数据头的值按旧版本的JSON文本解析，新旧数据可以混合存储。
+_MAGIC = b"\x00DBX"
+_HEADER_LENGTH = len(_MAGIC) + 2
+
+# 名称 -> (编号, dumps, loads)
+_SERIALIZERS = {}
+# 名称 -> (编号, compress, decompress)
+_COMPRESSORS = {}
+
+
+def register_serializer(name: str, code: int, dumps, loads):
+    """注册序列化方式
+    :param name: str, 名称
+    :param code: int, 编号，1~255，写入数据头中用于识别，注册后不能再修改
+    :param dumps: callable, 对象转bytes
+    :param loads: callable, bytes转对象
+    """
+    if not 0 < code < 256:
+        raise ValueError("序列化方式编号必须在1~255之间")
+    for _name, (_code, _, _) in _SERIALIZERS.items():
+        if _code == code and _name != name:
+            raise ValueError(f"序列化方式编号{code}已被{_name}占用")
+    _SERIALIZERS[name] = (code, dumps, loads)
+
+
+def register_compressor(name: str, code: int, compress, decompress):
+    """注册压缩方式
+    :param name: str, 名称
+    :param code: int, 编号，1~255，写入数据头中用于识别，注册后不能再修改
+    :param compress: callable, bytes压缩
+    :param decompress: callable, bytes解压
+    """
+    if not 0 < code < 256:
+        raise ValueError("压缩方式编号必须在1~255之间")
+    for _name, (_code, _, _) in _COMPRESSORS.items():
+        if _code == code and _name != name:
+            raise ValueError(f"压缩方式编号{code}已被{_name}占用")
+    _COMPRESSORS[name] = (code, compress, decompress)
+
+
+register_serializer(
+    "json",
+    1,
+    lambda value: json.dumps(value, ensure_ascii=False).encode("utf-8"),
+    json.loads,
+)
+register_serializer("pickle", 2, lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+if msgpack is not None:
+    register_serializer(
+        "msgpack",
+        3,
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda raw: msgpack.unpackb(raw, raw=False),
+    )
+register_compressor("zlib", 1, lambda raw: zlib.compress(raw, 6), zlib.decompress)
+if lz4_frame is not None:
+    register_compressor("lz4", 2, lz4_frame.compress, lz4_frame.decompress)
+
+
+class CacheSerializer:
+    """缓存值序列化器
+
+    默认（json且不压缩）时输出与旧版本一致的JSON文本，其他序列化方式或超过压缩阈值时输出带数据头的bytes；
+    读取时根据数据头自动选择解码方式，没有数据头的按JSON文本解析。
+    """
+
+    def __init__(
+        self, name: str = "json", compress: str | None = None, compress_threshold: int = 1024, allow_pickle=None
+    ):
+        """
+        :param name: str, 序列化方式：json、pickle，安装msgpack后可用msgpack，也可以是register_serializer注册的名称
+        :param compress: str, 压缩方式：zlib，安装lz4后可用lz4，为空时不压缩
+        :param compress_threshold: int, 序列化后的字节数达到该值时才压缩
+        :param allow_pickle: bool, 是否允许读取pickle格式的值，默认仅当name为pickle时允许（pickle反序列化可执行任意代码）
+        """
+        if name not in _SERIALIZERS:
+            raise ValueError(f"未知的序列化方式：{name}，可选值有：{', '.join(_SERIALIZERS)}")
+        if compress and compress not in _COMPRESSORS:
+            raise ValueError(f"未知的压缩方式：{compress}，可选值有：{', '.join(_COMPRESSORS)}")
+        self.name = name
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+        self.allow_pickle = name == "pickle" if allow_pickle is None else allow_pickle
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name!r}, compress={self.compress!r})"
+
+    def dumps(self, value) -> str | bytes:
+        """序列化缓存值"""
+        if self.name == "json" and not self.compress:
+            return _dump_value(value)
+
+        code, dumps, _ = _SERIALIZERS[self.name]
+        payload = dumps(value)
+        compress_code = 0
+        if self.compress and len(payload) >= self.compress_threshold:
+            compress_code, compress, _ = _COMPRESSORS[self.compress]
+            payload = compress(payload)
+        elif self.name == "json":
+            # 未达到压缩阈值的JSON仍保存为旧格式文本
+            return _dump_value(value)
+        return _MAGIC + bytes((code, compress_code)) + payload
+
+    def loads(self, raw):
+        """反序列化缓存值，无法解析时抛出ValueError"""
+        if isinstance(raw, memoryview):
+            raw = raw.tobytes()
+        if isinstance(raw, bytes) and raw.startswith(_MAGIC):
+            return self._loads_tagged(raw)
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return json.loads(raw)
+
+    def _loads_tagged(self, raw: bytes):
+        code, compress_code = raw[len(_MAGIC)], raw[len(_MAGIC) + 1]
+        payload = raw[_HEADER_LENGTH:]
+        if compress_code:
+            decompress = next((_c[2] for _c in _COMPRESSORS.values() if _c[0] == compress_code), None)
+            if decompress is None:
+                raise ValueError(f"未知的压缩方式编号：{compress_code}")
+            payload = decompress(payload)
+
+        for name, (_code, _, loads) in _SERIALIZERS.items():
+            if _code == code:
+                if name == "pickle" and not self.allow_pickle:
+                    raise ValueError("当前序列化器不允许读取pickle格式的值")
+                try:
+                    return loads(payload)
+                except Exception as e:
+                    raise ValueError(f"{name}反序列化失败：{e}") from e
+        raise ValueError(f"未知的序列化方式编号：{code}")
+
+
+def get_serializer(serializer=None) -> CacheSerializer:
+    """获取序列化器
+    :param serializer: None、序列化方式名称或CacheSerializer对象，为空时使用默认的json
+    """
+    if serializer is None:
+        return _DEFAULT_SERIALIZER
+    if isinstance(serializer, str):
+        return CacheSerializer(serializer)
+    return serializer
+
+
+_DEFAULT_SERIALIZER = CacheSerializer()
+
+
+class MyCachePipeline:
+    """MyCache的管道对象，与redis的Pipeline用法一致：调用命令时只记录，execute时在同一个事务中依次执行并返回结果列表"""
+
+    def __init__(self, cache: MyCache):
+        self.cache = cache
+        self.command_stack = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.reset()
+
+    def __len__(self):
+        return len(self.command_stack)
+
+    def __getattr__(self, item):
+        if item.startswith("_") or not callable(getattr(MyCache, item, None)):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
+
+        def _queue_command(*args, **kwargs):
+            self.command_stack.append((item, args, kwargs))
+            return self
+
+        return _queue_command
+
+    def reset(self):
+        """清空已缓存的命令"""
+        self.command_stack = []
+
+    def execute(self):
+        """在同一个事务中执行所有缓存的命令，任一命令抛出异常时整体回滚"""
+        command_stack, self.command_stack = self.command_stack, []
+        if not command_stack:
+            return []
+        with self.cache._transaction():
+            return [getattr(self.cache, name)(*args, **kwargs) for name, args, kwargs in command_stack]
+
+
+class LocalCache:
+    """进程内LRU缓存层，包裹MyRedis或MyCache使用
+
+    get与get_to_json先读进程内缓存，未命中时读穿透到后端并缓存结果，热点数据的重复读取不再产生网络往返与json解析；
+    条目的存活时间取本地ttl与后端剩余过期时间中的较小者，通过本对象执行的写入、删除会使对应条目失效；
+    其他方法原样转发给后端。注意：其他进程或通过pipeline写入的数据，最长在ttl秒后才会被感知。
+    """
+
+    def __init__(self, backend, maxsize: int = 1024, ttl=60):
+        """
+        :param backend: MyRedis或MyCache对象
+        :param maxsize: int, 最大缓存条目数，超出时淘汰最久未使用的条目
+        :param ttl: int or float, 条目最长存活秒数
+        """
+        self.backend = backend
+        self.maxsize = maxsize
+        # 不能命名为ttl，否则会遮蔽经__getattr__转发的后端ttl()方法
+        self.local_ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __getattr__(self, item):
+        if item == "backend":
+            raise AttributeError(item)
+        return getattr(self.backend, item)
+
+    def _lookup(self, entry_key):
+        """读取本地条目，返回(是否命中, 值)"""
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                expire_at, value = entry
+                if expire_at > time.monotonic():
+                    self._entries.move_to_end(entry_key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[entry_key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def _store(self, entry_key, value, expire_seconds=None):
+        """写入本地条目，存活时间取本地ttl与后端剩余过期时间的较小者"""
+        if expire_seconds is None or expire_seconds < 0:
+            lifetime = self.local_ttl
+        else:
+            lifetime = min(self.local_ttl, expire_seconds)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + lifetime, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _read_through(self, method, key):
+        """读穿透：本地未命中时调用后端方法读取，并按后端剩余过期时间缓存"""
+        hit, value = self._lookup((method, key))
+        if hit:
+            return value
+        value = getattr(self.backend, method)(key)
+        if value is not None:
+            self._store((method, key), value, self.backend.ttl(key))
+        return value
+
+    def invalidate(self, *keys):
+        """使指定键的本地条目失效，不传参数时清空全部本地条目"""
+        with self._lock:
+            if not keys:
+                self._entries.clear()
+                return
+            for key in keys:
+                self._entries.pop(("get", key), None)
+                self._entries.pop(("get_to_json", key), None)
+
+    def get(self, name):
+        value = self._read_through("get", name)
+        # 字典、列表为可变对象，返回副本，避免调用方修改本地缓存的内容
+        return value.copy() if isinstance(value, (dict, list)) else value
+
+    def get_to_json(self, name):
+        if not name:
+            return None
+        value = self._read_through("get_to_json", name)
+        return MyDict(value) if value is not None else None
+
+    def set(self, name, value, *args, **kwargs):
+        self.invalidate(name)
+        return self.backend.set(name, value, *args, **kwargs)
+
+    def setex(self, name, expire_seconds, value):
+        self.invalidate(name)
+        return self.backend.setex(name, expire_seconds, value)
+
+    def mset(self, mapping: dict):
+        self.invalidate(*mapping.keys())
+        return self.backend.mset(mapping)
+
+    def setex_many(self, mapping: dict, expire_seconds):
+        self.invalidate(*mapping.keys())
+        return self.backend.setex_many(mapping, expire_seconds)
+
+    def delete(self, *names):
+        self.invalidate(*names)
+        if isinstance(self.backend, Redis):
+            return self.backend.delete(*names)
+        # MyCache.delete每次只删除一个键，返回删除成功的数量
+        return sum(bool(self.backend.delete(name)) for name in names)
+
+    def batch_delete(self, name_expression, *args, **kwargs):
+        self.invalidate()
+        return self.backend.batch_delete(name_expression, *args, **kwargs)
+
+    def stats(self):
+        """获取本地缓存的命中统计"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
 class MyDict(dict):
     """自定义的字典类"""
 
@@ -548,12 +1743,35 @@ class MyDict(dict):
         self[key] = value
 
 
+# hget按db_index复用的缓存对象：SQLite缓存每次新建都会重新建表、新建连接并输出告警
+_hget_cache_objs = {}
+_hget_cache_lock = threading.Lock()
+
+
+def _get_hget_cache_obj(db_index):
+    """获取hget使用的缓存对象，同一db_index只创建一次"""
+    cache_obj = _hget_cache_objs.get(db_index)
+    if cache_obj is None:
+        with _hget_cache_lock:
+            cache_obj = _hget_cache_objs.get(db_index)
+            if cache_obj is None:
+                cache_obj = _hget_cache_objs[db_index] = get_cache_obj(db_index)
+    return cache_obj
+
+
 def hget(name, key, default=None, _type=None, db_index=1):
+    """获取哈希字段值，redis不可用时从本地SQLite缓存获取
+    :param name: str, 哈希名称
+    :param key: str, 字段名
+    :param default: 字段不存在时返回的默认值
+    :param _type: 返回值类型，None,int,float,str,bool,bytes之一
+    :param db_index: int, redis中数据库索引编号
+    """
     if _type not in (None, int, float, str, bool, bytes):
         raise TypeError("_type只能是None,int,float,str,bool,bytes之一")
 
-    redis_obj = MyRedis(db_index)
-    value = redis_obj.hget(name, key)
+    cache_obj = _get_hget_cache_obj(db_index)
+    value = cache_obj.hget(name, key)
 
     if value is None:
         return default
@@ -1,16 +1,30 @@
 import os
 import re
+import bz2
+import sys
+import mmap
+import zlib
+import codecs
 import json
 import time
 import stat
+import errno
 import shutil
+import hashlib
 import tarfile
 import zipfile
 import logging
 import filecmp
 import datetime
+import collections
 import configparser
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 logger = logging.getLogger(__name__)
@@ -79,30 +93,176 @@ def ensure_empty_dir(target: str | Path, mkdir=True, parents=True, *args, **kwar
         raise ValueError(f"删除目录出错：{target}")
 
 
-def compress_zip(src_path: str, compress_abs_path: str) -> None:
+# 已经压缩过的文件格式，再次压缩几乎不能减小体积，默认直接存储
+_COMPRESSED_EXTENSIONS = frozenset(
+    (
+        ".zip .gz .tgz .bz2 .xz .txz .zst .lz4 .7z .rar .jar .war .whl .apk .docx .xlsx .pptx "
+        ".jpg .jpeg .png .gif .webp .mp3 .mp4 .mkv .avi .mov .flv"
+    ).split()
+)
+_ZIP_COMPRESS_TYPES = {
+    "store": zipfile.ZIP_STORED,
+    "deflate": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+# 多线程压缩时每个成员在内存中压缩，超过此大小的文件仍由zipfile边读边压缩
+_ZIP_PARALLEL_MEMBER_LIMIT = 4 * 1024 * 1024
+# 多线程压缩时已提交、未写入的成员的原始大小之和上限，限制内存占用（每个成员同时持有原始与压缩后的数据）
+_ZIP_PARALLEL_BUFFER_LIMIT = 32 * 1024 * 1024
+# 写入已压缩成员时用到的ZipFile私有属性，见_write_zip_member
+_ZIP_PRIVATE_ATTRS = ("fp", "start_dir", "filelist", "NameToInfo", "_writecheck", "_didModify")
+
+
+def _iter_archive_files(src_path: str):
+    """产出待压缩的(文件路径, 压缩包内路径)"""
+    if os.path.isdir(src_path):
+        for abs_dir_path, dir_list, file_list in os.walk(src_path):
+            relative_path = abs_dir_path.replace(src_path, "")
+            relative_path = (relative_path and relative_path + os.sep) or ""
+            for filename in file_list:
+                yield os.path.join(abs_dir_path, filename), relative_path + filename
+    else:
+        yield src_path, os.path.basename(src_path)
+
+
+def _archive_result(action: str, files: int, size: int, archive_path, start: float) -> dict:
+    """压缩、解压的统计信息，mb_per_sec按未压缩的数据量计算"""
+    elapsed = time.perf_counter() - start
+    result = {
+        "files": files,
+        "bytes": size,
+        "compressed_bytes": os.path.getsize(archive_path) if os.path.isfile(archive_path) else 0,
+        "elapsed": elapsed,
+        "mb_per_sec": size / 1024 / 1024 / elapsed if elapsed else 0,
+    }
+    logger.info(
+        f"{action}完成：{archive_path}，文件{files}个，{size / 1024 / 1024:.1f}MB，"
+        f"压缩后{result['compressed_bytes'] / 1024 / 1024:.1f}MB，{result['mb_per_sec']:.1f}MB/s"
+    )
+    return result
+
+
+def compress_zip(
+    src_path: str,
+    compress_abs_path: str,
+    compress_type: str = "deflate",
+    compress_level: int | None = None,
+    workers: int = 1,
+    store_extensions=_COMPRESSED_EXTENSIONS,
+) -> dict:
     """压缩zip文件
     :param src_path: 待压缩文件或目录路径
     :param compress_abs_path: 压缩包输出绝对路径
+    :param compress_type: 压缩方式，可选值：store、deflate、bzip2、lzma
+    :param compress_level: 压缩级别，deflate为0~9，bzip2为1~9，为空时使用zipfile的默认级别
+    :param workers: int, 压缩线程数，大于1时deflate、bzip2的各成员在多个线程中同时压缩
+    :param store_extensions: 扩展名（小写，带点号）在其中的文件不压缩直接存储，传入空集合时全部压缩
+    :return: 统计信息，包括文件数、压缩前字节数、压缩包字节数、耗时（秒）、每秒压缩的MB数
     """
     if not os.path.exists(src_path):
         raise FileNotFoundError(src_path)
+    if compress_type not in _ZIP_COMPRESS_TYPES:
+        raise ValueError(f"不支持的压缩方式：{compress_type}，可选值：{', '.join(_ZIP_COMPRESS_TYPES)}")
+
+    default_type = _ZIP_COMPRESS_TYPES[compress_type]
+    start = time.perf_counter()
+    files = size = 0
+    with zipfile.ZipFile(compress_abs_path, "w", default_type, compresslevel=compress_level) as compress_file:
+        parallel = (
+            workers > 1
+            and default_type in (zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2)
+            and _zip_raw_write_supported(compress_file)
+        )
+        executor = ThreadPoolExecutor(max_workers=workers) if parallel else None
+        # 按源文件顺序写入，未写入的成员最多workers*2个，且原始大小之和不超过_ZIP_PARALLEL_BUFFER_LIMIT
+        pending = collections.deque()
+        pending_bytes = 0
+        try:
+            for file_path, arcname in _iter_archive_files(src_path):
+                file_size = os.path.getsize(file_path)
+                member_type = default_type
+                if os.path.splitext(file_path)[1].lower() in store_extensions:
+                    member_type = zipfile.ZIP_STORED
+                files += 1
+                size += file_size
+
+                if executor and member_type != zipfile.ZIP_STORED and file_size <= _ZIP_PARALLEL_MEMBER_LIMIT:
+                    while pending and (
+                        len(pending) >= workers * 2 or pending_bytes + file_size > _ZIP_PARALLEL_BUFFER_LIMIT
+                    ):
+                        pending_bytes -= _write_zip_member(compress_file, pending.popleft())
+                    future = executor.submit(_compress_zip_member, file_path, arcname, member_type, compress_level)
+                    pending.append((future, file_size))
+                    pending_bytes += file_size
+                else:
+                    pending.append((file_path, arcname, member_type))
+                    while len(pending) > workers * 2:
+                        pending_bytes -= _write_zip_member(compress_file, pending.popleft())
+            while pending:
+                _write_zip_member(compress_file, pending.popleft())
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+    return _archive_result("压缩", files, size, compress_abs_path, start)
+
+
+def _compress_zip_member(file_path: str, arcname: str, compress_type: int, compress_level: int | None):
+    """在内存中压缩一个成员，返回(ZipInfo, 压缩后的数据)；zlib、bz2压缩时释放GIL，可以多线程同时压缩"""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = compress_type
+    with open(file_path, "rb") as f:
+        data = f.read()
+    if compress_type == zipfile.ZIP_DEFLATED:
+        level = zlib.Z_DEFAULT_COMPRESSION if compress_level is None else compress_level
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+    else:
+        compressed = bz2.compress(data, 9 if compress_level is None else compress_level)
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, compressed
 
-    with zipfile.ZipFile(compress_abs_path, "w", zipfile.ZIP_DEFLATED) as compress_file:
-        if os.path.isdir(src_path):
-            for abs_dir_path, dir_list, file_list in os.walk(src_path):
-                relative_path = abs_dir_path.replace(src_path, "")
-                relative_path = (relative_path and relative_path + os.sep) or ""
-                for filename in file_list:
-                    compress_file.write(os.path.join(abs_dir_path, filename), relative_path + filename)
-        else:
-            filename = os.path.basename(src_path)
-            compress_file.write(src_path, filename)
+
+def _zip_raw_write_supported(compress_file: zipfile.ZipFile) -> bool:
+    """检查ZipFile是否具有_write_zip_member依赖的私有属性；这些属性属于CPython的实现细节，
+    缺少任何一个时（如其他Python实现或今后的版本）不使用多线程压缩，全部由zipfile逐个压缩
+    """
+    return all(hasattr(compress_file, name) for name in _ZIP_PRIVATE_ATTRS)
 
 
-def extract_zip(src_zip: str | Path, dst_dir: str | Path) -> None:
-    """解压zip文件
+def _write_zip_member(compress_file: zipfile.ZipFile, item) -> int:
+    """写入一个成员，返回其占用的缓冲大小：item为(文件路径, 压缩包内路径, 压缩方式)时由zipfile边读边压缩，返回0；
+    为(Future, 原始大小)时写入多线程压缩好的数据，返回原始大小
+    """
+    if len(item) == 3:
+        file_path, arcname, compress_type = item
+        compress_file.write(file_path, arcname, compress_type=compress_type)
+        return 0
+
+    # zipfile没有写入已压缩数据的接口，以下步骤与ZipFile._open_to_write及_ZipWriteFile.close一致，
+    # 依赖的私有属性见_ZIP_PRIVATE_ATTRS，由_zip_raw_write_supported检查；
+    # 成员不超过_ZIP_PARALLEL_MEMBER_LIMIT，不需要zip64扩展
+    future, file_size = item
+    zinfo, compressed = future.result()
+    compress_file.fp.seek(compress_file.start_dir)
+    zinfo.header_offset = compress_file.fp.tell()
+    compress_file._writecheck(zinfo)
+    compress_file._didModify = True
+    compress_file.fp.write(zinfo.FileHeader(False))
+    compress_file.fp.write(compressed)
+    compress_file.start_dir = compress_file.fp.tell()
+    compress_file.filelist.append(zinfo)
+    compress_file.NameToInfo[zinfo.filename] = zinfo
+    return file_size
+
+
+def extract_zip(src_zip: str | Path, dst_dir: str | Path) -> dict:
+    """解压zip文件，逐个成员边读边写，内存占用与成员大小无关
     :param src_zip: str or Path, 需要解压的zip文件绝对路径
     :param dst_dir: str or Path, 解压后存储的目标目录
+    :return: 统计信息，同compress_zip
     """
     if isinstance(src_zip, str):
         src_zip = Path(src_zip)
@@ -120,43 +280,98 @@ def extract_zip(src_zip: str | Path, dst_dir: str | Path) -> None:
     if dst_dir.is_file():
         raise ValueError(f"{dst_dir}不是一个有效的目录")
 
-    if zipfile.is_zipfile(src_zip):
-        fz = zipfile.ZipFile(src_zip, "r")
-        for file in fz.namelist():
-            fz.extract(file, dst_dir)
-    else:
+    if not zipfile.is_zipfile(src_zip):
         raise ValueError(f"{src_zip}不是一个有效的zip文件")
 
+    start = time.perf_counter()
+    files = size = 0
+    with zipfile.ZipFile(src_zip, "r") as fz:
+        for zinfo in fz.infolist():
+            fz.extract(zinfo, dst_dir)
+            files += 1
+            size += zinfo.file_size
+    return _archive_result("解压", files, size, src_zip, start)
+
+
+def iter_zip_members(src_zip: str | Path):
+    """逐个产出zip文件的(ZipInfo, 只读文件对象)，文件对象边读边解压，内存占用与成员大小无关；
+    文件对象只在产出后、取下一个成员前有效
+    """
+    with zipfile.ZipFile(src_zip, "r") as fz:
+        for zinfo in fz.infolist():
+            if zinfo.is_dir():
+                continue
+            with fz.open(zinfo) as member:
+                yield zinfo, member
+
+
+# tar压缩方式 -> (tarfile模式后缀, 压缩级别参数名)，zst需要Python 3.14及以上
+_TAR_COMPRESS_TYPES = {
+    "store": ("", None),
+    "gz": ("gz", "compresslevel"),
+    "bz2": ("bz2", "compresslevel"),
+    "xz": ("xz", "preset"),
+    "zst": ("zst", "level"),
+}
 
-def compress_tgz(source_files: str, compress_name: str):
+
+def compress_tgz(source_files: str, compress_name: str, compress_type: str = "gz", compress_level: int | None = None):
     """将源文件打包成tar.gz格式
     :param source_files：str, 源文件路径，传入相对路径时，压缩包中也为相当路径，为绝对路径时，压缩包中同样为绝对路径
     :param compress_name: str, 生成的压缩包路径
+    :param compress_type: 压缩方式，可选值：store（只打包不压缩）、gz、bz2、xz、zst（需要Python 3.14及以上）
+    :param compress_level: 压缩级别，gz、bz2为1~9，xz为0~9，zst为1~22，为空时使用tarfile的默认级别
+    :return: 统计信息，同compress_zip
     """
     # 判断文件是否存在，不存在时抛错
     if not os.path.exists(source_files):
         raise FileNotFoundError(source_files)
-
-    with tarfile.open(compress_name, "w:gz") as tar:
+    if compress_type not in _TAR_COMPRESS_TYPES:
+        raise ValueError(f"不支持的压缩方式：{compress_type}，可选值：{', '.join(_TAR_COMPRESS_TYPES)}")
+
+    suffix, level_name = _TAR_COMPRESS_TYPES[compress_type]
+    kwargs = {level_name: compress_level} if level_name and compress_level is not None else {}
+    start = time.perf_counter()
+    files = size = 0
+    with tarfile.open(compress_name, f"w:{suffix}" if suffix else "w", **kwargs) as tar:
         if os.path.isdir(source_files):
-            for root, _dir, files in os.walk(source_files):
-                for file in files:
+            for root, _dir, _files in os.walk(source_files):
+                for file in _files:
                     fullpath = os.path.join(root, file)
                     tar.add(fullpath)
+                    files += 1
+                    size += os.path.getsize(fullpath)
         else:
             tar.add(source_files)
+            files, size = 1, os.path.getsize(source_files)
+    return _archive_result("压缩", files, size, compress_name, start)
 
 
 def uncompress_tgz(compress_file, target_path="."):
-    """解压tar.gz格式文件
+    """解压tar.gz格式文件，按流式顺序读取，每个成员只解压一次
     :param compress_file: str, 压缩包路径
     :param target_path: str, 解压后存储路径
+    :return: 统计信息，同compress_zip
+    """
+    start = time.perf_counter()
+    files = size = 0
+    with tarfile.open(compress_file, "r|*") as tar:
+        for member in tar:
+            tar.extract(member, path=target_path)
+            if member.isfile():
+                files += 1
+                size += member.size
+    return _archive_result("解压", files, size, compress_file, start)
+
+
+def iter_tar_members(compress_file):
+    """逐个产出tar文件的(TarInfo, 只读文件对象)，按流式顺序读取，内存占用与成员大小无关；
+    只产出普通文件，文件对象只在产出后、取下一个成员前有效
     """
-    tar = tarfile.open(compress_file)
-    names = tar.getnames()
-    for name in names:
-        tar.extract(name, path=target_path)
-    tar.close()
+    with tarfile.open(compress_file, "r|*") as tar:
+        for member in tar:
+            if member.isfile():
+                yield member, tar.extractfile(member)
 
 
 def rm(src_path: str | Path, *args, **kwargs):
@@ -220,10 +435,14 @@ def copy_to_target(src_path: str | Path, dst_path: str | Path, *args, **kwargs):
     """复制文件或目标到目标路径
     :param src_path: str, 源文件或目录路径，不支持正则表达式；
     :param dst_path: str, 目标字符串路径；
+    :param workers: int, 复制目录时的线程数，默认4；
+    :param skip_unchanged: bool, 复制目录时跳过大小与修改时间都与源文件相同的目标文件，默认False；
     """
     src_path = Path(src_path)
     dst_path = Path(dst_path)
     check_path_is_exits(src_path)
+    workers = kwargs.get("workers", 4)
+    skip_unchanged = kwargs.get("skip_unchanged", False)
 
     if not dst_path.parent.exists():
         dst_path.parent.mkdir(parents=True)
@@ -236,10 +455,10 @@ def copy_to_target(src_path: str | Path, dst_path: str | Path, *args, **kwargs):
     if src_path.is_dir():
         if dst_path.exists():
             # 将目录复制到已经存在的目录下
-            shutil.copytree(str(src_path), str(dst_path / src_path.name), dirs_exist_ok=True)
+            copy_tree(src_path, dst_path / src_path.name, workers=workers, skip_unchanged=skip_unchanged)
         else:
             # 复制源目标生成指定的新目录
-            shutil.copytree(str(src_path), str(dst_path), dirs_exist_ok=True)
+            copy_tree(src_path, dst_path, workers=workers, skip_unchanged=skip_unchanged)
             return
 
 
@@ -248,12 +467,14 @@ def copy_to_target_by_pattern(
     dst_path: str | Path,
     recursion: bool = True,
     excludes: str | list = "",
+    **kwargs,
 ):
     """通过表达式复制文件或目标到目标路径
     :param src_path: str, 源文件或目录路径，支持正则表达式；
     :param dst_path: str, 目标字符串路径；
     :param recursion: bool, 递归子目录；
     :param excludes: str, 排除表达式，排除单个目录如："x86"，同时排除多个目录用分号分隔如"x86;x64"；
+    :param kwargs: workers、skip_unchanged，传给copy_to_target；
     """
     src_path = str(src_path)
     dst_path = str(dst_path)
@@ -266,16 +487,9 @@ def copy_to_target_by_pattern(
         last_sep_index = src_path.rfind(os.sep)
         pattern = src_path[last_sep_index + 1 :]
         src_path = src_path[:last_sep_index]
-    # 排除项表达式
-    if isinstance(excludes, str):
-        if excludes:
-            excludes = excludes.split(";")
-        else:
-            excludes = []
-    elif isinstance(excludes, list):
-        excludes = excludes
-    else:
-        excludes = []
+    # 表达式只编译一次
+    pattern = re.compile(pattern, re.I)
+    excludes = _compile_patterns(excludes)
 
     # 遍历源目录
     for child in os.listdir(src_path):
@@ -284,21 +498,207 @@ def copy_to_target_by_pattern(
             continue
 
         # 判断是否为排除的项
-        is_exclude = False
-        for _p in excludes:
-            if _p and re.match(_p, child, re.I):
-                is_exclude = True
-                break
-        if is_exclude:
+        if _match_any(excludes, child):
             continue
 
         # 判断是否为匹配的项
-        if re.match(pattern, child, re.I):
-            copy_to_target(src_path + os.sep + child, dst_path)
+        if pattern.match(child):
+            copy_to_target(src_path + os.sep + child, dst_path, **kwargs)
+
+
+def _compile_patterns(patterns: str | list | None) -> list:
+    """将表达式编译为忽略大小写的正则表达式列表，字符串时按分号分隔多个表达式，空表达式忽略"""
+    if isinstance(patterns, str):
+        patterns = patterns.split(";")
+    elif not isinstance(patterns, (list, tuple)):
+        patterns = []
+    return [re.compile(_p, re.I) for _p in patterns if _p]
+
+
+def _match_any(regexes: list, name: str) -> bool:
+    return any(regex.match(name) for regex in regexes)
+
+
+# 复制过程中目标文件先写入带此后缀的临时文件，完成后再重命名，中断时不会留下内容不完整的目标文件
+_COPY_TEMP_SUFFIX = ".dbox-part"
+# Linux下的FICLONE，在btrfs、xfs等文件系统上共享数据块（reflink），不实际复制数据
+_FICLONE = 0x40049409
+# 内核复制接口不适用于当前文件（系统不支持、跨文件系统、非普通文件等）时的错误码，遇到时换用下一种方式
+_COPY_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.ENOTSOCK,
+    errno.EPERM,
+}
+
+
+def _copy_file_data(fsrc, fdst, size: int) -> None:
+    """依次尝试reflink、os.copy_file_range、os.sendfile，都不可用时按块读写"""
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError as _err:
+            if _err.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    # procfs等文件系统上报的大小为0但可以读出内容，直接按块读写
+    copied = 0
+    for kernel_copy in (_copy_file_range, _sendfile) if size else ():
+        copied = 0
+        try:
+            while copied < size:
+                sent = kernel_copy(src_fd, dst_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            break
+        except OSError as _err:
+            # 已经写入部分数据时不能换用其他方式，直接抛出
+            if copied or _err.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    if size and copied == size:
+        return
+
+    # 内核接口不可用，或提前返回0（FUSE等文件系统）时，从已复制的位置起按块读写剩余部分
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "os.copy_file_range不可用")
+    return os.copy_file_range(src_fd, dst_fd, min(count, 1 << 30), offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "os.sendfile不可用")
+    return os.sendfile(dst_fd, src_fd, offset, min(count, 1 << 30))
+
+
+def _is_unchanged(src_stat: os.stat_result, dst_path: str) -> bool:
+    """目标文件存在且大小、修改时间（纳秒）都与源文件相同"""
+    try:
+        dst_stat = os.stat(dst_path)
+    except OSError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+
+def _copy_file(src_path: str, dst_path: str, src_stat: os.stat_result, skip_unchanged: bool) -> int | None:
+    """复制单个文件及其修改时间、权限，返回复制的字节数，跳过时返回None"""
+    if skip_unchanged and _is_unchanged(src_stat, dst_path):
+        return None
+
+    temp_path = dst_path + _COPY_TEMP_SUFFIX
+    try:
+        with open(src_path, "rb") as fsrc, open(temp_path, "wb") as fdst:
+            _copy_file_data(fsrc, fdst, src_stat.st_size)
+        shutil.copystat(src_path, temp_path)
+        os.replace(temp_path, dst_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return src_stat.st_size
+
+
+def _iter_copy_files(src_dir: str, dst_dir: str, includes: list, excludes: list, recursion: bool, dirs: list):
+    """遍历源目录，创建对应的目标目录，产出待复制的(源文件, 目标文件, 源文件stat)，经过的目录对追加到dirs中"""
+    os.makedirs(dst_dir, exist_ok=True)
+    dirs.append((src_dir, dst_dir))
+    sub_dirs = []
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if _match_any(excludes, entry.name):
+                continue
+            if entry.is_dir():
+                if recursion:
+                    sub_dirs.append(entry.name)
+            elif not includes or _match_any(includes, entry.name):
+                yield entry.path, os.path.join(dst_dir, entry.name), entry.stat()
+    for name in sub_dirs:
+        yield from _iter_copy_files(
+            os.path.join(src_dir, name), os.path.join(dst_dir, name), includes, excludes, recursion, dirs
+        )
+
+
+def copy_tree(
+    src_path: str | Path,
+    dst_path: str | Path,
+    workers: int = 4,
+    includes: str | list | None = None,
+    excludes: str | list | None = None,
+    recursion: bool = True,
+    skip_unchanged: bool = True,
+) -> dict:
+    """多线程复制目录，目标目录已存在时合并
+    文件数据优先使用reflink、copy_file_range、sendfile等内核接口复制，每个文件先写入临时文件再重命名，
+    中断后重新执行时，已复制完成的文件因大小与修改时间相同而跳过，可从中断处继续
+
+    :param src_path: str, 源目录路径
+    :param dst_path: str, 目标目录路径
+    :param workers: int, 复制文件的线程数
+    :param includes: 只复制文件名匹配的文件，表达式同copy_to_target_by_pattern的excludes，为空时复制全部文件
+    :param excludes: 排除文件名或目录名匹配的项，如"x86;x64"
+    :param recursion: bool, 递归子目录
+    :param skip_unchanged: bool, 跳过大小与修改时间都与源文件相同的目标文件
+    :return: 统计信息，包括文件数、复制数、跳过数、复制字节数、耗时（秒）、每秒复制字节数
+    """
+    src_path, dst_path = str(src_path), str(dst_path)
+    check_path_is_exits(src_path, path_type="dir")
+    includes, excludes = _compile_patterns(includes), _compile_patterns(excludes)
+    result = {"files": 0, "copied": 0, "skipped": 0, "bytes": 0}
+    start = time.perf_counter()
+
+    def _collect(copied_bytes):
+        result["files"] += 1
+        if copied_bytes is None:
+            result["skipped"] += 1
+        else:
+            result["copied"] += 1
+            result["bytes"] += copied_bytes
+
+    dirs = []
+    jobs = _iter_copy_files(src_path, dst_path, includes, excludes, recursion, dirs)
+    if workers <= 1:
+        for src_file, dst_file, src_stat in jobs:
+            _collect(_copy_file(src_file, dst_file, src_stat, skip_unchanged))
+    else:
+        # 最多同时保留workers*4个未完成的任务，文件数量很多时不会一次性占满内存
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for src_file, dst_file, src_stat in jobs:
+                if len(pending) >= workers * 4:
+                    _collect(pending.popleft().result())
+                pending.append(executor.submit(_copy_file, src_file, dst_file, src_stat, skip_unchanged))
+            while pending:
+                _collect(pending.popleft().result())
+
+    # 与shutil.copytree一致，复制完内容后再复制目录的修改时间与权限
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+    result["elapsed"] = time.perf_counter() - start
+    result["bytes_per_sec"] = result["bytes"] / result["elapsed"] if result["elapsed"] else 0
+    logger.info(
+        f"复制完成：{src_path} -> {dst_path}，文件{result['files']}个，复制{result['copied']}个，"
+        f"跳过{result['skipped']}个，{result['bytes'] / 1024 / 1024:.1f}MB，"
+        f"{result['bytes_per_sec'] / 1024 / 1024:.1f}MB/s"
+    )
+    return result
 
 
 def read_file_stream(file_path: str, start_index, end_index):
-    """读取文件流
+    """读取文件流，每次调用都会打开文件；同一文件多次读取时使用MappedFile
     :param file_path: str, 文件路径
     :param start_index: int, 读取起始位置
     :param end_index: int, 读取结尾位置
@@ -309,27 +709,267 @@ def read_file_stream(file_path: str, start_index, end_index):
         return _file.read(end_index - start_index)
 
 
-def read_file_raw_content(file_path: str | Path, encoding=None) -> tuple:
-    """读取文件内容
+class MappedFile:
+    """只读的内存映射文件，读取时返回memoryview切片，不复制数据、不产生系统调用
+
+    用法：
+        with MappedFile(file_path) as mapped:
+            header = mapped.read(0, 16)
+            for line in mapped.iter_lines():
+                ...
+
+    关闭前需要先释放或丢弃所有切片，否则mmap.close会抛出BufferError
+    """
+
+    def __init__(self, file_path: str | Path):
+        """
+        :param file_path: 文件路径
+        """
+        check_path_is_exits(file_path, path_type="file")
+        self.file_path = Path(file_path)
+        self._file = open(file_path, "rb")
+        # 空文件不能映射，用空bytes代替
+        if os.fstat(self._file.fileno()).st_size:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._data = b""
+        self.view = memoryview(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item) -> memoryview | int:
+        return self.view[item]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """关闭映射与文件"""
+        self.view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def read(self, start_index: int, end_index: int) -> memoryview:
+        """读取[start_index, end_index)范围内的数据，同read_file_stream，但返回memoryview"""
+        return self.view[start_index:end_index]
+
+    def find(self, sub: bytes, start: int = 0, end: int | None = None) -> int:
+        """查找子串的位置，找不到时返回-1"""
+        return self._data.find(sub, start, len(self._data) if end is None else end)
+
+    def iter_records(self, separator: bytes = b"\n", keep_separator: bool = False):
+        """按分隔符逐条产出记录的memoryview切片，最后一条记录后没有分隔符时也会产出
+        :param separator: bytes, 记录分隔符，如b"\n"、b"\0"、b"\n\n"
+        :param keep_separator: bool, 记录中保留末尾的分隔符
+        """
+        return self._iter_records(separator, len(separator) if keep_separator else 0, False)
+
+    def iter_lines(self, keepends: bool = False):
+        """逐行产出memoryview切片
+        :param keepends: bool, 保留行尾的换行符；为False时同时去掉\r\n中的\r
+        """
+        return self._iter_records(b"\n", 1 if keepends else 0, not keepends)
+
+    def iter_blocks(self, block_size: int = 1024 * 1024, separator: bytes = b"\n"):
+        """按块产出memoryview切片，每块在block_size附近的分隔符之后结束，记录不会跨块；
+        逐行处理的Python循环开销较大，大文件扫描时可以对整块使用re等在C层面处理
+        :param block_size: int, 块大小
+        :param separator: bytes, 记录分隔符
+        """
+        data, view, size = self._data, self.view, len(self._data)
+        if isinstance(data, mmap.mmap) and hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        position = 0
+        while position < size:
+            index = data.find(separator, min(position + block_size, size))
+            end = size if index < 0 else index + len(separator)
+            yield view[position:end]
+            position = end
+
+    def _iter_records(self, separator: bytes, keep_length: int, strip_cr: bool):
+        data, view, size = self._data, self.view, len(self._data)
+        if isinstance(data, mmap.mmap) and hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        find, separator_length = data.find, len(separator)
+        position = 0
+        while position < size:
+            index = find(separator, position)
+            if index < 0:
+                index = size
+            end = index + keep_length if index < size else size
+            if strip_cr and end > position and data[end - 1] == 13:
+                end -= 1
+            yield view[position:end]
+            position = index + separator_length
+
+
+def iter_jsonl(file_path: str | Path, encoding: str = "utf-8"):
+    """逐行解析JSONL文件，跳过空行，文件通过内存映射读取，不一次性读入整个文件
     :param file_path: 文件路径
-    :param encoding: 文件字符编码，没有指定时会按照utf-8，GBK，GB2312，GB18030依次读取
+    :param encoding: 文件编码
+    """
+    with MappedFile(file_path) as mapped:
+        for line in mapped.iter_lines():
+            text = str(line, encoding)
+            line.release()
+            if text.strip():
+                yield json.loads(text)
+
+
+# 可能出现在JSON数字中的字符
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# JSON中的空白，按下标跳过，不切片复制缓存
+_JSON_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+def iter_json_array(file_path: str | Path, encoding: str = "utf-8", chunk_size: int = 1024 * 1024):
+    """逐个解析顶层为数组的JSON文件中的元素，按块读取，内存占用与单个元素大小有关，与文件大小无关
+    :param file_path: 文件路径
+    :param encoding: 文件编码
+    :param chunk_size: int, 每次读取的字符数
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, encoding=encoding) as _file:
+        buffer, position, eof = "", 0, False
+
+        def _read_more():
+            nonlocal buffer, position, eof
+            # 丢弃已解析的部分；单个元素很大时按已缓存的长度加倍读取，避免反复解析
+            buffer = buffer[position:]
+            position = 0
+            chunk = _file.read(max(chunk_size, len(buffer)))
+            eof = not chunk
+            buffer += chunk
+
+        def _next_char() -> str:
+            """跳过空白，返回下一个字符，文件结束时返回空字符串"""
+            nonlocal position
+            while True:
+                position = _JSON_WHITESPACE.match(buffer, position).end()
+                if position < len(buffer) or eof:
+                    return buffer[position : position + 1]
+                _read_more()
+
+        if _next_char() != "[":
+            raise ValueError(f"JSON文件的顶层不是数组：{file_path}")
+        position += 1
+        if _next_char() == "]":
+            return
+
+        while True:
+            _next_char()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    _read_more()
+                    continue
+                # 数字、true等值在缓存末尾时可能被截断，读取更多内容后重新解析
+                if end == len(buffer) and not eof:
+                    _read_more()
+                    continue
+                # 数字在“2.”、“1e”处截断时也能解析成功，其后的内容仍可能属于该数字
+                if isinstance(value, (int, float)) and not isinstance(value, bool) and not eof:
+                    index = _JSON_WHITESPACE.match(buffer, end).end()
+                    if index == len(buffer) or buffer[index] in _NUMBER_CHARS:
+                        _read_more()
+                        continue
+                break
+            position = end
+            yield value
+
+            separator = _next_char()
+            position += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"JSON数组格式错误：{file_path}，位置附近的内容：{buffer[position - 1 : position + 20]!r}")
+
+
+# 未指定编码时依次尝试的编码
+_DEFAULT_ENCODINGS = ("utf-8", "GBK", "GB2312", "GB18030")
+# 按BOM确定的编码，UTF-32 LE的BOM以UTF-16 LE的BOM开头，需要先判断
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# 已识别的文件编码：绝对路径 -> (修改时间, 大小, 编码)
+_encoding_cache = {}
+_ENCODING_CACHE_SIZE = 4096
+
+
+def clear_encoding_cache():
+    """清空read_file_raw_content缓存的文件编码"""
+    _encoding_cache.clear()
+
+
+def _guess_encodings(data: bytes) -> list:
+    """按BOM与开头数据的字节特征排列候选编码，调整顺序不改变按_DEFAULT_ENCODINGS依次尝试的结果"""
+    for bom, encoding in _BOM_ENCODINGS:
+        if data.startswith(bom):
+            return [encoding, *_DEFAULT_ENCODINGS]
+    if data.isascii():
+        return ["utf-8"]
+    try:
+        # final=False时末尾被截断的多字节字符不会报错
+        codecs.getincrementaldecoder("utf-8")().decode(data[:4096], final=False)
+    except UnicodeDecodeError:
+        # 开头已经不是合法的utf-8，整个文件也不可能按utf-8解码成功
+        return list(_DEFAULT_ENCODINGS[1:])
+    return list(_DEFAULT_ENCODINGS)
+
+
+def read_file_raw_content(file_path: str | Path, encoding=None, use_cache: bool = True) -> tuple:
+    """读取文件内容，文件只读取一次，在内存中按候选编码解码
+    :param file_path: 文件路径
+    :param encoding: 文件字符编码，没有指定时按BOM识别，没有BOM时按照utf-8，GBK，GB2312，GB18030依次解码
+    :param use_cache: bool, 按(路径, 修改时间, 大小)缓存识别出的编码，再次读取未修改的文件时直接使用
     :return 返回文件类型与读取成功的文件编码
     """
     check_path_is_exits(file_path)
     file_path = Path(file_path)
 
+    with open(file_path, "rb") as _file:
+        _stat = os.fstat(_file.fileno())
+        data = _file.read()
+
+    # 只缓存自动识别的编码，指定的编码可能与自动识别的结果不同
+    use_cache = use_cache and not encoding
+    cache_key = os.path.abspath(file_path)
     if encoding:
         encoding_list = [encoding]
     else:
-        encoding_list = ["utf-8", "GBK", "GB2312", "GB18030"]
+        encoding_list = _guess_encodings(data)
+        cached = _encoding_cache.get(cache_key) if use_cache else None
+        if cached and cached[:2] == (_stat.st_mtime_ns, _stat.st_size):
+            encoding_list.insert(0, cached[2])
 
     error = None
     for encoding in encoding_list:
         try:
-            with open(file_path, encoding=encoding) as _file:
-                return _file.read(), encoding
-        except Exception as e:
+            content = data.decode(encoding)
+        except (UnicodeDecodeError, LookupError) as e:
             error = e
+            continue
+
+        if use_cache:
+            if len(_encoding_cache) >= _ENCODING_CACHE_SIZE:
+                _encoding_cache.clear()
+            _encoding_cache[cache_key] = (_stat.st_mtime_ns, _stat.st_size, encoding)
+        # 与文本模式读取一致，统一换行符为\n
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content, encoding
     else:
         if error is not None:
             raise error
@@ -456,19 +1096,18 @@ def save_ini_config_object(config_path: Path, _object: configparser.ConfigParser
         _object.write(_file)
 
 
-def compare_dir(target1: str, target2: str) -> bool:
-    """比较两个目标是否完成一致"""
+def compare_dir(target1: str, target2: str, workers: int = 4) -> bool:
+    """比较两个目标是否完成一致，按文件大小与内容哈希比较，多线程计算哈希"""
     logger.info(f"开始比较目录：{target1}与{target2}")
-
-    def print_diff_files(dcmp):
-        for name in dcmp.diff_files:
-            logger.error("diff_file %s found in %s and %s" % (name, dcmp.left, dcmp.right))
-        for sub_dcmp in dcmp.subdirs.values():
-            print_diff_files(sub_dcmp)
-
-    cmp_res = filecmp.dircmp(target1, target2)
-    print_diff_files(cmp_res)
-    if cmp_res.diff_files:
+    diff = diff_manifest(build_manifest(target1, workers=workers), build_manifest(target2, workers=workers))
+    for name in diff["changed"]:
+        logger.error(f"diff_file {name} found in {target1} and {target2}")
+    for name in diff["added"] + diff["added_dirs"]:
+        logger.error(f"only in {target1}: {name}")
+    for name in diff["removed"] + diff["removed_dirs"]:
+        logger.error(f"only in {target2}: {name}")
+
+    if diff["changed"] or diff["added"] or diff["removed"] or diff["added_dirs"] or diff["removed_dirs"]:
         logger.error("两个目录不完全相同")
         return False
     else:
@@ -479,3 +1118,213 @@ def compare_dir(target1: str, target2: str) -> bool:
 def compare_file(file1: str, file2: str) -> bool:
     """比较两个文件是否一致"""
     return filecmp.cmp(file1, file2, shallow=False)
+
+
+# 清单中记录的文件哈希算法
+_MANIFEST_HASH = "blake2b"
+
+
+def _hash_file(file_path: str) -> str:
+    """计算文件内容的blake2b哈希（128位），按1MB分块读取"""
+    digest = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(1024 * 1024)
+    view = memoryview(buffer)
+    with open(file_path, "rb") as f:
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+def _hash_files(file_paths: list, workers: int) -> list:
+    """多线程计算文件哈希，hashlib计算时释放GIL，多线程可以同时利用多个CPU核心"""
+    if workers <= 1 or len(file_paths) <= 1:
+        return [_hash_file(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_hash_file, file_paths))
+
+
+def _walk_tree(root: str, includes: list, excludes: list) -> tuple[list, list]:
+    """遍历目录树，返回(子目录相对路径列表, [(文件相对路径, stat)])，相对路径以/分隔"""
+    dirs, files = [], []
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                if _match_any(excludes, entry.name):
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir():
+                    dirs.append(rel_path)
+                    stack.append(rel_path)
+                elif not includes or _match_any(includes, entry.name):
+                    files.append((rel_path, entry.stat()))
+    return dirs, files
+
+
+def build_manifest(
+    root: str | Path,
+    workers: int = 4,
+    includes: str | list | None = None,
+    excludes: str | list | None = None,
+    previous: dict | None = None,
+    hash_files: bool = True,
+) -> dict:
+    """生成目录清单，记录每个文件的相对路径、大小、修改时间与内容哈希
+    :param root: 目录路径
+    :param workers: int, 计算哈希的线程数
+    :param includes: 只记录文件名匹配的文件，表达式同copy_tree
+    :param excludes: 排除文件名或目录名匹配的项，表达式同copy_tree
+    :param previous: 上次生成的清单，大小与修改时间都未变化的文件沿用其中的哈希，不再读取文件
+    :param hash_files: bool, 为False时只记录大小与修改时间
+    :return: {"root": 目录, "algorithm": 哈希算法, "dirs": [子目录], "files": {相对路径: {"size", "mtime", "mtime_ns", "hash"}}}
+    """
+    root = str(root)
+    check_path_is_exits(root, path_type="dir")
+    dirs, stats = _walk_tree(root, _compile_patterns(includes), _compile_patterns(excludes))
+    files = {
+        rel_path: {"size": _stat.st_size, "mtime": _stat.st_mtime, "mtime_ns": _stat.st_mtime_ns}
+        for rel_path, _stat in stats
+    }
+
+    if hash_files:
+        previous_files = previous["files"] if previous and previous.get("algorithm") == _MANIFEST_HASH else {}
+        to_hash = []
+        for rel_path, info in files.items():
+            old = previous_files.get(rel_path)
+            if old and old.get("hash") and old["size"] == info["size"] and _same_mtime(old, info):
+                info["hash"] = old["hash"]
+            else:
+                to_hash.append(rel_path)
+        hashes = _hash_files([os.path.join(root, rel_path) for rel_path in to_hash], workers)
+        for rel_path, file_hash in zip(to_hash, hashes):
+            files[rel_path]["hash"] = file_hash
+    return {"root": root, "algorithm": _MANIFEST_HASH, "dirs": sorted(dirs), "files": files}
+
+
+def save_manifest(manifest: dict, file_abs_path: str | Path):
+    """将目录清单保存为JSON文件"""
+    save_json_to_file(manifest, file_abs_path, indent=None)
+
+
+def load_manifest(file_abs_path: str | Path) -> dict:
+    """读取save_manifest保存的目录清单"""
+    return read_file_content(file_abs_path, encoding="utf-8", _return="json")
+
+
+def _same_mtime(info: dict, other: dict) -> bool:
+    """比较清单中两个文件的修改时间；同一秒内的修改也能区分，copystat会保留纳秒精度的修改时间"""
+    if "mtime_ns" in info and "mtime_ns" in other:
+        return info["mtime_ns"] == other["mtime_ns"]
+    # 旧版本的清单没有mtime_ns
+    return info["mtime"] == other["mtime"]
+
+
+def diff_manifest(source: dict, target: dict) -> dict:
+    """比较两个目录清单
+    两边都有哈希时按大小与哈希比较，否则按大小与修改时间（纳秒）比较
+    :return: {"added": 只在source中的文件, "removed": 只在target中的文件, "changed": 内容不同的文件,
+        "unchanged": 相同的文件, "added_dirs": 只在source中的目录, "removed_dirs": 只在target中的目录}，均为升序列表
+    """
+    source_files, target_files = source["files"], target["files"]
+    same_algorithm = source.get("algorithm") == target.get("algorithm")
+    diff = {"added": [], "removed": [], "changed": [], "unchanged": []}
+    for rel_path in sorted(source_files):
+        info, other = source_files[rel_path], target_files.get(rel_path)
+        if other is None:
+            diff["added"].append(rel_path)
+        elif info["size"] != other["size"]:
+            diff["changed"].append(rel_path)
+        elif same_algorithm and info.get("hash") and other.get("hash"):
+            diff["changed" if info["hash"] != other["hash"] else "unchanged"].append(rel_path)
+        else:
+            diff["unchanged" if _same_mtime(info, other) else "changed"].append(rel_path)
+    diff["removed"] = sorted(set(target_files) - set(source_files))
+    diff["added_dirs"] = sorted(set(source["dirs"]) - set(target["dirs"]))
+    diff["removed_dirs"] = sorted(set(target["dirs"]) - set(source["dirs"]))
+    return diff
+
+
+def sync_dir(
+    src_path: str | Path,
+    dst_path: str | Path,
+    workers: int = 4,
+    delete: bool = True,
+    includes: str | list | None = None,
+    excludes: str | list | None = None,
+    checksum: bool = False,
+) -> dict:
+    """增量同步目录：只复制新增与修改的文件，删除目标目录中多余的文件与目录
+    默认按大小与修改时间判断文件是否修改，只有大小相同而修改时间不同的文件才计算哈希确认，
+    耗时与修改的文件数量成正比，与目录大小无关
+
+    :param src_path: str, 源目录路径
+    :param dst_path: str, 目标目录路径，不存在时创建
+    :param workers: int, 复制文件与计算哈希的线程数
+    :param delete: bool, 删除目标目录中源目录没有的文件与目录；被excludes排除的项不会删除
+    :param includes: 只同步文件名匹配的文件，表达式同copy_tree
+    :param excludes: 排除文件名或目录名匹配的项，表达式同copy_tree
+    :param checksum: bool, 为True时计算全部文件的哈希进行比较
+    :return: 统计信息，包括复制数、删除数、未修改数、复制字节数、耗时（秒）
+    """
+    src_path, dst_path = str(src_path), str(dst_path)
+    start = time.perf_counter()
+    os.makedirs(dst_path, exist_ok=True)
+    options = {"workers": workers, "includes": includes, "excludes": excludes, "hash_files": checksum}
+    source, target = build_manifest(src_path, **options), build_manifest(dst_path, **options)
+    diff = diff_manifest(source, target)
+
+    changed = diff["changed"]
+    touched = []
+    if not checksum:
+        # 大小相同、只有修改时间不同的文件计算哈希确认，内容相同时只更新修改时间，不复制
+        candidates = [name for name in changed if source["files"][name]["size"] == target["files"][name]["size"]]
+        src_hashes = _hash_files([os.path.join(src_path, name) for name in candidates], workers)
+        dst_hashes = _hash_files([os.path.join(dst_path, name) for name in candidates], workers)
+        touched = [name for name, src_hash, dst_hash in zip(candidates, src_hashes, dst_hashes) if src_hash == dst_hash]
+        if touched:
+            touched_set = set(touched)
+            changed = [name for name in changed if name not in touched_set]
+            for name in touched:
+                shutil.copystat(os.path.join(src_path, name), os.path.join(dst_path, name))
+
+    # 先删除多余的文件，避免目标目录中同名的文件与目录冲突
+    deleted = 0
+    if delete:
+        for name in diff["removed"]:
+            os.remove(os.path.join(dst_path, name))
+            deleted += 1
+        # 子目录排在父目录之后，倒序删除；目录中还有被excludes排除的项时保留
+        for name in reversed(diff["removed_dirs"]):
+            try:
+                os.rmdir(os.path.join(dst_path, name))
+                deleted += 1
+            except OSError:
+                logger.warning(f"目录不为空，未删除：{os.path.join(dst_path, name)}")
+
+    for name in diff["added_dirs"]:
+        os.makedirs(os.path.join(dst_path, name), exist_ok=True)
+
+    def _copy(name):
+        src_file = os.path.join(src_path, name)
+        return _copy_file(src_file, os.path.join(dst_path, name), os.stat(src_file), False)
+
+    to_copy = diff["added"] + changed
+    if workers <= 1 or len(to_copy) <= 1:
+        copied_bytes = [_copy(name) for name in to_copy]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            copied_bytes = list(executor.map(_copy, to_copy))
+
+    result = {
+        "copied": len(to_copy),
+        "deleted": deleted,
+        "unchanged": len(diff["unchanged"]) + len(touched),
+        "bytes": sum(copied_bytes),
+        "elapsed": time.perf_counter() - start,
+    }
+    logger.info(
+        f"同步完成：{src_path} -> {dst_path}，复制{result['copied']}个，删除{result['deleted']}个，"
+        f"未修改{result['unchanged']}个，{result['bytes'] / 1024 / 1024:.1f}MB，耗时{result['elapsed']:.2f}秒"
+    )
+    return result
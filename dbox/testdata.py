@@ -5,15 +5,51 @@ author：dqy
 邮箱：yu12377@163.com
 time：2018/1/12 下午6:20
 """
+import os
+import csv
+import json
 import uuid
 import time
+import bisect
+import hashlib
 import random
 import string
+import secrets
+import calendar
 import datetime
+import functools
+import operator
+import itertools
+import contextlib
+import collections
 from xpinyin import Pinyin
 
-from .addressinfo import addr
-from .bankinfo import bank_bin_list
+
+def __getattr__(name: str):
+    """兼容旧版本的模块属性addr、bank_bin_list：数据模块体积大、导入慢，首次访问这两个属性时才导入"""
+    if name == "addr":
+        from .addressinfo import addr
+
+        return addr
+    if name == "bank_bin_list":
+        from .bankinfo import bank_bin_list
+
+        return bank_bin_list
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 批量生成的数量小于该值时使用纯Python实现，numpy的固定开销在小批量时大于逐个生成的耗时
+_NUMPY_MIN_BATCH = 64
+
+
+@functools.cache
+def _get_numpy():
+    """导入numpy，未安装时返回None；numpy导入耗时占本模块导入耗时的大部分，只在批量生成、批量校验时导入"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 def get_date(offset: int | None = None) -> str:
@@ -68,6 +104,10 @@ def get_random_date(
     :param date_format: 输出格式，默认为"%Y-%m-%d"
     :return: 随机日期，格式为date_format
     """
+    return _random_date(random, start_date, end_date, date_format)
+
+
+def _random_date(rng, start_date, end_date, date_format: str) -> str:
     if not start_date:
         start_date = datetime.date(1949, 1, 1)
     elif isinstance(start_date, str):
@@ -84,7 +124,7 @@ def get_random_date(
         end_date = datetime.datetime.combine(end_date, datetime.time.max)
 
     days_difference = (end_date - start_date).days + 1
-    random_days_offset = random.randint(0, days_difference - 1)
+    random_days_offset = rng.randint(0, days_difference - 1)
     random_date = start_date + datetime.timedelta(days=random_days_offset)
     return random_date.strftime(date_format)
 
@@ -95,6 +135,10 @@ def get_random_string(length: int = 32, source: str = "dlu") -> str:
     :param source: 字符源，d数字，l小写字母，u大写字母，s所有可打印字符，默认为dlu
     :return: 随机生成的字符串
     """
+    return _random_string(random, length, source)
+
+
+def _random_string(rng, length: int, source: str) -> str:
     char_pool = ""
     # s 包含所有字符，故直接重新赋值
     if "s" in source:
@@ -111,7 +155,7 @@ def get_random_string(length: int = 32, source: str = "dlu") -> str:
     if not char_pool or length <= 0:
         return ""
 
-    return "".join(random.choices(char_pool, k=length))
+    return "".join(rng.choices(char_pool, k=length))
 
 
 def get_uuid(length: int = 32) -> str:
@@ -119,10 +163,15 @@ def get_uuid(length: int = 32) -> str:
     :param length: UUID长度，默认32位（无连字符）；36位为带连字符的标准格式；小于32则截断；大于32则重复拼接
     :return: UUID字符串
     """
+    return _build_uuid(length, uuid.uuid1)
+
+
+def _build_uuid(length: int, make_uuid) -> str:
+    """按长度拼接make_uuid生成的UUID"""
     if length <= 0:
         return ""
 
-    uuid_with_hyphens = str(uuid.uuid1())
+    uuid_with_hyphens = str(make_uuid())
     uuid_without_hyphens = uuid_with_hyphens.replace("-", "")
 
     if length == 36:
@@ -135,7 +184,7 @@ def get_uuid(length: int = 32) -> str:
         # 如果需要超过32位，重复UUID直到达到指定长度
         result = uuid_without_hyphens
         while len(result) < length:
-            result += str(uuid.uuid1()).replace("-", "")
+            result += str(make_uuid()).replace("-", "")
         return result[:length]
 
 
@@ -148,9 +197,62 @@ def get_pinyin(name: str = "", separator="") -> tuple[str, str]:
     if not name:
         name = get_name()
 
-    pinyin_converter = Pinyin()
-    pinyin_result = pinyin_converter.get_pinyin(name, separator)
-    return pinyin_result, name
+    return _get_pinyin_converter().convert(name, separator), name
+
+
+def get_pinyin_many(names: list, separator="") -> list[tuple[str, str]]:
+    """批量获取拼音
+    :param names: list, 需要转换拼音的汉字列表
+    :param separator: str, 拼音连接符号
+    :return 与names一一对应的(拼音, 源汉字)元组列表
+    """
+    return _get_pinyin_converter().convert_many(names, separator)
+
+
+class _PinyinConverter:
+    """拼音转换器：只加载一次字典，并按字缓存转换结果（取第一个读音、不带声调）；
+    含非汉字字符的文本交给xpinyin整体转换，与其对连续非汉字字符的处理保持一致
+    """
+
+    def __init__(self):
+        self.pinyin = Pinyin()
+        # 汉字 -> 拼音，非汉字为None
+        self.cache = {}
+
+    def _lookup(self, char: str):
+        if f"{ord(char):X}" in self.pinyin.pinyins:
+            syllable = self.pinyin.get_pinyin(char, "")
+        else:
+            syllable = None
+        self.cache[char] = syllable
+        return syllable
+
+    def convert(self, text: str, separator="") -> str:
+        cache = self.cache
+        syllables = []
+        for char in text:
+            syllable = cache[char] if char in cache else self._lookup(char)
+            if syllable is None:
+                return self.pinyin.get_pinyin(text, separator)
+            syllables.append(syllable)
+        return separator.join(syllables)
+
+    def convert_many(self, texts: list, separator="") -> list[tuple[str, str]]:
+        # 先一次性补齐所有未缓存的字，再逐个拼接
+        for char in set().union(*texts).difference(self.cache):
+            self._lookup(char)
+        return [(self.convert(text, separator), text) for text in texts]
+
+
+_pinyin_converter = None
+
+
+def _get_pinyin_converter() -> _PinyinConverter:
+    """首次使用时加载拼音字典"""
+    global _pinyin_converter
+    if _pinyin_converter is None:
+        _pinyin_converter = _PinyinConverter()
+    return _pinyin_converter
 
 
 def get_name(gender: int = 0) -> str:
@@ -158,7 +260,44 @@ def get_name(gender: int = 0) -> str:
     :param gender: 性别，0为随机，偶数为女性，奇数为男性
     :return: 随机生成的姓名
     """
-    surnames = """
+    return get_names(1, gender=gender)[0]
+
+
+def get_names(
+    count: int, gender: int = 0, dedupe: bool = False, surname_weights: dict | None = None, single_char_ratio=1 / 3
+) -> list:
+    """批量获取随机中国人姓名
+    :param count: int, 生成数量
+    :param gender: 性别，0为随机，偶数为女性，奇数为男性
+    :param dedupe: bool, 为True时去掉名字库中重复的名字，每个名字被选中的概率相同；默认保留重复，重复的名字更常出现
+    :param surname_weights: dict, 姓氏权重，如{"王": 10, "李": 9}，未列出的姓氏权重为1，默认所有姓氏概率相同
+    :param single_char_ratio: float, 单字名所占的比例，单字名从双字名中随机取一个字
+    :return: 姓名列表
+    """
+    return _get_names(random, count, gender, dedupe, surname_weights, single_char_ratio)
+
+
+def _get_names(rng, count: int, gender, dedupe: bool, surname_weights: dict | None, single_char_ratio) -> list:
+    if count <= 0:
+        return []
+    surnames, male_names, female_names = _get_name_pools(dedupe)
+    surname_cum_weights = None
+    if surname_weights:
+        surname_cum_weights = list(itertools.accumulate(surname_weights.get(surname, 1) for surname in surnames))
+
+    if not isinstance(gender, int) or gender == 0:
+        gender_kind = 0
+    else:
+        gender_kind = 1 if gender % 2 == 1 else 2
+    given_names, given_cum_weights = _get_given_name_pool(gender_kind, dedupe, single_char_ratio)
+
+    selected_surnames = rng.choices(surnames, cum_weights=surname_cum_weights, k=count)
+    selected_given_names = rng.choices(given_names, cum_weights=given_cum_weights, k=count)
+    return list(map(operator.add, selected_surnames, selected_given_names))
+
+
+# 姓名库：首次使用时解析为元组
+_SURNAME_TEXT = """
         赵钱孙李，周吴郑王。
         冯陈褚卫，蒋沈韩杨。
         朱秦尤许，何吕施张。
@@ -183,10 +322,7 @@ def get_name(gender: int = 0) -> str:
         经房裘缪，干解应宗。
         丁宣贲邓，郁单杭洪。"""
 
-    surnames = surnames.replace("，", "").replace("。", "").replace("\n", "").replace(" ", "")
-    selected_surname = random.choice(surnames)
-
-    male_names = """
+_MALE_NAME_TEXT = """
     澄邈、德泽、海超、海阳、海荣、海逸、海昌、瀚钰、瀚文、涵亮、涵煦、涵蓄、涵衍、浩皛、浩波、浩博、浩初、浩宕、浩歌、浩广、浩邈、浩气、
     浩思、浩言、鸿宝、鸿波、鸿博、鸿才、鸿畅、鸿畴、鸿达、鸿德、鸿飞、鸿风、鸿福、鸿光、鸿晖、鸿朗、鸿文、鸿轩、鸿煊、鸿骞、鸿远、鸿云、
     鸿哲、鸿祯、鸿志、鸿卓、嘉澍、光济、澎湃、彭泽、鹏池、鹏海、浦和、浦泽、瑞渊、越泽、博耘、德运、辰宇、辰皓、辰钊、辰铭、辰锟、辰阳、
@@ -204,7 +340,7 @@ def get_name(gender: int = 0) -> str:
     文景、曦哲、永昌、子昂、智宇、智晖、晗日、晗昱、瀚玥、瀚昂、昊硕、昊磊、昊东、鸿晖、绍晖、文昂、文景、曦哲、永昌、子昂、智宇、智晖、
     浩然、鸿运、辰龙、运珹、振宇、高朗、景平、鑫鹏、昌淼、炫明、昆皓、曜栋、文昂"""
 
-    female_names = """
+_FEMALE_NAME_TEXT = """
     恨桃、依秋、依波、香巧、紫萱、涵易、忆之、幻巧、水风、安寒、白亦、惜玉、碧春、怜雪、听南、念蕾、紫夏、凌旋、芷梦、凌寒、梦竹、千凡、
     采波、元冬、思菱、平卉、笑柳、雪卉、南蓉、谷梦、巧兰、绿蝶、飞荷、平安、芷荷、怀瑶、慕易、若芹、紫安、曼冬、寻巧、寄波、尔槐、以旋、
     初夏、依丝、怜南、傲菡、谷蕊、笑槐、飞兰、笑卉、迎荷、元冬、痴安、妙绿、觅雪、寒安、沛凝、白容、乐蓉、映安、依云、映冬、凡雁、梦秋、
@@ -220,25 +356,38 @@ def get_name(gender: int = 0) -> str:
     念波、迎松、海瑶、乐萱、凌兰、曼岚、若枫、傲薇、凡灵、乐蕊、秋灵、谷槐、觅云、寻春、恨山、从寒、忆香、觅波、静曼、青寒、笑天、涵蕾、
     元柏、代萱、紫真、千青、雪珍、寄琴、绿蕊、醉柳、诗翠、念瑶、孤风、曼彤、怀曼、香巧、采蓝、芷天、尔曼、巧蕊"""
 
-    # 随机获取男名与女名
-    female_name = random.choice(female_names.replace("\n", "").replace(" ", "").split("、"))
-    male_name = random.choice(male_names.replace("\n", "").replace(" ", "").split("、"))
 
-    # 将两个字的名字随机转换成双字或单字
-    if random.randint(1, 3) == 1:
-        female_name = random.choice(female_name)
-        male_name = random.choice(male_name)
+@functools.lru_cache(maxsize=2)
+def _get_name_pools(dedupe: bool = False) -> tuple[tuple, tuple, tuple]:
+    """解析姓名库，返回(姓氏, 男名, 女名)三个元组"""
+    surnames = tuple(_SURNAME_TEXT.replace("，", "").replace("。", "").replace("\n", "").replace(" ", ""))
+    male_names = tuple(_MALE_NAME_TEXT.replace("\n", "").replace(" ", "").split("、"))
+    female_names = tuple(_FEMALE_NAME_TEXT.replace("\n", "").replace(" ", "").split("、"))
+    if dedupe:
+        surnames, male_names, female_names = (
+            tuple(dict.fromkeys(pool)) for pool in (surnames, male_names, female_names)
+        )
+    return surnames, male_names, female_names
 
-    # 男名or女名
-    if isinstance(gender, int):
-        if gender % 2 == 0:
-            selected_given_name = female_name
-        else:
-            selected_given_name = male_name
-    else:
-        selected_given_name = random.choice([male_name, female_name])
 
-    return f"{selected_surname}{selected_given_name}"
+@functools.lru_cache(maxsize=16)
+def _get_given_name_pool(gender_kind: int, dedupe: bool, single_char_ratio: float) -> tuple[tuple, list]:
+    """合并双字名与单字名为一个带累计权重的名字库，一次random.choices即可完成抽取
+    :param gender_kind: 0为男女各半，1为男性，2为女性
+    """
+    _, male_names, female_names = _get_name_pools(dedupe)
+    pools = {0: ((male_names, 0.5), (female_names, 0.5)), 1: ((male_names, 1),), 2: ((female_names, 1),)}[gender_kind]
+    names, weights = [], []
+    for pool, pool_weight in pools:
+        name_weight = pool_weight / len(pool)
+        for name in pool:
+            names.append(name)
+            weights.append(name_weight * (1 - single_char_ratio))
+            # 单字名：从该名字中随机取一个字
+            for char in name:
+                names.append(char)
+                weights.append(name_weight * single_char_ratio / len(name))
+    return tuple(names), list(itertools.accumulate(weights))
 
 
 def validate_id_card(id_card_number: str | int) -> str | bool:
@@ -287,39 +436,271 @@ def validate_id_card(id_card_number: str | int) -> str | bool:
         return ""
 
 
+def validate_id_cards(id_card_numbers) -> tuple[list, list]:
+    """批量校验18位身份证号码，安装numpy时按矩阵整批计算
+    :param id_card_numbers: 号码列表、元组、numpy数组等可迭代对象，或文本文件路径（每行一个号码）
+    :return: (是否有效的布尔值列表, 按前17位计算出的校验码列表)，两者与输入一一对应，格式不正确的号码校验码为空字符串
+    """
+    values = _read_numbers(id_card_numbers)
+    if not values:
+        return [], []
+    # 校验码为小写x的号码视为有效，统一转换为大写后再计算
+    values = [value[:-1] + "X" if value.endswith("x") else value for value in values]
+    if _get_numpy() is not None:
+        return _validate_id_cards_numpy(values)
+
+    # 按字节与加权因子相乘求和，再减去字符“0”的ASCII码带来的偏移
+    weight_offset = 48 * sum(_ID_CARD_WEIGHTS)
+    mask, check_codes = [], []
+    for value in values:
+        if len(value) != 18 or not value.isascii() or not value[:17].isdigit():
+            mask.append(False)
+            check_codes.append("")
+            continue
+        weighted_sum = sum(map(operator.mul, value[:17].encode("ascii"), _ID_CARD_WEIGHTS)) - weight_offset
+        check_code = _ID_CARD_CHECK_CODES[weighted_sum % 11]
+        mask.append(value[17] == check_code)
+        check_codes.append(check_code)
+    return mask, check_codes
+
+
+def _validate_id_cards_numpy(values: list) -> tuple[list, list]:
+    """将号码拼接为n*18的字节矩阵，前17位与加权因子相乘求和后查表得到校验码"""
+    import numpy
+
+    lengths = numpy.fromiter(map(len, values), dtype=numpy.int64, count=len(values))
+    length_ok = lengths == 18
+    # 长度不对的号码用占位值代替，保证矩阵每行18个字节；非ASCII字符替换为“?”，宽度不变
+    placeholder = "?" * 18
+    buffer = "".join(value if len(value) == 18 else placeholder for value in values).encode("ascii", "replace")
+    matrix = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(len(values), 18)
+
+    body = matrix[:, :17].astype(numpy.int64) - 48
+    digits_ok = ((body >= 0) & (body <= 9)).all(axis=1)
+    remainders = (body * numpy.array(_ID_CARD_WEIGHTS)).sum(axis=1) % 11
+    check_bytes = numpy.frombuffer(_ID_CARD_CHECK_CODES.encode("ascii"), dtype=numpy.uint8)[remainders]
+
+    format_ok = length_ok & digits_ok
+    mask = format_ok & (matrix[:, 17] == check_bytes)
+    check_codes = numpy.where(format_ok, numpy.array(list(_ID_CARD_CHECK_CODES))[remainders], "")
+    return mask.tolist(), check_codes.tolist()
+
+
+def _read_numbers(numbers) -> list:
+    """将号码输入统一为去除首尾空白的字符串列表：str或路径对象视为文本文件，每行一个号码"""
+    if isinstance(numbers, (str, os.PathLike)):
+        with open(numbers, encoding="utf-8") as f:
+            return [line.strip() for line in f.read().splitlines()]
+    return [
+        value.decode("utf-8", "replace").strip() if isinstance(value, bytes) else str(value).strip()
+        for value in numbers
+    ]
+
+
 def generate_id_card(gender: int = 0) -> str:
     """生成随机中国大陆18位身份证号码
     :param gender: 性别，0为随机，奇数为男性，偶数为女性
     :return: 18位身份证号码字符串
     """
-    # part1: 随机获取地区编码
-    region_code = random.choice(addr)[0]
+    return generate_id_cards(1, gender=gender)[0]
 
-    # part2: 随机获取1949/10/01到当天的一个日期
-    # 日期起始时间: 1949/10/01 00:00:00
-    birth_date = get_random_date(date_format="%Y%m%d")
 
-    # part3: 随机获取两位顺序码
-    sequence_number = random.randrange(11, 99)
+def generate_id_cards(count: int, gender: int = 0, birth_range=None, region=None) -> list:
+    """批量生成随机中国大陆18位身份证号码
+    :param count: int, 生成数量
+    :param gender: 性别，0为随机，奇数为男性，偶数为女性
+    :param birth_range: 出生日期范围(起始日期, 截止日期)，日期为date对象或"%Y-%m-%d"格式字符串，默认为1949-01-01至今天
+    :param region: 地区代码或前缀，如44（广东省）、4401（广州市）、440106，只生成该地区的号码，默认不限
+    :return: 身份证号码列表
+    """
+    return _generate_id_card_batch(random, count, _IdCardTables.get(gender, birth_range, region))
 
-    # part4：性别编码：奇数代表男性，偶数代表女性
-    if gender == 0:
-        gender_code = random.randrange(1, 10)
-    elif gender % 2 == 1:
-        gender_code = random.randrange(1, 10, 2)
-    else:
-        gender_code = random.randrange(2, 10, 2)
 
-    # part5: 计算校验码
-    validation_code = validate_id_card(f"{region_code}{birth_date}{sequence_number}{gender_code}")
+def iter_id_cards(count: int, gender: int = 0, birth_range=None, batch_size: int = 100000, region=None):
+    """逐个产出随机身份证号码，内部按批生成，适合生成大量数据
+    :param batch_size: int, 每批生成的数量
+    其他参数同generate_id_cards
+    """
+    return _iter_id_cards(random, count, gender, birth_range, batch_size, region)
+
 
-    return f"{region_code}{birth_date}{sequence_number}{gender_code}{validation_code}"
+def _iter_id_cards(rng, count: int, gender, birth_range, batch_size: int, region):
+    tables = _IdCardTables.get(gender, birth_range, region)
+    remaining = count
+    while remaining > 0:
+        batch = _generate_id_card_batch(rng, min(batch_size, remaining), tables)
+        remaining -= len(batch)
+        yield from batch
+
+
+def save_id_cards(
+    file_path, count: int, gender: int = 0, birth_range=None, batch_size: int = 100000, region=None
+) -> int:
+    """生成随机身份证号码并逐批写入文本文件，每行一个
+    :param file_path: 文件路径
+    其他参数同iter_id_cards
+    :return: 写入的数量
+    """
+    tables = _IdCardTables.get(gender, birth_range, region)
+    remaining = count
+    with open(file_path, "w", encoding="utf-8") as f:
+        while remaining > 0:
+            batch = _generate_id_card_batch(random, min(batch_size, remaining), tables)
+            remaining -= len(batch)
+            f.write("\n".join(batch))
+            f.write("\n")
+    return count
+
+
+# 身份证号码前17位的加权因子与校验码（ISO 7064 MOD 11-2），校验码按“加权和 % 11”取值
+_ID_CARD_WEIGHTS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+_ID_CARD_CHECK_CODES = "10X98765432"
+
+
+def _id_card_weighted_sum(digits: str, offset: int = 0) -> int:
+    """计算从第offset位开始的数字的加权和"""
+    return sum(int(digit) * weight for digit, weight in zip(digits, _ID_CARD_WEIGHTS[offset:]))
+
+
+def _to_date(value, default: datetime.date) -> datetime.date:
+    if not value:
+        return default
+    if isinstance(value, str):
+        return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    return value
+
+
+class _IdCardTables:
+    """身份证号码各段的取值表及其加权和：地区码（6位）、出生日期（8位）、顺序码+性别码（3位），
+    校验码由三段加权和相加取模得到，生成时不再逐位计算
+    """
+
+    def __init__(self, regions, dates, tails):
+        self.region_codes, self.region_sums = regions
+        self.date_codes, self.date_sums = dates
+        self.tail_codes, self.tail_sums = tails
+        self._numpy_sums = None
+
+    def numpy_sums(self, numpy) -> tuple:
+        """三段加权和的numpy数组，首次使用时转换并缓存（日期表有数万项，不能每批都转换）"""
+        if self._numpy_sums is None:
+            self._numpy_sums = tuple(
+                numpy.asarray(sums, dtype=numpy.int64) for sums in (self.region_sums, self.date_sums, self.tail_sums)
+            )
+        return self._numpy_sums
+
+    @classmethod
+    def get(cls, gender: int = 0, birth_range=None, region=None) -> "_IdCardTables":
+        start_date, end_date = birth_range or (None, None)
+        start_date = _to_date(start_date, datetime.date(1949, 1, 1))
+        end_date = _to_date(end_date, datetime.date.today())
+        if start_date > end_date:
+            raise ValueError("出生日期范围的起始日期不能晚于截止日期")
+        if gender == 0:
+            gender_kind = 0
+        else:
+            gender_kind = 1 if gender % 2 == 1 else 2
+        return _id_card_tables(
+            None if region is None else str(region), start_date.toordinal(), end_date.toordinal(), gender_kind
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _id_card_tables(region: str | None, start_ordinal: int, end_ordinal: int, gender_kind: int) -> _IdCardTables:
+    """按条件缓存取值表对象，其上缓存的numpy数组随之复用"""
+    return _IdCardTables(
+        _id_card_region_table(region),
+        _id_card_date_table(start_ordinal, end_ordinal),
+        _id_card_tail_table(gender_kind),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _id_card_region_table(region: str | None) -> tuple[list, list]:
+    """地区内全部的6位地区码及其加权和，region为空时不限地区"""
+    # 数据模块体积大、导入慢，只在首次使用时导入，只用到get_random_string等函数时不承担其导入耗时与内存
+    from .addressinfo import get_region_table
+
+    codes = [str(code) for code in get_region_table().select(region)]
+    if not codes:
+        raise ValueError(f"未找到地区：{region}")
+    return codes, [_id_card_weighted_sum(code) for code in codes]
+
+
+@functools.lru_cache(maxsize=16)
+def _id_card_date_table(start_ordinal: int, end_ordinal: int) -> tuple[list, list]:
+    """日期范围内每一天的"%Y%m%d"字符串及其加权和；加权和按年、月、日三段分别计算后相加，不逐天逐位计算"""
+    start_date = datetime.date.fromordinal(start_ordinal)
+    end_date = datetime.date.fromordinal(end_ordinal)
+    day_codes = [f"{day:02d}" for day in range(1, 32)]
+    day_sums = [_id_card_weighted_sum(code, 12) for code in day_codes]
+    codes, sums = [], []
+    for year in range(start_date.year, end_date.year + 1):
+        year_code = f"{year:04d}"
+        year_sum = _id_card_weighted_sum(year_code, 6)
+        for month in range(1, 13):
+            prefix = f"{year_code}{month:02d}"
+            prefix_sum = year_sum + _id_card_weighted_sum(f"{month:02d}", 10)
+            days = calendar.monthrange(year, month)[1]
+            codes.extend([prefix + code for code in day_codes[:days]])
+            sums.extend([prefix_sum + day_sum for day_sum in day_sums[:days]])
+    # 以上按整年生成，截去起始日期之前与截止日期之后的部分
+    offset = start_ordinal - datetime.date(start_date.year, 1, 1).toordinal()
+    count = end_ordinal - start_ordinal + 1
+    return codes[offset : offset + count], sums[offset : offset + count]
+
+
+@functools.lru_cache(maxsize=3)
+def _id_card_tail_table(gender_kind: int) -> tuple[list, list]:
+    """两位顺序码（11~98）加一位性别码的全部组合及其加权和：gender_kind为0随机，1男性（奇数），2女性（偶数）"""
+    gender_codes = {0: range(1, 10), 1: range(1, 10, 2), 2: range(2, 10, 2)}[gender_kind]
+    codes = [f"{sequence_number}{gender_code}" for sequence_number in range(11, 99) for gender_code in gender_codes]
+    return codes, [_id_card_weighted_sum(code, 14) for code in codes]
+
+
+def _generate_id_card_batch(rng, count: int, tables: _IdCardTables) -> list:
+    """按取值表批量生成身份证号码"""
+    if count <= 0:
+        return []
+    region_codes, region_sums = tables.region_codes, tables.region_sums
+    date_codes, date_sums = tables.date_codes, tables.date_sums
+    tail_codes, tail_sums = tables.tail_codes, tables.tail_sums
+    check_codes = _ID_CARD_CHECK_CODES
+
+    numpy = _get_numpy() if count >= _NUMPY_MIN_BATCH else None
+    if numpy is not None:
+        # numpy随机数生成器的种子取自rng，random.seed或DataGenerator的种子对两种实现都生效
+        numpy_rng = numpy.random.default_rng(rng.getrandbits(64))
+        region_indices = numpy_rng.integers(0, len(region_codes), size=count)
+        date_indices = numpy_rng.integers(0, len(date_codes), size=count)
+        tail_indices = numpy_rng.integers(0, len(tail_codes), size=count)
+        region_array, date_array, tail_array = tables.numpy_sums(numpy)
+        remainders = (region_array[region_indices] + date_array[date_indices] + tail_array[tail_indices]) % 11
+        rows = zip(region_indices.tolist(), date_indices.tolist(), tail_indices.tolist(), remainders.tolist())
+        return [f"{region_codes[r]}{date_codes[d]}{tail_codes[t]}{check_codes[m]}" for r, d, t, m in rows]
+
+    _random = rng.random
+    region_count, date_count, tail_count = len(region_codes), len(date_codes), len(tail_codes)
+    id_cards = []
+    for _ in range(count):
+        r = int(_random() * region_count)
+        d = int(_random() * date_count)
+        t = int(_random() * tail_count)
+        check_code = check_codes[(region_sums[r] + date_sums[d] + tail_sums[t]) % 11]
+        id_cards.append(f"{region_codes[r]}{date_codes[d]}{tail_codes[t]}{check_code}")
+    return id_cards
 
 
 def generate_mobile_number() -> str:
     """生成随机手机号码
     :return: 11位手机号码字符串，基于国内常见号段生成
     """
+    return _mobile_number(random)
+
+
+def _mobile_number(rng) -> str:
     phone_prefixes = [
         130,
         131,
@@ -352,7 +733,7 @@ def generate_mobile_number() -> str:
         188,
         189,
     ]
-    phone_number = str(random.choice(phone_prefixes)) + "".join(random.choices("0123456789", k=8))
+    phone_number = str(rng.choice(phone_prefixes)) + "".join(rng.choices("0123456789", k=8))
     return phone_number
 
 
@@ -360,33 +741,260 @@ def generate_phone_serial_number() -> str:
     """生成手机串号（IMEI格式）
     :return: 形如XXXX-XXXX-XXXXX的串号字符串
     """
-    serial_number = "".join(random.choices(string.ascii_uppercase, k=4))
-    serial_number += "-" + "".join(random.choices(string.ascii_uppercase, k=4))
-    serial_number += "-" + "".join(random.choices(string.digits, k=5))
+    return _phone_serial_number(random)
+
+
+def _phone_serial_number(rng) -> str:
+    serial_number = "".join(rng.choices(string.ascii_uppercase, k=4))
+    serial_number += "-" + "".join(rng.choices(string.ascii_uppercase, k=4))
+    serial_number += "-" + "".join(rng.choices(string.digits, k=5))
     return serial_number
 
 
-def generate_bank_card_number(card_count=1, bank_code=None, bank_name=None, card_type=None, card_length=None, return_single=None):
+def generate_bank_card_number(
+    card_count=1,
+    bank_code=None,
+    bank_name=None,
+    card_type=None,
+    card_length=None,
+    return_single=None,
+    as_columns=False,
+):
     """生成银联卡卡号
     :param bank_code: 银行简称，大写字母，如工行ICBC，建行CCB，农行ABC等——非必填，默认随机
     :param card_type: 卡片类型，储蓄卡DC，信用卡CC——非必填，默认随机
     :param card_length: 卡号长度，信用卡基本上都是16位，储蓄卡通常16至19位，最长19位，但偶尔有16位的——非必填，默认随机
     :param card_count: 一次生成的卡号数量——非必填，默认1
     :param return_single: 为True时返回一个对象，非True时返回列表
+    :param as_columns: 为True时按列返回字典，键为no、bin、bank、type、length、name，值为等长列表，适合大批量生成
     """
+    return _generate_bank_card_number(
+        random, card_count, bank_code, bank_name, card_type, card_length, return_single, as_columns
+    )
+
 
+def _generate_bank_card_number(
+    rng, card_count, bank_code, bank_name, card_type, card_length, return_single, as_columns
+):
     if card_length and (int(card_length) < 16 or int(card_length) > 19):
         raise ValueError("银联卡号通常是16到19数字，请检查输入的card_length参数")
 
-    # 获取参数获取bin码
-    bin_list = get_bank_bin(num=card_count, bank=bank_code, bank_name=bank_name, ftype=card_type, length=card_length)
+    # 获取参数获取bin码，按过滤条件缓存，每次调用的耗时只与生成的数量有关
+    table = _bank_card_table(bank_code, bank_name, card_type, card_length)
+    bin_list = table.bin_list
+    indices = None
+    if card_count <= 0:
+        # 与旧版本一致：card_count小于1时每个符合条件的BIN各生成一个卡号，返回单个对象时取第一个BIN
+        indices = [0] if return_single else list(range(len(bin_list)))
+    numbers, indices = _generate_bank_cards(table, card_count, rng, indices)
 
-    for bin_info in bin_list:
-        __generate_bank_number(bin_obj=bin_info)
+    if as_columns:
+        columns = {"no": numbers}
+        for field in ("bin", "bank", "type", "length", "name"):
+            values = [bin_info[field] for bin_info in bin_list]
+            columns[field] = [values[index] for index in indices]
+        return columns
+    cards = [{**bin_list[index], "no": number} for number, index in zip(numbers, indices)]
     if return_single:
-        return bin_list[0]
+        return cards[0]
     else:
-        return bin_list
+        return cards
+
+
+def iter_bank_card_numbers(
+    card_count: int,
+    bank_code=None,
+    bank_name=None,
+    card_type=None,
+    card_length=None,
+    batch_size: int = 100000,
+):
+    """逐个产出银联卡卡号，内部按批生成，适合生成大量卡号写入文件
+    :param card_count: int, 生成的卡号数量
+    :param batch_size: int, 每批生成的数量
+    其他参数同generate_bank_card_number
+    """
+    return _iter_bank_card_numbers(random, card_count, bank_code, bank_name, card_type, card_length, batch_size)
+
+
+def _iter_bank_card_numbers(rng, card_count: int, bank_code, bank_name, card_type, card_length, batch_size: int):
+    if card_length and (int(card_length) < 16 or int(card_length) > 19):
+        raise ValueError("银联卡号通常是16到19数字，请检查输入的card_length参数")
+
+    table = _bank_card_table(bank_code, bank_name, card_type, card_length)
+    remaining = card_count
+    while remaining > 0:
+        numbers, _ = _generate_bank_cards(table, min(batch_size, remaining), rng)
+        remaining -= len(numbers)
+        yield from numbers
+
+
+# Luhn算法：从右往左数的奇数位（不含校验位）乘2，两位数时减9
+_LUHN_DOUBLE = bytes.maketrans(b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+_LUHN_PLAIN = bytes.maketrans(b"0123456789", bytes(range(10)))
+# 按“加权和 % 10”取校验位
+_LUHN_CHECK_DIGITS = "0987654321"
+
+
+def _luhn_sum(number: str) -> int:
+    """计算不含校验位的卡号的Luhn加权和"""
+    raw = number.encode("ascii")
+    return sum(raw[-1::-2].translate(_LUHN_DOUBLE)) + sum(raw[-2::-2].translate(_LUHN_PLAIN))
+
+
+def luhn_check_digit(number: str) -> str:
+    """计算Luhn校验位
+    :param number: str, 不含校验位的卡号
+    :return: 一位数字字符
+    """
+    return _LUHN_CHECK_DIGITS[_luhn_sum(str(number)) % 10]
+
+
+def validate_bank_card_number(card_number: str | int) -> bool:
+    """按Luhn算法校验银行卡号
+    :param card_number: 完整卡号（含末位校验位）
+    """
+    card_number = str(card_number).strip()
+    if len(card_number) < 2 or len(card_number) > 19 or not card_number.isascii() or not card_number.isdigit():
+        return False
+    return luhn_check_digit(card_number[:-1]) == card_number[-1]
+
+
+def validate_bank_card_numbers(card_numbers) -> tuple[list, list]:
+    """批量按Luhn算法校验银行卡号，安装numpy时按矩阵整批计算
+    :param card_numbers: 卡号列表、元组、numpy数组等可迭代对象，或文本文件路径（每行一个卡号）
+    :return: (是否有效的布尔值列表, 按除末位外的数字计算出的校验位列表)，两者与输入一一对应，格式不正确的卡号校验位为空字符串
+    """
+    values = _read_numbers(card_numbers)
+    if not values:
+        return [], []
+    if _get_numpy() is not None:
+        return _validate_bank_card_numbers_numpy(values)
+
+    mask, check_digits = [], []
+    for value in values:
+        if len(value) < 2 or len(value) > 19 or not value.isascii() or not value.isdigit():
+            mask.append(False)
+            check_digits.append("")
+            continue
+        check_digit = luhn_check_digit(value[:-1])
+        mask.append(value[-1] == check_digit)
+        check_digits.append(check_digit)
+    return mask, check_digits
+
+
+def _validate_bank_card_numbers_numpy(values: list) -> tuple[list, list]:
+    """将卡号左补0右对齐为n*19的数字矩阵（补0不影响Luhn加权和），按列查表求和"""
+    import numpy
+
+    format_ok = numpy.fromiter(
+        (1 < len(value) <= 19 and value.isascii() and value.isdigit() for value in values),
+        dtype=bool,
+        count=len(values),
+    )
+    placeholder = "0" * 19
+    buffer = "".join(
+        value.rjust(19, "0") if ok else placeholder for value, ok in zip(values, format_ok.tolist())
+    ).encode("ascii")
+    matrix = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(len(values), 19) - 48
+
+    # 除校验位外的18列中，从右往左数的奇数列（下标为奇数）乘2
+    double_table = numpy.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=numpy.int64)
+    body = matrix[:, :18]
+    luhn_sum = double_table[body[:, 1::2]].sum(axis=1) + body[:, 0::2].sum(axis=1, dtype=numpy.int64)
+    computed = (10 - luhn_sum % 10) % 10
+
+    mask = format_ok & (matrix[:, 18] == computed)
+    check_digits = numpy.where(format_ok, computed.astype(str), "")
+    return mask.tolist(), check_digits.tolist()
+
+
+def _bank_card_specs(bin_list: list) -> list:
+    """将BIN信息转换为(bin, 中间随机位数, 卡号长度)"""
+    specs = []
+    for bin_info in bin_list:
+        if not bin_info["bin"].isdigit():
+            raise ValueError("银行卡BIN应该为6位数字")
+        # 中间数字长度=长度 - bin长度 - 末位校验码
+        specs.append((bin_info["bin"], int(bin_info["length"]) - len(bin_info["bin"]) - 1, int(bin_info["length"])))
+    return specs
+
+
+class _BankCardTable:
+    """一组BIN的生成参数：每个BIN的(bin, 中间随机位数, 卡号长度)，以及numpy实现用到的数组，按过滤条件缓存"""
+
+    def __init__(self, bin_list: list):
+        self.bin_list = bin_list
+        self.specs = _bank_card_specs(bin_list)
+        self._numpy_arrays = None
+
+    def numpy_arrays(self, numpy) -> tuple:
+        """BIN前缀数值、随机部分位数、前缀的Luhn加权和，首次使用时生成并缓存"""
+        if self._numpy_arrays is None:
+            specs = self.specs
+            self._numpy_arrays = (
+                numpy.array([int(prefix) for prefix, _, _ in specs], dtype=numpy.uint64),
+                numpy.array([middle_length for _, middle_length, _ in specs]),
+                # 前缀数字在卡号主体中的位置由随机部分的位数决定，按补0后的主体计算加权和
+                numpy.array([_luhn_sum(prefix + "0" * middle_length) for prefix, middle_length, _ in specs]),
+            )
+        return self._numpy_arrays
+
+
+@functools.lru_cache(maxsize=256)
+def _bank_card_table(bank_code=None, bank_name=None, card_type=None, card_length=None) -> _BankCardTable:
+    """按过滤条件从BIN索引中查找并缓存生成参数，查找不到时抛出ValueError（异常不缓存）"""
+    return _BankCardTable(_lookup_bank_bins(bank_code, bank_name, card_type, card_length))
+
+
+def _generate_bank_cards(table: _BankCardTable, card_count: int, rng=random, indices=None) -> tuple[list, list]:
+    """批量生成卡号，数量较多且安装numpy时整批向量化生成，否则逐个生成
+    :param indices: 指定每个卡号所用BIN的下标，为空时随机选择card_count个
+    :return: 卡号列表，以及每个卡号所用BIN在table.bin_list中的下标列表
+    """
+    specs = table.specs
+    if indices is None:
+        if card_count <= 0:
+            return [], []
+        if card_count >= _NUMPY_MIN_BATCH and _get_numpy() is not None:
+            return _generate_bank_cards_numpy(table, card_count, rng)
+        indices = rng.choices(range(len(specs)), k=card_count)
+
+    randrange = rng.randrange
+    numbers = []
+    for index in indices:
+        prefix, middle_length, _ = specs[index]
+        bank_number = prefix + str(randrange(10**middle_length)).zfill(middle_length)
+        numbers.append(bank_number + _LUHN_CHECK_DIGITS[_luhn_sum(bank_number) % 10])
+    return numbers, indices
+
+
+def _generate_bank_cards_numpy(table: _BankCardTable, card_count: int, rng=random) -> tuple[list, list]:
+    """用numpy整批生成卡号：卡号按整数计算，BIN前缀的Luhn加权和按BIN预先算好，
+    随机部分逐位取余查表累加，全程不按卡号逐个循环
+    """
+    import numpy
+
+    # numpy随机数生成器的种子取自rng，random.seed或DataGenerator的种子对两种实现都生效
+    numpy_rng = numpy.random.default_rng(rng.getrandbits(64))
+    prefix_values, middle_lengths, prefix_sums = table.numpy_arrays(numpy)
+    double_table = numpy.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=numpy.int64)
+
+    indices = numpy_rng.integers(0, len(table.specs), size=card_count)
+    scales = (10 ** middle_lengths[indices]).astype(numpy.uint64)
+    middles = numpy_rng.integers(0, scales, dtype=numpy.uint64)
+
+    luhn_sum = prefix_sums[indices]
+    remaining = middles.copy()
+    for position in range(int(middle_lengths.max())):
+        digits = (remaining % 10).astype(numpy.int64)
+        remaining //= 10
+        # 从右往左第1、3、5...位（位置为偶数）乘2
+        luhn_sum += double_table[digits] if position % 2 == 0 else digits
+
+    check_digits = ((10 - luhn_sum % 10) % 10).astype(numpy.uint64)
+    numbers = (prefix_values[indices] * scales + middles) * numpy.uint64(10) + check_digits
+    return list(map(str, numbers.tolist())), indices.tolist()
 
 
 def __generate_bank_number(bin_obj: dict) -> dict:
@@ -394,48 +1002,66 @@ def __generate_bank_number(bin_obj: dict) -> dict:
     :param bin_obj: 包含bin码和长度的字典，会在对象中添加生成的卡号no字段
     :return: 添加了卡号no字段的bin_obj对象
     """
-    if not bin_obj["bin"].isdigit():
-        raise ValueError("银行卡BIN应该为6位数字")
-
-    # 中间数字长度=长度 - 6位bin长度 - 末位校验码
-    middle_digits_length = int(bin_obj["length"]) - len(bin_obj["bin"]) - 1
-    middle_digits = ""
-    for i in range(middle_digits_length):
-        middle_digits += str(random.randint(0, 9))
-
-    # 计算末尾校验码
-    bank_number = bin_obj["bin"] + middle_digits
-    luhn_sum = 0
-    digit_index = 0
-    while True:
-        digit_index -= 1
-        try:
-            digit_value = int(bank_number[digit_index])
-        except IndexError as e:
-            break
-        # 判断位置
-        if abs(digit_index) % 2 == 1:
-            # 倒数：奇数位时*2
-            digit_value *= 2
-            if digit_value >= 10:
-                # 十位数时：取个位数字与十位数字相加
-                luhn_sum += digit_value - 9
-            else:
-                # 个位数时：直接采用
-                luhn_sum += digit_value
-        else:
-            # 倒数：偶数位时直接相加
-            luhn_sum += digit_value
-    # 拼接末尾校验码
-    if luhn_sum % 10 == 0:
-        check_digit = 0
-    else:
-        check_digit = 10 - luhn_sum % 10
-    bank_number += str(check_digit)
-    bin_obj["no"] = bank_number
+    numbers, _ = _generate_bank_cards(_BankCardTable([bin_obj]), 1)
+    bin_obj["no"] = numbers[0]
     return bin_obj
 
 
+class _BankBinIndex:
+    """银行卡BIN索引：按(银行, 卡类型, 长度)的各种组合预先分组（未指定的条件记为None），
+    银行名称前缀通过有序名称表二分查找，过滤时不再逐行扫描整张BIN表
+    """
+
+    def __init__(self, rows: list):
+        self.groups = {}
+        self.name_groups = {}
+        for row in rows:
+            for key in itertools.product((row["bank"], None), (row["type"], None), (row["length"], None)):
+                self.groups.setdefault(key, []).append(row)
+                self.name_groups.setdefault((row["name"], *key), []).append(row)
+        self.names = sorted({row["name"] for row in rows})
+
+    def lookup(self, bank=None, bank_name=None, ftype=None, length=None) -> list:
+        """查询符合条件的BIN信息，返回的列表为索引内部对象，调用方不应修改"""
+        key = (bank or None, ftype or None, length or None)
+        if not bank_name:
+            return self.groups.get(key, [])
+
+        bin_list = []
+        for index in range(bisect.bisect_left(self.names, bank_name), len(self.names)):
+            name = self.names[index]
+            if not name.startswith(bank_name):
+                break
+            bin_list.extend(self.name_groups.get((name, *key), ()))
+        return bin_list
+
+
+_bank_bin_index = None
+
+
+def _get_bank_bin_index() -> _BankBinIndex:
+    """首次使用时建立银行卡BIN索引"""
+    global _bank_bin_index
+    if _bank_bin_index is None:
+        # 同_id_card_region_table，数据模块在首次使用时导入
+        from .bankinfo import bank_bin_list
+
+        _bank_bin_index = _BankBinIndex(bank_bin_list)
+    return _bank_bin_index
+
+
+def _lookup_bank_bins(bank=None, bank_name=None, ftype=None, length=None) -> list:
+    """从索引中查找符合条件的BIN信息，返回索引内部的列表，调用方不应修改；查找不到时抛出ValueError"""
+    if length:
+        length = str(length)
+    bin_list = _get_bank_bin_index().lookup(bank=bank, bank_name=bank_name, ftype=ftype, length=length)
+    if not bin_list:
+        if ftype == "CC" and length and int(length) > 16:
+            raise ValueError("找不到对应的bin码，信用卡通常是16位，请检查输入的length参数")
+        raise ValueError("找不到对应的bin码，请检查输入是否正确！")
+    return bin_list
+
+
 def get_bank_bin(
     num: int = 1,
     bank: str | None = None,
@@ -446,26 +1072,9 @@ def get_bank_bin(
     """获取银行卡bin码
     :return: 符合条件的BIN信息列表，当num大于0时返回指定数量的随机选择
     """
-    if length:
-        length = str(length)
-    bin_list = []
-    # 根据条件过滤
-    for bin_info in bank_bin_list:
-        if bank and bin_info["bank"] != bank:
-            continue
-        if bank_name and not bin_info["name"].startswith(bank_name):
-            continue
-        if ftype and bin_info["type"] != ftype:
-            continue
-        if length and bin_info["length"] != length:
-            continue
-        bin_list.append(bin_info)
-    if not bin_list:
-        if ftype == "CC" and length and int(length) > 16:
-            raise ValueError("找不到对应的bin码，信用卡通常是16位，请检查输入的length参数")
-        raise ValueError("找不到对应的bin码，请检查输入是否正确！")
+    bin_list = _lookup_bank_bins(bank, bank_name, ftype, length)
     if num <= 0:
-        return bin_list
+        return list(bin_list)
     else:
         return random.choices(bin_list, k=num)
 
@@ -475,5 +1084,326 @@ def get_special_character(character_count: int) -> str:
     :param character_count: 需要生成的特殊字符数量
     :return: 由特殊字符组成的字符串
     """
+    return _special_character(random, character_count)
+
+
+def _special_character(rng, character_count: int) -> str:
     special_chars = r'''①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳⑴⑵⑶⑷⑸⑹⑺⑻⑼⑽⑾⑿⒀⒁⒂⒃⒄⒅⒆⒇⒈⒉⒊⒋⒌⒍⒎⒏⒐⒑⒒⒓⒔⒕⒖⒗⒘⒙⒚⒛㊀㊁㊂㊃㊄㊅㊆㊇㊈㊉㈠㈡㈢㈣㈤㈥㈦㈧㈨㈩№½⅓⅔¼¾⅛⅜⅝⅞+-×÷﹢﹣±/=∥∠≌∽≦≧≒﹤﹥≈≡≠=≤≥<>≮≯∷∶∫∮∝∞∧∨∑∏∪∩∈∵∴⊥∥∠⌒⊙√∟⊿㏒㏑%‰ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹⅺⅻΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩαβγδεζνξοπρσηθικλμτυφχψω㋀㋁㋂㋃㋄㋅㋆㋇㋈㋉㋊㋋㏠㏡㏢㏣㏤㏥㏦㏧㏨㏩㏪㏫㏬㏭㏮㏯㏰㏱㏲㏳㏴㏵㏶㏷㏸㏹㏺㏻㏼㏽㏾㍘㍙㍚㍛㍜㍝㍞㍟㍠㍡㍢㍣㍤㍥㍦㍧㍨㍩㍪㍫㍬㍭㍯㍰㊐㊊㊎㊍㊌㊋㊏㊑㊒㊓㊔㊕㊖㊗㊘㊜㊝㊞㊟㊠㊡㊢㊩㊪㊫㊬㊭㊮㊯㊰㊙㊚㊛㊣㊤㊥㊦㊧㊨囍㈱㍿卐卍ォミ灬彡ツ♩♪♫♬¶♭♯♮∮‖§Ψ⒜⒝⒞⒟⒠⒡⒢⒣⒤⒥⒦⒧⒨⒩⒪⒫⒬⒭⒮⒯⒰⒱⒲⒳⒴⒵ⓐⓑⓒⓓⓔⓕⓖⓗⓘⓙⓚⓛⓜⓝⓞⓟⓠⓡⓢⓣⓤⓥⓦⓧⓨⓩⒶⒷⒸⒹⒺⒻⒼⒽⒾⒿⓀⓁⓂⓃⓄⓅⓆⓇⓈⓉⓊⓋⓌⓍⓎⓏ零壹贰叁伍陆柒捌玖佰仟万亿☀☼♨☁☂☽☾❄❅❆☃©®℃℉♂♀㎡℗Ω㏎￼㎎㎏㎜㎝㎞㎡㏄㏎㏑㏒㏕℡%‰°′″￠℅￥$€￡₴$₰¢₤₳₲₪₵₣₱฿¤₡₮₭₩ރ₢₥₫₦zł﷼₠₧₯₨Kčर₹ƒ₸￠┏┳┓┌┬┐╔╦╗╓╥╖╒╤╕╭╮╱╲─│┱┲╃╄┣╋┫├┼┤╠╬╣╟╫╢╞╪╡╰╯╲╱━┇┅┋┗┻┛└┴┘╚╩╝╙╨╜╘╧╛═║︴﹏﹋﹌✱✲✳❃✾✽✼✻✺✹✸✷✶✵✴❄❅❆❇❈❉❊❋✱❤♡♥❥♠♣♤ღ❣★☆✡✦✧✩✪✫✬✭✮✯✰☑✓✔√☓☒✘ㄨ✕✖✗❏❐❑❒▏▐░▒▓▔▕■□▢▣▤▥▦▧▨▩▪▫▬▭▮▯ˍ∎⊞⊟⊠⊡⋄▱◆◇◈◧◨◩◪◫◙◘▀▁▂▃▄▅▆▇▉▊▋█▌▍▎▰⊙●○◕¤☪❂✪☻☼Θ⊖⊘⊕⊚⊛⊜⊝◉◌◍◐◑◒◓◔⊗◖◗◯◤◥◄►▶◀◣◢▲▼▸◂▴▾△▽▷◁⊿▻◅▵▿▹◃∆◬◭◮∇☢乾☰兑☱离☲震☳巽☴坎☵艮☶坤☷☯。，、：∶；''""〝〞ˆˇ﹕︰﹔﹖﹑·¨.¸;´？！～—｜‖＂〃｀@﹫¡¿﹏﹋︴々﹟#﹩$﹠&﹪%﹡﹢×﹦‐￣¯―﹨˜﹍﹎＿-~（）〈〉‹›﹛﹜『』〖〗［］《》〔〕}」【】︵︷︿︹︽_︶︸﹀︺︾ˉ﹂﹄︼﹁﹃︻▲●□…→āáǎàōóǒòēéěèīíǐìūúǔùǖǘǚǜüêɑńňǹɡㄅㄆㄇㄈㄉㄊㄋㄌㄍㄎㄏㄐㄑㄒㄓㄔㄕㄖㄗㄘㄙㄚㄛㄜㄝㄞㄟㄠㄡㄢㄣㄤㄥㄦㄧㄨㄩぁあぃいぅうぇえぉおかがきぎくぐけげこごさざしじすずせぜそぞただちぢつづてでとどなにぬねのはばぱひびぴふぶぷへべぺほぼぽまみむめもゃやゅゆょよらりるれろゎわゐゑをんゔゕゖ゚゛゜ゝゞゟ゠ァアィイゥウェエォオカガキギクグケゲコゴサザシジスズセゼソゾタダチヂッツヅテデトドナニヌネノハパヒビピフブプヘベペホボポマミムメモャヤュユョヨラリルレロヮワヰヱヲンヴヵヶヷヸヹヺ・ーヽヾヿ㍿ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅥㅦㅧㅨㅩㅪㅫㅬㅭㅮㅯㅰㅱㅲㅳㅴㅵㅶㅷㅸㅹㅺㅻㅼㅽㅾㅿㆀㆁㆂㆃㆄㆅㆆㆇㆈㆉㆊАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЭЮЯабвгдеёжзийклмнопрстуфхцчшщъыьэюя←↑→↓↙↘↖↗↰↱↲↳↴↵↶↺↻↷➝⇄⇅⇆⇇⇈⇉⇊⇋⇌⇍⇎⇏⇐⇑⇒⇓⇔⇕⇖⇗⇘⇙⇚⇛↯↹↔↕⇦⇧⇨⇩➫➬➩➪➭➮➯➱⏎➜➡➥➦➧➨➷➸➻➼➽➸➹➳➤➟➲➢➣➞⇪➚➘➙➛➺⇞⇟⇠⇡⇢⇣⇤⇥↜↝♐➴➵➶↼↽↾↿⇀⇁⇂⇃↞↟↠↡↢↣↤↪↫↬↭↮↯↩⇜⇝↸↚↛↥↦↧↨✐✎✏✑✒✍✉✁✂✃✄✆✉☎☏☢☠☣✈☜☞☝✍☚☟✌♤♧♡♢♠♣♥♦☀☁☂❄☃♨웃유❖☽☾☪✿♂♀✪✯☭➳卍卐√×■◆●○◐◑✙☺☻❀⚘♔♕♖♗♘♙♚♛♜♝♞♟♧♡♂♀♠♣♥❤⊙◎☺☻☼▧▨♨◐◑↔↕▪▒◊◦▣▤▥▦▩◘◈◇♬♪♩♭♪の★☆→あぃ￡Ю〓§♤♥▶¤✲❈✿✲❈➹☀☂☁【】┱┲❣✚✪✣✤✥✦❉❥❦❧❃❂❁❀✄☪☣☢☠☪♈ºº₪¤큐«»™♂✿♥☺☻｡◕‿◕｡｡◕‿◕｡◕‿-｡◉◞◟◉⊙‿⊙⊙▂⊙⊙０⊙⊙︿⊙⊙ω⊙⊙﹏⊙⊙△⊙⊙▽⊙∩▂∩∩０∩∩︿∩∩ω∩∩﹏∩∩△∩∩▽∩●▂●●０●●︿●●ω●●﹏●●△●●▽●∪▂∪∪０∪∪︿∪∪ω∪∪﹏∪∪△∪∪▽∪≧▂≦≧０≦≧︿≦≧ω≦≧﹏≦≧△≦≧▽≦＞▂＜＞０＜＞︿＜＞ω＜＞﹏＜＞△＜＞▽＜╯▂╰╯０╰╯︿╰╯ω╰╯﹏╰╯△╰╯▽╰＋▂＋＋０＋＋︿＋＋ω＋﹏＋＋△＋＋▽＋ˋ▂ˊˋ０ˊˋ︿ˊˋωˊˋ﹏ˊˋ△ˊˋ▽ˊˇ▂ˇˇ０ˇˇ︿ˇˇωˇˇ﹏ˇˇ△ˇˇ▽ˇ˙▂˙˙０˙˙︿˙˙ω˙˙﹏˙˙△˙˙▽˙≡(▔﹏▔)≡⊙﹏⊙∥∣°ˋ︿ˊ﹀-#╯︿╰﹀(=‵′=)<(‵^′)>(ˉ▽ˉ；)(-__-)b＼＿／￣□￣｜｜------\(˙<>˙)/------<("""O""">(‵▽′)ψ（°ο°）~@?(^人)?(＊?↓˙＊)(O^~^O)[>\/<]↓。υ。↓(；°○°)(>c<)艹丶灬丨彡丿丬巛o氵刂卩s宀卩刂阝肀忄冫丿氵彡丬丨丩丬丶丷丿乀乁乂乄乆乛亅亠亻冂冫冖凵刂辶釒钅阝飠牜饣卩卪厸厶厽孓宀巛巜彳廴彡彐彳忄扌攵氵灬爫犭疒癶礻糹纟罒罓耂艹訁覀兦亼亽亖亗吂凸凹卝卍卐匸皕旡玊尐幵'''
-    return "".join(random.choices(special_chars, k=character_count))
+    return "".join(rng.choices(special_chars, k=character_count))
+
+
+class DataGenerator:
+    """使用独立随机数生成器的测试数据生成器，相同的种子生成相同的数据，不受全局random状态影响
+
+    用法：
+        generator = DataGenerator(seed=1)
+        generator.get_name()
+        generator.generate_id_cards(100)
+
+    注意：安装与未安装numpy时批量生成的结果不同，需要跨环境复现时应保持numpy的安装状态一致
+    """
+
+    def __init__(self, seed=None):
+        """
+        :param seed: 随机种子，int、str或bytes，为空时使用系统随机源
+        """
+        self.seed = seed
+        self.random = random.Random(seed)
+        # 未指定种子时从系统随机源取一次基础种子，不同的无种子生成器派生出的子生成器互不相同
+        self._spawn_seed = secrets.randbits(64) if seed is None else seed
+
+    def spawn(self, index: int) -> "DataGenerator":
+        """派生第index个子生成器，子生成器的种子由当前种子与index确定，互不重叠"""
+        return DataGenerator(_derive_seed(self._spawn_seed, index))
+
+    def get_random_date(self, start_date="", end_date="", date_format: str = "%Y-%m-%d") -> str:
+        """同get_random_date"""
+        return _random_date(self.random, start_date, end_date, date_format)
+
+    def get_random_string(self, length: int = 32, source: str = "dlu") -> str:
+        """同get_random_string"""
+        return _random_string(self.random, length, source)
+
+    def get_uuid(self, length: int = 32) -> str:
+        """同get_uuid，但使用由随机数生成器产生的UUID4，保证可复现"""
+        return _build_uuid(length, lambda: uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def get_name(self, gender: int = 0) -> str:
+        """同get_name"""
+        return _get_names(self.random, 1, gender, False, None, 1 / 3)[0]
+
+    def get_names(
+        self,
+        count: int,
+        gender: int = 0,
+        dedupe: bool = False,
+        surname_weights: dict | None = None,
+        single_char_ratio=1 / 3,
+    ) -> list:
+        """同get_names"""
+        return _get_names(self.random, count, gender, dedupe, surname_weights, single_char_ratio)
+
+    def get_pinyin(self, name: str = "", separator="") -> tuple[str, str]:
+        """同get_pinyin，未指定name时由当前生成器生成姓名"""
+        if not name:
+            name = self.get_name()
+        return _get_pinyin_converter().convert(name, separator), name
+
+    def generate_id_card(self, gender: int = 0) -> str:
+        """同generate_id_card"""
+        return self.generate_id_cards(1, gender=gender)[0]
+
+    def generate_id_cards(self, count: int, gender: int = 0, birth_range=None, region=None) -> list:
+        """同generate_id_cards"""
+        return _generate_id_card_batch(self.random, count, _IdCardTables.get(gender, birth_range, region))
+
+    def iter_id_cards(self, count: int, gender: int = 0, birth_range=None, batch_size: int = 100000, region=None):
+        """同iter_id_cards"""
+        return _iter_id_cards(self.random, count, gender, birth_range, batch_size, region)
+
+    def generate_mobile_number(self) -> str:
+        """同generate_mobile_number"""
+        return _mobile_number(self.random)
+
+    def generate_phone_serial_number(self) -> str:
+        """同generate_phone_serial_number"""
+        return _phone_serial_number(self.random)
+
+    def generate_bank_card_number(
+        self,
+        card_count=1,
+        bank_code=None,
+        bank_name=None,
+        card_type=None,
+        card_length=None,
+        return_single=None,
+        as_columns=False,
+    ):
+        """同generate_bank_card_number"""
+        return _generate_bank_card_number(
+            self.random, card_count, bank_code, bank_name, card_type, card_length, return_single, as_columns
+        )
+
+    def iter_bank_card_numbers(
+        self, card_count: int, bank_code=None, bank_name=None, card_type=None, card_length=None, batch_size=100000
+    ):
+        """同iter_bank_card_numbers"""
+        return _iter_bank_card_numbers(
+            self.random, card_count, bank_code, bank_name, card_type, card_length, batch_size
+        )
+
+    def get_special_character(self, character_count: int) -> str:
+        """同get_special_character"""
+        return _special_character(self.random, character_count)
+
+
+def _derive_seed(seed, index: int) -> int:
+    """由父种子与序号派生子种子"""
+    digest = hashlib.sha256(f"{seed!r}:{index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:16], "big")
+
+
+def generate_records(count: int, record_factory, seed=0, workers: int = 1, chunk_size: int = 10000):
+    """按种子可复现地批量生成记录，可用多进程并行
+
+    记录按chunk_size分块，第i块使用DataGenerator(seed).spawn(i)生成，
+    因此结果只由seed与chunk_size决定，与进程数无关，单进程与多进程的输出完全一致
+
+    :param count: int, 记录数量
+    :param record_factory: callable, 接收DataGenerator对象并返回一条记录；多进程时必须是可被pickle的模块级函数
+    :param seed: 随机种子
+    :param workers: int, 进程数，1为在当前进程中生成
+    :param chunk_size: int, 每块的记录数
+    :return: 按顺序产出记录的迭代器
+    """
+    chunks = [(index, min(chunk_size, count - start)) for index, start in enumerate(range(0, count, chunk_size))]
+    if workers <= 1:
+        for index, size in chunks:
+            yield from _generate_record_chunk(record_factory, seed, index, size)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # 最多同时保留workers*2个未取走的块，避免生成速度大于消费速度时占满内存
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for index, size in chunks:
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_generate_record_chunk, record_factory, seed, index, size))
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _generate_record_chunk(record_factory, seed, index: int, size: int) -> list:
+    generator = DataGenerator(seed).spawn(index)
+    return [record_factory(generator) for _ in range(size)]
+
+
+# 数据集列类型 -> 批量生成函数，参数为(DataGenerator对象, 数量, 列选项)，返回等长列表
+_DATASET_COLUMN_TYPES = {
+    "name": lambda generator, count, options: generator.get_names(count, **options),
+    "id_card": lambda generator, count, options: generator.generate_id_cards(count, **options),
+    "mobile": lambda generator, count, options: [generator.generate_mobile_number() for _ in range(count)],
+    "phone_serial": lambda generator, count, options: [
+        generator.generate_phone_serial_number() for _ in range(count)
+    ],
+    "bank_card": lambda generator, count, options: generator.generate_bank_card_number(
+        count, as_columns=True, **options
+    )["no"],
+    "date": lambda generator, count, options: [generator.get_random_date(**options) for _ in range(count)],
+    "string": lambda generator, count, options: [generator.get_random_string(**options) for _ in range(count)],
+    "uuid": lambda generator, count, options: [generator.get_uuid(**options) for _ in range(count)],
+    "int": lambda generator, count, options: [
+        generator.random.randint(options.get("start", 0), options.get("end", 100)) for _ in range(count)
+    ],
+    "choice": lambda generator, count, options: generator.random.choices(
+        options["values"], weights=options.get("weights"), k=count
+    ),
+}
+
+
+def _parse_dataset_schema(schema: dict) -> list:
+    """将数据集结构解析为[(列名, 类型名, 生成函数, 列选项)]"""
+    columns = []
+    for column, spec in schema.items():
+        options = {}
+        if isinstance(spec, (tuple, list)):
+            spec, options = spec
+        if callable(spec):
+            columns.append((column, getattr(spec, "__name__", "callable"), _row_column(spec), options))
+        elif spec in _DATASET_COLUMN_TYPES:
+            columns.append((column, spec, _DATASET_COLUMN_TYPES[spec], options))
+        else:
+            raise ValueError(f"不支持的列类型：{column}={spec}，可选值：{', '.join(_DATASET_COLUMN_TYPES)}")
+    return columns
+
+
+def _row_column(factory):
+    """将逐行生成函数factory(generator)包装为批量生成函数"""
+    return lambda generator, count, options: [factory(generator) for _ in range(count)]
+
+
+def iter_dataset_chunks(schema: dict, count: int, seed=0, chunk_size: int = 100000, stats: dict | None = None):
+    """按结构分块生成数据集，每次产出一块按列存放的数据{列名: 等长列表}，内存占用只与chunk_size有关
+
+    第i块使用DataGenerator(seed).spawn(i)生成，相同的seed与chunk_size生成相同的数据
+
+    :param schema: dict, 数据集结构，{列名: 列定义}，列定义可以是：
+        类型名，如"name"，可选值见_DATASET_COLUMN_TYPES；
+        (类型名, 列选项)，如("id_card", {"gender": 1})、("int", {"start": 18, "end": 60})、("choice", {"values": [...]})，
+        列选项作为参数传给对应的生成方法；
+        函数，接收DataGenerator对象并返回一个值
+    :param count: int, 总行数
+    :param seed: 随机种子
+    :param chunk_size: int, 每块的行数
+    :param stats: dict, 不为空时按列累计生成耗时（秒）
+    """
+    columns = _parse_dataset_schema(schema)
+    for index, start in enumerate(range(0, count, chunk_size)):
+        size = min(chunk_size, count - start)
+        generator = DataGenerator(seed).spawn(index)
+        chunk = {}
+        for column, _, make_values, options in columns:
+            begin = time.perf_counter()
+            chunk[column] = make_values(generator, size, options)
+            if stats is not None:
+                stats[column] = stats.get(column, 0) + time.perf_counter() - begin
+        yield chunk
+
+
+def write_dataset(
+    file_path,
+    schema: dict,
+    count: int,
+    file_format: str | None = None,
+    seed=0,
+    chunk_size: int = 100000,
+    encoding: str = "utf-8",
+) -> dict:
+    """按结构生成数据集并逐块写入文件，适合生成超大数据集
+
+    :param file_path: 文件路径
+    :param schema: dict, 数据集结构，同iter_dataset_chunks
+    :param count: int, 总行数
+    :param file_format: 文件格式，csv、jsonl或parquet，为空时按文件后缀判断；parquet需要安装pyarrow，每块写为一个row group
+    :param seed: 随机种子
+    :param chunk_size: int, 每块的行数
+    :param encoding: 文本文件编码
+    :return: 统计信息，包括总行数、总耗时、写入耗时，以及每列的类型、生成耗时与每秒生成行数
+    """
+    file_format = (file_format or os.path.splitext(str(file_path))[1].lstrip(".")).lower()
+    if file_format not in ("csv", "jsonl", "parquet"):
+        raise ValueError(f"不支持的文件格式：{file_format}，可选值：csv、jsonl、parquet")
+    if file_format == "parquet" and _get_pyarrow() is None:
+        raise ImportError("写入parquet文件需要安装pyarrow")
+
+    columns = _parse_dataset_schema(schema)
+    names = [column[0] for column in columns]
+    column_elapsed = {}
+    write_elapsed = 0
+    start = time.perf_counter()
+    with _dataset_writer(file_path, file_format, names, encoding) as write_chunk:
+        for chunk in iter_dataset_chunks(schema, count, seed, chunk_size, column_elapsed):
+            begin = time.perf_counter()
+            write_chunk(chunk)
+            write_elapsed += time.perf_counter() - begin
+
+    return {
+        "rows": count,
+        "elapsed": time.perf_counter() - start,
+        "write_elapsed": write_elapsed,
+        "columns": {
+            column: {
+                "type": column_type,
+                "elapsed": column_elapsed.get(column, 0),
+                "rows_per_sec": count / column_elapsed[column] if column_elapsed.get(column) else 0,
+            }
+            for column, column_type, _, _ in columns
+        },
+    }
+
+
+def _get_pyarrow():
+    """导入pyarrow，未安装时返回None；pyarrow导入较慢，只在写入parquet文件时导入"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+@contextlib.contextmanager
+def _dataset_writer(file_path, file_format: str, names: list, encoding: str):
+    """打开数据集文件，返回写入一块数据的函数"""
+    if file_format == "parquet":
+        pyarrow = _get_pyarrow()
+        writer = None
+
+        def write_parquet(chunk):
+            nonlocal writer
+            table = pyarrow.table(chunk)
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(str(file_path), table.schema)
+            writer.write_table(table)
+
+        try:
+            yield write_parquet
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    with open(file_path, "w", encoding=encoding, newline="") as f:
+        if file_format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(names)
+            yield lambda chunk: writer.writerows(zip(*(chunk[name] for name in names)))
+        else:
+
+            def write_jsonl(chunk):
+                rows = (dict(zip(names, values)) for values in zip(*(chunk[name] for name in names)))
+                f.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+            yield write_jsonl
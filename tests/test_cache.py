@@ -4,14 +4,20 @@ import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+import dbox.cache as cache_module
 from dbox.cache import (
     get_cache_obj,
     get_redis_pool,
     get_redis_handler,
     batch_delete_key,
+    scan_delete,
     MyRedis,
     MyCache,
     MyDict,
+    LocalCache,
+    CacheSerializer,
+    CacheLockTimeout,
+    register_serializer,
     hget,
 )
 
@@ -85,11 +91,27 @@ class TestCache:
     def test_batch_delete_key(self, mock_handler):
         """测试批量删除键"""
         mock_redis = MagicMock()
-        mock_redis.keys.return_value = ["key1", "key2"]
+        mock_redis.scan_iter.return_value = iter(["key1", "key2"])
+        mock_redis.unlink.return_value = 2
         mock_handler.return_value = mock_redis
 
-        batch_delete_key(0, "test*")
-        mock_redis.delete.assert_called_once_with("key1", "key2")
+        assert batch_delete_key(0, "test*") == 2
+        mock_redis.scan_iter.assert_called_once_with(match="test*", count=1000)
+        mock_redis.unlink.assert_called_once_with("key1", "key2")
+        mock_redis.keys.assert_not_called()
+
+    def test_scan_delete_chunked(self):
+        """测试分批删除，且UNLINK不可用时改用DELETE"""
+        from redis.exceptions import ResponseError
+
+        mock_redis = MagicMock()
+        mock_redis.scan_iter.return_value = iter([f"key{i}" for i in range(5)])
+        mock_redis.unlink.side_effect = ResponseError("unknown command 'UNLINK'")
+        mock_redis.delete.side_effect = lambda *keys: len(keys)
+
+        assert scan_delete(mock_redis, "key*", count=10, chunk_size=2) == 5
+        mock_redis.unlink.assert_called_once()
+        assert mock_redis.delete.call_count == 3
 
 
 class TestMyRedis:
@@ -100,11 +122,44 @@ class TestMyRedis:
     def test_batch_delete(self, mock_super_init, mock_pool):
         """测试批量删除"""
         redis = MyRedis(0)
-        redis.keys = MagicMock(return_value=["key1", "key2"])
-        redis.delete = MagicMock()
+        redis.scan_iter = MagicMock(return_value=iter([b"key1", b"key2"]))
+        redis.unlink = MagicMock(return_value=2)
 
-        redis.batch_delete("test*")
-        redis.delete.assert_called_once_with("key1", "key2")
+        assert redis.batch_delete("test*") == 2
+        redis.unlink.assert_called_once_with(b"key1", b"key2")
+
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_mget(self, mock_super_init, mock_pool):
+        """测试批量获取时解码bytes"""
+        redis = MyRedis(0)
+        with patch("dbox.cache.Redis.mget", return_value=[b"value1", None]) as mock_mget:
+            assert redis.mget(["key1", "key2"]) == ["value1", None]
+            mock_mget.assert_called_once_with(["key1", "key2"])
+
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_mget_with_serializer(self, mock_super_init, mock_pool):
+        """测试批量获取时带数据头的值与get一样由序列化器解码"""
+        serializer = CacheSerializer("pickle", compress="zlib", compress_threshold=10)
+        redis = MyRedis(0, serializer=serializer)
+        value = {"data": "x" * 100}
+        with patch("dbox.cache.Redis.mget", return_value=[serializer.dumps(value), b"value2", None]):
+            assert redis.mget(["key1", "key2", "key3"]) == [value, "value2", None]
+
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_setex_many(self, mock_super_init, mock_pool):
+        """测试批量设置过期值时使用管道"""
+        redis = MyRedis(0)
+        mock_pipe = MagicMock()
+        redis.pipeline = MagicMock(return_value=mock_pipe)
+        mock_pipe.__enter__.return_value = mock_pipe
+
+        redis.setex_many({"key1": "value1", "key2": "value2"}, 60)
+        redis.pipeline.assert_called_once_with(transaction=False)
+        assert mock_pipe.setex.call_count == 2
+        mock_pipe.execute.assert_called_once()
 
     @patch("dbox.cache.get_redis_pool")
     @patch("dbox.cache.Redis.__init__", return_value=None)
@@ -175,6 +230,51 @@ class TestMyRedis:
         result = redis.pop_obj("queue")
         assert result == "invalid json"
 
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_set_obj_with_serializer(self, mock_super_init, mock_pool):
+        """测试指定序列化器时set_obj写入带数据头的值，get自动解码"""
+        test_data = {"name": "test", "value": 123}
+        redis = MyRedis(0, serializer=CacheSerializer("pickle"))
+        redis.set = MagicMock()
+
+        redis.set_obj("prefix", test_data)
+        stored = redis.set.call_args[0][1]
+        assert isinstance(stored, bytes)
+
+        with patch("dbox.cache.Redis.get", return_value=stored):
+            assert redis.get("key") == test_data
+            assert redis.get_to_json("key").name == "test"
+
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_lock(self, mock_super_init, mock_pool):
+        """测试锁通过SET NX PX获取，通过Lua脚本校验token后释放"""
+        redis = MyRedis(0)
+        redis.set = MagicMock(return_value=True)
+        redis.eval = MagicMock(return_value=1)
+
+        with redis.cache_lock("job", ttl=5) as lock:
+            token = lock.token
+            redis.set.assert_called_once_with("job", token, nx=True, px=5000)
+        assert redis.eval.call_args[0][1:] == (1, "job", token)
+
+        redis.set = MagicMock(return_value=None)
+        with pytest.raises(CacheLockTimeout):
+            with redis.cache_lock("job", blocking=False):
+                pass
+
+    @patch("dbox.cache.get_redis_pool")
+    @patch("dbox.cache.Redis.__init__", return_value=None)
+    def test_redis_lock_unchanged(self, mock_super_init, mock_pool):
+        """测试MyRedis的lock仍为redis-py原有的方法，接受timeout、lock_class等参数"""
+        redis = MyRedis(0)
+        lock_class = MagicMock()
+
+        redis.lock("job", timeout=10, blocking_timeout=1, lock_class=lock_class)
+        lock_class.assert_called_once()
+        assert lock_class.call_args.kwargs["timeout"] == 10
+
 
 class TestMyCache:
     """测试MyCache类"""
@@ -186,6 +286,74 @@ class TestMyCache:
 
         assert cache_file.exists()
 
+    def test_connection_reused(self, temp_dir):
+        """测试同一线程复用连接并已设置PRAGMA"""
+        cache = MyCache(temp_dir / "cache.db")
+        conn = cache._get_connection()
+        cache.set("test_key", "test_value")
+        cache.get("test_key")
+
+        assert cache._get_connection() is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+        cache.close()
+
+    def test_connection_per_thread(self, temp_dir):
+        """测试不同线程使用不同连接"""
+        import threading
+
+        cache = MyCache(temp_dir / "cache.db")
+        main_conn = cache._get_connection()
+        thread_conns = []
+
+        def worker():
+            cache.set("thread_key", "thread_value")
+            thread_conns.append(cache._get_connection())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert thread_conns[0] is not main_conn
+        assert cache.get("thread_key") == "thread_value"
+        cache.close()
+
+    def test_connection_pool_bounded(self, temp_dir):
+        """测试短生命周期线程结束后连接被关闭，连接池不随线程数增长"""
+        import sqlite3
+        import threading
+
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("thread_key", "thread_value")
+        thread_conns = []
+
+        def worker():
+            cache.get("thread_key")
+            thread_conns.append(cache._get_connection())
+
+        for _ in range(50):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        # 主线程与最后一个结束的线程
+        assert len(cache._connections) <= 2
+        with pytest.raises(sqlite3.ProgrammingError):
+            thread_conns[0].execute("SELECT 1")
+        assert cache.get("thread_key") == "thread_value"
+        cache.close()
+        assert cache._connections == {}
+
+    def test_connection_reset_after_fork(self, temp_dir):
+        """测试进程号变化（fork）后重建连接"""
+        cache = MyCache(temp_dir / "cache.db")
+        conn = cache._get_connection()
+
+        cache._pid = -1
+        assert cache._get_connection() is not conn
+        cache.close()
+        conn.close()
+
     def test_exists(self, temp_dir):
         """测试检查键是否存在"""
         cache = MyCache(temp_dir / "cache.db")
@@ -237,9 +405,8 @@ class TestMyCache:
         mapping = {"field1": "value1", "field2": "value2"}
         cache.hmset("hash_key", mapping)
 
-        result = cache.get("hash_key")
-        # 可能是dict也可能是JSON字符串，取决于实现
-        assert result is not None
+        result = cache.hgetall("hash_key")
+        assert result == mapping
 
     def test_hgetall(self, temp_dir):
         """测试获取哈希所有字段"""
@@ -260,6 +427,58 @@ class TestMyCache:
         # 可能是空dict也可能有值，取决于实现细节
         assert isinstance(result, dict)
 
+    def test_hash_field_operations(self, temp_dir):
+        """测试哈希字段级操作"""
+        cache = MyCache(temp_dir / "cache.db")
+        assert cache.hset("hash_key", mapping={"field1": "value1", "field2": 2}) == 2
+        assert cache.hset("hash_key", "field1", "new_value") == 0
+
+        assert cache.hget("hash_key", "field1") == "new_value"
+        assert cache.hget("hash_key", "missing") is None
+        assert cache.hmget("hash_key", ["field1", "missing", "field2"]) == ["new_value", None, 2]
+        assert cache.hlen("hash_key") == 2
+        assert cache.hexists("hash_key", "field2") is True
+        assert cache.hexists("hash_key", "missing") is False
+
+        assert cache.hdel("hash_key", "field2", "missing") == 1
+        assert cache.hgetall("hash_key") == {"field1": "new_value"}
+        assert "hash_key" in cache.keys("hash*")
+
+    def test_hincrby(self, temp_dir):
+        """测试哈希字段自增"""
+        cache = MyCache(temp_dir / "cache.db")
+        assert cache.hincrby("hash_key", "counter") == 1
+        assert cache.hincrby("hash_key", "counter", 5) == 6
+        cache.hset("hash_key", "text_counter", "10")
+        assert cache.hincrby("hash_key", "text_counter", -3) == 7
+
+    def test_hash_legacy_json(self, temp_dir):
+        """测试兼容旧版本以JSON对象存储的哈希"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("hash_key", {"field1": "value1", "field2": "value2"})
+
+        assert cache.hget("hash_key", "field1") == "value1"
+        assert cache.hlen("hash_key") == 2
+        cache.hset("hash_key", "field3", "value3")
+        assert cache.hgetall("hash_key") == {"field1": "value1", "field2": "value2", "field3": "value3"}
+        assert cache.get("hash_key") is None
+
+    def test_hash_replace_type(self, temp_dir):
+        """测试设置哈希字段时替换同名的普通值与队列，设置值时替换同名哈希，keys不返回重复的键"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("k", "text")
+        cache.rpush("q", 1)
+        cache.hset("k", "field", 1)
+        cache.hincrby("q", "counter")
+        assert sorted(cache.keys()) == ["k", "q"]
+        assert cache.get("k") is None
+        assert cache.llen("q") == 0
+        assert cache.hgetall("q") == {"counter": 1}
+
+        cache.set("k", "text")
+        assert cache.keys("k") == ["k"]
+        assert cache.hlen("k") == 0
+
     def test_batch_delete(self, temp_dir):
         """测试批量删除"""
         cache = MyCache(temp_dir / "cache.db")
@@ -267,8 +486,518 @@ class TestMyCache:
         cache.set("test_key_2", "value2")
         cache.set("other_key", "value3")
 
-        cache.batch_delete("test_key*")
-        # 不做严格断言，因为keys匹配可能有不同实现
+        cache.rpush("test_key_queue", "a")
+        cache.hset("test_key_hash", "field", "value")
+
+        assert cache.batch_delete("test_key*") == 4
+        assert cache.keys() == ["other_key"]
+
+    def test_keys_glob_pattern(self, temp_dir):
+        """测试键匹配使用glob通配符"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("user:1", 1)
+        cache.set("user_1", 1)
+        cache.set("userX1", 1)
+
+        assert sorted(cache.keys("user?1")) == ["user:1", "userX1", "user_1"]
+        assert cache.keys("user_*") == ["user_1"]
+
+    def test_keys_replace_type(self, temp_dir):
+        """测试与Redis一致，设置值时替换同名队列，推入队列时替换同名的普通值，keys不返回重复的键"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.rpush("q", 1)
+        cache.set("q", 1)
+        assert cache.keys() == ["q"]
+        assert cache.llen("q") == 0
+
+        cache.rpush("q", 2)
+        assert cache.keys("q*") == ["q"]
+        assert cache.get("q") is None
+        assert cache.lpop("q") == 2
+
+        cache.rpush("m", 1)
+        cache.mset({"m": 1})
+        cache.rpush("e", 1)
+        cache.setex_many({"e": 1}, 3600)
+        assert sorted(cache.keys()) == ["e", "m"]
+        assert cache.llen("m") == cache.llen("e") == 0
+
+    def test_mset_mget(self, temp_dir):
+        """测试批量设置与获取"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.mset({"key1": "value1", "key2": {"name": "test"}})
+        cache.setex_many({"key3": 3, "key4": 4}, 3600)
+        cache.setex_many({"expired": 5}, -1)
+
+        assert cache.mget(["key1", "missing", "key2"]) == ["value1", None, {"name": "test"}]
+        assert cache.mget("key3", "key4", "expired") == [3, 4, None]
+
+    def test_pipeline(self, temp_dir):
+        """测试管道在同一事务中执行"""
+        cache = MyCache(temp_dir / "cache.db")
+        with cache.pipeline() as pipe:
+            pipe.set("key1", "value1").setex("key2", 3600, "value2")
+            pipe.rpush("queue", "a").get("key1")
+            assert len(pipe) == 4
+            results = pipe.execute()
+
+        assert results == [None, None, 1, "value1"]
+        assert cache.get("key2") == "value2"
+
+    def test_pipeline_rollback(self, temp_dir):
+        """测试管道中命令出错时整体回滚"""
+        cache = MyCache(temp_dir / "cache.db")
+        pipe = cache.pipeline()
+        pipe.set("key1", "value1")
+        pipe.hset("hash_key")
+
+        with pytest.raises(ValueError):
+            pipe.execute()
+        assert cache.get("key1") is None
+
+        with pytest.raises(AttributeError):
+            pipe.not_exists_command
+
+    def test_get_expired_key_deleted(self, temp_dir):
+        """测试读取到已过期的键时直接删除"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.setex("expired", -1, "value")
+
+        assert cache.get("expired") is None
+        info = cache.info()
+        assert info["total_keys"] == 0
+        assert info["expire_stats"]["lazy_expired"] == 1
+
+    def test_write_lazy_expire(self, temp_dir):
+        """测试写入时顺带删除少量过期键"""
+        cache = MyCache(temp_dir / "cache.db", lazy_expire_batch=2)
+        cache.setex_many({f"expired_{i}": i for i in range(5)}, -1)
+
+        cache.set("key", "value")
+        info = cache.info()
+        assert info["expired_keys"] == 1
+        assert info["expire_stats"]["lazy_expired"] == 4
+
+    def test_sweep(self, temp_dir):
+        """测试分批清理过期键并回收文件空间"""
+        cache = MyCache(temp_dir / "cache.db", lazy_expire_batch=0)
+        cache.setex_many({f"expired_{i}": "x" * 1000 for i in range(300)}, -1)
+        cache.set("key", "value")
+
+        assert cache.sweep(batch_size=100) == 300
+        info = cache.info()
+        assert info["total_keys"] == 1
+        assert info["expire_stats"]["swept"] == 300
+        assert info["expire_stats"]["sweep_runs"] == 1
+        assert info["expire_stats"]["vacuum_runs"] == 1
+        assert info["freelist_count"] < info["page_count"] * cache.vacuum_threshold
+
+    def test_sweep_max_batches(self, temp_dir):
+        """测试限制清理批次"""
+        cache = MyCache(temp_dir / "cache.db", lazy_expire_batch=0)
+        cache.setex_many({f"expired_{i}": i for i in range(10)}, -1)
+
+        assert cache.sweep(batch_size=3, max_batches=2) == 6
+        assert cache.info()["expired_keys"] == 4
+
+    def test_sweeper_thread(self, temp_dir):
+        """测试后台清理线程"""
+        import time
+
+        cache = MyCache(temp_dir / "cache.db", lazy_expire_batch=0)
+        cache.setex("expired", -1, "value")
+        cache.start_sweeper(interval=0.05)
+        try:
+            for _ in range(100):
+                if cache.info()["expire_stats"]["sweep_runs"]:
+                    break
+                time.sleep(0.05)
+            info = cache.info()
+            assert info["expire_stats"]["sweeper_running"] is True
+            assert info["expire_stats"]["swept"] == 1
+        finally:
+            cache.stop_sweeper()
+        assert cache.info()["expire_stats"]["sweeper_running"] is False
+        cache.close()
+
+    def test_rpush_lpop(self, temp_dir):
+        """测试队列先进先出"""
+        cache = MyCache(temp_dir / "cache.db")
+        assert cache.rpush("queue", "a", "b") == 2
+        assert cache.rpush("queue", {"name": "c"}) == 3
+        assert cache.llen("queue") == 3
+
+        assert cache.lpop("queue") == "a"
+        assert cache.lpop("queue", count=5) == ["b", {"name": "c"}]
+        assert cache.lpop("queue") is None
+        assert cache.llen("queue") == 0
+        assert not cache.exists("queue")
+
+    def test_lpop_count(self, temp_dir):
+        """测试count为0时不弹出元素，为负数时抛出异常"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.rpush("queue", "a", "b")
+
+        with pytest.raises(ValueError):
+            cache.lpop("queue", count=-1)
+        assert cache.lpop("queue", count=0) == []
+        assert cache.lpop("missing", count=0) is None
+        assert cache.llen("queue") == 2
+
+    def test_push_pop_obj(self, temp_dir):
+        """测试推送与弹出对象"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.push_obj("queue", {"name": "test", "value": 123})
+        cache.push_obj("queue", [1, 2])
+
+        assert cache.exists("queue")
+        assert "queue" in cache.keys("que*")
+        assert cache.pop_obj("queue") == {"name": "test", "value": 123}
+        assert cache.pop_obj("queue") == [1, 2]
+        assert cache.pop_obj("queue") is None
+
+    def test_lpop_legacy_json_queue(self, temp_dir):
+        """测试兼容旧版本以JSON数组存储的队列"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("queue", ['{"name": "old"}', "2"])
+
+        assert cache.llen("queue") == 2
+        assert cache.rpush("queue", "3") == 3
+        assert cache.lpop("queue", count=3) == [{"name": "old"}, 2, 3]
+
+    def test_delete_queue(self, temp_dir):
+        """测试删除队列"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.rpush("queue", "a", "b")
+
+        assert cache.delete("queue") is True
+        assert cache.lpop("queue") is None
+
+    def test_lpop_concurrent(self, temp_dir):
+        """测试多线程并发弹出时不丢失、不重复"""
+        import threading
+
+        cache = MyCache(temp_dir / "cache.db")
+        cache.rpush("queue", *range(200))
+        popped = []
+
+        def worker():
+            while True:
+                value = cache.lpop("queue")
+                if value is None:
+                    break
+                popped.append(value)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(popped) == list(range(200))
+        cache.close()
+
+
+class TestCacheSerializer:
+    """测试缓存值序列化器"""
+
+    def test_default_is_legacy_json(self):
+        """测试默认序列化器与旧版本格式一致"""
+        serializer = CacheSerializer()
+        assert serializer.dumps({"name": "测试"}) == '{"name": "测试"}'
+        assert serializer.dumps(123) == "123"
+        assert serializer.loads('{"name": "测试"}') == {"name": "测试"}
+        assert serializer.loads(b"[1, 2]") == [1, 2]
+        with pytest.raises(ValueError):
+            serializer.loads("not json")
+
+    def test_pickle_round_trip(self):
+        """测试pickle序列化可保存非JSON类型"""
+        serializer = CacheSerializer("pickle")
+        value = {"tuple": (1, 2), "set": {1, 2}, "bytes": b"raw"}
+        raw = serializer.dumps(value)
+        assert isinstance(raw, bytes)
+        assert serializer.loads(raw) == value
+
+    def test_pickle_not_allowed_by_default(self):
+        """测试非pickle序列化器默认拒绝读取pickle格式的值"""
+        raw = CacheSerializer("pickle").dumps([1, 2])
+        with pytest.raises(ValueError):
+            CacheSerializer().loads(raw)
+        assert CacheSerializer(allow_pickle=True).loads(raw) == [1, 2]
+
+    def test_compress_threshold(self):
+        """测试超过阈值时才压缩，且未压缩的JSON仍为旧格式"""
+        serializer = CacheSerializer(compress="zlib", compress_threshold=100)
+        assert serializer.dumps({"a": 1}) == '{"a": 1}'
+
+        value = {"data": "x" * 10000}
+        raw = serializer.dumps(value)
+        assert isinstance(raw, bytes)
+        assert len(raw) < 1000
+        assert serializer.loads(raw) == value
+        # 任意序列化器都可以读取带数据头的JSON值
+        assert CacheSerializer().loads(raw) == value
+
+    def test_unknown_name(self):
+        """测试未知的序列化方式和压缩方式"""
+        with pytest.raises(ValueError):
+            CacheSerializer("unknown")
+        with pytest.raises(ValueError):
+            CacheSerializer(compress="unknown")
+
+    def test_register_serializer(self):
+        """测试注册自定义序列化方式"""
+        register_serializer("test_repr", 200, lambda v: repr(v).encode("utf-8"), lambda raw: raw.decode("utf-8"))
+        try:
+            serializer = CacheSerializer("test_repr")
+            assert serializer.loads(serializer.dumps([1, 2])) == "[1, 2]"
+            with pytest.raises(ValueError):
+                register_serializer("other", 200, repr, repr)
+        finally:
+            cache_module._SERIALIZERS.pop("test_repr", None)
+
+    def test_mycache_with_serializer(self, temp_dir):
+        """测试MyCache使用压缩序列化器读写，并兼容已有的JSON值"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.set("old", {"name": "old"})
+        cache.close()
+
+        serializer = CacheSerializer("pickle", compress="zlib", compress_threshold=10)
+        cache = MyCache(temp_dir / "cache.db", serializer=serializer)
+        value = {"data": "x" * 1000, "items": (1, 2)}
+        cache.set("new", value)
+        cache.setex("ex", 60, value)
+        cache.mset({"m1": value})
+        assert cache.get("new") == value
+        assert cache.get("ex") == value
+        assert cache.mget(["m1", "old"]) == [value, {"name": "old"}]
+
+        key = cache.set_obj("obj:", {"name": "test"})
+        assert cache.get_to_json(key).name == "test"
+
+        # 哈希、队列操作遇到带数据头的普通值时不抛出UnicodeDecodeError
+        cache.mset({"small1": {"a": 1}, "small2": [1, 2, 3], "small3": {"a": 1}})
+        assert cache.hget("small1", "field") is None
+        assert cache.hgetall("small2") == {}
+        assert cache.rpush("small3", "item") == 1
+        cache.close()
+
+
+class TestCacheLock:
+    """测试MyCache的锁与get_or_compute"""
+
+    def test_lock_exclusive(self, temp_dir):
+        """测试同一时刻只有一个持有者，释放后可再次获取"""
+        cache = MyCache(temp_dir / "cache.db")
+        first = cache.cache_lock("job", ttl=10)
+        second = cache.cache_lock("job", ttl=10, blocking=False)
+
+        assert first.acquire() is True
+        assert second.acquire() is False
+        assert first.release() is True
+        assert second.acquire() is True
+        # 已失去锁的对象不能释放其他持有者的锁
+        first.token = "other"
+        assert first.release() is False
+        assert second.release() is True
+        cache.close()
+
+    def test_lock_redis_signature(self, temp_dir):
+        """测试MyCache.lock兼容redis-py的参数，可作为上下文管理器使用"""
+        cache = MyCache(temp_dir / "cache.db")
+        with cache.lock("job", timeout=10) as lock:
+            assert lock.locked()
+            assert cache.lock("job", blocking=False).acquire() is False
+        # timeout为空时不自动失效
+        with cache.lock("job"):
+            with pytest.raises(CacheLockTimeout):
+                with cache.lock("job", blocking_timeout=0.05, sleep=0.01):
+                    pass
+        assert cache.lock("job", blocking=False).acquire() is True
+        cache.close()
+
+    def test_lock_expired_lease(self, temp_dir):
+        """测试租约到期后其他持有者可以获取，且原持有者释放时不会误删"""
+        import time
+
+        cache = MyCache(temp_dir / "cache.db")
+        first = cache.cache_lock("job", ttl=0.05)
+        assert first.acquire() is True
+        time.sleep(0.1)
+
+        second = cache.cache_lock("job", ttl=10, blocking=False)
+        assert second.acquire() is True
+        assert first.release() is False
+        assert second.release() is True
+        cache.close()
+
+    def test_lock_timeout(self, temp_dir):
+        """测试等待超时抛出CacheLockTimeout"""
+        cache = MyCache(temp_dir / "cache.db")
+        with cache.cache_lock("job", ttl=10):
+            with pytest.raises(CacheLockTimeout):
+                with cache.cache_lock("job", blocking_timeout=0.05, sleep=0.01):
+                    pass
+        cache.close()
+
+    def test_get_or_compute(self, temp_dir):
+        """测试缓存不存在时计算并写入，之后直接读取"""
+        cache = MyCache(temp_dir / "cache.db")
+        fn = MagicMock(return_value={"name": "test"})
+
+        assert cache.get_or_compute("key", fn, ttl=60) == {"name": "test"}
+        assert cache.get_or_compute("key", fn, ttl=60) == {"name": "test"}
+        assert fn.call_count == 1
+        assert 0 < cache.ttl("key") <= 60
+        cache.close()
+
+    def test_get_or_compute_single_flight(self, temp_dir):
+        """测试多线程同时计算同一个键时只执行一次"""
+        import time
+        import threading
+
+        cache = MyCache(temp_dir / "cache.db")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute, ttl=60, sleep=0.01)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ["value"] * 5
+        cache.close()
+
+    def test_get_or_compute_stale(self, temp_dir):
+        """测试陈旧期内其他持有者正在重算时直接返回旧值"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.setex("key", 30, "old")
+        fn = MagicMock(return_value="new")
+
+        with cache.cache_lock("lock:key", ttl=10):
+            assert cache.get_or_compute("key", fn, ttl=60, stale_ttl=60) == "old"
+        fn.assert_not_called()
+
+        assert cache.get_or_compute("key", fn, ttl=60, stale_ttl=60) == "new"
+        assert cache.ttl("key") > 60
+        cache.close()
+
+
+class TestLocalCache:
+    """测试LocalCache进程内缓存层"""
+
+    def test_read_through(self, temp_dir):
+        """测试读穿透与命中统计"""
+        backend = MyCache(temp_dir / "cache.db")
+        backend.set("key", {"name": "test"})
+        cache = LocalCache(backend)
+
+        assert cache.get("key") == {"name": "test"}
+        backend.set("key", {"name": "changed"})
+        assert cache.get("key") == {"name": "test"}
+        assert cache.get("missing") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 1
+
+    def test_get_to_json_returns_copy(self, temp_dir):
+        """测试get_to_json命中时返回独立的MyDict"""
+        backend = MyCache(temp_dir / "cache.db")
+        backend.set("user", {"name": "test"})
+        cache = LocalCache(backend)
+
+        first = cache.get_to_json("user")
+        first.name = "changed"
+        second = cache.get_to_json("user")
+        assert isinstance(second, MyDict)
+        assert second.name == "test"
+
+    def test_invalidate_on_write(self, temp_dir):
+        """测试本地写入与删除使条目失效"""
+        cache = LocalCache(MyCache(temp_dir / "cache.db"))
+        cache.set("key", "value1")
+        assert cache.get("key") == "value1"
+
+        cache.set("key", "value2")
+        assert cache.get("key") == "value2"
+
+        cache.delete("key")
+        assert cache.get("key") is None
+
+    def test_ttl_forwarded(self, temp_dir):
+        """测试ttl()转发给后端，本地存活秒数不遮蔽该方法"""
+        cache = LocalCache(MyCache(temp_dir / "cache.db"), ttl=30)
+        cache.setex("key", 100, "value")
+
+        assert 0 < cache.ttl("key") <= 100
+        assert cache.local_ttl == 30
+
+    def test_delete_many(self, temp_dir):
+        """测试一次删除多个键，MyCache后端逐个删除"""
+        cache = LocalCache(MyCache(temp_dir / "cache.db"))
+        cache.mset({"key1": 1, "key2": 2})
+        assert cache.get("key1") == 1
+
+        assert cache.delete("key1", "key2", "missing") == 2
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+
+    def test_setex_expiry(self, temp_dir):
+        """测试本地条目不晚于后端过期时间失效"""
+        cache = LocalCache(MyCache(temp_dir / "cache.db"), ttl=3600)
+        cache.setex("key", 10, "value")
+
+        with patch("dbox.cache.time.monotonic", return_value=0):
+            assert cache.get("key") == "value"
+        with patch("dbox.cache.time.monotonic", return_value=11):
+            cache.backend.delete("key")
+            assert cache.get("key") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self, temp_dir):
+        """测试超过容量时淘汰最久未使用的条目"""
+        backend = MyCache(temp_dir / "cache.db")
+        backend.mset({"key1": 1, "key2": 2, "key3": 3})
+        cache = LocalCache(backend, maxsize=2)
+
+        cache.get("key1")
+        cache.get("key2")
+        cache.get("key1")
+        cache.get("key3")
+
+        assert cache.stats()["evictions"] == 1
+        assert ("get", "key2") not in cache._entries
+        assert ("get", "key1") in cache._entries
+
+    def test_delegate_to_backend(self, temp_dir):
+        """测试未缓存的方法转发给后端"""
+        cache = LocalCache(MyCache(temp_dir / "cache.db"))
+        cache.rpush("queue", "a")
+        assert cache.lpop("queue") == "a"
+
+    @patch("dbox.cache.os.environ")
+    def test_get_cache_obj_with_local_cache(self, mock_environ):
+        """测试通过get_cache_obj开启进程内缓存"""
+        mock_environ.get.return_value = "test_redis_connect"
+
+        with patch("dbox.cache.MyRedis") as mock_myredis:
+            result = get_cache_obj(local_cache=True, local_cache_size=10)
+            assert isinstance(result, LocalCache)
+            assert result.backend == mock_myredis.return_value
+            assert result.maxsize == 10
 
 
 class TestMyDict:
@@ -309,32 +1038,58 @@ class TestMyDict:
 class TestHget:
     """测试hget函数"""
 
-    @patch("dbox.cache.MyRedis")
-    def test_hget_success(self, mock_myredis):
+    @pytest.fixture(autouse=True)
+    def clear_cache_objs(self):
+        """每个用例使用独立的缓存对象字典，避免复用其他用例创建的缓存对象"""
+        with patch.dict(cache_module._hget_cache_objs, clear=True):
+            yield
+
+    @patch("dbox.cache.get_cache_obj")
+    def test_hget_success(self, mock_get_cache_obj):
         """测试成功获取哈希值"""
         mock_redis = MagicMock()
         mock_redis.hget.return_value = "test_value"
-        mock_myredis.return_value = mock_redis
+        mock_get_cache_obj.return_value = mock_redis
 
         result = hget("hash_key", "field_key")
         assert result == "test_value"
 
-    @patch("dbox.cache.MyRedis")
-    def test_hget_none(self, mock_myredis):
+    @patch("dbox.cache.get_cache_obj")
+    def test_hget_none(self, mock_get_cache_obj):
         """测试获取不存在的哈希值"""
         mock_redis = MagicMock()
         mock_redis.hget.return_value = None
-        mock_myredis.return_value = mock_redis
+        mock_get_cache_obj.return_value = mock_redis
 
         result = hget("hash_key", "field_key", default="default_value")
         assert result == "default_value"
 
-    @patch("dbox.cache.MyRedis")
-    def test_hget_with_type_conversion(self, mock_myredis):
+    @patch("dbox.cache.get_cache_obj")
+    def test_hget_with_type_conversion(self, mock_get_cache_obj):
         """测试带类型转换的哈希值获取"""
         mock_redis = MagicMock()
         mock_redis.hget.return_value = "123"
-        mock_myredis.return_value = mock_redis
+        mock_get_cache_obj.return_value = mock_redis
 
         result = hget("hash_key", "field_key", _type=int)
         assert result == 123
+
+    def test_hget_sqlite_fallback(self, temp_dir):
+        """测试redis不可用时从SQLite缓存获取哈希值"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.hset("hash_key", "field_key", "1")
+
+        with patch("dbox.cache.get_cache_obj", return_value=cache):
+            assert hget("hash_key", "field_key", _type=bool) is True
+            assert hget("hash_key", "missing", default="default_value") == "default_value"
+
+    def test_hget_reuse_cache_obj(self, temp_dir):
+        """测试同一db_index只创建一次缓存对象"""
+        cache = MyCache(temp_dir / "cache.db")
+        cache.hset("hash_key", "field_key", "value")
+
+        with patch("dbox.cache.get_cache_obj", return_value=cache) as mock_get_cache_obj:
+            for _ in range(3):
+                assert hget("hash_key", "field_key") == "value"
+            hget("hash_key", "field_key", db_index=2)
+        assert [call.args for call in mock_get_cache_obj.call_args_list] == [(1,), (2,)]
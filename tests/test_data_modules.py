@@ -49,6 +49,67 @@ class TestAddressInfo:
         codes = [code for code, name in addressinfo.addr]
         assert len(codes) == len(set(codes)), "存在重复的地区代码"
 
+    def test_addr_lazy(self):
+        """测试导入模块及构建行政区划表时不生成addr，首次访问addr后缓存为模块属性"""
+        import subprocess
+        import sys
+
+        code = (
+            "import dbox.addressinfo as m\n"
+            "m.get_region_table()\n"
+            "print('addr' in vars(m))\n"
+            "print(m.addr is m.addr, 'addr' in vars(m))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True).splitlines()
+        assert output == ["False", "True True"]
+        with pytest.raises(AttributeError):
+            addressinfo.not_exist
+
+
+class TestRegionTable:
+    """测试行政区划表"""
+
+    table = addressinfo.get_region_table()
+
+    def test_same_as_addr(self):
+        """测试与addr的数据一致"""
+        assert len(self.table) == len(addressinfo.addr)
+        assert list(self.table) == sorted(addressinfo.addr)
+        assert list(self.table.codes) == sorted(self.table.codes)
+
+    def test_lookup(self):
+        """测试按代码查询名称"""
+        assert self.table[110000] == "北京市"
+        assert self.table["440100"] == "广州市"
+        assert 440100 in self.table
+        assert 999999 not in self.table
+        assert self.table.get(999999, "") == ""
+        with pytest.raises(KeyError):
+            self.table[999999]
+
+    def test_hierarchy(self):
+        """测试上下级关系"""
+        table = addressinfo.RegionTable
+        assert [table.level(code) for code in (440000, 440100, 440106)] == [1, 2, 3]
+        assert self.table.parent(440106) == 440100
+        assert self.table.parent(440100) == 440000
+        assert self.table.parent(440000) is None
+        assert self.table.parent(659001) == 659000
+        assert 440100 in self.table.children(440000)
+        assert all(code // 100 == 4401 and code != 440100 for code in self.table.children(440100))
+
+    def test_select_and_sample(self):
+        """测试按地区、级别筛选与抽样"""
+        districts = self.table.select(44, level=3)
+        assert len(districts) > 0
+        assert all(code // 10000 == 44 and code % 100 for code in districts)
+        assert list(self.table.select(440000)) == list(self.table.select("44"))
+        assert all(code // 100 == 4401 for code in self.table.sample(20, region=4401))
+        with pytest.raises(ValueError):
+            self.table.select(123)
+        with pytest.raises(ValueError):
+            self.table.sample(1, region=99)
+
 
 class TestBankInfo:
     """测试银行信息模块"""
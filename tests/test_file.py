@@ -1,4 +1,9 @@
+import os
+import json
+import errno
+import codecs
 import pytest
+import zipfile
 import tempfile
 import shutil
 from pathlib import Path
@@ -8,12 +13,24 @@ from dbox.file import (
     ensure_empty_dir,
     compress_zip,
     extract_zip,
+    iter_zip_members,
+    compress_tgz,
+    uncompress_tgz,
+    iter_tar_members,
     rm,
     rm_safe,
     move_to_dir,
     copy_to_target,
     copy_to_target_by_pattern,
+    copy_tree,
+    build_manifest,
+    save_manifest,
+    load_manifest,
+    diff_manifest,
+    sync_dir,
+    read_file_stream,
     read_file_raw_content,
+    clear_encoding_cache,
     read_file_content,
     save_obj_to_file,
     save_json_to_file,
@@ -23,6 +40,9 @@ from dbox.file import (
     save_ini_config_object,
     compare_dir,
     compare_file,
+    MappedFile,
+    iter_jsonl,
+    iter_json_array,
 )
 
 
@@ -191,3 +211,508 @@ class TestFile:
 
         compress_zip(str(source_dir), str(temp_dir / "test.zip"))
         mock_zipfile.assert_called_once()
+
+
+class TestCopyTree:
+    """测试多线程复制目录"""
+
+    @staticmethod
+    def _make_tree(root: Path):
+        (root / "sub" / "deep").mkdir(parents=True)
+        (root / "empty").mkdir()
+        (root / "x86").mkdir()
+        (root / "a.txt").write_text("a" * 100)
+        (root / "b.log").write_text("b" * 200)
+        (root / "sub" / "c.txt").write_text("c" * 300)
+        (root / "sub" / "deep" / "d.txt").write_bytes(os.urandom(1024 * 1024))
+        (root / "x86" / "e.txt").write_text("e")
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_copy_tree(self, temp_dir, workers):
+        """测试复制目录，内容、空目录、修改时间都与源目录一致"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        result = copy_tree(src, dst, workers=workers)
+        assert result["files"] == result["copied"] == 5
+        assert result["bytes"] == 100 + 200 + 300 + 1024 * 1024 + 1
+        assert (dst / "empty").is_dir()
+        for name in ("a.txt", "b.log", "sub/c.txt", "sub/deep/d.txt", "x86/e.txt"):
+            assert (dst / name).read_bytes() == (src / name).read_bytes()
+            assert int((dst / name).stat().st_mtime) == int((src / name).stat().st_mtime)
+        assert not list(dst.rglob("*.dbox-part"))
+
+    def test_skip_unchanged(self, temp_dir):
+        """测试再次复制时跳过未修改的文件"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        copy_tree(src, dst)
+        (src / "a.txt").write_text("changed content")
+        os.utime(src / "a.txt", (0, 0))
+        result = copy_tree(src, dst)
+        assert (result["copied"], result["skipped"]) == (1, 4)
+        assert (dst / "a.txt").read_text() == "changed content"
+
+    def test_includes_excludes(self, temp_dir):
+        """测试包含与排除表达式"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        copy_tree(src, dst, includes=r".+\.txt$", excludes="x86;deep")
+        copied = sorted(path.relative_to(dst).as_posix() for path in dst.rglob("*") if path.is_file())
+        assert copied == ["a.txt", "sub/c.txt"]
+
+    def test_not_recursion(self, temp_dir):
+        """测试不递归子目录"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        assert copy_tree(src, dst, recursion=False)["files"] == 2
+
+    def test_kernel_copy_fallback(self, temp_dir):
+        """测试内核复制接口不可用时按块读写"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        unsupported = OSError(errno.ENOSYS, "unsupported")
+        with patch("dbox.file.fcntl", None), patch("dbox.file._copy_file_range", side_effect=unsupported):
+            with patch("dbox.file._sendfile", side_effect=unsupported):
+                copy_tree(src, dst)
+        assert (dst / "sub" / "deep" / "d.txt").read_bytes() == (src / "sub" / "deep" / "d.txt").read_bytes()
+
+    def test_kernel_copy_short(self, temp_dir):
+        """测试内核复制接口提前返回0、文件大小上报为0时按块读写剩余部分，目标文件不被截断"""
+        from dbox.file import _copy_file_data
+
+        data = os.urandom(300 * 1024)
+        (temp_dir / "src.bin").write_bytes(data)
+
+        def short_copy(src_fd, dst_fd, offset, count):
+            if offset >= 100 * 1024:
+                return 0
+            return os.pwrite(dst_fd, os.pread(src_fd, min(count, 64 * 1024), offset), offset)
+
+        with patch("dbox.file.fcntl", None), patch("dbox.file._copy_file_range", side_effect=short_copy):
+            for size in (len(data), 0):
+                with open(temp_dir / "src.bin", "rb") as fsrc, open(temp_dir / "dst.bin", "wb") as fdst:
+                    _copy_file_data(fsrc, fdst, size)
+                assert (temp_dir / "dst.bin").read_bytes() == data
+
+    def test_skip_unchanged_sub_second(self, temp_dir):
+        """测试修改时间只有不足1秒的差异时不跳过"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        copy_tree(src, dst)
+        mtime_ns = (dst / "a.txt").stat().st_mtime_ns // 10**9 * 10**9
+        os.utime(dst / "a.txt", ns=(mtime_ns, mtime_ns))
+        os.utime(src / "a.txt", ns=(mtime_ns + 5 * 10**8, mtime_ns + 5 * 10**8))
+        result = copy_tree(src, dst)
+        assert (result["copied"], result["skipped"]) == (1, 4)
+
+    def test_copy_error_no_temp_file(self, temp_dir):
+        """测试复制出错时不留下临时文件与不完整的目标文件"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        with patch("dbox.file._copy_file_data", side_effect=OSError(errno.EIO, "io error")):
+            with pytest.raises(OSError):
+                copy_tree(src, dst, workers=1)
+        assert not [path for path in dst.rglob("*") if path.is_file()]
+
+    def test_copy_to_target_dir(self, temp_dir):
+        """测试copy_to_target复制目录：目标不存在时生成新目录，目标存在时复制到目标目录下"""
+        src = temp_dir / "src"
+        self._make_tree(src)
+        copy_to_target(src, temp_dir / "new")
+        assert (temp_dir / "new" / "sub" / "c.txt").exists()
+        (temp_dir / "exists").mkdir()
+        copy_to_target(src, temp_dir / "exists", workers=2)
+        assert (temp_dir / "exists" / "src" / "sub" / "c.txt").exists()
+
+    def test_copy_to_target_by_pattern(self, temp_dir):
+        """测试按表达式复制"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        dst.mkdir()
+        copy_to_target_by_pattern(str(src) + os.sep + r".+\.(txt|log)$", dst, excludes="b")
+        assert sorted(path.name for path in dst.iterdir()) == ["a.txt"]
+
+
+class TestManifest:
+    """测试目录清单与增量同步"""
+
+    @staticmethod
+    def _make_tree(root: Path):
+        (root / "sub" / "deep").mkdir(parents=True)
+        (root / "empty").mkdir()
+        (root / "a.txt").write_text("a" * 100)
+        (root / "sub" / "b.txt").write_text("b" * 200)
+        (root / "sub" / "deep" / "c.bin").write_bytes(os.urandom(3 * 1024 * 1024))
+
+    @staticmethod
+    def _files(root: Path) -> dict:
+        return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+    def test_build_manifest(self, temp_dir):
+        """测试生成清单"""
+        self._make_tree(temp_dir)
+        manifest = build_manifest(temp_dir)
+        assert manifest["dirs"] == ["empty", "sub", "sub/deep"]
+        assert sorted(manifest["files"]) == ["a.txt", "sub/b.txt", "sub/deep/c.bin"]
+        assert manifest["files"]["a.txt"]["size"] == 100
+        assert len(manifest["files"]["a.txt"]["hash"]) == 32
+        assert "hash" not in build_manifest(temp_dir, hash_files=False)["files"]["a.txt"]
+        assert sorted(build_manifest(temp_dir, excludes="deep")["files"]) == ["a.txt", "sub/b.txt"]
+
+    def test_previous_manifest(self, temp_dir):
+        """测试沿用上次清单中未修改文件的哈希"""
+        self._make_tree(temp_dir)
+        previous = build_manifest(temp_dir)
+        previous["files"]["a.txt"]["hash"] = "reused"
+        manifest = build_manifest(temp_dir, previous=previous)
+        assert manifest["files"]["a.txt"]["hash"] == "reused"
+        assert manifest["files"]["sub/b.txt"]["hash"] == previous["files"]["sub/b.txt"]["hash"]
+
+    def test_save_and_diff_manifest(self, temp_dir):
+        """测试保存清单并与修改后的目录比较"""
+        root = temp_dir / "root"
+        self._make_tree(root)
+        save_manifest(build_manifest(root), temp_dir / "manifest.json")
+        stored = load_manifest(temp_dir / "manifest.json")
+
+        (root / "a.txt").write_text("x" * 100)
+        os.utime(root / "a.txt", (0, 0))
+        (root / "new.txt").write_text("new")
+        (root / "sub" / "b.txt").unlink()
+        (root / "empty").rmdir()
+        diff = diff_manifest(build_manifest(root), stored)
+        assert diff["added"] == ["new.txt"]
+        assert diff["removed"] == ["sub/b.txt"]
+        assert diff["changed"] == ["a.txt"]
+        assert diff["unchanged"] == ["sub/deep/c.bin"]
+        assert diff["removed_dirs"] == ["empty"]
+
+    def test_compare_dir(self, temp_dir):
+        """测试比较目录"""
+        self._make_tree(temp_dir / "a")
+        copy_tree(temp_dir / "a", temp_dir / "b")
+        assert compare_dir(str(temp_dir / "a"), str(temp_dir / "b")) is True
+        (temp_dir / "b" / "extra.txt").write_text("extra")
+        assert compare_dir(str(temp_dir / "a"), str(temp_dir / "b")) is False
+
+    @pytest.mark.parametrize("checksum", [False, True])
+    def test_sync_dir(self, temp_dir, checksum):
+        """测试增量同步：复制新增与修改的文件，删除多余的文件与目录"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        result = sync_dir(src, dst, checksum=checksum)
+        assert (result["copied"], result["deleted"]) == (3, 0)
+        assert self._files(dst) == self._files(src)
+        assert (dst / "empty").is_dir()
+
+        result = sync_dir(src, dst, checksum=checksum)
+        assert (result["copied"], result["deleted"], result["unchanged"]) == (0, 0, 3)
+
+        (src / "a.txt").write_text("changed")
+        (src / "sub" / "new.txt").write_text("new")
+        (dst / "extra").mkdir()
+        (dst / "extra" / "extra.txt").write_text("extra")
+        (dst / "sub" / "old.txt").write_text("old")
+        result = sync_dir(src, dst, checksum=checksum)
+        assert (result["copied"], result["deleted"], result["unchanged"]) == (2, 3, 2)
+        assert self._files(dst) == self._files(src)
+        assert not (dst / "extra").exists()
+
+    def test_sync_dir_same_content(self, temp_dir):
+        """测试只有修改时间不同的文件只更新修改时间"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        sync_dir(src, dst)
+        os.utime(dst / "a.txt", (0, 0))
+        result = sync_dir(src, dst)
+        assert (result["copied"], result["unchanged"]) == (0, 3)
+        assert int((dst / "a.txt").stat().st_mtime) == int((src / "a.txt").stat().st_mtime)
+
+    def test_sync_dir_same_second_edit(self, temp_dir):
+        """测试同一秒内大小不变的修改也会被同步"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        mtime_ns = 1_700_000_000_100_000_000
+        os.utime(src / "a.txt", ns=(mtime_ns, mtime_ns))
+        sync_dir(src, dst)
+
+        (src / "a.txt").write_text("c" * 100)
+        os.utime(src / "a.txt", ns=(mtime_ns + 500_000_000, mtime_ns + 500_000_000))
+        result = sync_dir(src, dst)
+        assert (result["copied"], result["unchanged"]) == (1, 2)
+        assert (dst / "a.txt").read_text() == "c" * 100
+
+    def test_sync_dir_keep_excluded(self, temp_dir):
+        """测试被排除的项不复制也不删除"""
+        src, dst = temp_dir / "src", temp_dir / "dst"
+        self._make_tree(src)
+        (dst / "logs").mkdir(parents=True)
+        (dst / "logs" / "app.log").write_text("log")
+        sync_dir(src, dst, excludes="logs;deep")
+        assert (dst / "logs" / "app.log").exists()
+        assert not (dst / "sub" / "deep").exists()
+
+
+class TestCompress:
+    """测试压缩与解压"""
+
+    @staticmethod
+    def _make_tree(root: Path) -> dict:
+        (root / "sub").mkdir(parents=True)
+        files = {
+            "a.txt": b"hello world\n" * 1000,
+            "sub/b.log": os.urandom(100 * 1024),
+            "sub/c.png": b"png" * 1000,
+            "中文.txt": "中文内容".encode("utf-8") * 100,
+        }
+        for name, data in files.items():
+            (root / name).write_bytes(data)
+        return files
+
+    @staticmethod
+    def _read_tree(root: Path) -> dict:
+        return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+    @pytest.mark.parametrize("compress_type", ["store", "deflate", "bzip2", "lzma"])
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_zip_round_trip(self, temp_dir, compress_type, workers):
+        """测试各压缩方式、单线程与多线程压缩后解压内容一致"""
+        files = self._make_tree(temp_dir / "src")
+        zip_path = temp_dir / "test.zip"
+        result = compress_zip(str(temp_dir / "src"), str(zip_path), compress_type=compress_type, workers=workers)
+        assert result["files"] == 4
+        assert result["bytes"] == sum(len(data) for data in files.values())
+        assert result["compressed_bytes"] == zip_path.stat().st_size
+
+        with zipfile.ZipFile(zip_path) as fz:
+            assert fz.testzip() is None
+            # 已压缩格式的文件直接存储
+            assert fz.getinfo(os.path.join("sub", "c.png")).compress_type == zipfile.ZIP_STORED
+        assert extract_zip(zip_path, temp_dir / "dst")["files"] == 4
+        assert self._read_tree(temp_dir / "dst") == files
+
+    def test_zip_parallel_private_api(self, temp_dir):
+        """测试多线程压缩依赖的ZipFile私有属性在当前Python中存在；缺少时退回逐个压缩，超过大小上限的成员由zipfile压缩"""
+        from dbox import file as file_module
+
+        with zipfile.ZipFile(temp_dir / "check.zip", "w") as fz:
+            assert file_module._zip_raw_write_supported(fz)
+
+        files = self._make_tree(temp_dir / "src")
+        with patch("dbox.file._zip_raw_write_supported", return_value=False):
+            compress_zip(str(temp_dir / "src"), str(temp_dir / "serial.zip"), workers=4)
+        with patch("dbox.file._ZIP_PARALLEL_MEMBER_LIMIT", 16 * 1024), patch(
+            "dbox.file._ZIP_PARALLEL_BUFFER_LIMIT", 32 * 1024
+        ):
+            compress_zip(str(temp_dir / "src"), str(temp_dir / "mixed.zip"), workers=4)
+        for name in ("serial", "mixed"):
+            with zipfile.ZipFile(temp_dir / f"{name}.zip") as fz:
+                assert fz.testzip() is None
+            extract_zip(temp_dir / f"{name}.zip", temp_dir / name)
+            assert self._read_tree(temp_dir / name) == files
+
+    def test_zip_compress_level_and_store_extensions(self, temp_dir):
+        """测试压缩级别与不压缩的扩展名"""
+        self._make_tree(temp_dir / "src")
+        fast = compress_zip(str(temp_dir / "src"), str(temp_dir / "fast.zip"), compress_level=0, workers=2)
+        best = compress_zip(str(temp_dir / "src"), str(temp_dir / "best.zip"), compress_level=9, workers=2)
+        assert best["compressed_bytes"] < fast["compressed_bytes"]
+
+        compress_zip(str(temp_dir / "src"), str(temp_dir / "all.zip"), store_extensions=())
+        with zipfile.ZipFile(temp_dir / "all.zip") as fz:
+            assert fz.getinfo(os.path.join("sub", "c.png")).compress_type == zipfile.ZIP_DEFLATED
+
+    def test_zip_invalid_compress_type(self, temp_dir):
+        """测试不支持的压缩方式"""
+        self._make_tree(temp_dir / "src")
+        with pytest.raises(ValueError):
+            compress_zip(str(temp_dir / "src"), str(temp_dir / "test.zip"), compress_type="rar")
+
+    def test_iter_zip_members(self, temp_dir):
+        """测试逐个读取zip成员"""
+        files = self._make_tree(temp_dir / "src")
+        compress_zip(str(temp_dir / "src"), str(temp_dir / "test.zip"), workers=2)
+        members = iter_zip_members(temp_dir / "test.zip")
+        assert {zinfo.filename.replace(os.sep, "/"): member.read() for zinfo, member in members} == files
+
+    @pytest.mark.parametrize("compress_type", ["store", "gz", "bz2", "xz"])
+    def test_tar_round_trip(self, temp_dir, compress_type, monkeypatch):
+        """测试各压缩方式的tar打包与流式解压"""
+        files = self._make_tree(temp_dir / "src")
+        monkeypatch.chdir(temp_dir)
+        result = compress_tgz("src", str(temp_dir / "test.tar"), compress_type=compress_type, compress_level=1)
+        assert result["files"] == 4
+        assert uncompress_tgz(str(temp_dir / "test.tar"), str(temp_dir / "dst"))["files"] == 4
+        assert self._read_tree(temp_dir / "dst" / "src") == files
+
+        members = {member.name: fileobj.read() for member, fileobj in iter_tar_members(str(temp_dir / "test.tar"))}
+        assert members == {f"src/{name}": data for name, data in files.items()}
+
+    def test_tar_invalid_compress_type(self, temp_dir):
+        """测试不支持的tar压缩方式"""
+        with pytest.raises(ValueError):
+            compress_tgz(str(temp_dir), str(temp_dir / "test.tar"), compress_type="rar")
+
+
+class TestReadFileEncoding:
+    """测试读取文件时识别编码"""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            (b"hello", ("hello", "utf-8")),
+            (b"", ("", "utf-8")),
+            ("中文".encode("utf-8"), ("中文", "utf-8")),
+            ("中文".encode("gbk"), ("中文", "GBK")),
+            ("中文€".encode("gb18030"), ("中文€", "GB18030")),
+            (codecs.BOM_UTF8 + "中文".encode("utf-8"), ("中文", "utf-8-sig")),
+            ("中文".encode("utf-16"), ("中文", "utf-16")),
+            (b"a\r\nb\rc\n", ("a\nb\nc\n", "utf-8")),
+        ],
+    )
+    def test_detect_encoding(self, temp_dir, data, expected):
+        """测试按BOM与候选编码识别"""
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes(data)
+        assert read_file_raw_content(file_path, use_cache=False) == expected
+
+    def test_same_as_text_mode(self, temp_dir):
+        """测试与按utf-8、GBK、GB2312、GB18030依次以文本模式读取的结果一致"""
+        samples = ["纯中文内容" * 2000, "utf-8开头" + "中" * 5000, ("ascii" * 2000) + "结尾中文", "混合\r\n换行"]
+        for index, text in enumerate(samples):
+            for encoding in ("utf-8", "gbk"):
+                file_path = temp_dir / f"{index}_{encoding}.txt"
+                file_path.write_bytes(text.encode(encoding))
+                for candidate in ("utf-8", "GBK", "GB2312", "GB18030"):
+                    try:
+                        with open(file_path, encoding=candidate) as f:
+                            expected = (f.read(), candidate)
+                        break
+                    except UnicodeDecodeError:
+                        continue
+                assert read_file_raw_content(file_path, use_cache=False) == expected
+
+    def test_specified_encoding(self, temp_dir):
+        """测试指定编码"""
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes("中文".encode("gbk"))
+        assert read_file_raw_content(file_path, encoding="gbk") == ("中文", "gbk")
+        with pytest.raises(UnicodeDecodeError):
+            read_file_raw_content(file_path, encoding="utf-8")
+
+    def test_encoding_cache(self, temp_dir):
+        """测试缓存识别出的编码，文件修改后重新识别"""
+        clear_encoding_cache()
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes("中文".encode("gbk"))
+        assert read_file_raw_content(file_path)[1] == "GBK"
+        with patch("dbox.file._guess_encodings", return_value=["utf-8"]) as mock_guess:
+            assert read_file_raw_content(file_path) == ("中文", "GBK")
+            mock_guess.assert_called_once()
+
+        file_path.write_bytes("中文内容".encode("utf-8"))
+        os.utime(file_path, ns=(0, 0))
+        assert read_file_raw_content(file_path) == ("中文内容", "utf-8")
+        clear_encoding_cache()
+
+
+class TestMappedFile:
+    """测试内存映射读取"""
+
+    def test_read(self, temp_dir):
+        """测试按范围读取，与read_file_stream一致"""
+        file_path = temp_dir / "test.bin"
+        data = os.urandom(10000)
+        file_path.write_bytes(data)
+        with MappedFile(file_path) as mapped:
+            assert len(mapped) == 10000
+            for start, end in ((0, 10), (100, 5000), (9990, 10000), (9990, 20000)):
+                chunk = mapped.read(start, end)
+                assert isinstance(chunk, memoryview)
+                assert chunk == read_file_stream(str(file_path), start, end)
+                chunk.release()
+            assert mapped[5] == data[5]
+            assert mapped.find(data[200:210]) == data.find(data[200:210])
+
+    def test_iter_lines(self, temp_dir):
+        """测试逐行读取"""
+        file_path = temp_dir / "test.log"
+        file_path.write_bytes(b"first\r\nsecond\n\nlast")
+        with MappedFile(file_path) as mapped:
+            assert [bytes(line) for line in mapped.iter_lines()] == [b"first", b"second", b"", b"last"]
+            assert [bytes(line) for line in mapped.iter_lines(keepends=True)] == [
+                b"first\r\n",
+                b"second\n",
+                b"\n",
+                b"last",
+            ]
+
+    def test_iter_records(self, temp_dir):
+        """测试按分隔符读取记录"""
+        file_path = temp_dir / "test.dat"
+        file_path.write_bytes(b"a=1\nb=2\n\nc=3\n\n")
+        with MappedFile(file_path) as mapped:
+            assert [bytes(record) for record in mapped.iter_records(b"\n\n")] == [b"a=1\nb=2", b"c=3"]
+
+    @pytest.mark.parametrize("block_size", [1, 10, 1000])
+    def test_iter_blocks(self, temp_dir, block_size):
+        """测试按块读取，块在换行符之后结束"""
+        file_path = temp_dir / "test.log"
+        data = b"".join(f"line {index}\n".encode() for index in range(100)) + b"last"
+        file_path.write_bytes(data)
+        with MappedFile(file_path) as mapped:
+            blocks = [bytes(block) for block in mapped.iter_blocks(block_size)]
+        assert b"".join(blocks) == data
+        assert all(block.endswith(b"\n") for block in blocks[:-1])
+
+    def test_empty_file(self, temp_dir):
+        """测试空文件"""
+        file_path = temp_dir / "empty.txt"
+        file_path.write_bytes(b"")
+        with MappedFile(file_path) as mapped:
+            assert len(mapped) == 0
+            assert list(mapped.iter_lines()) == []
+            assert mapped.read(0, 10) == b""
+
+    def test_iter_jsonl(self, temp_dir):
+        """测试逐行解析JSONL文件"""
+        file_path = temp_dir / "test.jsonl"
+        records = [{"id": index, "name": f"名称{index}"} for index in range(100)]
+        file_path.write_text("\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\n\n", "utf-8")
+        assert list(iter_jsonl(file_path)) == records
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+    def test_iter_json_array(self, temp_dir, chunk_size):
+        """测试逐个解析JSON数组元素，元素跨越读取块时也能正确解析"""
+        file_path = temp_dir / "test.json"
+        values = [12345, -1.5e10, True, None, "字符串,]", {"nested": [1, {"a": "b"}]}, [], "x" * 100]
+        file_path.write_text(json.dumps(values, ensure_ascii=False, indent=2), "utf-8")
+        assert list(iter_json_array(file_path, chunk_size=chunk_size)) == values
+
+        file_path.write_text(" [ ] ", "utf-8")
+        assert list(iter_json_array(file_path, chunk_size=chunk_size)) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 6, 8])
+    def test_iter_json_array_number_boundary(self, temp_dir, chunk_size):
+        """测试小数、指数在读取块边界处截断时能正确解析"""
+        file_path = temp_dir / "test.json"
+        for text, values in [
+            ("[1, 2.5, 3]", [1, 2.5, 3]),
+            ("[1e5,2.25E-3 , -0.5,1e+2]", [1e5, 2.25e-3, -0.5, 1e2]),
+            ("[123456789, 0.000125]", [123456789, 0.000125]),
+        ]:
+            file_path.write_text(text, "utf-8")
+            assert list(iter_json_array(file_path, chunk_size=chunk_size)) == values
+
+    def test_iter_json_array_invalid(self, temp_dir):
+        """测试格式错误的JSON数组"""
+        file_path = temp_dir / "test.json"
+        file_path.write_text('{"a": 1}', "utf-8")
+        with pytest.raises(ValueError):
+            list(iter_json_array(file_path))
+        file_path.write_text("[1, 2", "utf-8")
+        with pytest.raises(ValueError):
+            list(iter_json_array(file_path, chunk_size=2))
+        file_path.write_text("[1 2]", "utf-8")
+        with pytest.raises(ValueError):
+            list(iter_json_array(file_path))
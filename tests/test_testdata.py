@@ -1,3 +1,5 @@
+import csv
+import json
 import pytest
 import datetime
 from unittest.mock import patch
@@ -9,17 +11,36 @@ from dbox.testdata import (
     get_random_string,
     get_uuid,
     get_pinyin,
+    get_pinyin_many,
     get_name,
+    get_names,
     generate_id_card,
+    generate_id_cards,
+    iter_id_cards,
+    save_id_cards,
     generate_mobile_number,
     generate_phone_serial_number,
     generate_bank_card_number,
+    iter_bank_card_numbers,
+    luhn_check_digit,
     get_bank_bin,
     get_special_character,
     validate_id_card,
+    validate_id_cards,
+    validate_bank_card_number,
+    validate_bank_card_numbers,
+    DataGenerator,
+    generate_records,
+    iter_dataset_chunks,
+    write_dataset,
 )
 
 
+def _make_record(generator):
+    """generate_records测试用的记录工厂，多进程时需要可被pickle"""
+    return (generator.get_name(), generator.generate_id_card(), generator.generate_mobile_number())
+
+
 class TestTestData:
     """测试测试数据生成函数"""
 
@@ -167,6 +188,7 @@ class TestTestData:
         assert isinstance(result, str)
         assert len(result) == 16
 
+    @patch("dbox.testdata._pinyin_converter", None)
     @patch("dbox.testdata.Pinyin")
     def test_get_pinyin_with_name(self, mock_pinyin):
         """测试获取拼音-指定姓名"""
@@ -179,6 +201,7 @@ class TestTestData:
         assert result[0] == "zhang san"
         assert result[1] == "张三"
 
+    @patch("dbox.testdata._pinyin_converter", None)
     @patch("dbox.testdata.get_name")
     @patch("dbox.testdata.Pinyin")
     def test_get_pinyin_without_name(self, mock_pinyin, mock_get_name):
@@ -191,6 +214,23 @@ class TestTestData:
         assert isinstance(result, tuple)
         assert len(result) == 2
 
+    def test_get_pinyin_cached(self):
+        """测试按字缓存的转换结果与xpinyin一致，且只加载一次字典"""
+        from xpinyin import Pinyin
+
+        pinyin = Pinyin()
+        with patch("dbox.testdata._pinyin_converter", None), patch("dbox.testdata.Pinyin", wraps=Pinyin) as mock_pinyin:
+            for name in ["张三", "欧阳娜娜", "单于", "张三a李", "李 abc"]:
+                assert get_pinyin(name, "-") == (pinyin.get_pinyin(name, "-"), name)
+            assert mock_pinyin.call_count == 1
+
+    def test_get_pinyin_many(self):
+        """测试批量获取拼音"""
+        names = ["张三", "李四", "王五a"]
+        result = get_pinyin_many(names, " ")
+        assert result == [("zhang san", "张三"), ("li si", "李四"), ("wang wu a", "王五a")]
+        assert get_pinyin_many([]) == []
+
     def test_get_name_default(self):
         """测试获取姓名-默认"""
         result = get_name()
@@ -209,6 +249,30 @@ class TestTestData:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    def test_get_names(self):
+        """测试批量获取姓名"""
+        from dbox.testdata import _get_name_pools
+
+        surnames, male_names, female_names = _get_name_pools()
+        result = get_names(200, gender=1)
+        assert len(result) == 200
+        for name in result:
+            assert name[0] in surnames
+            assert name[1:] in male_names or any(name[1:] in male_name for male_name in male_names)
+        assert get_names(0) == []
+
+    def test_get_names_options(self):
+        """测试单字名比例、姓氏权重与去重"""
+        from dbox.testdata import _get_name_pools
+
+        assert all(len(name) == 3 for name in get_names(100, single_char_ratio=0))
+        assert all(len(name) == 2 for name in get_names(100, single_char_ratio=1))
+        assert all(name[0] == "王" for name in get_names(100, surname_weights={"王": 10**12}))
+
+        for pool in _get_name_pools(dedupe=True):
+            assert len(pool) == len(set(pool))
+        assert len(get_names(50, gender=2, dedupe=True)) == 50
+
     def test_generate_id_card_default(self):
         """测试获取身份证号-默认"""
         result = generate_id_card()
@@ -227,6 +291,119 @@ class TestTestData:
         assert isinstance(result, str)
         assert len(result) == 18
 
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_generate_id_cards(self, use_numpy):
+        """测试批量生成身份证号码的出生日期范围、性别与校验码（numpy与纯Python两种实现）"""
+        import dbox.testdata
+
+        numpy_module = dbox.testdata._get_numpy() if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("未安装numpy")
+        with patch("dbox.testdata._get_numpy", return_value=numpy_module):
+            result = generate_id_cards(500, gender=2, birth_range=("2000-02-28", datetime.date(2000, 3, 1)))
+        assert len(result) == 500
+        for id_card in result:
+            assert id_card[6:14] in ("20000228", "20000229", "20000301")
+            assert int(id_card[16]) % 2 == 0
+            assert validate_id_card(id_card) == id_card[-1]
+
+    def test_generate_id_cards_small_batch(self):
+        """测试小批量使用纯Python实现，不导入numpy；取值表对象及其numpy数组按条件缓存复用"""
+        import dbox.testdata
+
+        with patch("dbox.testdata._get_numpy", side_effect=AssertionError):
+            assert validate_id_card(generate_id_card())
+            assert len(generate_id_cards(dbox.testdata._NUMPY_MIN_BATCH - 1)) == dbox.testdata._NUMPY_MIN_BATCH - 1
+
+        tables = dbox.testdata._IdCardTables.get(1, ("2000-01-01", "2000-12-31"))
+        assert dbox.testdata._IdCardTables.get(1, ("2000-01-01", "2000-12-31")) is tables
+        numpy = dbox.testdata._get_numpy()
+        if numpy is not None:
+            assert tables.numpy_sums(numpy) is tables.numpy_sums(numpy)
+
+    def test_generate_id_cards_invalid_range(self):
+        """测试出生日期范围起始晚于截止时抛出异常"""
+        with pytest.raises(ValueError):
+            generate_id_cards(1, birth_range=("2020-01-01", "2019-01-01"))
+
+    def test_generate_id_cards_region(self):
+        """测试按地区生成身份证号码"""
+        assert all(id_card.startswith("4401") for id_card in generate_id_cards(50, region=4401))
+        assert all(id_card.startswith("44") for id_card in generate_id_cards(50, region="440000"))
+        assert {id_card[:6] for id_card in generate_id_cards(20, region=440106)} == {"440106"}
+        with pytest.raises(ValueError):
+            generate_id_cards(1, region=99)
+
+    def test_iter_and_save_id_cards(self, tmp_path):
+        """测试分批产出与写入文件"""
+        result = list(iter_id_cards(25, gender=1, batch_size=10))
+        assert len(result) == 25
+        assert all(int(id_card[16]) % 2 == 1 for id_card in result)
+
+        file_path = tmp_path / "id_cards.txt"
+        assert save_id_cards(file_path, 25, batch_size=10) == 25
+        lines = file_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 25
+        assert all(validate_id_card(line) == line[-1] for line in lines)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_validate_id_cards(self, use_numpy):
+        """测试批量校验身份证号码，结果与逐个校验一致（numpy与纯Python两种实现）"""
+        import dbox.testdata
+
+        numpy_module = dbox.testdata._get_numpy() if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("未安装numpy")
+        valid_ids = generate_id_cards(20)
+        wrong_id = valid_ids[0][:-1] + ("0" if valid_ids[0][-1] != "0" else "1")
+        values = valid_ids + [wrong_id, "12345", "11010119900307A31X", "１" * 18]
+        with patch("dbox.testdata._get_numpy", return_value=numpy_module):
+            mask, check_codes = validate_id_cards(values)
+        assert mask == [True] * 20 + [False] * 4
+        assert check_codes[:21] == [validate_id_card(value[:17]) for value in values[:21]]
+        assert check_codes[21:] == ["", "", ""]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_validate_id_cards_lowercase_x(self, use_numpy):
+        """测试校验码为小写x的号码视为有效"""
+        import dbox.testdata
+
+        numpy_module = dbox.testdata._get_numpy() if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("未安装numpy")
+        with patch("dbox.testdata._get_numpy", return_value=numpy_module):
+            mask, check_codes = validate_id_cards(["11010519491231002X", "11010519491231002x", "11010519491231002y"])
+        assert mask == [True, True, False]
+        assert check_codes == ["X", "X", "X"]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_validate_bank_card_numbers(self, use_numpy):
+        """测试批量Luhn校验银行卡号（numpy与纯Python两种实现）"""
+        import dbox.testdata
+
+        numpy_module = dbox.testdata._get_numpy() if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("未安装numpy")
+        values = ["4111111111111111", "4111111111111112", "79927398713", "abc", "", 6222021001123456789]
+        with patch("dbox.testdata._get_numpy", return_value=numpy_module):
+            mask, check_digits = validate_bank_card_numbers(values)
+        assert mask == [True, False, True, False, False, True]
+        assert check_digits == ["1", "1", "3", "", "", "9"]
+
+    def test_validate_from_file(self, tmp_path):
+        """测试从文件读取号码批量校验"""
+        file_path = tmp_path / "numbers.txt"
+        file_path.write_text("4111111111111111\n 4111111111111112 \n", encoding="utf-8")
+        assert validate_bank_card_numbers(file_path) == ([True, False], ["1", "1"])
+        assert validate_bank_card_numbers(str(file_path))[0] == [True, False]
+
+    def test_validate_bank_card_number(self):
+        """测试单个银行卡号Luhn校验"""
+        cards = generate_bank_card_number(card_count=20)
+        assert all(validate_bank_card_number(card["no"]) for card in cards)
+        assert validate_bank_card_number("4111111111111112") is False
+        assert validate_bank_card_number("41111111111111a1") is False
+
     def test_validate_id_card_valid(self):
         """测试验证有效的身份证号-18位"""
         # 使用 generate_id_card 生成有效身份证进行测试
@@ -339,6 +516,93 @@ class TestTestData:
         result = generate_bank_card_number(card_count=1, bank_code="ICBC")
         assert result is not None
 
+    def test_luhn_check_digit(self):
+        """测试Luhn校验位计算"""
+        assert luhn_check_digit("7992739871") == "3"
+        assert luhn_check_digit("622202100112345678") == "9"
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_generate_bank_card_number_bulk(self, use_numpy):
+        """测试批量生成的卡号长度、BIN前缀与校验位正确（numpy与纯Python两种实现）"""
+        import dbox.testdata
+
+        numpy_module = dbox.testdata._get_numpy() if use_numpy else None
+        if use_numpy and numpy_module is None:
+            pytest.skip("未安装numpy")
+        with patch("dbox.testdata._get_numpy", return_value=numpy_module):
+            cards = generate_bank_card_number(card_count=500)
+        assert len(cards) == 500
+        for card in cards:
+            assert isinstance(card["no"], str)
+            assert len(card["no"]) == int(card["length"])
+            assert card["no"].startswith(card["bin"])
+            assert luhn_check_digit(card["no"][:-1]) == card["no"][-1]
+
+    def test_generate_bank_card_number_single_zero_count(self):
+        """测试返回单个对象时card_count为0仍生成一个卡号"""
+        card = generate_bank_card_number(card_count=0, return_single=True)
+        assert luhn_check_digit(card["no"][:-1]) == card["no"][-1]
+
+    def test_generate_bank_card_number_zero_count(self):
+        """测试card_count为0时与旧版本一致，每个符合条件的BIN各生成一个卡号"""
+        cards = generate_bank_card_number(card_count=0, bank_code="ICBC")
+        assert [card["bin"] for card in cards] == [item["bin"] for item in get_bank_bin(num=0, bank="ICBC")]
+        assert all(luhn_check_digit(card["no"][:-1]) == card["no"][-1] for card in cards)
+
+    def test_generate_bank_card_number_small_count(self):
+        """测试少量生成时使用纯Python实现，不导入numpy"""
+        with patch("dbox.testdata._get_numpy", side_effect=AssertionError):
+            assert len(generate_bank_card_number(card_count=5, card_type="CC")) == 5
+
+    def test_bank_card_table_cached(self):
+        """测试生成参数按过滤条件从BIN索引中查找并缓存"""
+        import dbox.testdata
+
+        table = dbox.testdata._bank_card_table(None, None, "CC", None)
+        assert table is dbox.testdata._bank_card_table(None, None, "CC", None)
+        assert table.bin_list == get_bank_bin(num=0, ftype="CC")
+        with pytest.raises(ValueError):
+            dbox.testdata._bank_card_table("NOT_EXISTS")
+
+    def test_generate_bank_card_number_columns(self):
+        """测试按列返回"""
+        columns = generate_bank_card_number(card_count=10, bank_code="ICBC", as_columns=True)
+        assert set(columns) == {"no", "bin", "bank", "type", "length", "name"}
+        assert all(len(values) == 10 for values in columns.values())
+        assert set(columns["bank"]) == {"ICBC"}
+
+    def test_lazy_import(self):
+        """测试导入testdata时不导入numpy与数据模块，旧版本的模块属性addr、bank_bin_list仍可导入"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, dbox.testdata\n"
+            "print(','.join(m for m in ('numpy', 'dbox.addressinfo', 'dbox.bankinfo') if m in sys.modules))\n"
+            "from dbox.testdata import addr, bank_bin_list\n"
+            "print(len(addr) > 0, len(bank_bin_list) > 0)"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True).splitlines()
+        assert output == ["", "True True"]
+
+        import dbox.testdata
+
+        with pytest.raises(AttributeError):
+            dbox.testdata.not_exist
+
+    def test_generate_bank_card_number_not_modify_bin_list(self):
+        """测试生成卡号时不修改BIN表中的对象"""
+        from dbox.bankinfo import bank_bin_list
+
+        generate_bank_card_number(card_count=100)
+        assert not any("no" in item for item in bank_bin_list)
+
+    def test_iter_bank_card_numbers(self):
+        """测试分批逐个产出卡号"""
+        numbers = list(iter_bank_card_numbers(25, card_type="CC", batch_size=10))
+        assert len(numbers) == 25
+        assert all(luhn_check_digit(number[:-1]) == number[-1] for number in numbers)
+
     def test_get_bank_bin_default(self):
         """测试获取银行卡BIN-默认"""
         result = get_bank_bin(num=1)
@@ -357,8 +621,177 @@ class TestTestData:
         assert isinstance(result, list)
         assert len(result) >= 1
 
+    def test_get_bank_bin_filters(self):
+        """测试索引查询结果与逐行过滤一致"""
+        from dbox.bankinfo import bank_bin_list
+
+        for bank, bank_name, ftype, length in [
+            ("ICBC", None, "DC", 19),
+            (None, "中国", "CC", None),
+            ("CMB", "招商", None, "16"),
+        ]:
+            expected = [
+                item
+                for item in bank_bin_list
+                if (not bank or item["bank"] == bank)
+                and (not bank_name or item["name"].startswith(bank_name))
+                and (not ftype or item["type"] == ftype)
+                and (not length or item["length"] == str(length))
+            ]
+            result = get_bank_bin(num=0, bank=bank, bank_name=bank_name, ftype=ftype, length=length)
+            assert sorted(map(id, result)) == sorted(map(id, expected))
+
+    def test_get_bank_bin_not_found(self):
+        """测试找不到BIN码时抛出异常"""
+        with pytest.raises(ValueError):
+            get_bank_bin(num=1, bank="NOT_EXISTS")
+
     def test_get_special_character(self):
         """测试获取特殊字符"""
         result = get_special_character(5)
         assert isinstance(result, str)
         assert len(result) == 5
+
+
+class TestDataGenerator:
+    """测试可复现的数据生成器"""
+
+    @staticmethod
+    def _sample(generator):
+        return [
+            generator.get_random_date(),
+            generator.get_random_string(16),
+            generator.get_uuid(),
+            generator.get_names(5),
+            generator.get_pinyin(),
+            generator.generate_id_cards(5),
+            generator.generate_mobile_number(),
+            generator.generate_phone_serial_number(),
+            generator.generate_bank_card_number(5),
+            generator.get_special_character(5),
+        ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_same_seed_same_data(self, use_numpy):
+        """测试相同种子生成相同数据"""
+        if use_numpy:
+            pytest.importorskip("numpy")
+            assert self._sample(DataGenerator(1)) == self._sample(DataGenerator(1))
+        else:
+            with patch("dbox.testdata._get_numpy", return_value=None):
+                assert self._sample(DataGenerator(1)) == self._sample(DataGenerator(1))
+
+    def test_spawn_without_seed(self):
+        """测试未指定种子时，不同生成器派生的子生成器互不相同，同一生成器派生的子生成器可复现"""
+        first, second = DataGenerator(), DataGenerator()
+        assert first.spawn(0).get_random_string(32) != second.spawn(0).get_random_string(32)
+        assert first.spawn(0).get_random_string(32) == first.spawn(0).get_random_string(32)
+
+    def test_different_seed_different_data(self):
+        """测试不同种子生成不同数据"""
+        assert self._sample(DataGenerator(1)) != self._sample(DataGenerator(2))
+
+    def test_not_affect_global_random(self):
+        """测试不影响全局random状态"""
+        import random
+
+        random.seed(10)
+        expected = random.random()
+        random.seed(10)
+        self._sample(DataGenerator(1))
+        assert random.random() == expected
+
+    def test_spawn(self):
+        """测试派生的子生成器可复现且互不相同"""
+        generator = DataGenerator(1)
+        assert generator.spawn(0).get_uuid() == DataGenerator(1).spawn(0).get_uuid()
+        assert generator.spawn(0).get_uuid() != generator.spawn(1).get_uuid()
+
+    def test_generate_records(self):
+        """测试记录生成结果与进程数、消费方式无关"""
+        single = list(generate_records(25, _make_record, seed=3, chunk_size=10))
+        assert len(single) == 25
+        assert single == list(generate_records(25, _make_record, seed=3, chunk_size=10))
+        assert single == list(generate_records(25, _make_record, seed=3, workers=2, chunk_size=10))
+        assert single != list(generate_records(25, _make_record, seed=4, chunk_size=10))
+
+    def test_generate_records_empty(self):
+        """测试数量为0时不产出记录"""
+        assert list(generate_records(0, _make_record)) == []
+
+
+class TestDataset:
+    """测试按结构生成数据集"""
+
+    SCHEMA = {
+        "name": "name",
+        "id_card": ("id_card", {"gender": 1}),
+        "mobile": "mobile",
+        "card": "bank_card",
+        "age": ("int", {"start": 18, "end": 60}),
+        "level": ("choice", {"values": ["A", "B"]}),
+        "code": lambda generator: generator.get_random_string(4),
+    }
+
+    def test_iter_dataset_chunks(self):
+        """测试分块生成与可复现"""
+        chunks = list(iter_dataset_chunks(self.SCHEMA, 25, seed=1, chunk_size=10))
+        assert [len(chunk["name"]) for chunk in chunks] == [10, 10, 5]
+        assert all(set(chunk) == set(self.SCHEMA) for chunk in chunks)
+        assert all(validate_id_card(number) and int(number[16]) % 2 == 1 for number in chunks[0]["id_card"])
+        assert all(18 <= age <= 60 for age in chunks[0]["age"])
+        assert chunks == list(iter_dataset_chunks(self.SCHEMA, 25, seed=1, chunk_size=10))
+
+    def test_invalid_column_type(self):
+        """测试不支持的列类型"""
+        with pytest.raises(ValueError):
+            list(iter_dataset_chunks({"x": "unknown"}, 1))
+
+    def test_write_csv(self, tmp_path):
+        """测试写入CSV文件"""
+        file_path = tmp_path / "data.csv"
+        stats = write_dataset(file_path, self.SCHEMA, 25, seed=1, chunk_size=10)
+        with open(file_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == list(self.SCHEMA)
+        assert len(rows) == 26
+        chunks = iter_dataset_chunks(self.SCHEMA, 25, seed=1, chunk_size=10)
+        expected = [row for chunk in chunks for row in zip(*chunk.values())]
+        assert rows[1:] == [[str(value) for value in row] for row in expected]
+        assert stats["rows"] == 25
+        assert stats["columns"]["id_card"]["type"] == "id_card"
+        assert stats["columns"]["code"]["type"] == "<lambda>"
+        assert all(column["rows_per_sec"] > 0 for column in stats["columns"].values())
+
+    def test_write_jsonl(self, tmp_path):
+        """测试写入JSONL文件"""
+        file_path = tmp_path / "data.jsonl"
+        write_dataset(file_path, self.SCHEMA, 25, seed=1, chunk_size=10)
+        with open(file_path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert len(rows) == 25
+        assert set(rows[0]) == set(self.SCHEMA)
+        assert isinstance(rows[0]["age"], int)
+
+    def test_write_invalid_format(self, tmp_path):
+        """测试不支持的文件格式"""
+        with pytest.raises(ValueError):
+            write_dataset(tmp_path / "data.txt", self.SCHEMA, 1)
+
+    def test_write_parquet(self, tmp_path):
+        """测试写入parquet文件，每块为一个row group"""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        file_path = tmp_path / "data.parquet"
+        write_dataset(file_path, self.SCHEMA, 25, seed=1, chunk_size=10)
+        parquet_file = parquet.ParquetFile(file_path)
+        assert parquet_file.metadata.num_rows == 25
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.read().column("age").to_pylist()[:10] == next(
+            iter_dataset_chunks(self.SCHEMA, 10, seed=1, chunk_size=10)
+        )["age"]
+
+    @patch("dbox.testdata._get_pyarrow", return_value=None)
+    def test_write_parquet_without_pyarrow(self, mock_get_pyarrow, tmp_path):
+        """测试未安装pyarrow时写入parquet文件"""
+        with pytest.raises(ImportError):
+            write_dataset(tmp_path / "data.parquet", self.SCHEMA, 1)